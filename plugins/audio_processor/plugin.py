@@ -1,18 +1,27 @@
 """Audio processing plugin - converts M4A/Opus to MP3.
 
 Based on AM1 audio.py functionality.
+
+Encoded outputs are kept in the content-addressed StepResultCache, keyed by
+the source digest, plugin version and the options that shape the output, so
+re-running a book whose tags or cover changed reuses its MP3s.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import shutil
 from pathlib import Path
 from typing import Any
 
+import yaml
+
+from audiomason.checkpoint.step_cache import StepResultCache, step_cache_key
 from audiomason.core import ProcessingContext
-from audiomason.core.errors import AudioMasonError
+from audiomason.core.cancellation import run_subprocess
+from audiomason.core.errors import AudioMasonError, OperationCancelledError
 
 
 class FFmpegError(AudioMasonError):
@@ -24,6 +33,16 @@ class FFmpegError(AudioMasonError):
 _SUPPORTED_FORMATS = {".m4a", ".m4b", ".opus", ".mp3"}
 _CONVERTIBLE_FORMATS = {".m4a", ".m4b", ".opus"}
 _CHAPTER_FORMATS = {".m4a", ".m4b"}
+_PLUGIN_NAME = "audio_processor"
+
+
+@functools.cache
+def _plugin_version() -> str:
+    try:
+        manifest = yaml.safe_load((Path(__file__).parent / "plugin.yaml").read_text("utf-8"))
+        return str(manifest.get("version") or "0")
+    except Exception:
+        return "0"
 
 
 class AudioProcessorPlugin:
@@ -42,6 +61,13 @@ class AudioProcessorPlugin:
         self.bitrate = self.config.get("bitrate", "128k")
         self.loudnorm = self.config.get("loudnorm", False)
         self.split_chapters = self.config.get("split_chapters", False)
+        self._step_cache: StepResultCache | None = None
+        if self.config.get("step_cache", True):
+            cache_dir = self.config.get("step_cache_dir")
+            self._step_cache = StepResultCache(
+                Path(cache_dir).expanduser() if cache_dir else None,
+                max_bytes=int(self.config.get("step_cache_max_mb", 4096)) * 1024 * 1024,
+            )
 
     async def process(self, context: ProcessingContext) -> ProcessingContext:
         """Process audio file.
@@ -206,35 +232,99 @@ class AudioProcessorPlugin:
         return plan
 
     async def _execute_plan(self, plan: list[dict[str, Any]]) -> list[Path]:
-        """Execute planned actions in declared order."""
+        """Execute planned actions in declared order.
+
+        Encoding actions of a source are restored from the step cache when
+        an entry for the same source content and options exists; otherwise
+        they run and their outputs are stored.
+        """
+        ordered = sorted(plan, key=lambda item: int(item.get("order", 0)))
+        by_source: dict[Path, list[dict[str, Any]]] = {}
+        for action in ordered:
+            if str(action.get("operation") or "") != "copy":
+                by_source.setdefault(Path(action["source"]), []).append(action)
+
+        cached: set[int] = set()
+        keys: dict[Path, str] = {}
+        for source, actions in by_source.items():
+            key = await self._cache_key(source, actions)
+            if key is None:
+                continue
+            keys[source] = key
+            outputs_for = [Path(a["output"]) for a in actions]
+            assert self._step_cache is not None
+            if await asyncio.to_thread(self._step_cache.get, key, outputs_for):
+                cached.update(id(a) for a in actions)
+        if self._step_cache is not None and keys:
+            # Digests of every source are written in one go, not per file.
+            await asyncio.to_thread(self._step_cache.save_digests)
+
         outputs: list[Path] = []
-        for action in sorted(plan, key=lambda item: int(item.get("order", 0))):
+        for action in ordered:
             operation = str(action.get("operation") or "")
             output = Path(action["output"])
             if operation == "copy":
                 shutil.copy2(Path(action["source"]), output)
                 outputs.append(output)
                 continue
-            cmd = self.build_conversion_command(action)
-            await self._run_ffmpeg_command(cmd)
+            if id(action) not in cached:
+                cmd = self.build_conversion_command(action)
+                try:
+                    await self._run_ffmpeg_command(cmd)
+                except OperationCancelledError:
+                    # The encoder was killed mid-write; drop the partial file.
+                    output.unlink(missing_ok=True)
+                    raise
             if output.exists():
                 outputs.append(output)
+
+        for source, key in keys.items():
+            actions = by_source[source]
+            if id(actions[0]) in cached:
+                continue
+            produced = [Path(a["output"]) for a in actions]
+            if self._step_cache is not None and all(p.exists() for p in produced):
+                await asyncio.to_thread(self._step_cache.put, key, produced)
         return outputs
 
+    async def _cache_key(self, source: Path, actions: list[dict[str, Any]]) -> str | None:
+        """Return the step cache key for encoding actions of one source."""
+        if self._step_cache is None:
+            return None
+        try:
+            digest = await asyncio.to_thread(self._step_cache.source_digest, source, persist=False)
+        except OSError:
+            return None
+        options = {
+            "bitrate": self.bitrate,
+            "loudnorm": bool(self.loudnorm),
+            "split_chapters": bool(self.split_chapters),
+            "actions": [
+                {
+                    "operation": str(a.get("operation") or ""),
+                    "loudnorm": bool(a.get("loudnorm", False)),
+                    "start_time": a.get("start_time"),
+                    "end_time": a.get("end_time"),
+                }
+                for a in actions
+            ],
+        }
+        return step_cache_key(digest, _PLUGIN_NAME, _plugin_version(), options)
+
     async def _run_ffmpeg_command(self, cmd: list[str]) -> None:
-        """Run FFmpeg command and raise FFmpegError on failure."""
+        """Run FFmpeg command and raise FFmpegError on failure.
+
+        Cancellation (OperationCancelledError) is passed through unchanged.
+        """
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _stdout, stderr = await proc.communicate()
-            if proc.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
-                raise FFmpegError(f"Conversion failed: {error_msg}")
+            returncode, _stdout, stderr = await run_subprocess(cmd)
+        except OperationCancelledError:
+            raise
         except Exception as e:
             raise FFmpegError(f"Conversion failed: {e}") from e
+        if returncode != 0:
+            error_msg = stderr.decode() if stderr else "Unknown error"
+            raise FFmpegError(f"Conversion failed: {error_msg}")
 
     async def _process_m4a(self, context: ProcessingContext) -> None:
         """Backward-compatible wrapper for M4A/M4B processing."""
@@ -268,19 +358,16 @@ class AudioProcessorPlugin:
             str(path),
         ]
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _stderr = await proc.communicate()
-            if proc.returncode != 0:
+            returncode, stdout, _stderr = await run_subprocess(cmd)
+            if returncode != 0:
                 return []
             data = json.loads(stdout.decode())
             chapters = data.get("chapters", [])
             if isinstance(chapters, list):
                 return [chapter for chapter in chapters if isinstance(chapter, dict)]
             return []
+        except OperationCancelledError:
+            raise
         except Exception:
             return []
 
@@ -33,9 +33,15 @@ from audiomason.core import (
 from audiomason.core.config_service import ConfigService
 from audiomason.core.errors import PluginError
 from audiomason.core.jobs.model import JobState
-from audiomason.core.logging import apply_logging_policy, get_logger, set_log_file
+from audiomason.core.logging import (
+    apply_logging_policy,
+    get_logger,
+    set_console_async,
+    set_log_file,
+)
 from audiomason.core.orchestration import Orchestrator
 from audiomason.core.orchestration_models import ProcessRequest
+from audiomason.core.plugin_index import PluginIndex, default_plugin_index_path
 from audiomason.core.plugin_registry import PluginRegistry
 
 log = get_logger(__name__)
@@ -92,6 +98,8 @@ class CLIPlugin:
         self._plugin_cli_commands: dict[str, tuple[Path, str]] = {}
         # Session-level failure isolation: plugin_name -> error summary.
         self._failed_plugins: dict[str, str] = {}
+        # Parsed manifests persist across CLI runs; nothing is read until first use.
+        self._plugin_index = PluginIndex(default_plugin_index_path())
 
     def _parse_cli_args(self, *, emit_debug: bool = True) -> dict[str, Any]:
         """Parse all CLI arguments into a dictionary for ConfigResolver.
@@ -165,7 +173,7 @@ class CLIPlugin:
             i += 1
 
         if emit_debug:
-            self._debug(f"Parsed CLI args: {cli_args}")
+            self._debug("Parsed CLI args: %s", cli_args)
         return cli_args
 
     def _extract_verbosity_from_argv(self) -> None:
@@ -194,7 +202,7 @@ class CLIPlugin:
         for i in reversed(args_to_remove):
             sys.argv.pop(i)
 
-        self._debug(f"Verbosity level set to: {self.verbosity}")
+        self._debug("Verbosity level set to: %s", self.verbosity)
 
     def _build_plugin_cli_stub_registry(
         self, *, plugin_dirs: list[Path] | None = None
@@ -212,13 +220,16 @@ class CLIPlugin:
         # NOTE: For tests that provide explicit plugin dirs, do not read or enforce
         # user configuration state from ConfigService/PluginRegistry.
         reg: PluginRegistry | None
+        index: PluginIndex | None
         if plugin_dirs is None:
             cfg = ConfigService()
             reg = PluginRegistry(cfg)
+            index = self._plugin_index
         else:
             reg = None
+            index = None
 
-        loader = PluginLoader(builtin_plugins_dir=plugins_dir, registry=reg)
+        loader = PluginLoader(builtin_plugins_dir=plugins_dir, registry=reg, index=index)
 
         if plugin_dirs is None:
             discovered = loader.discover()
@@ -233,6 +244,7 @@ class CLIPlugin:
                 continue
             if "ICLICommands" in manifest.interfaces:
                 manifests_and_dirs.append((pdir, manifest))
+        loader.save_index()
 
         manifests_and_dirs.sort(key=lambda x: x[1].name)
 
@@ -281,6 +293,16 @@ class CLIPlugin:
         policy = resolver.resolve_logging_policy()
         apply_logging_policy(policy)
 
+        # Optional queued console output so slow terminals/pipes do not block.
+        console_async = resolver.resolve_many(["logging.console_async"]).get(
+            "logging.console_async"
+        )
+        if console_async is not None:
+            value = console_async[0]
+            if isinstance(value, str):
+                value = value.strip().lower() in {"1", "true", "yes", "on"}
+            set_console_async(bool(value))
+
         # Optional human-readable system log file (global).
         try:
             if resolver.resolve_system_log_enabled():
@@ -297,7 +319,7 @@ class CLIPlugin:
         install_jsonl_sink(resolver=resolver)
 
         # Now that core logging is configured, emit debug-only diagnostics.
-        self._debug(f"Parsed CLI args: {cli_args}")
+        self._debug("Parsed CLI args: %s", cli_args)
 
         # Build stub registry for plugin-provided CLI commands (manifest-only).
         self._plugin_cli_commands = self._build_plugin_cli_stub_registry()
@@ -421,10 +443,13 @@ class CLIPlugin:
         plugins_dir = Path(__file__).parent.parent
         cfg = ConfigService()
         reg = PluginRegistry(cfg)
-        loader = PluginLoader(builtin_plugins_dir=plugins_dir, registry=reg)
+        loader = PluginLoader(
+            builtin_plugins_dir=plugins_dir, registry=reg, index=self._plugin_index
+        )
 
         try:
             plugin = loader.load_plugin(plugin_dir, validate=False)
+            loader.save_index()
             commands = plugin.get_cli_commands()
             if command not in commands:
                 raise PluginError(
@@ -513,7 +538,7 @@ class CLIPlugin:
                 continue
             try:
                 loader.load_plugin(plugin_dir, validate=False)
-                self._debug(f"  loaded {plugin_name}")
+                self._debug("  loaded %s", plugin_name)
             except Exception as e:  # pragma: no cover
                 self._verbose(f"  {plugin_name}: {e}")
 
@@ -579,10 +604,10 @@ class CLIPlugin:
 
             results[file] = result
 
-            self._debug(f"  {file.name}:")
-            self._debug(f"    Format: {fmt}")
-            self._debug(f"    Guessed author: {result.guessed_author}")
-            self._debug(f"    Guessed title: {result.guessed_title}")
+            self._debug("  %s:", file.name)
+            self._debug("    Format: %s", fmt)
+            self._debug("    Guessed author: %s", result.guessed_author)
+            self._debug("    Guessed title: %s", result.guessed_title)
 
         return results
 
@@ -772,15 +797,15 @@ class CLIPlugin:
         """Log info message."""
         log.info(msg)
 
-    def _verbose(self, msg: str) -> None:
-        """Log verbose message."""
+    def _verbose(self, msg: str, *args: Any) -> None:
+        """Log verbose message (%-style args are formatted only if shown)."""
         if self.verbosity >= VerbosityLevel.VERBOSE:
-            log.info(msg)
+            log.info(msg, *args)
 
-    def _debug(self, msg: str) -> None:
-        """Log debug message."""
+    def _debug(self, msg: str, *args: Any) -> None:
+        """Log debug message (%-style args are formatted only if shown)."""
         if self.verbosity >= VerbosityLevel.DEBUG:
-            log.debug(msg)
+            log.debug(msg, *args)
 
     def _error(self, msg: str) -> None:
         """Log error message."""
@@ -810,13 +835,13 @@ class CLIPlugin:
             args: Command arguments
         """
         if self.verbosity >= VerbosityLevel.DEBUG:
-            self._debug(f"Starting web server with verbosity: {self.verbosity}")
+            self._debug("Starting web server with verbosity: %s", self.verbosity)
 
         # Parse CLI arguments
         cli_args = self._parse_cli_args()
 
         if self.verbosity >= VerbosityLevel.DEBUG:
-            log.debug(f"Parsed CLI args: {cli_args}")
+            log.debug("Parsed CLI args: %s", cli_args)
 
         # Create ConfigResolver with CLI args
         config_resolver = ConfigResolver(cli_args=cli_args)
@@ -825,12 +850,12 @@ class CLIPlugin:
         try:
             port, source = config_resolver.resolve("web.port")
             if self.verbosity >= VerbosityLevel.DEBUG:
-                log.debug(f"Resolved port {port} from {source}")
+                log.debug("Resolved port %s from %s", port, source)
             self._verbose(f"Using port {port} (source: {source})")
         except Exception as e:
             port = 8080
             if self.verbosity >= VerbosityLevel.DEBUG:
-                log.debug(f"Failed to resolve web.port: {e}, using default 8080")
+                log.debug("Failed to resolve web.port: %s, using default 8080", e)
             self._debug("Using default port 8080")
 
         if self.verbosity <= VerbosityLevel.QUIET:
@@ -846,7 +871,7 @@ class CLIPlugin:
         loader = PluginLoader(builtin_plugins_dir=plugins_dir, registry=reg)
 
         if self.verbosity >= VerbosityLevel.DEBUG:
-            log.debug(f"Plugins directory: {plugins_dir}")
+            log.debug("Plugins directory: %s", plugins_dir)
 
         try:
             preload_supported_web_plugins(loader=loader, plugins_dir=plugins_dir)
@@ -932,9 +957,9 @@ class CLIPlugin:
 
             if self.verbosity >= VerbosityLevel.DEBUG:
                 log.debug("Web plugin initialized with:")
-                log.debug(f"  - config_resolver: {config_resolver is not None}")
-                log.debug(f"  - plugin_loader: {loader is not None}")
-                log.debug(f"  - verbosity: {self.verbosity}")
+                log.debug("  - config_resolver: %s", config_resolver is not None)
+                log.debug("  - plugin_loader: %s", loader is not None)
+                log.debug("  - verbosity: %s", self.verbosity)
 
             await web_plugin.run()
         except KeyboardInterrupt:
@@ -957,7 +982,7 @@ class CLIPlugin:
 
     async def _daemon_command(self) -> None:
         """Start daemon mode."""
-        self._debug(f"Starting daemon mode with verbosity: {self.verbosity}")
+        self._debug("Starting daemon mode with verbosity: %s", self.verbosity)
         self._info("\U0001f504 Starting daemon mode...")
         self._info("")
 
@@ -1022,7 +1047,7 @@ class CLIPlugin:
 
     async def _tui_command(self) -> None:
         """Launch TUI interface."""
-        self._debug(f"Launching TUI with verbosity level: {self.verbosity}")
+        self._debug("Launching TUI with verbosity level: %s", self.verbosity)
 
         try:
             # Load TUI plugin
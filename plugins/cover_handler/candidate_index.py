@@ -0,0 +1,340 @@
+"""Cover candidate index: cached directory listings and header-only artwork probes.
+
+Cover discovery runs for every book on every phase-1 state load, and usually
+looks at the same directories (each book and its shared parent) again and
+again. CoverCandidateIndex lists a directory with a single scandir pass,
+keeps the ordered file-cover candidates and the first audio file, and reuses
+that listing until the directory's mtime changes.
+
+Whether an audio file carries embedded artwork is answered from its tag
+headers alone: ID3v2 frame headers are walked (seeking over frame bodies) and
+MP4 atoms are followed down moov/udta/meta/ilst/covr, so no image bytes are
+loaded. Tags the header walk cannot interpret with certainty (tag-level
+unsynchronisation, compressed or encrypted frames, malformed frame headers)
+are handed to mutagen. Results are cached per file (mtime, size).
+
+Timestamps have coarse granularity, so a directory or file changed within
+the last RACY_WINDOW_NS of the lookup is not cached (it could change again
+without its mtime moving).
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from mutagen.id3 import ID3
+from mutagen.mp4 import MP4
+
+FILE_COVER_NAMES = (
+    "cover.jpg",
+    "cover.jpeg",
+    "cover.png",
+    "cover.webp",
+    "folder.jpg",
+    "folder.jpeg",
+    "folder.png",
+    "front.jpg",
+    "front.png",
+)
+GENERIC_COVER_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp")
+EMBEDDED_SUFFIXES = {".mp3", ".m4a", ".m4b"}
+
+DEFAULT_MAX_ENTRIES = 8192
+RACY_WINDOW_NS = 2_000_000_000
+
+_APIC_PREFIX_BYTES = 1024
+_MP4_COVER_PATH = (b"moov", b"udta", b"meta", b"ilst", b"covr")
+
+
+class _UndecidedError(Exception):
+    """The header walk cannot answer; ask mutagen."""
+
+
+# ----------------------------------------------------------------------
+# artwork probes
+# ----------------------------------------------------------------------
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _picture_data_length(body: bytes, frame_size: int, *, v22: bool) -> int:
+    """Return the image byte count of an APIC/PIC frame from its body prefix."""
+    if not body:
+        return 0
+    encoding = body[0]
+    if v22:
+        pos = 1 + 3  # image format, three characters
+    else:
+        end = body.find(b"\x00", 1)
+        if end < 0:
+            raise _UndecidedError
+        pos = end + 1
+    pos += 1  # picture type
+    if encoding in (1, 2):
+        end = pos
+        while True:
+            end = body.find(b"\x00\x00", end)
+            if end < 0:
+                raise _UndecidedError
+            if (end - pos) % 2 == 0:
+                break
+            end += 1
+        pos = end + 2
+    else:
+        end = body.find(b"\x00", pos)
+        if end < 0:
+            raise _UndecidedError
+        pos = end + 1
+    return frame_size - pos
+
+
+def _id3_has_artwork(f: BinaryIO) -> bool:
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != b"ID3":
+        return False
+    major, flags = header[3], header[5]
+    if major not in (2, 3, 4):
+        raise _UndecidedError
+    if flags & 0x80 and major < 4:
+        raise _UndecidedError  # tag-level unsynchronisation changes frame sizes
+    if major == 2 and flags & 0x40:
+        raise _UndecidedError  # v2.2 compression
+    end = 10 + _syncsafe(header[6:10])
+    pos = 10
+    if major >= 3 and flags & 0x40:
+        ext = f.read(4)
+        # v2.3 counts the size field separately, v2.4 includes it.
+        pos += (4 + struct.unpack(">I", ext)[0]) if major == 3 else _syncsafe(ext)
+
+    header_size, id_size = (6, 3) if major == 2 else (10, 4)
+    picture_id = b"PIC" if major == 2 else b"APIC"
+    while pos + header_size <= end:
+        f.seek(pos)
+        frame = f.read(header_size)
+        if len(frame) < header_size or frame[0] == 0:
+            break  # padding
+        frame_id = frame[:id_size]
+        if not all(48 <= c <= 57 or 65 <= c <= 90 for c in frame_id):
+            raise _UndecidedError
+        if major == 2:
+            size = int.from_bytes(frame[3:6], "big")
+        elif major == 3:
+            size = struct.unpack(">I", frame[4:8])[0]
+        else:
+            size = _syncsafe(frame[4:8])
+        if frame_id == picture_id:
+            format_flags = frame[9] if major >= 3 else 0
+            if (major == 3 and format_flags & 0xE0) or (major == 4 and format_flags & 0x4F):
+                raise _UndecidedError
+            body = f.read(min(size, _APIC_PREFIX_BYTES))
+            if _picture_data_length(body, size, v22=major == 2) > 0:
+                return True
+        pos += header_size + size
+    return False
+
+
+def _mp4_atoms(f: BinaryIO, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """Yield (name, body_start, body_end) for the atoms in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        head = f.read(8)
+        if len(head) < 8:
+            return
+        size, name = struct.unpack(">I4s", head)
+        body = pos + 8
+        if size == 1:
+            large = f.read(8)
+            if len(large) < 8:
+                return
+            size = struct.unpack(">Q", large)[0]
+            body = pos + 16
+        elif size == 0:
+            size = end - pos
+        if size < body - pos:
+            return
+        yield name, body, min(pos + size, end)
+        pos += size
+
+
+def _mp4_has_artwork(f: BinaryIO, file_size: int) -> bool:
+    start, end = 0, file_size
+    for name in _MP4_COVER_PATH:
+        found = next(((s, e) for n, s, e in _mp4_atoms(f, start, end) if n == name), None)
+        if found is None:
+            return False
+        start, end = found
+        if name == b"meta":
+            # meta is a full box (version/flags) except in QuickTime-style files.
+            f.seek(start)
+            if f.read(8)[4:8] != b"hdlr":
+                start += 4
+    # A covr data atom holds 8 bytes of type and locale before the image.
+    return any(n == b"data" and e - s > 8 for n, s, e in _mp4_atoms(f, start, end))
+
+
+def _probe_with_mutagen(audio_file: Path) -> bool:
+    suffix = audio_file.suffix.lower()
+    try:
+        if suffix == ".mp3":
+            mp3_tags = ID3(str(audio_file))
+            apic_frames = mp3_tags.getall("APIC")
+            return any(bool(getattr(frame, "data", b"")) for frame in apic_frames)
+        if suffix in {".m4a", ".m4b"}:
+            mp4_tags: Any = MP4(str(audio_file)).tags
+            covers = mp4_tags.get("covr") if mp4_tags is not None else None
+            return any(bool(bytes(item)) for item in (covers or []))
+    except Exception:
+        return False
+    return False
+
+
+def probe_embedded_artwork(audio_file: Path) -> bool:
+    """Return True when audio_file has non-empty embedded artwork."""
+    suffix = audio_file.suffix.lower()
+    try:
+        with open(audio_file, "rb") as f:
+            if suffix == ".mp3":
+                return _id3_has_artwork(f)
+            if suffix in {".m4a", ".m4b"}:
+                return _mp4_has_artwork(f, os.fstat(f.fileno()).st_size)
+    except _UndecidedError:
+        return _probe_with_mutagen(audio_file)
+    except (OSError, struct.error):
+        return False
+    return False
+
+
+# ----------------------------------------------------------------------
+# index
+# ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Cover-relevant files of one directory, in discovery order."""
+
+    file_candidates: tuple[Path, ...]
+    first_audio: Path | None
+
+
+def _scan(directory: Path) -> DirectoryListing:
+    names: list[str] = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                if entry.is_file():
+                    names.append(entry.name)
+            except OSError:
+                continue
+    present = set(names)
+    preferred = [name for name in FILE_COVER_NAMES if name in present]
+    skip = set(preferred)
+    generic = sorted(
+        name
+        for name in names
+        if name not in skip and os.path.splitext(name)[1].lower() in GENERIC_COVER_SUFFIXES
+    )
+    audio = sorted(name for name in names if os.path.splitext(name)[1].lower() in EMBEDDED_SUFFIXES)
+    return DirectoryListing(
+        file_candidates=tuple(directory / name for name in [*preferred, *generic]),
+        first_audio=directory / audio[0] if audio else None,
+    )
+
+
+def _settled(mtime_ns: int) -> bool:
+    return time.time_ns() - mtime_ns > RACY_WINDOW_NS
+
+
+class CoverCandidateIndex:
+    """Thread-safe, bounded cache of directory listings and artwork probes."""
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._listings: OrderedDict[str, tuple[int, DirectoryListing]] = OrderedDict()
+        self._artwork: OrderedDict[str, tuple[tuple[int, int], bool]] = OrderedDict()
+
+    def listing(self, directory: Path) -> DirectoryListing | None:
+        """Return the listing of directory, or None if it is not a directory."""
+        try:
+            st = os.stat(directory)
+        except OSError:
+            return None
+        if not stat.S_ISDIR(st.st_mode):
+            return None
+        key = str(directory)
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns:
+                self._listings.move_to_end(key)
+                return cached[1]
+        try:
+            listing = _scan(directory)
+        except OSError:
+            return None
+        if _settled(st.st_mtime_ns):
+            with self._lock:
+                self._store(self._listings, key, (st.st_mtime_ns, listing))
+        return listing
+
+    def has_embedded_artwork(self, audio_file: Path) -> bool:
+        try:
+            st = os.stat(audio_file)
+        except OSError:
+            return False
+        key = str(audio_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._artwork.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._artwork.move_to_end(key)
+                return cached[1]
+        found = probe_embedded_artwork(audio_file)
+        if _settled(st.st_mtime_ns):
+            with self._lock:
+                self._store(self._artwork, key, (stamp, found))
+        return found
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+            self._artwork.clear()
+
+    def _store(self, table: OrderedDict[str, Any], key: str, value: Any) -> None:
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > self.max_entries:
+            table.popitem(last=False)
+
+
+_SHARED_INDEX = CoverCandidateIndex()
+
+
+def shared_candidate_index() -> CoverCandidateIndex:
+    """Return the process-wide cover candidate index."""
+    return _SHARED_INDEX
+
+
+__all__ = [
+    "CoverCandidateIndex",
+    "DirectoryListing",
+    "EMBEDDED_SUFFIXES",
+    "FILE_COVER_NAMES",
+    "GENERIC_COVER_SUFFIXES",
+    "probe_embedded_artwork",
+    "shared_candidate_index",
+]
@@ -0,0 +1,419 @@
+"""Shared, persistent cache of downloaded cover images.
+
+Series imports fetch the same cover URL for every book. CoverCache keeps each
+downloaded image once, content-addressed by its sha256, and remembers per URL
+which blob it resolved to together with the validators the server sent
+(ETag, Last-Modified). Within max_age_s a URL is served from disk without any
+network traffic; after that a conditional request revalidates it and a 304
+reuses the blob. When the server cannot be reached, a stale blob is still
+served.
+
+Layout under the cache root:
+
+    blobs/<sha[:2]>/<sha>   image bytes
+    urls.json               url -> sha256, validators, last check time
+
+Blobs are evicted least recently used first once their total size exceeds
+max_bytes; URL entries pointing at evicted blobs are dropped with them.
+
+Downloads go through CoverHttpClient: an in-process HTTP/1.1 client that keeps
+idle keep-alive connections per host, bounds concurrent requests, applies a
+timeout to every request and caps the response size.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import http.client
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin, urlsplit
+
+from audiomason.core.errors import CoverError
+
+CACHE_SCHEMA_VERSION = 1
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE_S = 7 * 24 * 3600.0
+DEFAULT_TIMEOUT_S = 15.0
+DEFAULT_CONCURRENCY = 4
+MAX_COVER_BYTES = 32 * 1024 * 1024
+MAX_REDIRECTS = 5
+
+_IDLE_PER_HOST = 4
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_USER_AGENT = "AudioMason2/cover_handler"
+_INDEX_FILE = "urls.json"
+
+
+def default_cover_cache_dir() -> Path:
+    """Return the per-user cover cache location."""
+    return Path.home() / ".audiomason" / "cache" / "covers"
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """A fully read HTTP response; header names are lower-case."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    url: str
+
+
+class CoverHttpClient:
+    """Pooled, bounded HTTP client for cover downloads (thread-safe)."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = DEFAULT_CONCURRENCY,
+        max_bytes: int = MAX_COVER_BYTES,
+    ) -> None:
+        self.max_bytes = max(1, int(max_bytes))
+        self._slots = threading.BoundedSemaphore(max(1, int(max_concurrent)))
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+    ) -> HttpResponse:
+        """GET url, following redirects. Raises CoverError on transport errors."""
+        with self._slots:
+            for _ in range(MAX_REDIRECTS + 1):
+                response = self._request(url, headers or {}, timeout_s)
+                location = response.headers.get("location")
+                if response.status not in _REDIRECT_STATUSES or not location:
+                    return response
+                url = urljoin(url, location)
+        raise CoverError(f"Too many redirects: {url}")
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _checkout(
+        self, key: tuple[str, str, int], timeout_s: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                conn = conns.pop()
+                conn.timeout = timeout_s
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout_s)
+                return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout_s), False
+        return http.client.HTTPConnection(host, port, timeout=timeout_s), False
+
+    def _checkin(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < _IDLE_PER_HOST:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def _request(self, url: str, headers: dict[str, str], timeout_s: float) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise CoverError(f"Unsupported cover URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request_headers = {"User-Agent": _USER_AGENT, "Accept": "image/*,*/*;q=0.8", **headers}
+
+        while True:
+            conn, reused = self._checkout(key, timeout_s)
+            try:
+                conn.request("GET", target, headers=request_headers)
+                resp = conn.getresponse()
+                declared = resp.getheader("Content-Length")
+                if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+                    conn.close()
+                    raise CoverError(f"Cover too large ({declared} bytes): {url}")
+                body = resp.read(self.max_bytes + 1)
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if reused:
+                    # The server dropped an idle keep-alive connection; retry on a new one.
+                    continue
+                raise CoverError(f"Cover download failed: {url}: {e}") from e
+            break
+
+        if len(body) > self.max_bytes:
+            conn.close()
+            raise CoverError(f"Cover too large (over {self.max_bytes} bytes): {url}")
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return HttpResponse(
+            status=int(resp.status),
+            headers={name.lower(): value for name, value in resp.getheaders()},
+            body=body,
+            url=url,
+        )
+
+
+@dataclass(frozen=True)
+class CachedCover:
+    """A cover served from the cache."""
+
+    sha256: str
+    size: int
+    content_type: str
+    from_network: bool
+
+
+class CoverCache:
+    """Persistent cover store keyed by URL and content hash."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        client: CoverHttpClient | None = None,
+    ) -> None:
+        self.root = root or default_cover_cache_dir()
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_s = float(max_age_s)
+        self.timeout_s = float(timeout_s)
+        self.client = client or shared_http_client()
+        self._lock = threading.Lock()
+        self._url_locks: dict[str, threading.Lock] = {}
+        self._index: dict[str, dict[str, Any]] | None = None
+
+    # ------------------------------------------------------------------
+    # index
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        if self._index is None:
+            try:
+                raw = json.loads((self.root / _INDEX_FILE).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                raw = None
+            ok = isinstance(raw, dict) and raw.get("schema_version") == CACHE_SCHEMA_VERSION
+            urls = raw.get("urls") if ok and isinstance(raw, dict) else None
+            self._index = dict(urls) if isinstance(urls, dict) else {}
+        return self._index
+
+    def _save_index(self) -> None:
+        data = {"schema_version": CACHE_SCHEMA_VERSION, "urls": self._load_index()}
+        with contextlib.suppress(OSError):
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".urls.", dir=self.root)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=True, separators=(",", ":"))
+            os.replace(tmp, self.root / _INDEX_FILE)
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def _blob_path(self, sha: str) -> Path:
+        return self.root / "blobs" / sha[:2] / sha
+
+    # ------------------------------------------------------------------
+    # fetch
+    # ------------------------------------------------------------------
+
+    def fetch(self, url: str, output: Path) -> CachedCover:
+        """Write the image behind url to output, from cache when possible.
+
+        Concurrent fetches of one URL share a single download. Raises
+        CoverError when the image is neither cached nor downloadable.
+        """
+        with self._url_lock(url):
+            with self._lock:
+                entry = dict(self._load_index().get(url) or {})
+            sha = str(entry.get("sha256") or "")
+            have_blob = bool(sha) and self._blob_path(sha).is_file()
+            fresh = time.time() - float(entry.get("checked_at") or 0) < self.max_age_s
+            if have_blob and fresh:
+                return self._serve(url, entry, output, from_network=False)
+
+            headers: dict[str, str] = {}
+            if have_blob:
+                if entry.get("etag"):
+                    headers["If-None-Match"] = str(entry["etag"])
+                if entry.get("last_modified"):
+                    headers["If-Modified-Since"] = str(entry["last_modified"])
+            try:
+                response = self.client.get(url, headers=headers, timeout_s=self.timeout_s)
+            except CoverError:
+                if have_blob:
+                    return self._serve(url, entry, output, from_network=False)
+                raise
+
+            if response.status == 304 and have_blob:
+                entry["checked_at"] = time.time()
+                return self._serve(url, entry, output, from_network=True)
+            if response.status != 200 or not response.body:
+                raise CoverError(f"Cover download failed: {url}: HTTP {response.status}")
+
+            sha = hashlib.sha256(response.body).hexdigest()
+            self._store_blob(sha, response.body)
+            entry = {
+                "sha256": sha,
+                "etag": response.headers.get("etag", ""),
+                "last_modified": response.headers.get("last-modified", ""),
+                "content_type": response.headers.get("content-type", ""),
+                "checked_at": time.time(),
+            }
+            cover = self._serve(url, entry, output, from_network=True)
+        self.evict(keep=sha)
+        return cover
+
+    def _store_blob(self, sha: str, data: bytes) -> None:
+        blob = self._blob_path(sha)
+        if blob.is_file():
+            return
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{sha[:12]}.", dir=blob.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, blob)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def _serve(
+        self, url: str, entry: dict[str, Any], output: Path, *, from_network: bool
+    ) -> CachedCover:
+        sha = str(entry["sha256"])
+        blob = self._blob_path(sha)
+        # Copy under the cache lock so eviction cannot remove the blob midway.
+        with self._lock:
+            self._load_index()[url] = entry
+            self._save_index()
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(blob, output)
+            with contextlib.suppress(OSError):
+                os.utime(blob)
+            size = blob.stat().st_size
+        return CachedCover(
+            sha256=sha,
+            size=size,
+            content_type=str(entry.get("content_type") or ""),
+            from_network=from_network,
+        )
+
+    # ------------------------------------------------------------------
+    # eviction
+    # ------------------------------------------------------------------
+
+    def _blobs(self) -> list[tuple[float, int, Path]]:
+        out: list[tuple[float, int, Path]] = []
+        base = self.root / "blobs"
+        if not base.is_dir():
+            return out
+        for shard in base.iterdir():
+            if not shard.is_dir():
+                continue
+            for blob in shard.iterdir():
+                if blob.name.startswith("."):
+                    continue
+                with contextlib.suppress(OSError):
+                    st = blob.stat()
+                    out.append((st.st_mtime, st.st_size, blob))
+        return out
+
+    def total_bytes(self) -> int:
+        return sum(size for _mtime, size, _path in self._blobs())
+
+    def evict(self, *, keep: str = "") -> int:
+        """Delete least recently used blobs until under max_bytes; return count."""
+        with self._lock:
+            blobs = sorted(self._blobs(), key=lambda item: item[0])
+            total = sum(size for _mtime, size, _path in blobs)
+            removed: set[str] = set()
+            for _mtime, size, blob in blobs:
+                if total <= self.max_bytes:
+                    break
+                if blob.name == keep:
+                    continue
+                with contextlib.suppress(OSError):
+                    blob.unlink()
+                    removed.add(blob.name)
+                    total -= size
+            if removed:
+                index = self._load_index()
+                for url in [u for u, e in index.items() if e.get("sha256") in removed]:
+                    del index[url]
+                self._save_index()
+        return len(removed)
+
+
+_SHARED_LOCK = threading.Lock()
+_SHARED_CLIENT: CoverHttpClient | None = None
+_SHARED_CACHES: dict[Path, CoverCache] = {}
+
+
+def shared_http_client() -> CoverHttpClient:
+    """Return the process-wide cover HTTP client."""
+    global _SHARED_CLIENT
+    with _SHARED_LOCK:
+        if _SHARED_CLIENT is None:
+            _SHARED_CLIENT = CoverHttpClient()
+        return _SHARED_CLIENT
+
+
+def shared_cover_cache(
+    root: Path | None = None,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    max_age_s: float = DEFAULT_MAX_AGE_S,
+    timeout_s: float = DEFAULT_TIMEOUT_S,
+) -> CoverCache:
+    """Return the process-wide CoverCache for root, applying the given limits."""
+    key = (root or default_cover_cache_dir()).expanduser().resolve()
+    client = shared_http_client()
+    with _SHARED_LOCK:
+        cache = _SHARED_CACHES.get(key)
+        if cache is None:
+            cache = CoverCache(key, client=client)
+            _SHARED_CACHES[key] = cache
+        cache.max_bytes = max(0, int(max_bytes))
+        cache.max_age_s = float(max_age_s)
+        cache.timeout_s = float(timeout_s)
+        return cache
+
+
+__all__ = [
+    "CachedCover",
+    "CoverCache",
+    "CoverHttpClient",
+    "DEFAULT_MAX_AGE_S",
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_TIMEOUT_S",
+    "HttpResponse",
+    "default_cover_cache_dir",
+    "shared_cover_cache",
+    "shared_http_client",
+]
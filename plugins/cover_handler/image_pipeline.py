@@ -0,0 +1,209 @@
+"""In-process cover image pipeline.
+
+Covers are prepared once per book as JPEG bytes no larger than a maximum
+dimension, then embedded into every MP3 directly from memory:
+
+- prepare_cover() first sniffs the image header; a JPEG already within the
+  limit is returned unchanged without decoding anything.
+- Otherwise the image is decoded, downscaled and re-encoded with Pillow in a
+  worker thread when Pillow is installed, or by one ffmpeg process reading
+  and writing pipes (no temp files) when it is not.
+- read_embedded_artwork() and write_embedded_artwork() move picture bytes in
+  and out of tags with mutagen, without remuxing the audio.
+
+Pillow is an optional dependency imported on first use; it is not declared in
+the package metadata, so install it separately (pip install Pillow).
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import io
+import struct
+import threading
+from pathlib import Path
+from typing import Any
+
+from mutagen.id3 import APIC, ID3, ID3NoHeaderError
+from mutagen.mp4 import MP4
+
+from audiomason.core.cancellation import run_subprocess
+from audiomason.core.errors import CoverError
+
+DEFAULT_MAX_DIMENSION = 1400
+DEFAULT_QUALITY = 95
+
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+_PIL_LOCK = threading.Lock()
+_PIL_IMAGE: Any = None
+_PIL_CHECKED = False
+
+
+def _pil_image() -> Any:
+    """Return the PIL.Image module, or None when Pillow is not installed."""
+    global _PIL_IMAGE, _PIL_CHECKED
+    with _PIL_LOCK:
+        if not _PIL_CHECKED:
+            try:
+                _PIL_IMAGE = importlib.import_module("PIL.Image")
+            except ImportError:
+                _PIL_IMAGE = None
+            _PIL_CHECKED = True
+        return _PIL_IMAGE
+
+
+def pillow_available() -> bool:
+    return _pil_image() is not None
+
+
+def image_info(data: bytes) -> tuple[str, int, int] | None:
+    """Return (format, width, height) from a JPEG or PNG header, else None."""
+    if data.startswith(_PNG_SIGNATURE) and len(data) >= 24 and data[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", data[16:24])
+        return ("png", int(width), int(height))
+    if not data.startswith(b"\xff\xd8"):
+        return None
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            pos += 2
+            continue
+        (length,) = struct.unpack(">H", data[pos + 2 : pos + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 9 > len(data):
+                return None
+            height, width = struct.unpack(">HH", data[pos + 5 : pos + 9])
+            return ("jpeg", int(width), int(height))
+        pos += 2 + length
+    return None
+
+
+def image_mime(data: bytes) -> str:
+    return "image/png" if data.startswith(_PNG_SIGNATURE) else "image/jpeg"
+
+
+def _prepare_with_pillow(data: bytes, max_dimension: int, quality: int) -> bytes:
+    image_module = _pil_image()
+    with image_module.open(io.BytesIO(data)) as img:
+        img.load()
+        oversized = max(img.size) > max_dimension
+        if img.format == "JPEG" and img.mode in ("RGB", "L") and not oversized:
+            return data
+        if img.mode in ("RGB", "L"):
+            out_img = img.copy()
+        else:
+            rgba = img.convert("RGBA")
+            out_img = image_module.new("RGB", rgba.size, (255, 255, 255))
+            out_img.paste(rgba, mask=rgba.getchannel("A"))
+    if oversized:
+        out_img.thumbnail((max_dimension, max_dimension), image_module.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    out_img.save(buf, "JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+
+async def _prepare_with_ffmpeg(data: bytes, max_dimension: int, quality: int) -> bytes:
+    # mjpeg qscale runs from 2 (best) to 31 (worst).
+    qscale = max(2, min(31, round(2 + (100 - quality) * 29 / 100)))
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        "pipe:0",
+        "-frames:v",
+        "1",
+        "-vf",
+        (
+            f"scale=w='min(iw,{max_dimension})':h='min(ih,{max_dimension})'"
+            ":force_original_aspect_ratio=decrease"
+        ),
+        "-q:v",
+        str(qscale),
+        "-f",
+        "image2",
+        "-c:v",
+        "mjpeg",
+        "pipe:1",
+    ]
+    try:
+        returncode, stdout, stderr = await run_subprocess(cmd, stdin_data=data)
+    except FileNotFoundError as e:
+        raise CoverError("Image conversion failed: neither Pillow nor ffmpeg is available") from e
+    if returncode != 0 or not stdout:
+        message = stderr.decode("utf-8", errors="replace").strip() or f"exit code {returncode}"
+        raise CoverError(f"Image conversion failed: {message}")
+    return stdout
+
+
+async def prepare_cover(
+    data: bytes,
+    *,
+    max_dimension: int = DEFAULT_MAX_DIMENSION,
+    quality: int = DEFAULT_QUALITY,
+) -> bytes:
+    """Return data as JPEG bytes whose larger side is at most max_dimension."""
+    if not data:
+        raise CoverError("Image conversion failed: empty image")
+    info = image_info(data)
+    if info is not None and info[0] == "jpeg" and max(info[1], info[2]) <= max_dimension:
+        return data
+    if pillow_available():
+        try:
+            return await asyncio.to_thread(_prepare_with_pillow, data, max_dimension, quality)
+        except Exception as e:
+            raise CoverError(f"Image conversion failed: {e}") from e
+    return await _prepare_with_ffmpeg(data, max_dimension, quality)
+
+
+def read_embedded_artwork(audio_file: Path) -> bytes | None:
+    """Return the first non-empty embedded picture of an MP3/M4A/M4B file."""
+    suffix = audio_file.suffix.lower()
+    try:
+        if suffix == ".mp3":
+            for frame in ID3(str(audio_file)).getall("APIC"):
+                if getattr(frame, "data", b""):
+                    return bytes(frame.data)
+        elif suffix in {".m4a", ".m4b"}:
+            tags: Any = MP4(str(audio_file)).tags
+            for item in (tags.get("covr") if tags is not None else None) or []:
+                if bytes(item):
+                    return bytes(item)
+    except Exception:
+        return None
+    return None
+
+
+def write_embedded_artwork(mp3_file: Path, data: bytes) -> None:
+    """Replace the pictures in mp3_file's ID3 tag with data (front cover)."""
+    try:
+        tags = ID3(str(mp3_file))
+    except ID3NoHeaderError:
+        tags = ID3()
+    tags.delall("APIC")
+    tags.add(APIC(encoding=3, mime=image_mime(data), type=3, desc="Cover", data=data))
+    tags.save(str(mp3_file))
+
+
+__all__ = [
+    "DEFAULT_MAX_DIMENSION",
+    "DEFAULT_QUALITY",
+    "image_info",
+    "image_mime",
+    "pillow_available",
+    "prepare_cover",
+    "read_embedded_artwork",
+    "write_embedded_artwork",
+]
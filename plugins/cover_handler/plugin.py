@@ -6,6 +6,14 @@ Handles all cover operations:
 - Convert image formats
 - Embed into MP3
 - Find file covers
+
+HTTP(S) cover URLs are downloaded in process through the shared CoverCache
+(download_cache.py), so a URL used by every book of a series is fetched once
+and revalidated cheaply afterwards.
+
+Images are converted, downscaled to cover_size and embedded in process
+(image_pipeline.py): the cover is prepared once as JPEG bytes and written into
+each MP3's ID3 tag from memory, in parallel worker threads.
 """
 
 from __future__ import annotations
@@ -19,29 +27,27 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-from mutagen.id3 import ID3
-from mutagen.mp4 import MP4
-
 from audiomason.core import CoverChoice, ProcessingContext
-from audiomason.core.errors import CoverError
+from audiomason.core.cancellation import current_cancel_token, run_subprocess
+from audiomason.core.errors import CoverError, OperationCancelledError
 from audiomason.core.logging import get_logger
+from plugins.cover_handler.candidate_index import EMBEDDED_SUFFIXES, shared_candidate_index
+from plugins.cover_handler.download_cache import (
+    DEFAULT_TIMEOUT_S,
+    CoverCache,
+    shared_cover_cache,
+    shared_http_client,
+)
+from plugins.cover_handler.image_pipeline import (
+    DEFAULT_QUALITY,
+    prepare_cover,
+    read_embedded_artwork,
+    write_embedded_artwork,
+)
 
 logger = get_logger(__name__)
 
-_FILE_COVER_NAMES = (
-    "cover.jpg",
-    "cover.jpeg",
-    "cover.png",
-    "cover.webp",
-    "folder.jpg",
-    "folder.jpeg",
-    "folder.png",
-    "front.jpg",
-    "front.png",
-)
-
-_GENERIC_COVER_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp")
-_EMBEDDED_SUFFIXES = {".mp3", ".m4a", ".m4b"}
+_INDEX = shared_candidate_index()
 
 
 def _cache_token(value: str) -> str:
@@ -49,48 +55,17 @@ def _cache_token(value: str) -> str:
 
 
 def _ordered_file_candidates(directory: Path) -> list[Path]:
-    seen: set[str] = set()
-    ordered: list[Path] = []
-    for name in _FILE_COVER_NAMES:
-        candidate = directory / name
-        if candidate.exists() and candidate.is_file():
-            ordered.append(candidate)
-            seen.add(str(candidate))
-    ordered.extend(
-        sorted(
-            candidate
-            for candidate in directory.iterdir()
-            if candidate.is_file()
-            and candidate.suffix.lower() in _GENERIC_COVER_SUFFIXES
-            and str(candidate) not in seen
-        )
-    )
-    return ordered
+    listing = _INDEX.listing(directory)
+    return list(listing.file_candidates) if listing is not None else []
 
 
 def _first_audio_source(directory: Path) -> Path | None:
-    if not directory.exists() or not directory.is_dir():
-        return None
-    for path in sorted(directory.iterdir()):
-        if path.is_file() and path.suffix.lower() in _EMBEDDED_SUFFIXES:
-            return path
-    return None
+    listing = _INDEX.listing(directory)
+    return listing.first_audio if listing is not None else None
 
 
 def _has_embedded_artwork(audio_file: Path) -> bool:
-    suffix = audio_file.suffix.lower()
-    try:
-        if suffix == ".mp3":
-            mp3_tags = ID3(str(audio_file))
-            apic_frames = mp3_tags.getall("APIC")
-            return any(bool(getattr(frame, "data", b"")) for frame in apic_frames)
-        if suffix in {".m4a", ".m4b"}:
-            mp4_tags: Any = MP4(str(audio_file)).tags
-            covers = mp4_tags.get("covr") if mp4_tags is not None else None
-            return any(bool(bytes(item)) for item in (covers or []))
-    except Exception:
-        return False
-    return False
+    return _INDEX.has_embedded_artwork(audio_file)
 
 
 def _normalize_relative_path(rel_path: str) -> str:
@@ -141,7 +116,20 @@ class CoverHandlerPlugin:
             config: Plugin configuration
         """
         self.config = config or {}
-        self.cover_size = self.config.get("cover_size", 1400)
+        self.cover_size = int(self.config.get("cover_size", 1400) or 1400)
+        self.embed_concurrency = max(1, int(self.config.get("embed_concurrency", 4) or 1))
+        self.download_timeout_s = float(
+            self.config.get("download_timeout_s", DEFAULT_TIMEOUT_S) or DEFAULT_TIMEOUT_S
+        )
+        self._cover_cache: CoverCache | None = None
+        if self.config.get("cover_cache", True):
+            cache_dir = self.config.get("cover_cache_dir")
+            self._cover_cache = shared_cover_cache(
+                Path(cache_dir).expanduser() if cache_dir else None,
+                max_bytes=int(self.config.get("cover_cache_max_mb", 256)) * 1024 * 1024,
+                max_age_s=float(self.config.get("cover_cache_max_age_hours", 168)) * 3600,
+                timeout_s=self.download_timeout_s,
+            )
 
     async def process(self, context: ProcessingContext) -> ProcessingContext:
         """Handle cover based on user choice.
@@ -201,6 +189,8 @@ class CoverHandlerPlugin:
             else:
                 context.add_warning("Cover not found")
 
+        except OperationCancelledError:
+            raise
         except Exception as e:
             context.add_warning(f"Cover error: {e}")
 
@@ -390,20 +380,22 @@ class CoverHandlerPlugin:
         group_root: str | None = None,
         stage_root: str | None = None,
     ) -> list[dict[str, str]]:
-        if not directory.exists() or not directory.is_dir():
+        listing = _INDEX.listing(directory)
+        if listing is None:
             return []
 
         candidates: list[dict[str, str]] = []
         resolved_root = self._resolve_root_name(group_root=group_root, stage_root=stage_root)
-        scopes = [("primary", directory)]
+        scopes = [("primary", listing.file_candidates)]
         fallback = directory.parent
-        if fallback.exists() and fallback.is_dir() and fallback != directory:
-            scopes.append(("fallback", fallback))
+        fallback_listing = _INDEX.listing(fallback) if fallback != directory else None
+        if fallback_listing is not None:
+            scopes.append(("fallback", fallback_listing.file_candidates))
 
         ordered_files = [
             (scope_name, candidate)
-            for scope_name, scope_dir in scopes
-            for candidate in _ordered_file_candidates(scope_dir)
+            for scope_name, scope_candidates in scopes
+            for candidate in scope_candidates
         ]
         duplicate_names = {
             name
@@ -438,7 +430,7 @@ class CoverHandlerPlugin:
 
         if (
             audio_file is not None
-            and audio_file.suffix.lower() in _EMBEDDED_SUFFIXES
+            and audio_file.suffix.lower() in EMBEDDED_SUFFIXES
             and _has_embedded_artwork(audio_file)
         ):
             candidates.append(
@@ -531,23 +523,37 @@ class CoverHandlerPlugin:
         *,
         output_path: Path | None = None,
     ) -> Path | None:
-        """Extract embedded cover from audio file."""
+        """Extract embedded cover from audio file.
+
+        The picture is read from the tag in process; ffmpeg is only used
+        when the tag holds none (or it cannot be converted).
+        """
         output = output_path or (audio_file.parent / "cover_extracted.jpg")
 
+        try:
+            data = await asyncio.to_thread(read_embedded_artwork, audio_file)
+            if data:
+                jpeg = await self.prepare_cover_bytes(data)
+                await asyncio.to_thread(output.write_bytes, jpeg)
+                return output
+        except OperationCancelledError:
+            output.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            logger.debug("in-process cover extraction failed: %s", e)
+
         for cmd in self.build_embedded_extract_commands(audio_file, output):
             try:
                 if output.exists():
                     output.unlink()
 
-                proc = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                await proc.communicate()
+                returncode, _stdout, _stderr = await run_subprocess(cmd)
 
-                if proc.returncode == 0 and output.exists() and output.stat().st_size > 0:
+                if returncode == 0 and output.exists() and output.stat().st_size > 0:
                     return output
+            except OperationCancelledError:
+                output.unlink(missing_ok=True)
+                raise
             except Exception:
                 continue
 
@@ -613,7 +619,20 @@ class CoverHandlerPlugin:
             cache_key=cache_key,
         )
 
-        # Use curl for downloading (more reliable than Python requests)
+        if urlparse(url).scheme.lower() in ("http", "https"):
+            try:
+                await self._download_http(url, output)
+                if output.exists() and output.stat().st_size > 0:
+                    return output
+            except OperationCancelledError:
+                output.unlink(missing_ok=True)
+                raise
+            except Exception as e:
+                logger.debug("cover download failed: %s", e)
+            output.unlink(missing_ok=True)
+            return None
+
+        # Other schemes: curl, or ffmpeg when curl is missing.
         cmd = [
             "curl",
             "-L",  # Follow redirects
@@ -639,17 +658,14 @@ class CoverHandlerPlugin:
                     str(output),
                 ]
 
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            await proc.communicate()
+            await run_subprocess(cmd)
 
             if output.exists() and output.stat().st_size > 0:
                 return output
 
+        except OperationCancelledError:
+            output.unlink(missing_ok=True)
+            raise
         except Exception:
             pass
 
@@ -658,8 +674,28 @@ class CoverHandlerPlugin:
 
         return None
 
-    async def convert_to_jpeg(self, image_path: Path, quality: int = 95) -> Path:
-        """Convert image to JPEG format.
+    async def _download_http(self, url: str, output: Path) -> None:
+        token = current_cancel_token()
+        if token is not None:
+            token.raise_if_cancelled()
+        if self._cover_cache is not None:
+            await asyncio.to_thread(self._cover_cache.fetch, url, output)
+        else:
+            response = await asyncio.to_thread(
+                shared_http_client().get, url, timeout_s=self.download_timeout_s
+            )
+            if response.status != 200:
+                raise CoverError(f"Cover download failed: {url}: HTTP {response.status}")
+            await asyncio.to_thread(output.write_bytes, response.body)
+        if token is not None:
+            token.raise_if_cancelled()
+
+    async def prepare_cover_bytes(self, data: bytes, *, quality: int = DEFAULT_QUALITY) -> bytes:
+        """Return data as JPEG bytes no larger than cover_size on either side."""
+        return await prepare_cover(data, max_dimension=self.cover_size, quality=quality)
+
+    async def convert_to_jpeg(self, image_path: Path, quality: int = DEFAULT_QUALITY) -> Path:
+        """Convert image to JPEG format, downscaled to cover_size.
 
         Args:
             image_path: Input image
@@ -668,110 +704,69 @@ class CoverHandlerPlugin:
         Returns:
             Path to JPEG image
         """
-        # Already JPEG?
-        if image_path.suffix.lower() in [".jpg", ".jpeg"]:
-            return image_path
-
-        output = image_path.with_suffix(".jpg")
-
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-nostdin",
-            "-loglevel",
-            "error",
-            "-y",
-            "-i",
-            str(image_path),
-            "-q:v",
-            str(100 - quality),  # FFmpeg quality scale is inverted
-            str(output),
-        ]
-
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            await proc.communicate()
-
-            if proc.returncode == 0 and output.exists():
-                # Remove original if conversion successful
-                if output != image_path:
-                    image_path.unlink()
-                return output
-
+            data = await asyncio.to_thread(image_path.read_bytes)
+            jpeg = await self.prepare_cover_bytes(data, quality=quality)
+        except (CoverError, OperationCancelledError):
+            raise
         except Exception as e:
             raise CoverError(f"Image conversion failed: {e}") from e
 
-        raise CoverError("Image conversion failed")
+        is_jpeg_name = image_path.suffix.lower() in [".jpg", ".jpeg"]
+        if jpeg is data and is_jpeg_name:
+            return image_path
+
+        output = image_path if is_jpeg_name else image_path.with_suffix(".jpg")
+        await asyncio.to_thread(output.write_bytes, jpeg)
+        if output != image_path:
+            # Remove original once the JPEG is written
+            image_path.unlink(missing_ok=True)
+        return output
 
-    async def embed_cover(self, mp3_file: Path, cover_path: Path) -> None:
+    async def embed_cover(self, mp3_file: Path, cover: Path | bytes) -> None:
         """Embed cover into MP3 file.
 
         Args:
             mp3_file: MP3 file
-            cover_path: Cover image path
+            cover: Cover image path, or the image bytes
         """
-        temp_file = mp3_file.with_suffix(".covered.mp3")
-
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-nostdin",
-            "-loglevel",
-            "error",
-            "-y",
-            "-i",
-            str(mp3_file),
-            "-i",
-            str(cover_path),
-            "-map",
-            "0:a",  # Audio from first input
-            "-map",
-            "1:v",  # Video (cover) from second input
-            "-c:a",
-            "copy",  # Copy audio without re-encoding
-            "-c:v",
-            "copy",  # Copy cover
-            "-disposition:v:0",
-            "attached_pic",  # Mark as attached picture
-            str(temp_file),
-        ]
-
+        token = current_cancel_token()
+        if token is not None:
+            token.raise_if_cancelled()
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await proc.communicate()
-
-            if proc.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown error"
-                raise CoverError(f"Cover embedding failed: {error_msg}")
-
-            # Replace original with covered version
-            temp_file.replace(mp3_file)
-
+            data = cover if isinstance(cover, bytes) else await asyncio.to_thread(cover.read_bytes)
+            await asyncio.to_thread(write_embedded_artwork, mp3_file, data)
         except Exception as e:
-            if temp_file.exists():
-                temp_file.unlink()
             raise CoverError(f"Failed to embed cover: {e}") from e
 
-    async def embed_covers_batch(self, mp3_files: list[Path], cover_path: Path) -> None:
+    async def embed_covers_batch(self, mp3_files: list[Path], cover: Path | bytes) -> None:
         """Embed cover into multiple MP3 files.
 
+        The image is read and prepared once; files are written in parallel
+        (up to embed_concurrency at a time).
+
         Args:
             mp3_files: List of MP3 files
-            cover_path: Cover image path
+            cover: Cover image path, or the image bytes
         """
-        for mp3_file in mp3_files:
-            try:
-                await self.embed_cover(mp3_file, cover_path)
-            except Exception as e:
-                # Log error but continue with other files
-                logger.warning(f"Failed to embed cover in {mp3_file.name}: {e}")
+        data = cover if isinstance(cover, bytes) else await asyncio.to_thread(cover.read_bytes)
+        try:
+            data = await self.prepare_cover_bytes(data)
+        except OperationCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Cover not resized, embedding as is: {e}")
+
+        slots = asyncio.Semaphore(self.embed_concurrency)
+
+        async def _embed_one(mp3_file: Path) -> None:
+            async with slots:
+                try:
+                    await self.embed_cover(mp3_file, data)
+                except OperationCancelledError:
+                    raise
+                except Exception as e:
+                    # Log error but continue with other files
+                    logger.warning(f"Failed to embed cover in {mp3_file.name}: {e}")
+
+        await asyncio.gather(*(_embed_one(mp3_file) for mp3_file in mp3_files))
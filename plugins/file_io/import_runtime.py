@@ -5,6 +5,8 @@ ASCII-only.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import shutil
 from pathlib import Path
 
@@ -163,14 +165,14 @@ def _fallback_relative_path(fs: FileService, root: RootName, rel_path: str) -> s
         index += 1
 
 
-def stage_source(
+def _stage_plan(
     fs: FileService,
     *,
     source_root: RootName | str,
     source_relative_path: str,
-    work_relative_path: str | None = None,
-    archive_service: ArchiveService | None = None,
-) -> dict[str, dict[str, str]]:
+    work_relative_path: str | None,
+    archive_service: ArchiveService | None,
+) -> tuple[RootName, str, dict[str, str], ArchiveService, str]:
     src_root = parse_root(source_root)
     src_rel = normalize_relative_path(source_relative_path)
     intake = inspect_source(
@@ -190,8 +192,35 @@ def stage_source(
         if work_relative_path is None
         else normalize_relative_path(work_relative_path)
     )
-
     fs.delete_path(RootName.STAGE, work_rel, missing_ok=True)
+    return src_root, src_rel, intake, archive_service, work_rel
+
+
+def _stage_result(
+    src_root: RootName, src_rel: str, intake: dict[str, str], work_rel: str
+) -> dict[str, dict[str, str]]:
+    return {
+        "source": {"root": src_root.value, "relative_path": src_rel},
+        "work": {"root": RootName.STAGE.value, "relative_path": work_rel},
+        "intake": {"kind": intake["kind"], "archive_format": intake["archive_format"]},
+    }
+
+
+def stage_source(
+    fs: FileService,
+    *,
+    source_root: RootName | str,
+    source_relative_path: str,
+    work_relative_path: str | None = None,
+    archive_service: ArchiveService | None = None,
+) -> dict[str, dict[str, str]]:
+    src_root, src_rel, intake, archive_service, work_rel = _stage_plan(
+        fs,
+        source_root=source_root,
+        source_relative_path=source_relative_path,
+        work_relative_path=work_relative_path,
+        archive_service=archive_service,
+    )
     if intake["kind"] == "archive":
         archive_service.unpack(
             src_root,
@@ -204,12 +233,49 @@ def stage_source(
         )
     else:
         fs.copy_path(src_root, src_rel, RootName.STAGE, work_rel, overwrite=True)
+    return _stage_result(src_root, src_rel, intake, work_rel)
 
-    return {
-        "source": {"root": src_root.value, "relative_path": src_rel},
-        "work": {"root": RootName.STAGE.value, "relative_path": work_rel},
-        "intake": {"kind": intake["kind"], "archive_format": intake["archive_format"]},
-    }
+
+async def stage_source_async(
+    fs: FileService,
+    *,
+    source_root: RootName | str,
+    source_relative_path: str,
+    work_relative_path: str | None = None,
+    archive_service: ArchiveService | None = None,
+) -> dict[str, dict[str, str]]:
+    """stage_source for event-loop callers.
+
+    Archive extraction uses ArchiveService.unpack_async, so external tools
+    run as cancellable subprocesses; filesystem work runs in a thread.
+    """
+    src_root, src_rel, intake, archiver, work_rel = await asyncio.to_thread(
+        functools.partial(
+            _stage_plan,
+            fs,
+            source_root=source_root,
+            source_relative_path=source_relative_path,
+            work_relative_path=work_relative_path,
+            archive_service=archive_service,
+        )
+    )
+    if intake["kind"] == "archive":
+        await archiver.unpack_async(
+            src_root,
+            src_rel,
+            RootName.STAGE,
+            work_rel,
+            autodetect=True,
+            preserve_tree=True,
+            flatten=False,
+        )
+    else:
+        await asyncio.to_thread(
+            functools.partial(
+                fs.copy_path, src_root, src_rel, RootName.STAGE, work_rel, overwrite=True
+            )
+        )
+    return _stage_result(src_root, src_rel, intake, work_rel)
 
 
 def publish_staged(
@@ -234,12 +300,14 @@ def publish_staged(
         else:
             actual_dst_rel = _fallback_relative_path(fs, dst_root, dst_rel)
 
-    fs.copy_path(RootName.STAGE, work_rel, dst_root, actual_dst_rel, overwrite=True)
-
     cleanup_performed = False
     if cleanup:
-        fs.delete_path(RootName.STAGE, work_rel, missing_ok=True)
+        # The stage copy is discarded anyway: move it, which is a rename when
+        # stage and the library share a filesystem.
+        fs.move_path(RootName.STAGE, work_rel, dst_root, actual_dst_rel, overwrite=True)
         cleanup_performed = True
+    else:
+        fs.copy_path(RootName.STAGE, work_rel, dst_root, actual_dst_rel, overwrite=True)
 
     return {
         "work": {"root": RootName.STAGE.value, "relative_path": work_rel},
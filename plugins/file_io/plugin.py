@@ -96,6 +96,22 @@ class FileIOPlugin:
             archive_service=self.archive_service,
         )
 
+    async def stage_import_path_async(
+        self,
+        root: RootName | str,
+        relative_path: str,
+        *,
+        work_relative_path: str | None = None,
+    ) -> dict[str, dict[str, str]]:
+        """Async stage_import_path; archive extraction does not block the loop."""
+        return await import_runtime.stage_source_async(
+            self.file_service,
+            source_root=root,
+            source_relative_path=relative_path,
+            work_relative_path=work_relative_path,
+            archive_service=self.archive_service,
+        )
+
     def publish_import_path(
         self,
         *,
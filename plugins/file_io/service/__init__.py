@@ -2,15 +2,18 @@
 
 from .archives import ArchiveFormat, ArchiveService, CollisionPolicy, DetectedArchiveFormat
 from .service import FileService
-from .types import FileEntry, FileStat, RootName
+from .snapshots import TreeSnapshot
+from .types import DirNames, FileEntry, FileStat, RootName
 
 __all__ = [
     "ArchiveFormat",
     "ArchiveService",
     "CollisionPolicy",
     "DetectedArchiveFormat",
+    "DirNames",
     "FileEntry",
     "FileService",
     "FileStat",
     "RootName",
+    "TreeSnapshot",
 ]
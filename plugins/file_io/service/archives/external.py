@@ -0,0 +1,290 @@
+"""External archive tools (7z, unrar) for formats the stdlib cannot read.
+
+Listings are parsed line by line from the tool's stdout while it runs, so a
+large listing is never buffered into one string. A listing is cached per
+archive (path, mtime, size) so that planning and unpacking the same archive
+run the lister once. Every operation has a blocking and an asyncio variant;
+the async variants run the tool as an asyncio subprocess and terminate it
+(then kill it) when the awaiting task is cancelled.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from audiomason.core.errors import FileError
+
+from .types import ArchiveFormat
+
+TOOL_7Z = "7z"
+TOOL_UNRAR = "unrar"
+
+# Grace period between SIGTERM and SIGKILL for a cancelled tool.
+_TERMINATE_GRACE_S = 2.0
+_LISTING_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class ExternalEntry:
+    path: str
+    size: int | None
+
+
+def pick_tool(fmt: ArchiveFormat) -> str:
+    """Return the external tool for fmt (7z preferred, unrar for RAR)."""
+    if shutil.which(TOOL_7Z):
+        return TOOL_7Z
+    if fmt == ArchiveFormat.RAR and shutil.which(TOOL_UNRAR):
+        return TOOL_UNRAR
+    raise FileError(f"No external tool available for {fmt.value}; install 7z (preferred) or unrar")
+
+
+def list_command(tool: str, abs_path: Path) -> list[str]:
+    if tool == TOOL_7Z:
+        # -slt produces key/value blocks separated by blank lines.
+        return [TOOL_7Z, "l", "-slt", str(abs_path)]
+    # 'unrar vb' prints bare file names, one per line.
+    return [TOOL_UNRAR, "vb", str(abs_path)]
+
+
+def extract_command(tool: str, abs_src: Path, abs_dst: Path, *, flat: bool) -> list[str]:
+    """Command extracting abs_src into abs_dst, dropping directories when flat."""
+    if tool == TOOL_7Z:
+        return [TOOL_7Z, "e" if flat else "x", "-y", "-bd", str(abs_src), f"-o{abs_dst}"]
+    return [TOOL_UNRAR, "e" if flat else "x", "-o+", "-idq", str(abs_src), f"{abs_dst}/"]
+
+
+def _normalize(path: str) -> str:
+    return path.replace("\\", "/").lstrip("/")
+
+
+class _SltParser:
+    """Incremental parser for `7z l -slt` output, fed one line at a time.
+
+    The archive's own block comes first and ends at a "----------"
+    separator; it is skipped. Directory entries are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._in_entries = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._path: str | None = None
+        self._attrs = ""
+        self._folder = False
+        self._size: int | None = None
+
+    def _take(self) -> ExternalEntry | None:
+        path, attrs, folder, size = self._path, self._attrs, self._folder, self._size
+        self._reset()
+        if not self._in_entries or not path or folder or attrs.startswith("D"):
+            return None
+        p = _normalize(path)
+        if not p or p.endswith("/"):
+            return None
+        return ExternalEntry(path=p, size=size)
+
+    def feed(self, line: str) -> ExternalEntry | None:
+        s = line.strip()
+        if s.startswith("----------"):
+            self._in_entries = True
+            self._reset()
+            return None
+        if not s:
+            return self._take()
+        key, sep, value = s.partition(" = ")
+        if not sep:
+            return None
+        value = value.strip()
+        if key == "Path":
+            self._path = value
+        elif key == "Attributes":
+            self._attrs = value
+        elif key == "Folder":
+            self._folder = value == "+"
+        elif key == "Size":
+            with contextlib.suppress(ValueError):
+                self._size = int(value)
+        return None
+
+    def finish(self) -> ExternalEntry | None:
+        return self._take()
+
+
+class _VbParser:
+    """Parser for `unrar vb` output: one bare file name per line."""
+
+    def feed(self, line: str) -> ExternalEntry | None:
+        p = _normalize(line.strip())
+        if p and not p.endswith("/"):
+            return ExternalEntry(path=p, size=None)
+        return None
+
+    def finish(self) -> ExternalEntry | None:
+        return None
+
+
+def _parser(tool: str) -> _SltParser | _VbParser:
+    return _SltParser() if tool == TOOL_7Z else _VbParser()
+
+
+def parse_listing(tool: str, lines: Iterable[str]) -> Iterator[ExternalEntry]:
+    """Yield file entries from a listing as its lines arrive."""
+    parser = _parser(tool)
+    for line in lines:
+        entry = parser.feed(line)
+        if entry is not None:
+            yield entry
+    last = parser.finish()
+    if last is not None:
+        yield last
+
+
+def _tool_error(cmd: list[str], returncode: int, stderr: str) -> FileError:
+    tail = stderr.strip().splitlines()[-1:] if stderr else []
+    detail = f": {tail[0]}" if tail else ""
+    return FileError(f"{cmd[0]} exited with status {returncode}{detail}")
+
+
+def list_entries(tool: str, abs_path: Path) -> list[ExternalEntry]:
+    """Run the lister and parse its output while it streams."""
+    cmd = list_command(tool, abs_path)
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    ) as proc:
+        assert proc.stdout is not None and proc.stderr is not None
+        entries = list(parse_listing(tool, proc.stdout))
+        stderr = proc.stderr.read()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise _tool_error(cmd, returncode, stderr)
+    return entries
+
+
+def run_tool(cmd: list[str]) -> None:
+    """Run an extraction command; its progress output is discarded."""
+    res = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if res.returncode != 0:
+        raise _tool_error(cmd, res.returncode, res.stderr)
+
+
+async def _stop(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is not None:
+        return
+    with contextlib.suppress(ProcessLookupError):
+        proc.terminate()
+    try:
+        await asyncio.wait_for(proc.wait(), _TERMINATE_GRACE_S)
+    except TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+
+
+async def _lines(stream: asyncio.StreamReader) -> AsyncIterator[str]:
+    while True:
+        raw = await stream.readline()
+        if not raw:
+            return
+        yield raw.decode("utf-8", errors="replace")
+
+
+async def list_entries_async(tool: str, abs_path: Path) -> list[ExternalEntry]:
+    """Async list_entries; cancelling the caller stops the tool."""
+    cmd = list_command(tool, abs_path)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    try:
+        parser = _parser(tool)
+        entries: list[ExternalEntry] = []
+        async for line in _lines(proc.stdout):
+            entry = parser.feed(line)
+            if entry is not None:
+                entries.append(entry)
+        last = parser.finish()
+        if last is not None:
+            entries.append(last)
+        stderr = (await proc.stderr.read()).decode("utf-8", errors="replace")
+        returncode = await proc.wait()
+    except BaseException:
+        await asyncio.shield(_stop(proc))
+        raise
+    if returncode != 0:
+        raise _tool_error(cmd, returncode, stderr)
+    return entries
+
+
+async def run_tool_async(cmd: list[str]) -> None:
+    """Async run_tool; cancelling the caller terminates (then kills) the tool."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        _stdout, stderr_b = await proc.communicate()
+    except BaseException:
+        await asyncio.shield(_stop(proc))
+        raise
+    if proc.returncode != 0:
+        raise _tool_error(cmd, int(proc.returncode or 0), stderr_b.decode("utf-8", "replace"))
+
+
+class ListingCache:
+    """Small LRU of external listings keyed by archive identity."""
+
+    def __init__(self, max_entries: int = _LISTING_CACHE_SIZE) -> None:
+        self._max = max_entries
+        self._lock = threading.Lock()
+        self._items: OrderedDict[tuple[str, str, int, int], tuple[ExternalEntry, ...]] = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def key(tool: str, abs_path: Path) -> tuple[str, str, int, int]:
+        st = abs_path.stat()
+        return (tool, str(abs_path), int(st.st_mtime_ns), int(st.st_size))
+
+    def get(self, key: tuple[str, str, int, int]) -> list[ExternalEntry] | None:
+        with self._lock:
+            entries = self._items.get(key)
+            if entries is None:
+                return None
+            self._items.move_to_end(key)
+            return list(entries)
+
+    def put(self, key: tuple[str, str, int, int], entries: list[ExternalEntry]) -> None:
+        with self._lock:
+            self._items[key] = tuple(entries)
+            self._items.move_to_end(key)
+            while len(self._items) > self._max:
+                self._items.popitem(last=False)
+
+
+__all__ = [
+    "ExternalEntry",
+    "ListingCache",
+    "extract_command",
+    "list_command",
+    "list_entries",
+    "list_entries_async",
+    "parse_listing",
+    "pick_tool",
+    "run_tool",
+    "run_tool_async",
+]
@@ -0,0 +1,309 @@
+"""Single-pass archive extraction for ArchiveService.
+
+Entry names are mapped to destination paths while the archive is read, so an
+unpack never opens the archive a second time just to plan it:
+
+- ZIP: the central directory is already in memory once the archive is open.
+  All members are planned from it, then extracted by a small thread pool.
+  Each worker has its own archive handle; zlib releases the GIL while
+  inflating. Stored (uncompressed) members, typically MP3s, are copied from
+  their data offset with large positional reads, and their CRC is checked.
+- TAR (plain, gz, xz): the archive is read as a stream ("r|*") and every
+  member is written to a staging directory as it arrives. A compressed tar
+  is decompressed exactly once. Once the stream ends, members are planned in
+  sorted name order (as plan_unpack and ZIP extraction do) and renamed into
+  place, so collision renames do not depend on member order in the archive.
+
+Progress is reported as OpEvent(op="unpack", phase=OpPhase.PROGRESS) with
+byte and file counters. Events are throttled and delivered under a lock; with
+parallel ZIP extraction they arrive on worker threads.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import struct
+import tarfile
+import tempfile
+import threading
+import zipfile
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO
+
+from audiomason.core.errors import FileError
+
+from .types import CollisionPolicy, OpEvent, OpPhase
+
+ProgressCallback = Callable[[OpEvent], None]
+
+COPY_BUFSIZE = 1024 * 1024
+# Stored members are raw bytes on disk; bigger reads mean fewer syscalls.
+STORED_COPY_BUFSIZE = 8 * 1024 * 1024
+PROGRESS_STEP_BYTES = 8 * 1024 * 1024
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_MAGIC = b"PK\x03\x04"
+
+
+def default_unpack_workers() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def _rename_for_collision(existing: set[str], name: str) -> str:
+    stem = Path(name).stem
+    suffix = Path(name).suffix
+    head, tail = (stem, suffix) if suffix else (name, "")
+    i = 1
+    candidate = name
+    while candidate in existing:
+        candidate = f"{head}__{i}{tail}"
+        i += 1
+    return candidate
+
+
+class EntryPlanner:
+    """Map archive entry names to safe destination paths, one entry at a time."""
+
+    def __init__(
+        self, dst_dir: Path, *, preserve_tree: bool, flatten: bool, collision: CollisionPolicy
+    ) -> None:
+        self._dst = dst_dir.resolve()
+        self._flatten = flatten or not preserve_tree
+        self._collision = collision
+        self._used: set[str] = set()
+        self._made_dirs: set[Path] = set()
+
+    @property
+    def dst(self) -> Path:
+        return self._dst
+
+    def plan(self, name: str) -> Path:
+        out = Path(name).name if self._flatten else name
+        out = out.lstrip("/")
+        if out in self._used:
+            if self._collision == CollisionPolicy.ERROR:
+                raise FileError(f"Collision while unpacking (flatten={self._flatten}): {out}")
+            if self._collision == CollisionPolicy.RENAME:
+                out = _rename_for_collision(self._used, out)
+            # OVERWRITE keeps out as-is
+        self._used.add(out)
+        dst_path = (self._dst / out).resolve()
+        try:
+            dst_path.relative_to(self._dst)
+        except ValueError:
+            raise FileError(f"Archive entry escapes destination: {name}") from None
+        parent = dst_path.parent
+        if parent not in self._made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(parent)
+        return dst_path
+
+
+class ProgressReporter:
+    """Aggregate byte/file counters and emit throttled progress events."""
+
+    def __init__(
+        self,
+        callback: ProgressCallback | None,
+        *,
+        bytes_total: int | None,
+        files_total: int | None,
+    ) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._bytes_total = bytes_total
+        self._files_total = files_total
+        self.bytes_done = 0
+        self.files_done = 0
+        self._next_emit = PROGRESS_STEP_BYTES
+
+    def add_bytes(self, n: int, entry: str) -> None:
+        with self._lock:
+            self.bytes_done += n
+            if self._callback is not None and self.bytes_done >= self._next_emit:
+                self._next_emit = self.bytes_done + PROGRESS_STEP_BYTES
+                self._emit(entry)
+
+    def file_done(self, entry: str) -> None:
+        with self._lock:
+            self.files_done += 1
+            if self._callback is not None:
+                self._emit(entry)
+
+    def _emit(self, entry: str) -> None:
+        assert self._callback is not None
+        self._callback(
+            OpEvent(
+                op="unpack",
+                phase=OpPhase.PROGRESS,
+                details={
+                    "entry": entry,
+                    "bytes_done": self.bytes_done,
+                    "bytes_total": self._bytes_total,
+                    "files_done": self.files_done,
+                    "files_total": self._files_total,
+                },
+            )
+        )
+
+
+def _copy_stream(src: IO[bytes], dst: IO[bytes], entry: str, progress: ProgressReporter) -> None:
+    while True:
+        chunk = src.read(COPY_BUFSIZE)
+        if not chunk:
+            return
+        dst.write(chunk)
+        progress.add_bytes(len(chunk), entry)
+
+
+def _stored_data_offset(fd: int, info: zipfile.ZipInfo) -> int:
+    header = os.pread(fd, _LOCAL_HEADER.size, info.header_offset)
+    if len(header) != _LOCAL_HEADER.size:
+        raise FileError(f"Truncated zip local header: {info.filename}")
+    fields = _LOCAL_HEADER.unpack(header)
+    if fields[0] != _LOCAL_HEADER_MAGIC:
+        raise FileError(f"Bad zip local header: {info.filename}")
+    name_len, extra_len = fields[10], fields[11]
+    return info.header_offset + _LOCAL_HEADER.size + name_len + extra_len
+
+
+def _copy_stored(
+    fd: int, info: zipfile.ZipInfo, dst_path: Path, progress: ProgressReporter
+) -> None:
+    offset = _stored_data_offset(fd, info)
+    remaining = int(info.file_size)
+    crc = 0
+    with open(dst_path, "wb", buffering=0) as out:
+        while remaining:
+            chunk = os.pread(fd, min(STORED_COPY_BUFSIZE, remaining), offset)
+            if not chunk:
+                raise FileError(f"Truncated zip member: {info.filename}")
+            crc = zlib.crc32(chunk, crc)
+            view = memoryview(chunk)
+            while view:
+                view = view[out.write(view) :]
+            offset += len(chunk)
+            remaining -= len(chunk)
+            progress.add_bytes(len(chunk), info.filename)
+    if crc != info.CRC:
+        raise FileError(f"Bad CRC-32 for zip member: {info.filename}")
+
+
+def extract_zip(
+    abs_src: Path,
+    planner: EntryPlanner,
+    *,
+    workers: int,
+    progress_cb: ProgressCallback | None,
+) -> tuple[int, int]:
+    """Extract all files of a zip archive; return (files, total_bytes)."""
+    with zipfile.ZipFile(abs_src, "r") as zf:
+        infos = sorted((i for i in zf.infolist() if not i.is_dir()), key=lambda i: i.filename)
+    # Plan everything up front (the central directory is already read). With
+    # OVERWRITE the last entry for a path wins, so earlier ones are skipped
+    # instead of racing on the same file.
+    jobs: dict[Path, zipfile.ZipInfo] = {}
+    for info in infos:
+        jobs[planner.plan(info.filename)] = info
+    progress = ProgressReporter(
+        progress_cb,
+        bytes_total=sum(int(i.file_size) for i in jobs.values()),
+        files_total=len(jobs),
+    )
+
+    local = threading.local()
+    handles: list[zipfile.ZipFile] = []
+    handles_lock = threading.Lock()
+    raw_fd = os.open(abs_src, os.O_RDONLY)
+
+    def _zip() -> zipfile.ZipFile:
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = zipfile.ZipFile(abs_src, "r")
+            local.zf = zf
+            with handles_lock:
+                handles.append(zf)
+        return zf
+
+    def _extract_one(item: tuple[Path, zipfile.ZipInfo]) -> None:
+        dst_path, info = item
+        if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+            _copy_stored(raw_fd, info, dst_path, progress)
+        else:
+            with _zip().open(info, "r") as src_f, open(dst_path, "wb") as dst_f:
+                _copy_stream(src_f, dst_f, info.filename, progress)
+        progress.file_done(info.filename)
+
+    # Largest first keeps the pool busy until the end.
+    ordered = sorted(jobs.items(), key=lambda item: int(item[1].file_size), reverse=True)
+    try:
+        if workers <= 1 or len(ordered) <= 1:
+            for item in ordered:
+                _extract_one(item)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="am-unzip") as pool:
+                # list() re-raises the first worker error.
+                list(pool.map(_extract_one, ordered))
+    finally:
+        os.close(raw_fd)
+        for zf in handles:
+            with contextlib.suppress(Exception):
+                zf.close()
+    return progress.files_done, progress.bytes_done
+
+
+def extract_tar_stream(
+    abs_src: Path,
+    planner: EntryPlanner,
+    *,
+    progress_cb: ProgressCallback | None,
+) -> tuple[int, int]:
+    """Stream a (compressed) tar once, then move its files into place.
+
+    Data is written to a staging directory inside the destination while the
+    stream is read. Names are mapped afterwards in sorted order (stable for
+    repeated names), so the result matches plan_unpack.
+    """
+    progress = ProgressReporter(progress_cb, bytes_total=None, files_total=None)
+    planner.dst.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".am-unpack-", dir=planner.dst))
+    staged: list[tuple[str, Path]] = []
+    try:
+        with (
+            open(abs_src, "rb") as raw,
+            tarfile.open(fileobj=raw, mode="r|*", bufsize=COPY_BUFSIZE) as tf,
+        ):
+            for member in tf:
+                if not member.isfile():
+                    continue
+                src_f = tf.extractfile(member)
+                if src_f is None:
+                    continue
+                part = staging / f"{len(staged):08d}"
+                with contextlib.closing(src_f), open(part, "wb") as dst_f:
+                    _copy_stream(src_f, dst_f, member.name, progress)
+                staged.append((member.name, part))
+                progress.file_done(member.name)
+        for name, part in sorted(staged, key=lambda item: item[0]):
+            os.replace(part, planner.plan(name))
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return progress.files_done, progress.bytes_done
+
+
+__all__ = [
+    "COPY_BUFSIZE",
+    "EntryPlanner",
+    "ProgressCallback",
+    "ProgressReporter",
+    "default_unpack_workers",
+    "extract_tar_stream",
+    "extract_zip",
+]
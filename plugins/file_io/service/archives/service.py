@@ -7,7 +7,9 @@ Autodetection is performed only when explicitly requested.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
 import io
 import os
 import shutil
@@ -24,7 +26,16 @@ from audiomason.core.logging import get_logger
 
 from ..service import FileService
 from ..types import RootName
+from . import external
 from .detect import detect_from_magic, detect_from_suffix
+from .external import ExternalEntry, ListingCache
+from .extract import (
+    EntryPlanner,
+    ProgressCallback,
+    default_unpack_workers,
+    extract_tar_stream,
+    extract_zip,
+)
 from .types import (
     ArchiveFormat,
     CollisionPolicy,
@@ -40,7 +51,7 @@ from .types import (
 log = get_logger(__name__)
 
 
-TarReadMode = Literal["r:", "r:gz", "r:xz"]
+TarStreamMode = Literal["r|", "r|gz", "r|xz"]
 TarWriteMode = Literal["w:", "w:gz", "w:xz"]
 
 
@@ -131,6 +142,7 @@ class ArchiveService:
     def __init__(self, file_service: FileService, resolver: ConfigResolver | None = None) -> None:
         self._fs = file_service
         self._resolver = resolver or ConfigResolver(cli_args={})
+        self._listings = ListingCache()
 
     def detect_format(self, root: RootName, rel_path: str) -> DetectedArchiveFormat:
         abs_path = _local_path(self._fs, root, rel_path)
@@ -215,7 +227,16 @@ class ArchiveService:
         allow_external: bool | None = None,
         debug_trace: bool | None = None,
         include_stack: bool | None = None,
+        progress: ProgressCallback | None = None,
+        workers: int | None = None,
     ) -> UnpackResult:
+        """Unpack an archive into dst_root/dst_dir in a single pass.
+
+        progress, if given, receives OpEvent(op="unpack", phase=PROGRESS)
+        events with byte and file counters (possibly from worker threads).
+        workers bounds parallel ZIP member extraction; the default comes from
+        file_io.archives.unpack_workers.
+        """
         _collision = collision or _collision_from_resolver(
             self._resolver, "file_io.archives.flatten.collision", CollisionPolicy.ERROR
         )
@@ -259,6 +280,8 @@ class ArchiveService:
                     preserve_tree,
                     flatten,
                     _collision,
+                    progress=progress,
+                    workers=workers,
                 )
             elif _fmt in (ArchiveFormat.TAR, ArchiveFormat.TAR_GZ, ArchiveFormat.TAR_XZ):
                 files, total = self._unpack_tar(
@@ -270,6 +293,7 @@ class ArchiveService:
                     preserve_tree,
                     flatten,
                     _collision,
+                    progress=progress,
                 )
             else:
                 files, total = self._unpack_external(
@@ -533,12 +557,14 @@ class ArchiveService:
                         [n for n in zf.namelist() if not n.endswith("/")]
                     ), warnings
             if fmt in (ArchiveFormat.TAR, ArchiveFormat.TAR_GZ, ArchiveFormat.TAR_XZ):
+                # Stream mode: one sequential pass, no seeking back into a
+                # compressed stream.
                 mode = cast(
-                    TarReadMode,
-                    {"tar": "r:", "tar.gz": "r:gz", "tar.xz": "r:xz"}[fmt.value],
+                    TarStreamMode,
+                    {"tar": "r|", "tar.gz": "r|gz", "tar.xz": "r|xz"}[fmt.value],
                 )
                 with tarfile.open(name=str(abs_path), mode=mode) as tf:
-                    names = [m.name for m in tf.getmembers() if m.isfile()]
+                    names = [m.name for m in tf if m.isfile()]
                     return _stable_sorted(names), warnings
         if backend == "external":
             entries = self._list_entries_external(fmt, abs_path)
@@ -555,59 +581,24 @@ class ArchiveService:
 
         Raises FileError if no suitable external lister is available.
         """
-        if shutil.which("7z"):
-            # 7z -slt produces stable key/value blocks separated by blank lines.
-            cmd = ["7z", "l", "-slt", str(abs_path)]
-            res = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            entries: list[str] = []
-            cur_path: str | None = None
-            cur_attr: str | None = None
-
-            def _flush() -> None:
-                nonlocal cur_path, cur_attr
-                if not cur_path:
-                    cur_path, cur_attr = None, None
-                    return
-                is_dir = False
-                if cur_attr is not None:
-                    is_dir = cur_attr.strip().startswith("D")
-                if not is_dir:
-                    p = cur_path.replace("\\\\", "/").lstrip("/")
-                    if p and not p.endswith("/"):
-                        entries.append(p)
-                cur_path, cur_attr = None, None
-
-            for line in res.stdout.splitlines():
-                s = line.strip()
-                if not s:
-                    _flush()
-                    continue
-                if s.startswith("Path = "):
-                    cur_path = s.split("=", 1)[1].strip()
-                    continue
-                if s.startswith("Attributes = "):
-                    cur_attr = s.split("=", 1)[1].strip()
-                    continue
-            _flush()
-            return _stable_sorted(entries)
-
-        if fmt == ArchiveFormat.RAR and shutil.which("unrar"):
-            # 'unrar vb' prints bare file names, one per line.
-            cmd = ["unrar", "vb", str(abs_path)]
-            res = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            entries = []
-            for line in res.stdout.splitlines():
-                s = line.strip()
-                if not s:
-                    continue
-                p = s.replace("\\\\", "/").lstrip("/")
-                if p and not p.endswith("/"):
-                    entries.append(p)
-            return _stable_sorted(entries)
-
-        raise FileError(
-            f"No external listing tool available for {fmt.value}; install 7z (preferred) or unrar"
-        )
+        tool = external.pick_tool(fmt)
+        return _stable_sorted(e.path for e in self._external_listing(tool, abs_path))
+
+    def _external_listing(self, tool: str, abs_path: Path) -> list[ExternalEntry]:
+        key = ListingCache.key(tool, abs_path)
+        entries = self._listings.get(key)
+        if entries is None:
+            entries = external.list_entries(tool, abs_path)
+            self._listings.put(key, entries)
+        return entries
+
+    async def _external_listing_async(self, tool: str, abs_path: Path) -> list[ExternalEntry]:
+        key = await asyncio.to_thread(ListingCache.key, tool, abs_path)
+        entries = self._listings.get(key)
+        if entries is None:
+            entries = await external.list_entries_async(tool, abs_path)
+            self._listings.put(key, entries)
+        return entries
 
     def _map_entry_names(
         self,
@@ -653,6 +644,15 @@ class ArchiveService:
                 rels.append(str(p.relative_to(base)).replace(os.sep, "/"))
         return _stable_sorted(rels)
 
+    def _unpack_workers(self, workers: int | None) -> int:
+        if workers is not None:
+            return max(1, int(workers))
+        try:
+            val, _src = self._resolver.resolve("file_io.archives.unpack_workers")
+            return max(1, int(val))
+        except Exception:
+            return default_unpack_workers()
+
     def _unpack_zip(
         self,
         src_root: RootName,
@@ -662,37 +662,18 @@ class ArchiveService:
         preserve_tree: bool,
         flatten: bool,
         collision: CollisionPolicy,
+        *,
+        progress: ProgressCallback | None = None,
+        workers: int | None = None,
     ) -> tuple[int, int]:
         abs_src = _local_path(self._fs, src_root, src_archive_path)
         abs_dst = _local_path(self._fs, dst_root, dst_dir)
-        files = 0
-        total = 0
-        used: set[str] = set()
-        with zipfile.ZipFile(abs_src, "r") as zf:
-            for info in sorted(
-                [i for i in zf.infolist() if not i.is_dir()], key=lambda x: x.filename
-            ):
-                name = info.filename
-                out = name if preserve_tree and not flatten else _apply_flatten(name)
-                out = out.lstrip("/")
-                if out in used:
-                    if collision == CollisionPolicy.ERROR:
-                        raise FileError(f"Collision while unpacking (flatten={flatten}): {out}")
-                    if collision == CollisionPolicy.RENAME:
-                        out = _rename_for_collision(used, out)
-                    # OVERWRITE keeps out as-is
-                used.add(out)
-                dst_path = (abs_dst / out).resolve()
-                try:
-                    dst_path.relative_to(abs_dst.resolve())
-                except ValueError:
-                    raise FileError(f"Archive entry escapes destination: {name}") from None
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                with zf.open(info, "r") as src_f, open(dst_path, "wb") as dst_f:
-                    shutil.copyfileobj(src_f, dst_f)
-                    total += int(info.file_size)
-                files += 1
-        return files, total
+        planner = EntryPlanner(
+            abs_dst, preserve_tree=preserve_tree, flatten=flatten, collision=collision
+        )
+        return extract_zip(
+            abs_src, planner, workers=self._unpack_workers(workers), progress_cb=progress
+        )
 
     def _unpack_tar(
         self,
@@ -704,42 +685,16 @@ class ArchiveService:
         preserve_tree: bool,
         flatten: bool,
         collision: CollisionPolicy,
+        *,
+        progress: ProgressCallback | None = None,
     ) -> tuple[int, int]:
+        # The stream reader detects plain/gz/xz itself; fmt only selected this path.
         abs_src = _local_path(self._fs, src_root, src_archive_path)
         abs_dst = _local_path(self._fs, dst_root, dst_dir)
-        mode = cast(
-            TarReadMode,
-            {"tar": "r:", "tar.gz": "r:gz", "tar.xz": "r:xz"}[fmt.value],
+        planner = EntryPlanner(
+            abs_dst, preserve_tree=preserve_tree, flatten=flatten, collision=collision
         )
-        files = 0
-        total = 0
-        used: set[str] = set()
-        with tarfile.open(name=str(abs_src), mode=mode) as tf:
-            members = [m for m in tf.getmembers() if m.isfile()]
-            for m in sorted(members, key=lambda x: x.name):
-                name = m.name
-                out = name if preserve_tree and not flatten else _apply_flatten(name)
-                out = out.lstrip("/")
-                if out in used:
-                    if collision == CollisionPolicy.ERROR:
-                        raise FileError(f"Collision while unpacking (flatten={flatten}): {out}")
-                    if collision == CollisionPolicy.RENAME:
-                        out = _rename_for_collision(used, out)
-                used.add(out)
-                dst_path = (abs_dst / out).resolve()
-                try:
-                    dst_path.relative_to(abs_dst.resolve())
-                except ValueError:
-                    raise FileError(f"Archive entry escapes destination: {name}") from None
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                f = tf.extractfile(m)
-                if f is None:
-                    continue
-                with contextlib.closing(f), open(dst_path, "wb") as out_f:
-                    shutil.copyfileobj(f, out_f)
-                total += int(m.size)
-                files += 1
-        return files, total
+        return extract_tar_stream(abs_src, planner, progress_cb=progress)
 
     def _unpack_external(
         self,
@@ -754,33 +709,131 @@ class ArchiveService:
     ) -> tuple[int, int]:
         abs_src = _local_path(self._fs, src_root, src_archive_path)
         abs_dst = _local_path(self._fs, dst_root, dst_dir)
+        tool = external.pick_tool(fmt)
+        entries = self._external_listing(tool, abs_src)
+        cmd, post_flatten = self._external_extract_plan(
+            tool, abs_src, abs_dst, entries, preserve_tree=preserve_tree, flatten=flatten
+        )
+        external.run_tool(cmd)
+        return self._external_result(abs_dst, entries, post_flatten, collision)
+
+    async def unpack_async(
+        self,
+        src_root: RootName,
+        src_archive_path: str,
+        dst_root: RootName,
+        dst_dir: str,
+        *,
+        fmt: ArchiveFormat | None = None,
+        autodetect: bool = False,
+        preserve_tree: bool = True,
+        flatten: bool = False,
+        collision: CollisionPolicy | None = None,
+        allow_external: bool | None = None,
+        progress: ProgressCallback | None = None,
+        workers: int | None = None,
+    ) -> UnpackResult:
+        """Unpack without blocking the event loop.
 
-        # For external tools, prefer preserve tree; flatten is supported by post-processing.
-        tool = self._pick_external_unpack_tool(fmt)
-        if tool == "7z":
-            cmd = ["7z", "x", "-y", str(abs_src), f"-o{abs_dst}"]
-        elif tool == "unrar":
-            cmd = ["unrar", "x", "-o+", str(abs_src), str(abs_dst)]
-        else:
-            raise FileError(f"No external unpack tool available for {fmt.value}")
+        External formats (RAR, 7z) run the tool as an asyncio subprocess;
+        cancelling the awaiting task terminates it. Stdlib formats run unpack()
+        in a worker thread, which finishes the current archive when cancelled.
+        """
+        _fmt = await asyncio.to_thread(
+            self._resolve_format, src_root, src_archive_path, fmt=fmt, autodetect=autodetect
+        )
+        if _fmt not in (ArchiveFormat.RAR, ArchiveFormat.SEVEN_Z):
+            return await asyncio.to_thread(
+                functools.partial(
+                    self.unpack,
+                    src_root,
+                    src_archive_path,
+                    dst_root,
+                    dst_dir,
+                    fmt=_fmt,
+                    preserve_tree=preserve_tree,
+                    flatten=flatten,
+                    collision=collision,
+                    allow_external=allow_external,
+                    progress=progress,
+                    workers=workers,
+                )
+            )
 
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _collision = collision or _collision_from_resolver(
+            self._resolver, "file_io.archives.flatten.collision", CollisionPolicy.ERROR
+        )
+        _allow_external = allow_external
+        if _allow_external is None:
+            _allow_external = _bool_from_resolver(
+                self._resolver, "file_io.archives.allow_external", True
+            )
+        backend = self._select_backend_for_unpack(_fmt, allow_external=_allow_external)
+        try:
+            self._fs.mkdir(dst_root, dst_dir, parents=True, exist_ok=True)
+            abs_src = _local_path(self._fs, src_root, src_archive_path)
+            abs_dst = _local_path(self._fs, dst_root, dst_dir)
+            tool = external.pick_tool(_fmt)
+            entries = await self._external_listing_async(tool, abs_src)
+            cmd, post_flatten = self._external_extract_plan(
+                tool, abs_src, abs_dst, entries, preserve_tree=preserve_tree, flatten=flatten
+            )
+            await external.run_tool_async(cmd)
+            files, total = await asyncio.to_thread(
+                self._external_result, abs_dst, entries, post_flatten, _collision
+            )
+        except FileError:
+            raise
+        except (OSError, ValueError) as e:
+            raise FileError(str(e)) from e
+        return UnpackResult(
+            format=_fmt,
+            backend=backend,
+            dst_root=dst_root.value,
+            dst_dir=dst_dir,
+            files_unpacked=files,
+            total_bytes=total,
+            warnings=[],
+            trace=[],
+        )
 
-        # Optionally flatten.
-        if flatten or not preserve_tree:
+    def _external_extract_plan(
+        self,
+        tool: str,
+        abs_src: Path,
+        abs_dst: Path,
+        entries: list[ExternalEntry],
+        *,
+        preserve_tree: bool,
+        flatten: bool,
+    ) -> tuple[list[str], bool]:
+        """Return (command, needs_post_flatten) for an external extraction.
+
+        When flattening and the listing shows no basename collisions, the
+        tool extracts flat itself and no post-pass over the output is needed.
+        """
+        if not (flatten or not preserve_tree):
+            return external.extract_command(tool, abs_src, abs_dst, flat=False), False
+        names = [Path(e.path).name for e in entries]
+        if len(set(names)) == len(names):
+            return external.extract_command(tool, abs_src, abs_dst, flat=True), False
+        return external.extract_command(tool, abs_src, abs_dst, flat=False), True
+
+    def _external_result(
+        self,
+        abs_dst: Path,
+        entries: list[ExternalEntry],
+        post_flatten: bool,
+        collision: CollisionPolicy,
+    ) -> tuple[int, int]:
+        if post_flatten:
             files = self._flatten_dir(abs_dst, collision=collision)
-        else:
-            files = [p for p in abs_dst.rglob("*") if p.is_file()]
-        total = sum(p.stat().st_size for p in files)
-        return len(files), total
-
-    def _pick_external_unpack_tool(self, fmt: ArchiveFormat) -> str:
-        # Currently only for RAR/7Z.
-        if shutil.which("7z"):
-            return "7z"
-        if fmt == ArchiveFormat.RAR and shutil.which("unrar"):
-            return "unrar"
-        raise FileError(f"No external backend found for {fmt.value}; install 7z or unrar")
+            return len(files), sum(p.stat().st_size for p in files)
+        sizes = [e.size for e in entries]
+        if entries and all(size is not None for size in sizes):
+            return len(entries), sum(int(size or 0) for size in sizes)
+        files = [p for p in abs_dst.rglob("*") if p.is_file()]
+        return len(files), sum(p.stat().st_size for p in files)
 
     def _flatten_dir(self, base: Path, *, collision: CollisionPolicy) -> list[Path]:
         files = [p for p in base.rglob("*") if p.is_file()]
@@ -28,6 +28,7 @@ class CollisionPolicy(StrEnum):
 class OpPhase(StrEnum):
     PLANNED = "planned"
     STARTED = "started"
+    PROGRESS = "progress"
     OK = "ok"
     ERROR = "error"
 
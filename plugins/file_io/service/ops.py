@@ -12,7 +12,7 @@ from pathlib import Path
 from audiomason.core.errors import FileError
 
 from .paths import RootConfig, resolve_path
-from .types import FileEntry, FileStat
+from .types import DirNames, FileEntry, FileStat
 
 
 class NotFoundError(FileError):
@@ -75,6 +75,33 @@ def list_dir(root: RootConfig, rel_path: str, *, recursive: bool = False) -> lis
     return entries
 
 
+def list_names(root: RootConfig, rel_path: str) -> DirNames:
+    """Return the entry names of one directory from a single scandir pass.
+
+    Unlike list_dir, entries are not stat'ed. Dangling symlinks are omitted so
+    that membership matches exists().
+    """
+    base = resolve_path(root.dir_path, rel_path, root_name=root.name)
+    try:
+        st = base.stat()
+    except FileNotFoundError as exc:
+        raise NotFoundError(f"Not found: {rel_path}") from exc
+    if not base.is_dir():
+        raise NotADirectoryError(f"Not a directory: {rel_path}")
+
+    names: set[str] = set()
+    with os.scandir(base) as it:
+        for entry in it:
+            if entry.is_symlink() and not os.path.exists(entry.path):
+                continue
+            names.add(entry.name)
+    return DirNames(
+        rel_path=base.relative_to(root.dir_path).as_posix(),
+        names=frozenset(names),
+        mtime_ns=int(st.st_mtime_ns),
+    )
+
+
 def stat_path(root: RootConfig, rel_path: str) -> FileStat:
     abs_path = resolve_path(root.dir_path, rel_path, root_name=root.name)
     if not abs_path.exists():
@@ -25,15 +25,19 @@ from .ops import copy as op_copy
 from .ops import delete_file as op_delete_file
 from .ops import exists as op_exists
 from .ops import list_dir as op_list_dir
+from .ops import list_names as op_list_names
 from .ops import mkdir as op_mkdir
 from .ops import rename as op_rename
 from .ops import rmdir as op_rmdir
 from .ops import rmtree as op_rmtree
 from .ops import stat_path as op_stat
 from .paths import RootConfig, resolve_path
+from .snapshots import TreeSnapshot
+from .snapshots import scan_tree as op_scan_tree
 from .streams import open_append, open_read, open_write
 from .streams import tail_bytes as stream_tail_bytes
-from .types import FileEntry, FileStat, RootName
+from .transfer import move_tree
+from .types import DirNames, FileEntry, FileStat, RootName
 
 _logger = get_logger(__name__)
 
@@ -311,6 +315,41 @@ class FileService:
             summary["dirs_count"] = sum(1 for e in entries if e.is_dir)
             return entries
 
+    def list_names(self, root: RootName, rel_path: str = ".") -> DirNames:
+        """Return entry names of one directory without stat'ing each entry."""
+        abs_path = resolve_path(self._root(root).dir_path, rel_path, root_name=root)
+        base = {"root": root.value, "rel_path": rel_path, "resolved_path": str(abs_path)}
+        with _observe_operation(operation="file_io.list_names", base=base) as summary:
+            listing = op_list_names(self._root(root), rel_path)
+            summary["items_count"] = len(listing.names)
+            return listing
+
+    def scan_tree(
+        self,
+        root: RootName,
+        rel_path: str = ".",
+        *,
+        previous: TreeSnapshot | None = None,
+    ) -> TreeSnapshot:
+        """Snapshot the directory tree below rel_path.
+
+        When previous is given, only directories whose mtime changed are
+        re-listed; unchanged subtrees are reused from previous.
+        """
+        abs_path = resolve_path(self._root(root).dir_path, rel_path, root_name=root)
+        base = {
+            "root": root.value,
+            "rel_path": rel_path,
+            "resolved_path": str(abs_path),
+            "incremental": previous is not None,
+        }
+        with _observe_operation(operation="file_io.scan_tree", base=base) as summary:
+            snapshot = op_scan_tree(self._root(root), rel_path, previous=previous)
+            summary["dirs_count"] = snapshot.dirs_listed + snapshot.dirs_reused
+            summary["dirs_listed"] = snapshot.dirs_listed
+            summary["dirs_reused"] = snapshot.dirs_reused
+            return snapshot
+
     def stat(self, root: RootName, rel_path: str) -> FileStat:
         abs_path = resolve_path(self._root(root).dir_path, rel_path, root_name=root)
         base = {"root": root.value, "rel_path": rel_path, "resolved_path": str(abs_path)}
@@ -476,6 +515,52 @@ class FileService:
             else:
                 shutil.copy2(src_abs, dst_abs)
 
+    def move_path(
+        self,
+        src_root: RootName,
+        src_rel_path: str,
+        dst_root: RootName,
+        dst_rel_path: str,
+        *,
+        overwrite: bool = False,
+        mkdir_parents: bool = True,
+    ) -> str:
+        """Move a file or directory tree between roots.
+
+        Uses an atomic rename when both paths are on the same filesystem and
+        a streamed copy plus source removal otherwise. Returns "rename" or
+        "copy".
+        """
+        src_abs = resolve_path(self._root(src_root).dir_path, src_rel_path, root_name=src_root)
+        dst_abs = resolve_path(self._root(dst_root).dir_path, dst_rel_path, root_name=dst_root)
+        base = {
+            "root": src_root.value,
+            "rel_path": src_rel_path,
+            "src_root": src_root.value,
+            "src": src_rel_path,
+            "dst_root": dst_root.value,
+            "dst": dst_rel_path,
+            "resolved_path": str(src_abs),
+            "resolved_dst_path": str(dst_abs),
+            "overwrite": bool(overwrite),
+            "mkdir_parents": bool(mkdir_parents),
+        }
+        with _observe_operation(operation="file_io.move_path", base=base) as summary:
+            if not src_abs.exists():
+                raise NotFoundError(f"Not found: {src_rel_path}")
+            if dst_abs.exists():
+                if not overwrite:
+                    raise AlreadyExistsError(f"Destination exists: {dst_rel_path}")
+                if dst_abs.is_dir():
+                    shutil.rmtree(dst_abs)
+                else:
+                    dst_abs.unlink()
+            if mkdir_parents:
+                dst_abs.parent.mkdir(parents=True, exist_ok=True)
+            method = move_tree(src_abs, dst_abs)
+            summary["method"] = method
+            return method
+
     def checksum(self, root: RootName, rel_path: str, *, algo: str = "sha256") -> str:
         abs_path = resolve_path(self._root(root).dir_path, rel_path, root_name=root)
         base = {
@@ -0,0 +1,306 @@
+"""Incremental directory-tree snapshots for file_io.
+
+A snapshot records, per directory, its mtime, the names of its non-directory
+entries, its child directories, and a Merkle digest over the listing. A
+rescan against a previous snapshot only re-lists directories whose mtime
+changed; unchanged directories cost a single stat.
+
+Directory mtimes only change when entries are added, removed, or renamed, so
+snapshots describe names and kinds, not file contents or sizes.
+
+Like Path.rglob, a child directory that cannot be listed (unreadable, or
+removed mid-scan) is skipped rather than failing the scan. Its parent is
+then stored with mtime 0, so the next scan lists it again.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat as stat_mod
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .ops import NotADirectoryError, NotFoundError
+from .paths import RootConfig, resolve_path
+
+SNAPSHOT_VERSION = 1
+
+# Directories modified this close to the previous scan are always re-listed,
+# because coarse mtime granularity could hide a change made in the same tick.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class DirSnapshot:
+    """Listing of one directory inside a tree snapshot."""
+
+    mtime_ns: int
+    digest: str
+    files: tuple[str, ...]
+    dirs: dict[str, DirSnapshot] = field(default_factory=dict)
+    is_link: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "mtime_ns": self.mtime_ns,
+            "digest": self.digest,
+            "files": list(self.files),
+            "dirs": {name: child.to_dict() for name, child in self.dirs.items()},
+        }
+        if self.is_link:
+            out["is_link"] = True
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DirSnapshot:
+        dirs_any = data.get("dirs")
+        dirs = (
+            {str(name): cls.from_dict(child) for name, child in dirs_any.items()}
+            if isinstance(dirs_any, dict)
+            else {}
+        )
+        return cls(
+            mtime_ns=int(data.get("mtime_ns") or 0),
+            digest=str(data.get("digest") or ""),
+            files=tuple(str(name) for name in data.get("files") or []),
+            dirs=dirs,
+            is_link=bool(data.get("is_link")),
+        )
+
+
+_LINK_DIGEST = hashlib.sha256(b"link").hexdigest()
+_LINK_SNAPSHOT = DirSnapshot(mtime_ns=0, digest=_LINK_DIGEST, files=(), is_link=True)
+
+
+@dataclass(frozen=True)
+class TreeSnapshot:
+    """Snapshot of the tree below rel_path, plus scan statistics."""
+
+    rel_path: str
+    scanned_ns: int
+    tree: DirSnapshot
+    dirs_listed: int = 0
+    dirs_reused: int = 0
+
+    @property
+    def digest(self) -> str:
+        return self.tree.digest
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "rel_path": self.rel_path,
+            "scanned_ns": self.scanned_ns,
+            "tree": self.tree.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> TreeSnapshot | None:
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return None
+        tree_any = data.get("tree")
+        if not isinstance(tree_any, dict):
+            return None
+        return cls(
+            rel_path=str(data.get("rel_path") or ""),
+            scanned_ns=int(data.get("scanned_ns") or 0),
+            tree=DirSnapshot.from_dict(tree_any),
+        )
+
+    def iter_entries(self) -> list[tuple[str, bool]]:
+        """Return (rel_path, is_dir) for every entry below the snapshot base.
+
+        Paths are relative to the root, like FileService.list_dir.
+        """
+        out: list[tuple[str, bool]] = []
+        prefix = "" if self.rel_path in ("", ".") else self.rel_path.rstrip("/") + "/"
+        stack: list[tuple[str, DirSnapshot]] = [(prefix, self.tree)]
+        while stack:
+            base, node = stack.pop()
+            for name in node.files:
+                out.append((base + name, False))
+            for name, child in node.dirs.items():
+                out.append((base + name, True))
+                stack.append((base + name + "/", child))
+        return out
+
+
+def _dir_digest(files: tuple[str, ...], dirs: dict[str, DirSnapshot]) -> str:
+    h = hashlib.sha256()
+    for name in files:
+        h.update(b"f\0" + name.encode("utf-8", "surrogateescape") + b"\n")
+    for name in sorted(dirs):
+        h.update(b"d\0" + name.encode("utf-8", "surrogateescape") + b"\0")
+        h.update(dirs[name].digest.encode("ascii") + b"\n")
+    return h.hexdigest()
+
+
+def _scan_child(
+    path: str,
+    *,
+    mtime_ns: int,
+    previous: DirSnapshot | None,
+    previous_scan_ns: int,
+    counters: _Counters,
+) -> DirSnapshot | None:
+    """Scan a child directory; None if it cannot be listed."""
+    try:
+        return _scan_dir(
+            path,
+            mtime_ns=mtime_ns,
+            previous=previous,
+            previous_scan_ns=previous_scan_ns,
+            counters=counters,
+        )
+    except OSError:
+        return None
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.listed = 0
+        self.reused = 0
+
+
+def _scan_dir(
+    path: str,
+    *,
+    mtime_ns: int,
+    previous: DirSnapshot | None,
+    previous_scan_ns: int,
+    counters: _Counters,
+) -> DirSnapshot:
+    reusable = (
+        previous is not None
+        and previous.mtime_ns == mtime_ns
+        and mtime_ns < previous_scan_ns - RACY_WINDOW_NS
+    )
+    if reusable and previous is not None:
+        counters.reused += 1
+        dirs: dict[str, DirSnapshot] = {}
+        for name, child_prev in previous.dirs.items():
+            if child_prev.is_link:
+                dirs[name] = child_prev
+                continue
+            child_path = os.path.join(path, name)
+            try:
+                st = os.lstat(child_path)
+            except FileNotFoundError:
+                # Vanished between listings: the parent mtime must have moved.
+                return _scan_dir(
+                    path,
+                    mtime_ns=mtime_ns,
+                    previous=None,
+                    previous_scan_ns=previous_scan_ns,
+                    counters=counters,
+                )
+            except OSError:
+                continue
+            child = _scan_child(
+                child_path,
+                mtime_ns=st.st_mtime_ns,
+                previous=child_prev,
+                previous_scan_ns=previous_scan_ns,
+                counters=counters,
+            )
+            if child is not None:
+                dirs[name] = child
+        complete = len(dirs) == len(previous.dirs)
+        if complete and all(dirs[name] is previous.dirs[name] for name in dirs):
+            return previous
+        return DirSnapshot(
+            mtime_ns=mtime_ns if complete else 0,
+            digest=_dir_digest(previous.files, dirs),
+            files=previous.files,
+            dirs=dirs,
+        )
+
+    counters.listed += 1
+    prev_dirs = previous.dirs if previous is not None else {}
+    files: list[str] = []
+    child_dirs: list[tuple[str, int, bool]] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+                continue
+            # Like Path.rglob: symlinked directories are listed, never descended.
+            try:
+                is_link = entry.is_symlink()
+                child_mtime = 0 if is_link else entry.stat(follow_symlinks=False).st_mtime_ns
+            except OSError:
+                # Removed since the listing; the parent mtime has moved on.
+                continue
+            child_dirs.append((entry.name, child_mtime, is_link))
+
+    dirs = {}
+    for name, child_mtime, is_link in sorted(child_dirs):
+        if is_link:
+            dirs[name] = _LINK_SNAPSHOT
+            continue
+        child = _scan_child(
+            os.path.join(path, name),
+            mtime_ns=child_mtime,
+            previous=prev_dirs.get(name),
+            previous_scan_ns=previous_scan_ns,
+            counters=counters,
+        )
+        if child is not None:
+            dirs[name] = child
+    complete = len(dirs) == len(child_dirs)
+    files_t = tuple(sorted(files))
+    return DirSnapshot(
+        mtime_ns=mtime_ns if complete else 0,
+        digest=_dir_digest(files_t, dirs),
+        files=files_t,
+        dirs=dirs,
+    )
+
+
+def scan_tree(
+    root: RootConfig,
+    rel_path: str,
+    *,
+    previous: TreeSnapshot | None = None,
+) -> TreeSnapshot:
+    """Snapshot the tree below rel_path, reusing unchanged parts of previous."""
+    base = resolve_path(root.dir_path, rel_path, root_name=root.name)
+    try:
+        st = os.stat(base)
+    except FileNotFoundError as exc:
+        raise NotFoundError(f"Not found: {rel_path}") from exc
+    if not stat_mod.S_ISDIR(st.st_mode):
+        raise NotADirectoryError(f"Not a directory: {rel_path}")
+
+    rel_norm = Path(base).relative_to(root.dir_path).as_posix()
+    if previous is not None and previous.rel_path != rel_norm:
+        previous = None
+
+    scanned_ns = time.time_ns()
+    counters = _Counters()
+    tree = _scan_dir(
+        str(base),
+        mtime_ns=st.st_mtime_ns,
+        previous=previous.tree if previous is not None else None,
+        previous_scan_ns=previous.scanned_ns if previous is not None else 0,
+        counters=counters,
+    )
+    return TreeSnapshot(
+        rel_path=rel_norm,
+        scanned_ns=scanned_ns,
+        tree=tree,
+        dirs_listed=counters.listed,
+        dirs_reused=counters.reused,
+    )
+
+
+__all__ = ["DirSnapshot", "TreeSnapshot", "scan_tree"]
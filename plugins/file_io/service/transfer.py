@@ -0,0 +1,168 @@
+"""Move files and directory trees between roots without redundant copies.
+
+When source and destination live on the same filesystem, a move is a single
+atomic rename. Across filesystems the tree is streamed into a hidden sibling
+of the destination with copy_file_range (falling back to sendfile, then to a
+buffered copy), every copied file and directory is fsynced in one pass at
+the end, the sibling is renamed into place, and only then is the source
+removed. Readers of the destination never see a partially written tree.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+from pathlib import Path
+
+MOVE_RENAME = "rename"
+MOVE_COPY = "copy"
+
+_CHUNK = 64 * 1024 * 1024
+
+
+def same_device(src: Path, dst_dir: Path) -> bool:
+    """Return True if src and the existing directory dst_dir share a device."""
+    try:
+        return os.lstat(src).st_dev == os.stat(dst_dir).st_dev
+    except OSError:
+        return False
+
+
+def _short_copy(done: int, size: int) -> OSError:
+    return OSError(errno.EIO, f"short copy: {done} of {size} bytes (source shrank?)")
+
+
+def _copy_fd_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy size bytes with copy_file_range; False means use another method.
+
+    Some filesystems report 0 bytes instead of an error when they cannot copy
+    in-kernel; with nothing copied yet that falls back, midway it is an error.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+    copied = 0
+    try:
+        while copied < size:
+            n = copy_file_range(src_fd, dst_fd, min(_CHUNK, size - copied))
+            if n == 0:
+                if copied == 0:
+                    return False
+                raise _short_copy(copied, size)
+            copied += n
+    except OSError as exc:
+        if copied == 0 and exc.errno in {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}:
+            return False
+        raise
+    return True
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> bool:
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is None:
+        return False
+    offset = 0
+    try:
+        while offset < size:
+            n = sendfile(dst_fd, src_fd, offset, min(_CHUNK, size - offset))
+            if n == 0:
+                if offset == 0:
+                    return False
+                raise _short_copy(offset, size)
+            offset += n
+    except OSError as exc:
+        if offset == 0 and exc.errno in {errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK}:
+            return False
+        raise
+    return True
+
+
+def copy_file_streaming(src: Path, dst: Path) -> None:
+    """Copy one file's data and metadata in-kernel where the OS allows it.
+
+    The caller is responsible for fsync.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if not (
+            _copy_fd_range(fsrc.fileno(), fdst.fileno(), size)
+            or _sendfile(fsrc.fileno(), fdst.fileno(), size)
+        ):
+            shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    shutil.copystat(src, dst)
+
+
+def _fsync_path(path: Path, *, directory: bool) -> None:
+    flags = os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _copy_tree(src: Path, dst: Path) -> tuple[list[Path], list[Path]]:
+    files: list[Path] = []
+    dirs: list[Path] = []
+    if src.is_symlink() or not src.is_dir():
+        if src.is_symlink():
+            os.symlink(os.readlink(src), dst)
+        else:
+            copy_file_streaming(src, dst)
+            files.append(dst)
+        return files, dirs
+
+    dst.mkdir()
+    dirs.append(dst)
+    for entry in sorted(src.iterdir(), key=lambda p: p.name):
+        child_files, child_dirs = _copy_tree(entry, dst / entry.name)
+        files.extend(child_files)
+        dirs.extend(child_dirs)
+    shutil.copystat(src, dst)
+    return files, dirs
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+def move_tree(src: Path, dst: Path) -> str:
+    """Move src to dst (which must not exist) and return the method used."""
+    if same_device(src, dst.parent):
+        try:
+            os.rename(src, dst)
+            return MOVE_RENAME
+        except OSError as exc:
+            # Bind mounts and overlay filesystems can share st_dev yet refuse.
+            if exc.errno != errno.EXDEV:
+                raise
+
+    tmp = dst.parent / f".{dst.name}.am2-move-{os.getpid()}"
+    _remove(tmp)
+    try:
+        files, dirs = _copy_tree(src, tmp)
+        for path in files:
+            _fsync_path(path, directory=False)
+        for path in reversed(dirs):
+            _fsync_path(path, directory=True)
+        os.rename(tmp, dst)
+        _fsync_path(dst.parent, directory=True)
+    except BaseException:
+        _remove(tmp)
+        raise
+    _remove(src)
+    return MOVE_COPY
+
+
+__all__ = ["MOVE_COPY", "MOVE_RENAME", "copy_file_streaming", "move_tree", "same_device"]
@@ -38,3 +38,12 @@ class FileStat:
     is_dir: bool
     size: int
     mtime: float
+
+
+@dataclass(frozen=True)
+class DirNames:
+    """Entry names of one directory returned by list_names."""
+
+    rel_path: str
+    names: frozenset[str]
+    mtime_ns: int
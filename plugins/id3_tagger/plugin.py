@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 from typing import Any
 
 from audiomason.core import ProcessingContext
-from audiomason.core.errors import AudioMasonError
+from audiomason.core.cancellation import run_subprocess
+from audiomason.core.errors import AudioMasonError, OperationCancelledError
 
 
 class ID3Error(AudioMasonError):
@@ -164,19 +164,16 @@ class ID3TaggerPlugin:
         )
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _stdout, stderr = await proc.communicate()
-            if proc.returncode != 0:
+            returncode, _stdout, stderr = await run_subprocess(cmd)
+            if returncode != 0:
                 error_msg = stderr.decode() if stderr else "Unknown error"
                 raise ID3Error(f"Tagging failed: {error_msg}")
             temp_file.replace(mp3_file)
         except Exception as e:
             if temp_file.exists():
                 temp_file.unlink()
+            if isinstance(e, OperationCancelledError):
+                raise
             raise ID3Error(f"Failed to tag {mp3_file.name}: {e}") from e
 
     def _ordered_tags(self, tags: dict[str, str]) -> dict[str, str]:
@@ -298,15 +295,9 @@ class ID3TaggerPlugin:
         ]
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            returncode, stdout, _stderr = await run_subprocess(cmd)
 
-            stdout, _stderr = await proc.communicate()
-
-            if proc.returncode != 0:
+            if returncode != 0:
                 return {}
 
             metadata = {}
@@ -319,5 +310,7 @@ class ID3TaggerPlugin:
 
             return metadata
 
+        except OperationCancelledError:
+            raise
         except Exception:
             return {}
@@ -0,0 +1,121 @@
+"""Process-wide wizard callable authority for the import plugin.
+
+call.invoke, the metadata boundary and the cover boundary resolve published
+wizard callables through one shared PluginRegistry/PluginLoader pair, so the
+callable publication cache stays warm and plugin instances are reused across
+calls. The pair is rebuilt when a plugin manifest, a wizard callable manifest,
+or the user config file changes on disk; that check runs at most once per
+RECHECK_INTERVAL_S.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+
+from audiomason.core.config_service import ConfigService
+from audiomason.core.errors import PluginError
+from audiomason.core.loader import PluginLoader
+from audiomason.core.plugin_registry import PluginRegistry
+
+RECHECK_INTERVAL_S = 2.0
+
+_Stamp = tuple[tuple[str, tuple[int, int] | None], ...]
+
+
+@dataclass(frozen=True)
+class _Authority:
+    registry: PluginRegistry
+    loader: PluginLoader
+    config: ConfigService
+    stamp: _Stamp
+
+
+_lock = threading.Lock()
+_authority: _Authority | None = None
+_checked_at = 0.0
+
+
+def _builtin_plugins_dir() -> Path:
+    plugins_pkg = import_module("plugins")
+    pkg_file = getattr(plugins_pkg, "__file__", None)
+    if not isinstance(pkg_file, str) or not pkg_file:
+        raise RuntimeError("plugins package path unavailable")
+    return Path(pkg_file).resolve().parent
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _authority_stamp(*, loader: PluginLoader, config: ConfigService) -> _Stamp:
+    items: list[tuple[str, tuple[int, int] | None]] = [
+        (str(config.user_config_path), _file_stamp(config.user_config_path))
+    ]
+    for plugin_dir in loader.discover():
+        manifest_path = plugin_dir / "plugin.yaml"
+        items.append((str(manifest_path), _file_stamp(manifest_path)))
+        try:
+            pointer = loader.load_manifest_only(plugin_dir).wizard_callable_manifest_pointer
+        except PluginError:
+            continue
+        if pointer:
+            callable_path = plugin_dir / pointer
+            items.append((str(callable_path), _file_stamp(callable_path)))
+    return tuple(items)
+
+
+def _build_authority() -> _Authority:
+    config = ConfigService()
+    registry = PluginRegistry(config)
+    loader = PluginLoader(
+        builtin_plugins_dir=_builtin_plugins_dir(),
+        registry=registry,
+    )
+    return _Authority(
+        registry=registry,
+        loader=loader,
+        config=config,
+        stamp=_authority_stamp(loader=loader, config=config),
+    )
+
+
+def callable_authority() -> tuple[PluginRegistry, PluginLoader]:
+    """Return the shared registry and loader, rebuilding them if stale."""
+    global _authority, _checked_at
+    now = time.monotonic()
+    authority = _authority
+    if authority is not None and now - _checked_at < RECHECK_INTERVAL_S:
+        return authority.registry, authority.loader
+
+    with _lock:
+        authority = _authority
+        if authority is None:
+            authority = _build_authority()
+        elif now - _checked_at >= RECHECK_INTERVAL_S:
+            stamp = _authority_stamp(loader=authority.loader, config=authority.config)
+            if stamp != authority.stamp:
+                authority = _build_authority()
+        _authority = authority
+        _checked_at = now
+    return authority.registry, authority.loader
+
+
+def invalidate_callable_authority() -> None:
+    """Drop the shared authority; the next call rebuilds it."""
+    global _authority, _checked_at
+    with _lock:
+        _authority = None
+        _checked_at = 0.0
+
+
+__all__ = ["RECHECK_INTERVAL_S", "callable_authority", "invalidate_callable_authority"]
@@ -2,14 +2,67 @@
 
 This scans for existing target paths before creating jobs.
 
+Targets are grouped by parent directory and each parent is listed once
+(FileService.list_names) instead of stat'ing every target. An optional
+TargetTreeCache keeps those listings for a few seconds so that rescans
+between wizard steps do not touch the library root again.
+
 ASCII-only.
 """
 
 from __future__ import annotations
 
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 
 from plugins.file_io.service import FileService, RootName
+from plugins.file_io.service.ops import NotADirectoryError, NotFoundError
+
+DEFAULT_TARGET_CACHE_TTL_S = 5.0
+
+
+class TargetTreeCache:
+    """Short-lived cache of target parent-directory listings.
+
+    Entries expire after ttl_s seconds. A parent that does not exist (or is
+    not a directory) is cached as None.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = DEFAULT_TARGET_CACHE_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_s = float(ttl_s)
+        self._clock = clock
+        self._entries: dict[tuple[str, str, str], tuple[float, frozenset[str] | None]] = {}
+        self._lock = threading.Lock()
+
+    def names(self, fs: FileService, root: RootName, parent_rel: str) -> frozenset[str] | None:
+        key = (str(fs.root_dir(root)), root.value, parent_rel)
+        now = self._clock()
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and now - hit[0] < self._ttl_s:
+                return hit[1]
+        names = _list_parent(fs, root, parent_rel)
+        with self._lock:
+            self._entries[key] = (now, names)
+        return names
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _list_parent(fs: FileService, root: RootName, parent_rel: str) -> frozenset[str] | None:
+    try:
+        return fs.list_names(root, parent_rel or ".").names
+    except (NotFoundError, NotADirectoryError):
+        return None
 
 
 def _normalize_rel_path(rel_path: str) -> str:
@@ -39,10 +92,13 @@ def scan_conflicts(
     *,
     plan: dict[str, Any],
     mode: str,
+    cache: TargetTreeCache | None = None,
 ) -> list[dict[str, Any]]:
     """Return a canonical list of conflicts derived from plan.json.
 
     Conflict scan MUST operate on planned outputs, not raw discovery.
+    Each target parent directory is listed at most once per scan, or once
+    per cache lifetime when a cache is given.
     """
 
     tgt_root = _target_root(str(mode))
@@ -63,7 +119,7 @@ def scan_conflicts(
                     }
                 ]
 
-    conflicts: list[dict[str, Any]] = []
+    targets: list[tuple[str, str]] = []
     for it in selected_any:
         if not isinstance(it, dict):
             continue
@@ -78,13 +134,25 @@ def scan_conflicts(
         if not rel:
             # Root output is not a meaningful conflict target.
             continue
+        targets.append((rel, book_id_any))
 
-        if fs.exists(tgt_root, rel):
+    listings: dict[str, frozenset[str] | None] = {}
+    conflicts: list[dict[str, Any]] = []
+    for rel, book_id in targets:
+        parent, _, name = rel.rpartition("/")
+        if parent not in listings:
+            listings[parent] = (
+                cache.names(fs, tgt_root, parent)
+                if cache is not None
+                else _list_parent(fs, tgt_root, parent)
+            )
+        names = listings[parent]
+        if names is not None and name in names:
             conflicts.append(
                 {
                     "target_relative_path": rel,
                     "reason": "exists",
-                    "source_book_id": book_id_any,
+                    "source_book_id": book_id,
                 }
             )
 
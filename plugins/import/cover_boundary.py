@@ -7,20 +7,16 @@ ASCII-only.
 
 from __future__ import annotations
 
-from functools import lru_cache
-from importlib import import_module
 from pathlib import Path
 from typing import Any, Protocol, cast
 
-from audiomason.core.config_service import ConfigService
 from audiomason.core.errors import PluginError, PluginNotFoundError
-from audiomason.core.loader import PluginLoader
 from audiomason.core.plugin_callable_authority import (
     RegisteredWizardCallable,
     resolve_registered_wizard_callable,
 )
-from audiomason.core.plugin_registry import PluginRegistry
 
+from .callable_authority import callable_authority
 from .file_io_boundary import (
     join_source_relative_path,
     materialize_local_path,
@@ -56,24 +52,6 @@ class _ApplyCoverCallable(Protocol):
     ) -> dict[str, str] | None: ...
 
 
-def _builtin_plugins_dir() -> Path:
-    plugins_pkg = import_module("plugins")
-    pkg_file = getattr(plugins_pkg, "__file__", None)
-    if not isinstance(pkg_file, str) or not pkg_file:
-        raise RuntimeError("plugins package path unavailable")
-    return Path(pkg_file).resolve().parent
-
-
-@lru_cache(maxsize=1)
-def _callable_authority() -> tuple[PluginRegistry, PluginLoader]:
-    registry = PluginRegistry(ConfigService())
-    loader = PluginLoader(
-        builtin_plugins_dir=_builtin_plugins_dir(),
-        registry=registry,
-    )
-    return registry, loader
-
-
 _LEGACY_METHOD_ALIASES = {
     "cover.discover_candidates_for_ref": ("discover_cover_candidates",),
     "cover.apply_candidate_for_ref": ("apply_cover_candidate",),
@@ -211,7 +189,7 @@ def _published_wizard_callable(
     expected_execution_mode: str,
     plugin_obj: object | None = None,
 ) -> object:
-    registry, loader = _callable_authority()
+    registry, loader = callable_authority()
     published = registry.resolve_wizard_callable(operation_id, loader=loader)
     if published.execution_mode != expected_execution_mode:
         raise RuntimeError(
@@ -1,13 +1,24 @@
 """Deterministic discovery (PHASE 0) for import wizard engine.
 
+Discovery keeps a persistent directory-tree snapshot per root/path (see
+file_io TreeSnapshot). Re-discovery only re-lists directories whose mtime
+changed; when the snapshot's Merkle digest is unchanged, the previous
+discovery set and its fingerprint are reused as-is.
+
 ASCII-only.
 """
 
 from __future__ import annotations
 
+import json
+import threading
 from dataclasses import dataclass
+from typing import Any
+
+from plugins.file_io.service import FileEntry, FileService, RootName, TreeSnapshot
 
-from plugins.file_io.service import FileEntry, FileService, RootName
+from .fingerprints import fingerprint_json, sha256_hex
+from .storage import atomic_write_json
 
 _BUNDLE_EXTS = {
     ".zip",
@@ -40,16 +51,26 @@ def _normalize_rel_path(rel_path: str) -> str:
     return "/".join(segments)
 
 
-def _kind(entry: FileEntry) -> str:
-    if entry.is_dir:
+_BUNDLE_EXTS_LONGEST_FIRST = tuple(sorted(_BUNDLE_EXTS, key=len, reverse=True))
+
+SNAPSHOT_DIR = "import/discovery_snapshots"
+_MEMORY_CACHE_MAX = 8
+
+
+def _kind_for(rel_path: str, *, is_dir: bool) -> str:
+    if is_dir:
         return "dir"
-    name = entry.rel_path.lower()
-    for ext in sorted(_BUNDLE_EXTS, key=len, reverse=True):
+    name = rel_path.lower()
+    for ext in _BUNDLE_EXTS_LONGEST_FIRST:
         if name.endswith(ext):
             return "bundle"
     return "file"
 
 
+def _kind(entry: FileEntry) -> str:
+    return _kind_for(entry.rel_path, is_dir=entry.is_dir)
+
+
 @dataclass(frozen=True)
 class DiscoveryItem:
     item_id: str
@@ -66,21 +87,34 @@ class DiscoveryItem:
         }
 
 
-def run_discovery(fs: FileService, *, root: str, relative_path: str) -> list[dict[str, str]]:
-    root_enum = RootName(root)
-    base_rel = _normalize_rel_path(relative_path)
+@dataclass(frozen=True)
+class DiscoveryResult:
+    items: list[dict[str, str]]
+    fingerprint: str
+    tree_digest: str | None = None
+
+
+@dataclass(frozen=True)
+class _CachedDiscovery:
+    snapshot: TreeSnapshot
+    items: list[dict[str, str]]
+    fingerprint: str
+
+
+_memory_cache: dict[tuple[str, str, str], _CachedDiscovery] = {}
+_memory_lock = threading.Lock()
 
-    entries = fs.list_dir(root_enum, base_rel or ".", recursive=True)
 
+def _canonical_items(root: str, entries: list[tuple[str, bool]]) -> list[dict[str, str]]:
     items: list[DiscoveryItem] = []
-    for e in entries:
-        rel_norm = _normalize_rel_path(e.rel_path)
+    for rel_path, is_dir in entries:
+        rel_norm = _normalize_rel_path(rel_path)
         items.append(
             DiscoveryItem(
                 item_id=f"root:{root}|path:{rel_norm}",
                 root=root,
                 relative_path=rel_norm,
-                kind=_kind(e),
+                kind=_kind_for(rel_norm, is_dir=is_dir),
             )
         )
 
@@ -92,3 +126,125 @@ def run_discovery(fs: FileService, *, root: str, relative_path: str) -> list[dic
     # Canonical ordering: root, relative_path, kind
     items_sorted = sorted(items, key=_canonical_sort_key)
     return [it.to_dict() for it in items_sorted]
+
+
+def _snapshot_rel_path(root: str, base_rel: str) -> str:
+    key = sha256_hex(f"root:{root}|path:{base_rel}".encode())[:16]
+    return f"{SNAPSHOT_DIR}/{key}.json"
+
+
+def _load_persisted(fs: FileService, rel_path: str) -> tuple[TreeSnapshot, str] | None:
+    try:
+        with fs.open_read(RootName.WIZARDS, rel_path) as handle:
+            payload = json.loads(handle.read().decode("utf-8"))
+    except Exception:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    snapshot = TreeSnapshot.from_dict(payload.get("snapshot"))
+    fingerprint = payload.get("discovery_fingerprint")
+    if snapshot is None or not isinstance(fingerprint, str) or not fingerprint:
+        return None
+    return snapshot, fingerprint
+
+
+def _persist(
+    fs: FileService,
+    rel_path: str,
+    *,
+    root: str,
+    base_rel: str,
+    snapshot: TreeSnapshot,
+    fingerprint: str,
+) -> None:
+    try:
+        atomic_write_json(
+            fs,
+            RootName.WIZARDS,
+            rel_path,
+            {
+                "root": root,
+                "relative_path": base_rel,
+                "tree_digest": snapshot.digest,
+                "discovery_fingerprint": fingerprint,
+                "snapshot": snapshot.to_dict(),
+            },
+        )
+    except Exception:
+        # The snapshot is a cache; failing to persist it must not fail discovery.
+        return
+
+
+def _discover_with_snapshot(fs: FileService, *, root: str, base_rel: str) -> DiscoveryResult:
+    root_enum = RootName(root)
+    cache_key = (str(fs.root_dir(root_enum)), root, base_rel)
+    snapshot_rel = _snapshot_rel_path(root, base_rel)
+
+    with _memory_lock:
+        cached = _memory_cache.get(cache_key)
+
+    persisted_fingerprint: str | None = None
+    previous: TreeSnapshot | None = None
+    if cached is not None:
+        previous = cached.snapshot
+    else:
+        loaded = _load_persisted(fs, snapshot_rel)
+        if loaded is not None:
+            previous, persisted_fingerprint = loaded
+
+    snapshot = fs.scan_tree(root_enum, base_rel or ".", previous=previous)
+    unchanged = previous is not None and snapshot.digest == previous.digest
+
+    if unchanged and cached is not None:
+        items = cached.items
+        fingerprint = cached.fingerprint
+    else:
+        items = _canonical_items(root, snapshot.iter_entries())
+        if unchanged and persisted_fingerprint is not None:
+            fingerprint = persisted_fingerprint
+        else:
+            fingerprint = fingerprint_json(items)
+
+    if previous is None or snapshot.tree is not previous.tree:
+        _persist(
+            fs,
+            snapshot_rel,
+            root=root,
+            base_rel=base_rel,
+            snapshot=snapshot,
+            fingerprint=fingerprint,
+        )
+
+    with _memory_lock:
+        _memory_cache.pop(cache_key, None)
+        _memory_cache[cache_key] = _CachedDiscovery(
+            snapshot=snapshot,
+            items=items,
+            fingerprint=fingerprint,
+        )
+        while len(_memory_cache) > _MEMORY_CACHE_MAX:
+            _memory_cache.pop(next(iter(_memory_cache)))
+
+    return DiscoveryResult(
+        items=[dict(item) for item in items],
+        fingerprint=fingerprint,
+        tree_digest=snapshot.digest,
+    )
+
+
+def discover(fs: Any, *, root: str, relative_path: str) -> DiscoveryResult:
+    """Run discovery and return the canonical item set with its fingerprint.
+
+    The fingerprint is always SHA-256 over the canonical JSON discovery set.
+    """
+    base_rel = _normalize_rel_path(relative_path)
+    if isinstance(fs, FileService):
+        return _discover_with_snapshot(fs, root=root, base_rel=base_rel)
+
+    entries = fs.list_dir(RootName(root), base_rel or ".", recursive=True)
+    items = _canonical_items(root, [(e.rel_path, e.is_dir) for e in entries])
+    return DiscoveryResult(items=items, fingerprint=fingerprint_json(items))
+
+
+def run_discovery(fs: FileService, *, root: str, relative_path: str) -> list[dict[str, str]]:
+    return discover(fs, root=root, relative_path=relative_path).items
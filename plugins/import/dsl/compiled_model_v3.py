@@ -0,0 +1,144 @@
+"""Indexed runtime form of a WizardDefinition v3 effective model.
+
+The interpreter walks the effective model one step at a time. Looking up a
+step, its outgoing edges, and its registry declaration through the raw JSON
+lists costs O(steps) per hop, which makes a full run O(steps^2). This module
+compiles the model once into dict/set indexes so that each hop is O(1).
+
+The compiled form is runtime-only; effective_model.json is never rewritten.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..errors import FinalizeError
+from ..primitives import baseline_registry_entries, is_non_interactive, is_prompt_primitive
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledEdge:
+    to_step_id: str
+    condition_expr: dict[str, Any] | None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledStep:
+    step_id: str
+    step: dict[str, Any]
+    primitive_id: str
+    primitive_version: int
+    phase: int
+    is_prompt: bool
+    is_non_interactive: bool
+    registry_declared: bool
+    outgoing: tuple[CompiledEdge, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFlowModel:
+    model: dict[str, Any]
+    steps: dict[str, CompiledStep]
+    _graphs: dict[int, tuple[Any, CompiledFlowModel]] = field(default_factory=dict)
+
+    def step(self, step_id: str) -> CompiledStep:
+        compiled = self.steps.get(step_id)
+        if compiled is None:
+            raise FinalizeError("unknown step_id")
+        return compiled
+
+    def get_step(self, step_id: str) -> dict[str, Any]:
+        """Return a shallow copy of the projected step, like flowmodel_v3.get_step."""
+        return dict(self.step(step_id).step)
+
+    def for_graph(self, model: dict[str, Any]) -> CompiledFlowModel:
+        """Return the compiled form of model, reusing graphs already compiled.
+
+        Subflow graphs (libraries) are handed to the interpreter as shallow
+        copies, so they are keyed by the identity of their steps list. The
+        cache lives as long as this compiled root, i.e. a single runtime pass.
+        """
+        if model is self.model:
+            return self
+        steps_any = model.get("steps")
+        cached = self._graphs.get(id(steps_any))
+        if cached is not None and cached[0] is steps_any:
+            return cached[1]
+        compiled = compile_flow_model(model)
+        self._graphs[id(steps_any)] = (steps_any, compiled)
+        return compiled
+
+
+_REGISTRY_KEYS: frozenset[tuple[str, int]] | None = None
+
+
+def registry_primitive_keys() -> frozenset[tuple[str, int]]:
+    """Return the (primitive_id, version) pairs declared by the baseline registry."""
+    global _REGISTRY_KEYS
+    if _REGISTRY_KEYS is None:
+        _REGISTRY_KEYS = frozenset(
+            (str(entry.get("primitive_id") or ""), int(entry.get("version") or 0))
+            for entry in baseline_registry_entries()
+        )
+    return _REGISTRY_KEYS
+
+
+def _outgoing_edges(edges_any: Any) -> dict[str, list[CompiledEdge]]:
+    out: dict[str, list[CompiledEdge]] = {}
+    if not isinstance(edges_any, list):
+        return out
+    for edge_any in edges_any:
+        if not isinstance(edge_any, dict):
+            continue
+        frm = edge_any.get("from")
+        to = edge_any.get("to")
+        if not isinstance(frm, str) or not isinstance(to, str) or not to:
+            continue
+        cond = edge_any.get("condition_expr")
+        if cond is not None and not (isinstance(cond, dict) and set(cond.keys()) == {"expr"}):
+            # Malformed conditions never match; keep parity with the edge scan.
+            continue
+        out.setdefault(frm, []).append(CompiledEdge(to_step_id=to, condition_expr=cond))
+    return out
+
+
+def compile_flow_model(effective_model: dict[str, Any]) -> CompiledFlowModel:
+    """Compile an effective model (or a library graph) into indexed form."""
+    steps_any = effective_model.get("steps")
+    if not isinstance(steps_any, list):
+        raise FinalizeError("effective_model steps must be a list")
+    registry = registry_primitive_keys()
+    outgoing = _outgoing_edges(effective_model.get("edges"))
+    steps: dict[str, CompiledStep] = {}
+    for step_any in steps_any:
+        if not isinstance(step_any, dict):
+            continue
+        step_id = step_any.get("step_id")
+        if not isinstance(step_id, str) or not step_id:
+            continue
+        primitive_id = str(step_any.get("primitive_id") or "")
+        primitive_version = int(step_any.get("primitive_version") or 0)
+        steps[step_id] = CompiledStep(
+            step_id=step_id,
+            step=dict(step_any),
+            primitive_id=primitive_id,
+            primitive_version=primitive_version,
+            phase=int(step_any.get("phase") or 1),
+            is_prompt=is_prompt_primitive(primitive_id, primitive_version),
+            is_non_interactive=is_non_interactive(primitive_id, primitive_version),
+            registry_declared=(primitive_id, primitive_version) in registry,
+            outgoing=tuple(outgoing.get(step_id, ())),
+        )
+    return CompiledFlowModel(model=effective_model, steps=steps)
+
+
+__all__ = [
+    "CompiledEdge",
+    "CompiledFlowModel",
+    "CompiledStep",
+    "compile_flow_model",
+    "registry_primitive_keys",
+]
@@ -12,9 +12,7 @@ from ..engine_util import _emit_required, append_trace_event, sync_session_curso
 from ..errors import FinalizeError, StepSubmissionError
 from ..primitives import (
     CTRL_STOP_ID,
-    baseline_registry_entries,
     execute_non_prompt,
-    is_non_interactive,
     is_prompt_primitive,
     validate_submit_payload,
 )
@@ -24,8 +22,8 @@ from ..primitives.ui_v1 import (
     project_prompt_ui,
     prompt_output_key,
 )
+from .compiled_model_v3 import CompiledFlowModel, compile_flow_model
 from .expr_eval import eval_expr_ref
-from .flowmodel_v3 import get_step
 from .subflow_runtime import (
     execute_phase2_step,
     guard_parallel_map_write_conflicts,
@@ -210,36 +208,29 @@ def apply_writes(
 
 
 def _next_step_id(
-    effective_model: dict[str, Any],
+    compiled: CompiledFlowModel,
     step_id: str,
     state: dict[str, Any],
 ) -> str | None:
-    edges_any = effective_model.get("edges")
-    if not isinstance(edges_any, list):
+    compiled_step = compiled.steps.get(step_id)
+    if compiled_step is None:
         return None
     unconditional: str | None = None
-    for edge_any in edges_any:
-        if not isinstance(edge_any, dict) or edge_any.get("from") != step_id:
-            continue
-        to = edge_any.get("to")
-        if not isinstance(to, str) or not to:
-            continue
-        cond = edge_any.get("condition_expr")
-        if cond is None:
+    for edge in compiled_step.outgoing:
+        if edge.condition_expr is None:
             if unconditional is None:
-                unconditional = to
+                unconditional = edge.to_step_id
             continue
-        if isinstance(cond, dict) and set(cond.keys()) == {"expr"}:
-            value = _resolve_expr(
-                cond,
-                state=state,
-                inputs=runtime_input_context(state),
-                op_outputs=None,
-                allow_op_outputs=False,
-                path="$.condition_expr",
-            )
-            if value is True:
-                return to
+        value = _resolve_expr(
+            edge.condition_expr,
+            state=state,
+            inputs=runtime_input_context(state),
+            op_outputs=None,
+            allow_op_outputs=False,
+            path="$.condition_expr",
+        )
+        if value is True:
+            return edge.to_step_id
     return unconditional
 
 
@@ -278,7 +269,7 @@ def _prompt_autofill_outputs(
 
 def _advance_prompt_step(
     *,
-    effective_model: dict[str, Any],
+    compiled: CompiledFlowModel,
     state: dict[str, Any],
     step_id: str,
     step: dict[str, Any],
@@ -292,7 +283,7 @@ def _advance_prompt_step(
     if step_id not in completed:
         completed.append(step_id)
     state["completed_step_ids"] = completed
-    next_step = _next_step_id(effective_model, step_id, state)
+    next_step = _next_step_id(compiled, step_id, state)
     state["current_step_id"] = step_id if next_step is None else next_step
     sync_session_cursor(state, step_id=state["current_step_id"])
     writes_any = step.get("writes")
@@ -361,34 +352,31 @@ def prompt_ui_from_resolved_inputs(inputs: dict[str, Any]) -> dict[str, Any]:
     return {key: inputs[key] for key in PROMPT_METADATA_KEYS if key in inputs}
 
 
-def _registry_declares_primitive(primitive_id: str, primitive_version: int) -> bool:
-    return any(
-        str(entry.get("primitive_id") or "") == primitive_id
-        and int(entry.get("version") or 0) == primitive_version
-        for entry in baseline_registry_entries()
-    )
-
-
 def run_automatic_steps(
     *,
     effective_model: dict[str, Any],
     state: dict[str, Any],
     session_id: str,
+    compiled: CompiledFlowModel | None = None,
 ) -> dict[str, Any]:
+    if compiled is None:
+        compiled = compile_flow_model(effective_model)
+    root = compiled
     current = str((state.get("cursor") or {}).get("step_id") or state.get("current_step_id") or "")
     while current and state.get("status") == "in_progress":
-        step = get_step(effective_model, current)
-        if int(step.get("phase") or 1) == 2:
+        compiled_step = compiled.step(current)
+        if compiled_step.phase == 2:
             return _enter_phase2_boundary(state=state, step_id=current)
-        primitive_id = str(step.get("primitive_id") or "")
-        primitive_version = int(step.get("primitive_version") or 0)
-        if is_prompt_primitive(primitive_id, primitive_version):
+        step = dict(compiled_step.step)
+        primitive_id = compiled_step.primitive_id
+        primitive_version = compiled_step.primitive_version
+        if compiled_step.is_prompt:
             prompt_outputs = _prompt_autofill_outputs(step, state)
             if prompt_outputs is None:
                 break
             inputs, outputs = prompt_outputs
             state, next_step = _advance_prompt_step(
-                effective_model=effective_model,
+                compiled=compiled,
                 state=state,
                 step_id=current,
                 step=step,
@@ -399,9 +387,9 @@ def run_automatic_steps(
                 break
             current = next_step
             continue
-        if not is_non_interactive(primitive_id, primitive_version):
+        if not compiled_step.is_non_interactive:
             raise FinalizeError("non_prompt_submit_payload_forbidden")
-        if not _registry_declares_primitive(primitive_id, primitive_version):
+        if not compiled_step.registry_declared:
             raise FinalizeError("unknown primitive")
         inputs = resolve_inputs(step, state)
         guard_parallel_map_write_conflicts(step, inputs)
@@ -427,6 +415,7 @@ def run_automatic_steps(
                         effective_model=model,
                         state=graph_state,
                         session_id=graph_session_id,
+                        compiled=root.for_graph(model),
                     )
                 ),
                 apply_writes=apply_writes,
@@ -484,7 +473,7 @@ def run_automatic_steps(
                 writes=writes,
                 append_trace=append_trace_event,
             )
-        next_step = _next_step_id(effective_model, current, state)
+        next_step = _next_step_id(compiled, current, state)
         state["current_step_id"] = current if next_step is None else next_step
         sync_session_cursor(state, step_id=state["current_step_id"])
         state = record_trace(
@@ -515,15 +504,17 @@ def submit_current_step(
     current = str((state.get("cursor") or {}).get("step_id") or state.get("current_step_id") or "")
     if step_id != current:
         raise StepSubmissionError("step_id must match current_step_id")
-    step = get_step(effective_model, step_id)
-    primitive_id = str(step.get("primitive_id") or "")
-    primitive_version = int(step.get("primitive_version") or 0)
-    if not is_prompt_primitive(primitive_id, primitive_version):
+    compiled = compile_flow_model(effective_model)
+    compiled_step = compiled.step(step_id)
+    step = dict(compiled_step.step)
+    primitive_id = compiled_step.primitive_id
+    primitive_version = compiled_step.primitive_version
+    if not compiled_step.is_prompt:
         raise StepSubmissionError("non-prompt primitive cannot be submitted")
     outputs = validate_submit_payload(primitive_id, primitive_version, payload)
     inputs = resolve_inputs(step, state)
     state, next_step = _advance_prompt_step(
-        effective_model=effective_model,
+        compiled=compiled,
         state=state,
         step_id=step_id,
         step=step,
@@ -532,7 +523,12 @@ def submit_current_step(
     )
     if next_step is None:
         return state
-    return run_automatic_steps(effective_model=effective_model, state=state, session_id=session_id)
+    return run_automatic_steps(
+        effective_model=effective_model,
+        state=state,
+        session_id=session_id,
+        compiled=compiled,
+    )
 
 
 __all__ = [
@@ -16,6 +16,7 @@ from plugins.file_io.service import FileService
 from plugins.file_io.service.types import RootName
 
 from . import flow_config_api
+from .conflicts import TargetTreeCache
 from .defaults import ensure_default_models
 from .detached_runtime import serialize_detached_runtime_bootstrap
 from .engine_actions_v3 import apply_action_v3, build_runtime_flow_model, is_v3_effective_model
@@ -111,6 +112,7 @@ class ImportWizardEngine:
     def __init__(self, *, resolver: Any) -> None:
         self._resolver = resolver
         self._fs = FileService.from_resolver(self._resolver)
+        self._conflict_targets = TargetTreeCache()
 
     def get_file_service(self) -> FileService:
         """Return the file service used by this engine.
@@ -855,7 +857,18 @@ class ImportWizardEngine:
     ) -> dict[str, Any]:
         return flow_config_api.merge_flow_config_overrides(base, overrides)
 
-    def _scan_conflicts(self, session_id: str, state: dict[str, Any]) -> list[dict[str, str]]:
+    def _scan_conflicts(
+        self,
+        session_id: str,
+        state: dict[str, Any],
+        *,
+        fresh: bool = False,
+    ) -> list[dict[str, str]]:
+        """Scan planned targets for conflicts.
+
+        Parent listings are reused from the short-lived target cache unless
+        fresh is True, which forces a new listing (and refills the cache).
+        """
         from .conflicts import scan_conflicts
 
         session_dir = f"import/sessions/{session_id}"
@@ -867,7 +880,9 @@ class ImportWizardEngine:
         plan = plan if isinstance(plan, dict) else {}
 
         mode = self._validate_mode(str(state.get("mode") or "stage"))
-        items = scan_conflicts(self._fs, plan=plan, mode=mode)
+        if fresh:
+            self._conflict_targets.invalidate()
+        items = scan_conflicts(self._fs, plan=plan, mode=mode, cache=self._conflict_targets)
         return [cast(dict[str, str], it) for it in items]
 
     def _update_conflicts(self, session_id: str, state: dict[str, Any]) -> None:
@@ -274,7 +274,7 @@ def start_processing_impl(
         conflicts = state.get("conflicts")
         policy = str(conflicts.get("policy") or "ask") if isinstance(conflicts, dict) else "ask"
         preview_fp = str(state.get("derived", {}).get("conflict_fingerprint") or "")
-        current_conflicts = engine._scan_conflicts(session_id, state)
+        current_conflicts = engine._scan_conflicts(session_id, state, fresh=True)
         current_fp = fingerprint_json(current_conflicts)
 
         resolved = engine._resolve_flag_for_scan(
@@ -105,8 +105,9 @@ def _build_session_start_context(
             flow_config=flow_cfg_norm,
         )
 
-    discovery = discovery_mod.run_discovery(engine._fs, root=root, relative_path=relative_path)
-    discovery_fingerprint = fingerprint_json(discovery)
+    discovery_result = discovery_mod.discover(engine._fs, root=root, relative_path=relative_path)
+    discovery = discovery_result.items
+    discovery_fingerprint = discovery_result.fingerprint
 
     authors_items, books_items = _derive_selection_items(discovery)
     if effective_model.get("flowmodel_kind") != "dsl_step_graph_v3":
@@ -422,6 +422,7 @@ def build_job_requests(
         "config_fingerprint": config_fingerprint,
         "plan_summary": plan.get("summary", {}),
         "policies": dict(phase2_inputs),
+        "parallelism": _policy_dict(authority, "parallelism"),
         "actions": actions,
         "authority": {
             "phase1": {
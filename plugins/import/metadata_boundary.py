@@ -7,19 +7,16 @@ from __future__ import annotations
 
 import asyncio
 from functools import lru_cache
-from importlib import import_module
-from pathlib import Path
 from typing import Any, Protocol, cast
 
-from audiomason.core.config_service import ConfigService
 from audiomason.core.errors import PluginNotFoundError
-from audiomason.core.loader import PluginLoader
 from audiomason.core.orchestration import _run_coro_sync
 from audiomason.core.plugin_callable_authority import (
     RegisteredWizardCallable,
     resolve_registered_wizard_callable,
 )
-from audiomason.core.plugin_registry import PluginRegistry
+
+from .callable_authority import callable_authority
 
 _DEFAULT_AUTHOR = {"valid": False, "canonical": None, "suggestion": None}
 _DEFAULT_BOOK = {"valid": False, "canonical": None, "suggestion": None}
@@ -44,24 +41,6 @@ class _MetadataPhase1ValidationPlugin(Protocol):
     async def execute_job(self, job: dict[str, Any]) -> dict[str, Any]: ...
 
 
-def _builtin_plugins_dir() -> Path:
-    plugins_pkg = import_module("plugins")
-    pkg_file = getattr(plugins_pkg, "__file__", None)
-    if not isinstance(pkg_file, str) or not pkg_file:
-        raise RuntimeError("plugins package path unavailable")
-    return Path(pkg_file).resolve().parent
-
-
-@lru_cache(maxsize=1)
-def _callable_authority() -> tuple[PluginRegistry, PluginLoader]:
-    registry = PluginRegistry(ConfigService())
-    loader = PluginLoader(
-        builtin_plugins_dir=_builtin_plugins_dir(),
-        registry=registry,
-    )
-    return registry, loader
-
-
 def _tune_metadata_plugin(
     plugin: _MetadataPhase1ValidationPlugin,
 ) -> _MetadataPhase1ValidationPlugin:
@@ -88,7 +67,7 @@ def _resolve_phase1_validation_authority() -> tuple[
     _Phase1ValidationJobBuilder,
     _MetadataPhase1ValidationPlugin,
 ]:
-    registry, loader = _callable_authority()
+    registry, loader = callable_authority()
     published = registry.resolve_wizard_callable(
         "metadata.phase1_validate",
         loader=loader,
@@ -1,11 +1,21 @@
 """Plugin-owned PHASE 2 runner for canonical import job requests.
 
+Books are independent, so their actions run concurrently: up to
+parallelism.workers books are in flight, ffmpeg-heavy capabilities share a
+CPU-sized limit and publish/delete share a small disk limit. Capabilities of
+one book always run in their declared order, and diagnostics are emitted in
+action order as if the batch ran serially.
+
 ASCII-only.
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import os
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -15,10 +25,33 @@ from plugins.file_io.service.types import RootName
 from .cover_boundary import apply_cover_candidate as apply_cover_candidate_ref
 from .engine_util import _emit_required
 from .file_io_boundary import materialize_local_path
+from .phase1_policy_flow import DEFAULT_PARALLELISM
 from .storage import read_json
 
 _AUDIO_SUFFIXES = {".m4a", ".m4b", ".mp3", ".opus"}
 _CHAPTER_SUFFIXES = {".m4a", ".m4b"}
+_CPU_KINDS = {"audio.import", "cover.embed", "metadata.tags"}
+_DISK_KINDS = {"publish.write", "source.delete"}
+
+# Concurrent publish/delete beyond this mostly adds seek contention.
+DISK_CONCURRENCY = 2
+
+
+@dataclass(frozen=True)
+class _Limits:
+    books: int
+    cpu: int
+    disk: int
+
+
+@dataclass(frozen=True)
+class _BookAction:
+    action_index: int
+    action: dict[str, Any]
+    book_id: str
+    source_root: RootName
+    source_rel: str
+    target_rel: str
 
 
 def _parse_job_requests_path(text: str) -> tuple[RootName, str]:
@@ -180,15 +213,12 @@ async def _run_audio_import(
     work_path: Path,
     capability: dict[str, Any],
 ) -> None:
-    plugin = plugin_loader.get_plugin("audio_processor")
     options_any = capability.get("options")
     options = dict(options_any) if isinstance(options_any, dict) else {}
 
-    original_values = {
-        "bitrate": getattr(plugin, "bitrate", None),
-        "loudnorm": getattr(plugin, "loudnorm", None),
-        "split_chapters": getattr(plugin, "split_chapters", None),
-    }
+    # Books run concurrently, so per-book options go on a private copy
+    # instead of the shared plugin instance.
+    plugin = copy.copy(plugin_loader.get_plugin("audio_processor"))
     if "bitrate" in options:
         plugin.bitrate = str(options["bitrate"])
     if "loudnorm" in options:
@@ -197,29 +227,24 @@ async def _run_audio_import(
         plugin.split_chapters = bool(options["split_chapters"])
 
     work_path.mkdir(parents=True, exist_ok=True)
-    try:
-        for source_file in _iter_audio_sources(source_path):
-            relative_parent = (
-                source_file.relative_to(source_path).parent if source_path.is_dir() else Path()
-            )
-            output_dir = work_path / relative_parent
-            output_dir.mkdir(parents=True, exist_ok=True)
-            chapters: list[dict[str, Any]] | None = None
-            if bool(getattr(plugin, "split_chapters", False)) and (
-                source_file.suffix.lower() in _CHAPTER_SUFFIXES
-            ):
-                detect = getattr(plugin, "_detect_chapters", None)
-                if callable(detect):
-                    chapters = await detect(source_file)
-            plan = plugin.plan_import_conversion(source_file, output_dir, chapters=chapters)
-            execute_plan = getattr(plugin, "_execute_plan", None)
-            if not callable(execute_plan):
-                raise RuntimeError("audio_processor missing _execute_plan")
-            await execute_plan(plan)
-    finally:
-        for key, value in original_values.items():
-            if value is not None:
-                setattr(plugin, key, value)
+    for source_file in _iter_audio_sources(source_path):
+        relative_parent = (
+            source_file.relative_to(source_path).parent if source_path.is_dir() else Path()
+        )
+        output_dir = work_path / relative_parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        chapters: list[dict[str, Any]] | None = None
+        if bool(getattr(plugin, "split_chapters", False)) and (
+            source_file.suffix.lower() in _CHAPTER_SUFFIXES
+        ):
+            detect = getattr(plugin, "_detect_chapters", None)
+            if callable(detect):
+                chapters = await detect(source_file)
+        plan = plugin.plan_import_conversion(source_file, output_dir, chapters=chapters)
+        execute_plan = getattr(plugin, "_execute_plan", None)
+        if not callable(execute_plan):
+            raise RuntimeError("audio_processor missing _execute_plan")
+        await execute_plan(plan)
 
 
 async def _run_cover_embed(
@@ -321,7 +346,8 @@ async def _run_publish_write(
     rel = normalize_relative_path(str(capability.get("relative_path") or ""))
     if not rel:
         raise ValueError("publish.write.relative_path must be non-empty")
-    publish_staged(
+    await asyncio.to_thread(
+        publish_staged,
         fs,
         work_relative_path=work_rel,
         final_root=root,
@@ -333,41 +359,29 @@ async def _run_publish_write(
 
 async def _run_source_delete(*, source_path: Path, capability: dict[str, Any]) -> None:
     if bool(capability.get("enabled", False)):
-        _remove_path(source_path)
-
-
-async def run_phase2_job_requests(
-    *,
-    engine: Any,
-    job_id: str,
-    job_meta: dict[str, Any],
-    plugin_loader: Any,
-) -> None:
-    fs = engine.get_file_service()
-    job_requests_path = str(job_meta.get("job_requests_path") or "")
-    if not job_requests_path:
-        raise ValueError("job_requests_path is required")
+        await asyncio.to_thread(_remove_path, source_path)
 
-    root, rel_path = _parse_job_requests_path(job_requests_path)
-    job_requests_any = read_json(fs, root, rel_path)
-    if not isinstance(job_requests_any, dict):
-        raise ValueError("job_requests.json is invalid")
 
-    actions_any = job_requests_any.get("actions")
-    actions = actions_any if isinstance(actions_any, list) else []
-    diagnostics_any = job_requests_any.get("diagnostics_context")
-    diagnostics_context = dict(diagnostics_any) if isinstance(diagnostics_any, dict) else {}
-
-    _emit_required(
-        "phase2.runner.start",
-        "phase2.runner.start",
-        {
-            "job_id": job_id,
-            "batch_size": len(actions),
-            **diagnostics_context,
-        },
+def _phase2_limits(job_requests: dict[str, Any]) -> _Limits:
+    parallelism_any = job_requests.get("parallelism")
+    parallelism = dict(parallelism_any) if isinstance(parallelism_any, dict) else {}
+    cpu_count = os.cpu_count() or 1
+    # Absent or malformed policy means the wizard default; there is no "auto".
+    default_workers = int(DEFAULT_PARALLELISM["workers"])
+    try:
+        workers = int(parallelism.get("workers", default_workers))
+    except (TypeError, ValueError):
+        workers = default_workers
+    workers = max(1, workers)
+    return _Limits(
+        books=workers,
+        cpu=min(workers, cpu_count),
+        disk=min(workers, DISK_CONCURRENCY),
     )
 
+
+def _book_actions(actions: list[Any]) -> list[_BookAction]:
+    out: list[_BookAction] = []
     for action_index, action_any in enumerate(actions, start=1):
         if not isinstance(action_any, dict):
             continue
@@ -383,28 +397,81 @@ async def run_phase2_job_requests(
         target_rel = normalize_relative_path(str(target_any.get("relative_path") or ""))
         if not source_rel or not target_rel:
             raise ValueError("action source/target paths must be non-empty")
-
-        source_path = materialize_local_path(fs, source_root, source_rel)
-        work_rel = _resolve_work_relative_path(job_id, action_index, target_rel)
-        work_path = materialize_local_path(fs, RootName.STAGE, work_rel)
-        _remove_path(work_path)
-        work_path.mkdir(parents=True, exist_ok=True)
-
-        _emit_required(
-            "phase2.action.start",
-            "phase2.action.start",
-            {
-                "job_id": job_id,
-                "action_index": action_index,
-                "book_id": str(action.get("book_id") or ""),
-                "source_relative_path": source_rel,
-                "target_relative_path": target_rel,
-                **diagnostics_context,
-            },
+        out.append(
+            _BookAction(
+                action_index=action_index,
+                action=action,
+                book_id=str(action.get("book_id") or ""),
+                source_root=source_root,
+                source_rel=source_rel,
+                target_rel=target_rel,
+            )
         )
+    return out
+
+
+class _OrderedEvents:
+    """Buffer per-book diagnostics and emit them in action order."""
+
+    def __init__(self, books: list[_BookAction]) -> None:
+        self._order = [book.action_index for book in books]
+        self._pending: dict[int, list[tuple[str, dict[str, Any]]]] = {}
+        self._done: set[int] = set()
+        self._next = 0
+
+    def add(self, action_index: int, event: str, data: dict[str, Any]) -> None:
+        self._pending.setdefault(action_index, []).append((event, data))
+
+    def finish(self, action_index: int) -> None:
+        self._done.add(action_index)
+        while self._next < len(self._order) and self._order[self._next] in self._done:
+            for event, data in self._pending.pop(self._order[self._next], []):
+                _emit_required(event, event, data)
+            self._next += 1
+
+    def flush(self) -> None:
+        for action_index in self._order[self._next :]:
+            for event, data in self._pending.pop(action_index, []):
+                _emit_required(event, event, data)
+        self._next = len(self._order)
+
+
+async def _run_book(
+    *,
+    fs: Any,
+    job_id: str,
+    book: _BookAction,
+    plugin_loader: Any,
+    diagnostics_context: dict[str, str],
+    cpu: asyncio.Semaphore,
+    disk: asyncio.Semaphore,
+    events: _OrderedEvents,
+) -> None:
+    action = book.action
+    source_path = materialize_local_path(fs, book.source_root, book.source_rel)
+    work_rel = _resolve_work_relative_path(job_id, book.action_index, book.target_rel)
+    work_path = materialize_local_path(fs, RootName.STAGE, work_rel)
+    _remove_path(work_path)
+    work_path.mkdir(parents=True, exist_ok=True)
 
-        for capability in _ordered_capabilities(action):
-            kind = str(capability.get("kind") or "")
+    events.add(
+        book.action_index,
+        "phase2.action.start",
+        {
+            "job_id": job_id,
+            "action_index": book.action_index,
+            "book_id": book.book_id,
+            "source_relative_path": book.source_rel,
+            "target_relative_path": book.target_rel,
+            **diagnostics_context,
+        },
+    )
+
+    for capability in _ordered_capabilities(action):
+        kind = str(capability.get("kind") or "")
+        if kind not in _CPU_KINDS and kind not in _DISK_KINDS:
+            raise ValueError(f"Unsupported capability kind: {kind}")
+        async with cpu if kind in _CPU_KINDS else disk:
             if kind == "audio.import":
                 await _run_audio_import(
                     plugin_loader=plugin_loader,
@@ -413,43 +480,104 @@ async def run_phase2_job_requests(
                     capability=capability,
                 )
                 _apply_rename_authority(work_path=work_path, action=action)
-                continue
-            if kind == "cover.embed":
+            elif kind == "cover.embed":
                 await _run_cover_embed(
                     fs=fs,
                     plugin_loader=plugin_loader,
-                    source_root=source_root,
-                    source_relative_path=source_rel,
+                    source_root=book.source_root,
+                    source_relative_path=book.source_rel,
                     work_rel=work_rel,
                     work_path=work_path,
                     capability=capability,
                 )
-                continue
-            if kind == "metadata.tags":
+            elif kind == "metadata.tags":
                 await _run_metadata_tags(
                     plugin_loader=plugin_loader,
                     work_path=work_path,
                     capability=capability,
                 )
-                continue
-            if kind == "publish.write":
+            elif kind == "publish.write":
                 await _run_publish_write(fs=fs, work_rel=work_rel, capability=capability)
-                continue
-            if kind == "source.delete":
+            else:
                 await _run_source_delete(source_path=source_path, capability=capability)
-                continue
-            raise ValueError(f"Unsupported capability kind: {kind}")
 
-        _emit_required(
-            "phase2.action.end",
-            "phase2.action.end",
-            {
-                "job_id": job_id,
-                "action_index": action_index,
-                "book_id": str(action.get("book_id") or ""),
-                **diagnostics_context,
-            },
-        )
+    events.add(
+        book.action_index,
+        "phase2.action.end",
+        {
+            "job_id": job_id,
+            "action_index": book.action_index,
+            "book_id": book.book_id,
+            **diagnostics_context,
+        },
+    )
+
+
+async def run_phase2_job_requests(
+    *,
+    engine: Any,
+    job_id: str,
+    job_meta: dict[str, Any],
+    plugin_loader: Any,
+) -> None:
+    fs = engine.get_file_service()
+    job_requests_path = str(job_meta.get("job_requests_path") or "")
+    if not job_requests_path:
+        raise ValueError("job_requests_path is required")
+
+    root, rel_path = _parse_job_requests_path(job_requests_path)
+    job_requests_any = read_json(fs, root, rel_path)
+    if not isinstance(job_requests_any, dict):
+        raise ValueError("job_requests.json is invalid")
+
+    actions_any = job_requests_any.get("actions")
+    actions = actions_any if isinstance(actions_any, list) else []
+    diagnostics_any = job_requests_any.get("diagnostics_context")
+    diagnostics_context = dict(diagnostics_any) if isinstance(diagnostics_any, dict) else {}
+
+    _emit_required(
+        "phase2.runner.start",
+        "phase2.runner.start",
+        {
+            "job_id": job_id,
+            "batch_size": len(actions),
+            **diagnostics_context,
+        },
+    )
+
+    books = _book_actions(actions)
+    limits = _phase2_limits(job_requests_any)
+    cpu = asyncio.Semaphore(limits.cpu)
+    disk = asyncio.Semaphore(limits.disk)
+    events = _OrderedEvents(books)
+    queue = list(reversed(books))
+    failures: dict[int, BaseException] = {}
+
+    async def _worker() -> None:
+        # After the first failure no new books start; books already running
+        # finish so their work directories are left in a consistent state.
+        while queue and not failures:
+            book = queue.pop()
+            try:
+                await _run_book(
+                    fs=fs,
+                    job_id=job_id,
+                    book=book,
+                    plugin_loader=plugin_loader,
+                    diagnostics_context=diagnostics_context,
+                    cpu=cpu,
+                    disk=disk,
+                    events=events,
+                )
+            except Exception as exc:
+                failures[book.action_index] = exc
+            events.finish(book.action_index)
+
+    await asyncio.gather(*(_worker() for _ in range(min(limits.books, len(books)))))
+
+    if failures:
+        events.flush()
+        raise failures[min(failures)]
 
     _emit_required(
         "phase2.runner.end",
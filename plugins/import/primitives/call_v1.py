@@ -5,24 +5,19 @@ ASCII-only.
 
 from __future__ import annotations
 
-import asyncio
 import inspect
-import threading
 from dataclasses import dataclass
-from functools import lru_cache
-from importlib import import_module
-from pathlib import Path
 from typing import Any, Protocol, cast
 
 from audiomason.core.config_service import ConfigService
 from audiomason.core.errors import PluginNotFoundError
-from audiomason.core.loader import PluginLoader
+from audiomason.core.loop_pool import run_coro_blocking
 from audiomason.core.plugin_callable_authority import (
     RegisteredWizardCallable,
     resolve_registered_wizard_callable,
 )
-from audiomason.core.plugin_registry import PluginRegistry
 
+from ..callable_authority import callable_authority
 from ..detached_runtime import rehydrate_detached_runtime_from_bootstrap
 from ..file_io_facade import file_service_from_resolver
 
@@ -83,30 +78,12 @@ _RUNTIME_ARG_FACTORIES: dict[str, Any] = {
 }
 
 
-def _builtin_plugins_dir() -> Path:
-    plugins_pkg = import_module("plugins")
-    pkg_file = getattr(plugins_pkg, "__file__", None)
-    if not isinstance(pkg_file, str) or not pkg_file:
-        raise RuntimeError("plugins package path unavailable")
-    return Path(pkg_file).resolve().parent
-
-
-@lru_cache(maxsize=1)
-def _callable_authority() -> tuple[PluginRegistry, PluginLoader]:
-    registry = PluginRegistry(ConfigService())
-    loader = PluginLoader(
-        builtin_plugins_dir=_builtin_plugins_dir(),
-        registry=registry,
-    )
-    return registry, loader
-
-
 def _resolve_published_callable_binding(
     *,
     operation_id: str,
     expected_execution_mode: str,
 ) -> _ResolvedCallableBinding:
-    registry, loader = _callable_authority()
+    registry, loader = callable_authority()
     published = registry.resolve_wizard_callable(operation_id, loader=loader)
     if published.execution_mode != expected_execution_mode:
         raise RuntimeError(
@@ -136,35 +113,6 @@ def _resolve_published_callable_binding(
     )
 
 
-def _run_coro_blocking(coro: Any) -> Any:
-    result_box: dict[str, Any] = {}
-    error_box: dict[str, BaseException] = {}
-
-    def _runner() -> None:
-        loop = asyncio.new_event_loop()
-        try:
-            asyncio.set_event_loop(loop)
-            result_box["result"] = loop.run_until_complete(coro)
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except BaseException as exc:  # pragma: no cover
-            error_box["error"] = exc
-        finally:
-            asyncio.set_event_loop(None)
-            loop.close()
-
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        _runner()
-    else:
-        thread = threading.Thread(target=_runner, name="import-call-invoke")
-        thread.start()
-        thread.join()
-    if "error" in error_box:
-        raise error_box["error"]
-    return result_box.get("result")
-
-
 def _execute_inline(*, binding: _ResolvedCallableBinding, args: dict[str, Any]) -> Any:
     callable_obj = cast(Any, binding.callable_obj)
     return callable_obj(**dict(args))
@@ -179,7 +127,7 @@ def _execute_job(*, binding: _ResolvedCallableBinding, args: dict[str, Any]) ->
     execute_job = getattr(plugin, "execute_job", None)
     if not callable(execute_job):
         raise RuntimeError("wizard_callable_job_plugin_missing_execute_job")
-    return _run_coro_blocking(execute_job(dict(job)))
+    return run_coro_blocking(execute_job(dict(job)))
 
 
 def _bind_runtime_args(
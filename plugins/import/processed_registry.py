@@ -3,7 +3,22 @@
 This module is file_io-only and contains no core imports.
 
 Registry location (RootName.WIZARDS):
-  import/processed/processed_registry.json
+  import/processed/processed_registry.json        compacted snapshot
+  import/processed/processed_registry.log.jsonl   append-only update log
+  import/processed/processed_registry.lock        writer/reader lock file
+
+Successful jobs append one log line per changed book instead of rewriting
+the snapshot. The effective registry is the snapshot with the log replayed
+on top (last line per book wins). Once the log outgrows its threshold it is
+folded into the snapshot by a background compaction. The very first write
+creates the snapshot directly.
+
+The in-process index is shared by all threads. flock only serializes
+processes (shared readers in one process all pass), so every refresh and
+read of the index also holds the index's own threading lock.
+
+Log line:
+  {"book_id": "...", "entry": { ...schema v1 book entry... }}
 
 Schema v1:
   {
@@ -26,7 +41,13 @@ ASCII-only.
 
 from __future__ import annotations
 
-from contextlib import suppress
+import fcntl
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from typing import Any
 
 from plugins.file_io.service import FileService, RootName
@@ -34,15 +55,200 @@ from plugins.file_io.service import FileService, RootName
 from .storage import atomic_write_json, read_json
 
 _REGISTRY_PATH = "import/processed/processed_registry.json"
+_LOG_PATH = "import/processed/processed_registry.log.jsonl"
+_LOCK_PATH = "import/processed/processed_registry.lock"
 _SCHEMA_VERSION = 1
 
+# Compact once the log holds this many bytes, or half the snapshot size if
+# that is larger, which keeps compaction cost amortized O(1) per update.
+COMPACT_MIN_LOG_BYTES = 1024 * 1024
+
+
+@dataclass
+class _RegistryIndex:
+    books: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_source: dict[str, set[str]] = field(default_factory=dict)
+    snapshot_id: tuple[int, int, int] | None = None
+    snapshot_size: int = 0
+    log_id: tuple[int, int] | None = None
+    log_offset: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def put(self, book_id: str, entry: dict[str, Any]) -> None:
+        prev = self.books.get(book_id)
+        if prev is not None:
+            ids = self.by_source.get(str(prev.get("source_relative_path") or ""))
+            if ids is not None:
+                ids.discard(book_id)
+        self.books[book_id] = entry
+        source = str(entry.get("source_relative_path") or "")
+        self.by_source.setdefault(source, set()).add(book_id)
+
+
+_indexes: dict[str, _RegistryIndex] = {}
+_indexes_lock = threading.Lock()
+_compactions: dict[str, threading.Thread] = {}
+
+
+def _abs(fs: FileService, rel_path: str) -> str:
+    return os.path.join(str(fs.root_dir(RootName.WIZARDS)), rel_path)
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def _registry_lock(fs: FileService, *, shared: bool = False) -> Iterator[None]:
+    with fs.open_append(RootName.WIZARDS, _LOCK_PATH) as handle:
+        fd = handle.fileno()
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            with suppress(OSError):
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _read_snapshot_books(fs: FileService) -> dict[str, Any]:
+    if not fs.exists(RootName.WIZARDS, _REGISTRY_PATH):
+        return {}
+    data = read_json(fs, RootName.WIZARDS, _REGISTRY_PATH)
+    return _ensure_registry_shape(data)["books"]
+
+
+def _replay_log(fs: FileService, index: _RegistryIndex) -> None:
+    st = _stat_or_none(_abs(fs, _LOG_PATH))
+    if st is None:
+        index.log_id = None
+        index.log_offset = 0
+        return
+    log_id = (st.st_dev, st.st_ino)
+    if index.log_id != log_id or st.st_size < index.log_offset:
+        index.log_id = log_id
+        index.log_offset = 0
+    start = index.log_offset
+    if st.st_size == start:
+        return
+    with fs.open_read(RootName.WIZARDS, _LOG_PATH) as handle:
+        handle.seek(start)
+        data = handle.read()
+    # Only complete lines count; a torn tail is picked up on the next refresh.
+    end = data.rfind(b"\n") + 1
+    for raw in data[:end].splitlines():
+        try:
+            record = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+        if not isinstance(record, dict):
+            continue
+        book_id = record.get("book_id")
+        entry = record.get("entry")
+        if isinstance(book_id, str) and book_id and isinstance(entry, dict):
+            index.put(book_id, entry)
+    index.log_offset = start + end
+
+
+def _refresh_index(fs: FileService, index: _RegistryIndex) -> None:
+    """Bring index up to date. Caller holds the registry lock and index.lock."""
+    st = _stat_or_none(_abs(fs, _REGISTRY_PATH))
+    snapshot_id = None if st is None else (st.st_ino, st.st_mtime_ns, st.st_size)
+    if index.snapshot_id != snapshot_id:
+        index.books = {}
+        index.by_source = {}
+        for book_id, entry in sorted(_read_snapshot_books(fs).items()):
+            if isinstance(entry, dict):
+                index.put(str(book_id), dict(entry))
+        index.snapshot_id = snapshot_id
+        index.snapshot_size = st.st_size if st else 0
+        index.log_id = None
+        index.log_offset = 0
+    _replay_log(fs, index)
+
+
+@contextmanager
+def _locked_index(fs: FileService, *, shared: bool = False) -> Iterator[_RegistryIndex]:
+    """Hold the registry lock and the index lock; yield the refreshed index."""
+    key = str(fs.root_dir(RootName.WIZARDS))
+    with _indexes_lock:
+        index = _indexes.setdefault(key, _RegistryIndex())
+    with _registry_lock(fs, shared=shared), index.lock:
+        _refresh_index(fs, index)
+        yield index
+
 
 def load_registry(fs: FileService) -> dict[str, Any]:
-    if fs.exists(RootName.WIZARDS, _REGISTRY_PATH):
-        data = read_json(fs, RootName.WIZARDS, _REGISTRY_PATH)
-        if isinstance(data, dict):
-            return data
-    return {"schema_version": _SCHEMA_VERSION, "books": {}}
+    """Return the effective registry (snapshot plus replayed log) as schema v1."""
+    if not fs.exists(RootName.WIZARDS, _REGISTRY_PATH) and not fs.exists(
+        RootName.WIZARDS, _LOG_PATH
+    ):
+        return {"schema_version": _SCHEMA_VERSION, "books": {}}
+    with _locked_index(fs, shared=True) as index:
+        books = {book_id: dict(entry) for book_id, entry in index.books.items()}
+    return {"schema_version": _SCHEMA_VERSION, "books": books}
+
+
+def lookup_book(fs: FileService, book_id: str) -> dict[str, Any] | None:
+    """Return the registry entry for book_id, or None."""
+    with _locked_index(fs, shared=True) as index:
+        entry = index.books.get(book_id)
+        return dict(entry) if entry is not None else None
+
+
+def lookup_source(fs: FileService, source_relative_path: str) -> list[str]:
+    """Return book_ids whose entry was imported from source_relative_path."""
+    with _locked_index(fs, shared=True) as index:
+        return sorted(index.by_source.get(source_relative_path) or ())
+
+
+def compact_registry(fs: FileService) -> bool:
+    """Fold the append-only log into the snapshot.
+
+    Returns True if a compaction was performed.
+    """
+    with _locked_index(fs) as index:
+        if index.log_offset == 0 and index.snapshot_id is not None:
+            return False
+        reg = {"schema_version": _SCHEMA_VERSION, "books": index.books}
+        atomic_write_json(fs, RootName.WIZARDS, _REGISTRY_PATH, reg)
+        # Replace (not truncate) the log so readers notice the new inode.
+        with fs.open_write(RootName.WIZARDS, f"{_LOG_PATH}.tmp", overwrite=True):
+            pass
+        fs.rename(RootName.WIZARDS, f"{_LOG_PATH}.tmp", _LOG_PATH, overwrite=True)
+        _refresh_index(fs, index)
+    return True
+
+
+def _needs_compaction(index: _RegistryIndex) -> bool:
+    return index.log_offset >= max(COMPACT_MIN_LOG_BYTES, index.snapshot_size // 2)
+
+
+def _schedule_compaction(fs: FileService) -> threading.Thread | None:
+    key = str(fs.root_dir(RootName.WIZARDS))
+    with _indexes_lock:
+        running = _compactions.get(key)
+        if running is not None and running.is_alive():
+            return running
+
+        def _run() -> None:
+            with suppress(Exception):
+                compact_registry(fs)
+
+        thread = threading.Thread(target=_run, name="processed-registry-compact", daemon=True)
+        _compactions[key] = thread
+    thread.start()
+    return thread
+
+
+def wait_for_compaction(fs: FileService, timeout: float | None = None) -> None:
+    """Block until a background compaction for fs (if any) finishes."""
+    with _indexes_lock:
+        thread = _compactions.get(str(fs.root_dir(RootName.WIZARDS)))
+    if thread is not None:
+        thread.join(timeout)
 
 
 def _ensure_registry_shape(reg: Any) -> dict[str, Any]:
@@ -200,10 +406,7 @@ def apply_successful_job_requests(fs: FileService, job_requests: dict[str, Any])
     plan_fp_any = job_requests.get("plan_fingerprint")
     plan_fp = plan_fp_any if isinstance(plan_fp_any, str) and plan_fp_any else None
 
-    reg = _ensure_registry_shape(load_registry(fs))
-    books: dict[str, Any] = reg["books"]
-
-    changed = False
+    updates: list[tuple[str, dict[str, Any]]] = []
     for record in records:
         book_id = str(record["book_id"])
         entry: dict[str, Any] = {
@@ -219,14 +422,43 @@ def apply_successful_job_requests(fs: FileService, job_requests: dict[str, Any])
         authority = dict(authority_any) if isinstance(authority_any, dict) else {}
         if authority:
             entry["authority"] = authority
-
-        prev = books.get(book_id)
-        if prev != entry:
-            books[book_id] = entry
-            changed = True
-
-    if not changed:
-        return False
-
-    atomic_write_json(fs, RootName.WIZARDS, _REGISTRY_PATH, reg)
+        updates.append((book_id, entry))
+
+    compact = False
+    with _locked_index(fs) as index:
+        changed = [
+            (book_id, entry) for book_id, entry in updates if index.books.get(book_id) != entry
+        ]
+        if not changed:
+            return False
+
+        if index.snapshot_id is None and index.log_offset == 0:
+            for book_id, entry in changed:
+                index.put(book_id, entry)
+            reg = {"schema_version": _SCHEMA_VERSION, "books": index.books}
+            atomic_write_json(fs, RootName.WIZARDS, _REGISTRY_PATH, reg)
+            _refresh_index(fs, index)
+            return True
+
+        payload = b"".join(
+            (
+                json.dumps(
+                    {"book_id": book_id, "entry": entry},
+                    ensure_ascii=True,
+                    separators=(",", ":"),
+                    sort_keys=True,
+                )
+                + "\n"
+            ).encode("utf-8")
+            for book_id, entry in changed
+        )
+        with fs.open_append(RootName.WIZARDS, _LOG_PATH) as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        _replay_log(fs, index)
+        compact = _needs_compaction(index)
+
+    if compact:
+        _schedule_compaction(fs)
     return True
@@ -0,0 +1,192 @@
+"""Incremental follower for an append-only log file.
+
+The follower keeps the file open at the last read offset and reads only what
+was appended since. Between reads it sleeps on an inotify watch of the
+parent directory where the platform provides one (Linux), so an idle follow
+costs no reads at all; elsewhere it falls back to polling with one stat per
+interval. Rotation (the path now names a different inode) is handled by
+draining the old handle and reopening at offset 0; truncation (the file
+shrank below the offset) restarts from 0. Partial trailing lines are held
+back until their newline arrives.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# With inotify the timeout is only a safety net (e.g. network filesystems).
+_INOTIFY_SAFETY_TIMEOUT_S = 5.0
+_READ_CHUNK = 1024 * 1024
+
+
+class _InotifyWatch:
+    """Wait for changes in one directory via inotify (Linux only)."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    @classmethod
+    def create(cls, directory: Path) -> _InotifyWatch | None:
+        if not hasattr(select, "poll"):
+            return None
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            return None
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            init1 = libc.inotify_init1
+            add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return None
+        fd = int(init1(_IN_NONBLOCK | _IN_CLOEXEC))
+        if fd < 0:
+            return None
+        wd = int(add_watch(fd, os.fsencode(str(directory)), _WATCH_MASK))
+        if wd < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, timeout_s: float) -> None:
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        if poller.poll(int(timeout_s * 1000)):
+            # Drain; the events themselves do not matter, only the wake-up.
+            with contextlib.suppress(BlockingIOError):
+                while os.read(self._fd, 64 * (struct.calcsize("iIII") + 256)):
+                    pass
+
+    def close(self) -> None:
+        with contextlib.suppress(OSError):
+            os.close(self._fd)
+
+
+class _Follower:
+    """Open handle, offset and pending partial line for one followed path."""
+
+    def __init__(
+        self, path: Path, *, start_offset: int | None, poll_interval_s: float, use_inotify: bool
+    ) -> None:
+        self._path = path
+        self._watch = _InotifyWatch.create(path.parent) if use_inotify else None
+        self._timeout_s = _INOTIFY_SAFETY_TIMEOUT_S if self._watch is not None else poll_interval_s
+        self._handle: BinaryIO | None = None
+        self._inode: int | None = None
+        self._offset = 0
+        self._pending = b""
+        self._open(start_offset)
+
+    def _open(self, at: int | None) -> None:
+        try:
+            f = open(self._path, "rb")  # noqa: SIM115 - kept open across iterations
+        except FileNotFoundError:
+            return
+        st = os.fstat(f.fileno())
+        self._offset = st.st_size if at is None else min(max(0, at), st.st_size)
+        f.seek(self._offset)
+        self._handle, self._inode, self._pending = f, st.st_ino, b""
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _read_new(self) -> list[bytes]:
+        assert self._handle is not None
+        lines: list[bytes] = []
+        while True:
+            chunk = self._handle.read(_READ_CHUNK)
+            if not chunk:
+                break
+            self._offset += len(chunk)
+            self._pending += chunk
+            *complete, self._pending = self._pending.split(b"\n")
+            lines.extend(complete)
+        return lines
+
+    def _check_replaced(self) -> list[bytes] | None:
+        """Handle rotation/truncation; return trailing old lines if reopened."""
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        if st.st_ino != self._inode:
+            # Rotated: finish the old file, then start the new one.
+            tail = self._read_new()
+            if self._pending:
+                tail.append(self._pending)
+            self._close_handle()
+            self._open(0)
+            return tail
+        if st.st_size < self._offset and self._handle is not None:
+            # Truncated in place.
+            self._handle.seek(0)
+            self._offset, self._pending = 0, b""
+            return []
+        return None
+
+    def lines(self) -> Iterator[bytes]:
+        try:
+            while True:
+                if self._handle is None:
+                    self._open(0)
+                if self._handle is not None:
+                    yield from self._read_new()
+                    replaced = self._check_replaced()
+                    if replaced is not None:
+                        yield from replaced
+                        continue
+                if self._watch is not None:
+                    self._watch.wait(self._timeout_s)
+                else:
+                    time.sleep(self._timeout_s)
+        finally:
+            self._close_handle()
+            if self._watch is not None:
+                self._watch.close()
+
+
+def follow_file(
+    path: Path,
+    *,
+    start_offset: int | None = None,
+    poll_interval_s: float = 0.2,
+    use_inotify: bool = True,
+) -> Iterator[bytes]:
+    """Return an iterator of complete lines (without newline) appended to path.
+
+    The start position is fixed when this is called: start_offset, or the
+    current end of the file when None.
+    """
+    follower = _Follower(
+        path,
+        start_offset=start_offset,
+        poll_interval_s=poll_interval_s,
+        use_inotify=use_inotify,
+    )
+    return follower.lines()
+
+
+__all__ = ["follow_file"]
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import contextlib
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
 from audiomason.core.config import ConfigResolver
@@ -25,6 +25,7 @@ from plugins.file_io.service.service import FileService
 from plugins.file_io.service.types import RootName
 
 from .service import SyslogConfig, SyslogService
+from .writer import SyslogRotation
 
 _LOG = get_logger(__name__)
 
@@ -146,13 +147,7 @@ class SyslogPlugin:
                     "error_message": f"invalid disk_format: {self._cfg.disk_format!r}",
                 },
             )
-            self._cfg = SyslogConfig(
-                enabled=False,
-                filename=self._cfg.filename,
-                disk_format=self._cfg.disk_format,
-                cli_default_command=self._cfg.cli_default_command,
-                cli_default_follow=self._cfg.cli_default_follow,
-            )
+            self._cfg = replace(self._cfg, enabled=False)
             return
 
         if not self._cfg.filename or self._cfg.filename.strip() == "":
@@ -166,13 +161,7 @@ class SyslogPlugin:
                     "error_message": "empty filename",
                 },
             )
-            self._cfg = SyslogConfig(
-                enabled=False,
-                filename=self._cfg.filename,
-                disk_format=self._cfg.disk_format,
-                cli_default_command=self._cfg.cli_default_command,
-                cli_default_follow=self._cfg.cli_default_follow,
-            )
+            self._cfg = replace(self._cfg, enabled=False)
             return
 
         # Validate and preflight the configured path deterministically.
@@ -195,22 +184,10 @@ class SyslogPlugin:
                     "error_message": msg,
                 },
             )
-            self._cfg = SyslogConfig(
-                enabled=False,
-                filename=filename,
-                disk_format=self._cfg.disk_format,
-                cli_default_command=self._cfg.cli_default_command,
-                cli_default_follow=self._cfg.cli_default_follow,
-            )
+            self._cfg = replace(self._cfg, enabled=False, filename=filename)
             return
 
-        self._cfg = SyslogConfig(
-            enabled=self._cfg.enabled,
-            filename=filename,
-            disk_format=self._cfg.disk_format,
-            cli_default_command=self._cfg.cli_default_command,
-            cli_default_follow=self._cfg.cli_default_follow,
-        )
+        self._cfg = replace(self._cfg, filename=filename)
 
         # Preflight: ensure the file is writable and within roots (creates file if missing).
         try:
@@ -232,18 +209,10 @@ class SyslogPlugin:
                     "error_message": msg,
                 },
             )
-            self._cfg = SyslogConfig(
-                enabled=False,
-                filename=filename,
-                disk_format=self._cfg.disk_format,
-                cli_default_command=self._cfg.cli_default_command,
-                cli_default_follow=self._cfg.cli_default_follow,
-            )
+            self._cfg = replace(self._cfg, enabled=False, filename=filename)
             return
 
-        self._service = SyslogService(
-            self._fs, filename=self._cfg.filename, disk_format=self._cfg.disk_format
-        )
+        self._service = self._new_service()
 
         try:
             get_log_bus().subscribe_all(self._on_log_record)
@@ -269,6 +238,17 @@ class SyslogPlugin:
     def get_cli_commands(self) -> dict[str, Any]:
         return {"syslog": self._handle_syslog}
 
+    def _new_service(self) -> SyslogService:
+        # The live service shares its writer so CLI reads see buffered records.
+        if self._service is not None:
+            return self._service
+        return SyslogService(
+            self._fs,
+            filename=self._cfg.filename,
+            disk_format=self._cfg.disk_format,
+            rotation=self._cfg.rotation,
+        )
+
     def _resolve_config(self, resolver: ConfigResolver) -> SyslogConfig:
         # Detect plugin namespace presence.
         plugin_ns_present = False
@@ -339,6 +319,20 @@ class SyslogPlugin:
             cli_default_command = "tail"
             cli_default_follow = True
 
+        rotation_prefix = "plugins.syslog." if plugin_ns_present else "logging.system_log_"
+        rotation = SyslogRotation(
+            max_bytes=self._try_resolve_int(
+                resolver, rotation_prefix + "max_bytes", default=SyslogRotation.max_bytes
+            ),
+            max_age_s=float(
+                self._try_resolve_int(resolver, rotation_prefix + "max_age_s", default=0)
+            ),
+            backups=self._try_resolve_int(
+                resolver, rotation_prefix + "backups", default=SyslogRotation.backups
+            ),
+            compress=self._try_resolve_bool(resolver, rotation_prefix + "compress", default=False),
+        )
+
         if cli_default_command not in _ALLOWED_DEFAULT_CMDS:
             cli_default_command = "tail"
 
@@ -348,8 +342,19 @@ class SyslogPlugin:
             disk_format=str(disk_format),
             cli_default_command=str(cli_default_command),
             cli_default_follow=bool(cli_default_follow),
+            rotation=rotation,
         )
 
+    @staticmethod
+    def _try_resolve_int(resolver: ConfigResolver, key: str, *, default: int) -> int:
+        try:
+            v, _src = resolver.resolve(key)
+        except Exception:
+            return default
+        if isinstance(v, bool) or not isinstance(v, (int, float)) or v < 0:
+            return default
+        return int(v)
+
     @staticmethod
     def _try_resolve_bool(resolver: ConfigResolver, key: str, *, default: bool) -> bool:
         try:
@@ -443,9 +448,7 @@ class SyslogPlugin:
     def _cmd_status(self, _argv: list[str]) -> int:
         _emit_diag("START", operation="cli_status", data={"cmd": "status"})
         try:
-            svc = SyslogService(
-                self._fs, filename=self._cfg.filename, disk_format=self._cfg.disk_format
-            )
+            svc = self._new_service()
             exists = svc.exists()
             print(f"enabled = {'true' if self._cfg.enabled else 'false'}")
             print("root = stage")
@@ -480,9 +483,7 @@ class SyslogPlugin:
 
         _emit_diag("START", operation="cli_cat", data={"cmd": "cat", "raw": raw})
 
-        svc = SyslogService(
-            self._fs, filename=self._cfg.filename, disk_format=self._cfg.disk_format
-        )
+        svc = self._new_service()
         if not svc.exists():
             msg = "syslog file does not exist"
             print(msg)
@@ -518,9 +519,7 @@ class SyslogPlugin:
             raise
 
     def _cmd_tail(self, argv: list[str]) -> int:
-        svc = SyslogService(
-            self._fs, filename=self._cfg.filename, disk_format=self._cfg.disk_format
-        )
+        svc = self._new_service()
 
         try:
             args = _parse_tail_args(argv, self._cfg)
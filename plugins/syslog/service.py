@@ -1,23 +1,33 @@
 """Syslog persistence service.
 
 This module provides a thin wrapper over the file_io capability.
-All filesystem operations MUST go through FileService.
+All filesystem operations MUST go through FileService, with one exception:
+the buffered SyslogWriter (see writer.py) appends and rotates with plain file
+operations, because FileService operations log through the log bus that feeds
+the writer and would loop back into it.
 
 The syslog file is stored under the STAGE root, configured by
-logging.system_log_path (relative).
+logging.system_log_path (relative). Records are appended by the SyslogWriter,
+which resolves the path through FileService once and keeps the handle open.
+Reads (cat/tail) go through FileService and cover rotated segments too.
 """
 
 from __future__ import annotations
 
+import gzip
 import json
-import time
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 from audiomason.core.log_bus import LogRecord
 from plugins.file_io.service.service import FileService
 from plugins.file_io.service.types import RootName
 
+from .follow import follow_file
+from .writer import SyslogRotation, SyslogWriter, segment_name
+
 
 @dataclass(frozen=True)
 class SyslogConfig:
@@ -26,15 +36,26 @@ class SyslogConfig:
     disk_format: str  # jsonl | plain
     cli_default_command: str  # tail | status | cat
     cli_default_follow: bool
+    rotation: SyslogRotation = field(default_factory=SyslogRotation)
 
 
 class SyslogService:
     """Append/read/tail/follow syslog file under the file_io STAGE root."""
 
-    def __init__(self, fs: FileService, *, filename: str, disk_format: str) -> None:
+    def __init__(
+        self,
+        fs: FileService,
+        *,
+        filename: str,
+        disk_format: str,
+        rotation: SyslogRotation | None = None,
+    ) -> None:
         self._fs = fs
         self._filename = filename
         self._disk_format = disk_format
+        self._rotation = rotation or SyslogRotation()
+        self._writer: SyslogWriter | None = None
+        self._writer_lock = threading.Lock()
 
     @property
     def filename(self) -> str:
@@ -45,61 +66,67 @@ class SyslogService:
         return self._disk_format
 
     def exists(self) -> bool:
-        return self._fs.exists(RootName.STAGE, self._filename)
+        self.flush()
+        if self._fs.exists(RootName.STAGE, self._filename):
+            return True
+        return bool(self._segment_names())
 
     def append_record(self, record: LogRecord) -> None:
-        line = self._encode_record(record)
-        with self._fs.open_append(RootName.STAGE, self._filename, mkdir_parents=True) as f:
-            f.write(line)
+        self._get_writer().write(self._encode_record(record))
+
+    def flush(self) -> None:
+        """Wait until every appended record is on disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and release the append handle."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
 
     def read_all_raw(self) -> str:
-        with self._fs.open_read(RootName.STAGE, self._filename) as f:
-            data = f.read()
-        if not isinstance(data, (bytes, bytearray)):
-            raise TypeError("syslog read returned non-bytes")
-        return bytes(data).decode("utf-8", errors="replace")
+        self.flush()
+        chunks = [self._read_segment(name) for name in reversed(self._segment_names())]
+        if self._fs.exists(RootName.STAGE, self._filename):
+            chunks.append(self._read_segment(self._filename))
+        return b"".join(chunks).decode("utf-8", errors="replace")
 
     def tail_lines_raw(self, n: int) -> list[str]:
         if n <= 0:
             return []
+        self.flush()
 
         # Read at most N lines from the end by tailing bytes with a conservative cap.
         # This is a best-effort tail that avoids reading full files for very large logs.
-        max_bytes = max(4096, n * 512)
-        raw = self._fs.tail_bytes(RootName.STAGE, self._filename, max_bytes=max_bytes)
-        text = raw.decode("utf-8", errors="replace")
-        lines = text.splitlines()
+        lines: list[str] = []
+        if self._fs.exists(RootName.STAGE, self._filename):
+            max_bytes = max(4096, n * 512)
+            raw = self._fs.tail_bytes(RootName.STAGE, self._filename, max_bytes=max_bytes)
+            lines = raw.decode("utf-8", errors="replace").splitlines()
+
+        # Right after a rotation the live file is short; continue into segments.
+        for name in self._segment_names():
+            if len(lines) >= n:
+                break
+            older = self._read_segment(name).decode("utf-8", errors="replace").splitlines()
+            lines = older + lines
         return lines[-n:]
 
-    def follow_lines_raw(self, *, poll_interval_s: float = 0.2) -> Any:
+    def follow_lines_raw(
+        self, *, poll_interval_s: float = 0.2, start_offset: int | None = None
+    ) -> Iterator[str]:
         """Yield new raw lines as they are appended.
 
-        Implementation reads the full file on each poll and yields only new lines
-        past the last byte offset.
+        Starts at the current end of the live file (or at start_offset) and
+        reads only appended bytes; see follow.follow_file for rotation handling.
         """
-        offset = 0
-        while True:
-            with self._fs.open_read(
-                RootName.STAGE,
-                self._filename,
-                silent_polling_read=True,
-            ) as f:
-                data = f.read()
-
-            if not isinstance(data, (bytes, bytearray)):
-                raise TypeError("syslog read returned non-bytes")
-
-            b = bytes(data)
-            new_bytes = b[offset:]
-            if new_bytes:
-                offset += len(new_bytes)
-                for raw_line in new_bytes.splitlines():
-                    line = raw_line.decode("utf-8", errors="replace")
-                    if line.strip() == "":
-                        continue
-                    yield line
-
-            time.sleep(poll_interval_s)
+        self.flush()
+        path = self._fs.resolve_abs_path(RootName.STAGE, self._filename)
+        raw_lines = follow_file(path, start_offset=start_offset, poll_interval_s=poll_interval_s)
+        decoded = (raw.decode("utf-8", errors="replace") for raw in raw_lines)
+        return (line for line in decoded if line.strip() != "")
 
     def human_render_lines(self, raw_lines: list[str]) -> list[str]:
         if self._disk_format == "plain":
@@ -137,6 +164,35 @@ class SyslogService:
 
         return out
 
+    def _get_writer(self) -> SyslogWriter:
+        writer = self._writer
+        if writer is not None:
+            return writer
+        with self._writer_lock:
+            if self._writer is None:
+                path = self._fs.resolve_abs_path(RootName.STAGE, self._filename)
+                self._writer = SyslogWriter(path, rotation=self._rotation)
+            return self._writer
+
+    def _segment_names(self) -> list[str]:
+        """Return existing rotated segment names, newest first."""
+        out: list[str] = []
+        for index in range(1, max(0, int(self._rotation.backups)) + 1):
+            for compressed in (False, True):
+                name = segment_name(self._filename, index, compressed=compressed)
+                if self._fs.exists(RootName.STAGE, name):
+                    out.append(name)
+                    break
+        return out
+
+    def _read_segment(self, name: str) -> bytes:
+        with self._fs.open_read(RootName.STAGE, name) as f:
+            data = f.read()
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError("syslog read returned non-bytes")
+        b = bytes(data)
+        return gzip.decompress(b) if name.endswith(".gz") else b
+
     def _encode_record(self, record: LogRecord) -> bytes:
         if self._disk_format == "plain":
             plain = record.plain if record.plain is not None else ""
@@ -0,0 +1,233 @@
+"""Buffered syslog writer with size/age based rotation.
+
+Log records are encoded by the caller and handed to SyslogWriter, which puts
+them on a bounded queue. A single daemon thread drains the queue in batches
+into one persistent append handle, so a log call costs a queue put instead of
+an open/write/close cycle (and its file_io observation events).
+
+Rotation renames the live file to <name>.1, shifting older segments up to
+<name>.<backups> and optionally gzip-compressing them to <name>.<n>.gz. If
+another process rotates the file, the writer notices the inode change and
+reopens.
+
+The absolute path is resolved once by FileService; the writer then owns the
+handle for its lifetime. Opening, appending and rotating deliberately bypass
+FileService: every FileService operation logs through the log bus, which is
+what feeds this writer, so doing them on the drain thread would queue new
+records to itself (and block on its own full queue).
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import gzip
+import os
+import queue
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUPS = 5
+DEFAULT_QUEUE_SIZE = 10000
+
+_BATCH_MAX = 512
+
+
+@dataclass(frozen=True)
+class SyslogRotation:
+    """Rotation policy. Zero disables the corresponding trigger."""
+
+    max_bytes: int = DEFAULT_MAX_BYTES
+    max_age_s: float = 0.0
+    backups: int = DEFAULT_BACKUPS
+    compress: bool = False
+
+
+def segment_name(filename: str, index: int, *, compressed: bool) -> str:
+    """Return the relative name of rotated segment index (1 is the newest)."""
+    return f"{filename}.{index}.gz" if compressed else f"{filename}.{index}"
+
+
+def _existing_segment(path: Path, index: int) -> Path | None:
+    for compressed in (False, True):
+        candidate = path.with_name(segment_name(path.name, index, compressed=compressed))
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def rotate_file(path: Path, rotation: SyslogRotation) -> None:
+    """Shift rotated segments and move the live file to segment 1."""
+    backups = max(0, int(rotation.backups))
+    if backups == 0:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+        return
+
+    oldest = _existing_segment(path, backups)
+    if oldest is not None:
+        oldest.unlink()
+    for index in range(backups - 1, 0, -1):
+        seg = _existing_segment(path, index)
+        if seg is None:
+            continue
+        suffix = ".gz" if seg.name.endswith(".gz") else ""
+        seg.rename(path.with_name(f"{path.name}.{index + 1}{suffix}"))
+
+    first = path.with_name(segment_name(path.name, 1, compressed=False))
+    try:
+        path.rename(first)
+    except FileNotFoundError:
+        return
+    if rotation.compress:
+        gz_path = path.with_name(segment_name(path.name, 1, compressed=True))
+        tmp = gz_path.with_name(gz_path.name + ".tmp")
+        with open(first, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        tmp.rename(gz_path)
+        first.unlink()
+
+
+class SyslogWriter:
+    """Append encoded lines to one file from a background thread."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        rotation: SyslogRotation | None = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        self._path = path
+        self._rotation = rotation or SyslogRotation()
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._closed = False
+
+        self._handle: BinaryIO | None = None
+        self._inode = -1
+        self._size = 0
+        self._opened_at = 0.0
+
+        self._thread = threading.Thread(target=self._drain, name="am-syslog", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(self, line: bytes) -> None:
+        """Queue one encoded line; blocks only if the queue is full.
+
+        Raises the error of a previously failed background write, once.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("syslog writer is closed")
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        """Block until every queued line has been written and flushed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write out queued lines, stop the thread and close the file."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._thread.join()
+
+    def _open(self) -> BinaryIO:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self._path, "ab")  # noqa: SIM115 - owned for the writer lifetime
+        st = os.fstat(handle.fileno())
+        self._inode = st.st_ino
+        self._size = st.st_size
+        self._opened_at = time.time()
+        return handle
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            with contextlib.suppress(OSError):
+                self._handle.close()
+            self._handle = None
+
+    def _current_handle(self) -> BinaryIO:
+        if self._handle is not None:
+            try:
+                if os.stat(self._path).st_ino != self._inode:
+                    self._close_handle()
+            except FileNotFoundError:
+                self._close_handle()
+        if self._handle is None:
+            self._handle = self._open()
+        return self._handle
+
+    def _needs_rotation(self) -> bool:
+        if self._size <= 0:
+            return False
+        max_bytes = int(self._rotation.max_bytes)
+        if max_bytes > 0 and self._size >= max_bytes:
+            return True
+        max_age = float(self._rotation.max_age_s)
+        return max_age > 0 and time.time() - self._opened_at >= max_age
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        handle = self._current_handle()
+        data = b"".join(batch)
+        handle.write(data)
+        handle.flush()
+        self._size += len(data)
+        if self._needs_rotation():
+            self._close_handle()
+            rotate_file(self._path, self._rotation)
+
+    def _drain(self) -> None:
+        stop = False
+        while not stop:
+            batch: list[bytes] = []
+            item = self._queue.get()
+            taken = 1
+            if item is None:
+                stop = True
+            else:
+                batch.append(item)
+            while not stop and len(batch) < _BATCH_MAX:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write_batch(batch)
+            except Exception as e:
+                self._close_handle()
+                with self._lock:
+                    self._error = e
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+        self._close_handle()
+
+
+__all__ = ["SyslogRotation", "SyslogWriter", "rotate_file", "segment_name"]
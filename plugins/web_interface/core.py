@@ -223,7 +223,7 @@ class WebInterfacePlugin:
                 )
                 logger.info("import_ui_mount: failed phase=get_plugin origin=None")
                 if verbosity >= 3:
-                    logger.debug(f"import_ui_mount: get_plugin failed: {exc!r}")
+                    logger.debug("import_ui_mount: get_plugin failed: %r", exc)
                 return
             except Exception as exc:
                 _emit(
@@ -237,7 +237,7 @@ class WebInterfacePlugin:
                 )
                 logger.info("import_ui_mount: failed phase=get_plugin origin=None")
                 if verbosity >= 3:
-                    logger.debug(f"import_ui_mount: get_plugin failed: {exc!r}")
+                    logger.debug("import_ui_mount: get_plugin failed: %r", exc)
                 return
 
             plugin_origin = _plugin_origin(plugin)
@@ -270,7 +270,7 @@ class WebInterfacePlugin:
                 )
                 logger.info(f"import_ui_mount: failed phase=build_router origin={plugin_origin}")
                 if verbosity >= 3:
-                    logger.debug(f"import_ui_mount: build_router failed: {exc!r}")
+                    logger.debug("import_ui_mount: build_router failed: %r", exc)
                 return
 
             if router is None:
@@ -300,7 +300,7 @@ class WebInterfacePlugin:
                 )
                 logger.info(f"import_ui_mount: failed phase=include_router origin={plugin_origin}")
                 if verbosity >= 3:
-                    logger.debug(f"import_ui_mount: include_router failed: {exc!r}")
+                    logger.debug("import_ui_mount: include_router failed: %r", exc)
                 return
 
             _emit(
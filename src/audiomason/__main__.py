@@ -15,6 +15,7 @@ import sys
 from pathlib import Path
 
 from audiomason.core import PluginLoader
+from audiomason.core.plugin_index import PluginIndex, default_plugin_index_path
 
 
 def _find_plugins_dir() -> Path:
@@ -63,7 +64,9 @@ def _run_main() -> None:
 async def main() -> None:
     """Main entry point."""
     plugins_dir = _find_plugins_dir()
-    loader = PluginLoader(builtin_plugins_dir=plugins_dir)
+    loader = PluginLoader(
+        builtin_plugins_dir=plugins_dir, index=PluginIndex(default_plugin_index_path())
+    )
 
     cli_plugin_dir = plugins_dir / "cmd_interface"
     if not cli_plugin_dir.exists():
@@ -73,6 +76,7 @@ async def main() -> None:
 
     try:
         cli_plugin = loader.load_plugin(cli_plugin_dir, validate=False)
+        loader.save_index()
         await cli_plugin.run()
     except Exception as e:  # pragma: no cover
         print(f"Error: {e}")
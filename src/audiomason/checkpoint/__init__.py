@@ -10,9 +10,12 @@ import json
 from pathlib import Path
 from typing import Any
 
+from audiomason.checkpoint.step_cache import StepResultCache, step_cache_key
 from audiomason.core.context import ProcessingContext
 from audiomason.core.errors import FileError
 
+__all__ = ["CheckpointManager", "StepResultCache", "step_cache_key"]
+
 
 class CheckpointManager:
     """Manage checkpoints for resume support."""
@@ -0,0 +1,257 @@
+"""Content-addressed cache of pipeline step outputs.
+
+Checkpoints only record context fields, so a re-run (after a crash, or with
+changed tags or cover) redoes every conversion. StepResultCache stores the
+files a step produced under a key derived from what determines them: the
+source file's content digest, the plugin name and version, and the plugin
+options that affect the output (for audio_processor: bitrate, loudnorm,
+split_chapters and the planned actions). Metadata is not part of the key, so
+re-tagging reuses the encoded files.
+
+Layout under the cache root:
+
+    entries/<k[:2]>/<key>/<index>.bin   output files, in step order
+    entries/<k[:2]>/<key>/entry.json    file names and total size
+    digests.json                        source digests by (path, mtime, size)
+
+An entry directory is built under a temporary name and renamed into place, so
+readers never see a partial entry. Hits refresh the entry's mtime; when the
+total size exceeds max_bytes, entries are evicted least recently used first.
+The digest table is bounded the same way: it keeps the max_digests most
+recently used sources. Callers hashing many sources pass persist=False and
+write the table once with save_digests().
+Cached files are copied out (never hard-linked), so later in-place tag
+writes cannot alter the cache. Every failure is treated as a miss.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+CACHE_SCHEMA_VERSION = 1
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024 * 1024
+DEFAULT_MAX_DIGESTS = 20000
+
+_ENTRY_FILE = "entry.json"
+_DIGESTS_FILE = "digests.json"
+_HASH_CHUNK = 1024 * 1024
+
+
+def default_step_cache_dir() -> Path:
+    """Return the per-user step cache location."""
+    return Path.home() / ".audiomason" / "cache" / "steps"
+
+
+def step_cache_key(
+    source_digest: str, plugin: str, version: str, options: Mapping[str, Any]
+) -> str:
+    """Return the cache key for one step run.
+
+    options must be JSON-serializable; key order does not matter.
+    """
+    payload = json.dumps(
+        {
+            "schema": CACHE_SCHEMA_VERSION,
+            "source": source_digest,
+            "plugin": plugin,
+            "version": version,
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+
+class StepResultCache:
+    """Size-bounded, LRU-evicted on-disk store of step output files."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_digests: int = DEFAULT_MAX_DIGESTS,
+    ) -> None:
+        self.root = root or default_step_cache_dir()
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_digests = max(1, int(max_digests))
+        self._lock = threading.Lock()
+        # Insertion order is recency order: the oldest digest comes first.
+        self._digests: dict[str, dict[str, Any]] | None = None
+        self._digests_dirty = False
+
+    # ------------------------------------------------------------------
+    # source digests
+    # ------------------------------------------------------------------
+
+    def _load_digests(self) -> dict[str, dict[str, Any]]:
+        if self._digests is None:
+            try:
+                raw = json.loads((self.root / _DIGESTS_FILE).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                raw = None
+            ok = isinstance(raw, dict) and raw.get("schema_version") == CACHE_SCHEMA_VERSION
+            files = raw.get("files") if ok and isinstance(raw, dict) else None
+            self._digests = dict(files) if isinstance(files, dict) else {}
+        return self._digests
+
+    def save_digests(self) -> None:
+        """Persist the digest table if it changed since the last save."""
+        with self._lock:
+            if not self._digests_dirty:
+                return
+            data = {"schema_version": CACHE_SCHEMA_VERSION, "files": self._load_digests()}
+            with contextlib.suppress(OSError):
+                self.root.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(prefix=".digests.", dir=self.root)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=True, separators=(",", ":"))
+                os.replace(tmp, self.root / _DIGESTS_FILE)
+                self._digests_dirty = False
+
+    def source_digest(self, path: Path, *, persist: bool = True) -> str:
+        """Return the sha256 of path's content.
+
+        The digest is remembered per (mtime_ns, size), so an unchanged
+        library is not re-read on every run. With persist=False a newly
+        computed digest stays in memory until save_digests() is called.
+        """
+        abs_path = path.resolve()
+        st = abs_path.stat()
+        stamp = [int(st.st_mtime_ns), int(st.st_size)]
+        key = str(abs_path)
+        with self._lock:
+            digests = self._load_digests()
+            known = digests.pop(key, None)
+            if isinstance(known, dict) and known.get("stamp") == stamp:
+                digests[key] = known
+                return str(known["sha256"])
+
+        h = hashlib.sha256()
+        with open(abs_path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK):
+                h.update(chunk)
+        digest = h.hexdigest()
+
+        with self._lock:
+            digests = self._load_digests()
+            digests.pop(key, None)
+            digests[key] = {"stamp": stamp, "sha256": digest}
+            while len(digests) > self.max_digests:
+                del digests[next(iter(digests))]
+            self._digests_dirty = True
+        if persist:
+            self.save_digests()
+        return digest
+
+    # ------------------------------------------------------------------
+    # entries
+    # ------------------------------------------------------------------
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / "entries" / key[:2] / key
+
+    def get(self, key: str, outputs: Sequence[Path]) -> bool:
+        """Copy a cached entry to outputs (in step order); return False on a miss.
+
+        A hit requires the entry to hold exactly len(outputs) files.
+        """
+        entry_dir = self._entry_dir(key)
+        try:
+            meta = json.loads((entry_dir / _ENTRY_FILE).read_text(encoding="utf-8"))
+            files = meta["files"]
+            if not isinstance(files, list) or len(files) != len(outputs):
+                return False
+            for name, output in zip(files, outputs, strict=True):
+                output.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(entry_dir / str(name), output)
+            os.utime(entry_dir / _ENTRY_FILE)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    def put(self, key: str, files: Sequence[Path]) -> None:
+        """Store copies of files under key, then evict down to max_bytes."""
+        entry_dir = self._entry_dir(key)
+        if (entry_dir / _ENTRY_FILE).exists():
+            return
+        tmp_dir: Path | None = None
+        try:
+            entry_dir.parent.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=entry_dir.parent))
+            names: list[str] = []
+            total = 0
+            for index, src in enumerate(files):
+                name = f"{index:04d}.bin"
+                shutil.copyfile(src, tmp_dir / name)
+                total += (tmp_dir / name).stat().st_size
+                names.append(name)
+            (tmp_dir / _ENTRY_FILE).write_text(
+                json.dumps({"files": names, "size": total}, ensure_ascii=True),
+                encoding="utf-8",
+            )
+            os.rename(tmp_dir, entry_dir)
+            tmp_dir = None
+        except OSError:
+            return
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        out: list[tuple[float, int, Path]] = []
+        base = self.root / "entries"
+        if not base.is_dir():
+            return out
+        for shard in base.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry_dir in shard.iterdir():
+                meta_path = entry_dir / _ENTRY_FILE
+                try:
+                    st = meta_path.stat()
+                    size = int(json.loads(meta_path.read_text(encoding="utf-8"))["size"])
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+                out.append((st.st_mtime, size, entry_dir))
+        return out
+
+    def total_bytes(self) -> int:
+        return sum(size for _mtime, size, _path in self._entries())
+
+    def evict(self) -> int:
+        """Delete least recently used entries until under max_bytes; return count."""
+        entries = sorted(self._entries(), key=lambda item: item[0])
+        total = sum(size for _mtime, size, _path in entries)
+        removed = 0
+        for _mtime, size, entry_dir in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+__all__ = [
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_MAX_DIGESTS",
+    "StepResultCache",
+    "default_step_cache_dir",
+    "step_cache_key",
+]
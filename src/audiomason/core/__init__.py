@@ -27,6 +27,7 @@ from audiomason.core.errors import (
     DiskFullError,
     FileError,
     MetadataError,
+    OperationCancelledError,
     PipelineError,
     PluginError,
     PluginNotFoundError,
@@ -38,9 +39,12 @@ from audiomason.core.jobs import Job, JobService, JobState, JobStore, JobType
 from audiomason.core.loader import PluginLoader, PluginManifest
 from audiomason.core.logging import (
     VerbosityLevel,
+    flush_console,
     get_logger,
     get_verbosity,
+    log_scope,
     set_colors,
+    set_console_async,
     set_log_file,
     set_verbosity,
 )
@@ -72,6 +76,7 @@ __all__ = [
     "DiskFullError",
     "MetadataError",
     "CoverError",
+    "OperationCancelledError",
     # Events
     "EventBus",
     "get_event_bus",
@@ -97,8 +102,11 @@ __all__ = [
     "get_logger",
     "set_verbosity",
     "get_verbosity",
+    "log_scope",
     "set_log_file",
     "set_colors",
+    "set_console_async",
+    "flush_console",
     # Jobs
     "Job",
     "JobType",
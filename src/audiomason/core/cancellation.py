@@ -0,0 +1,190 @@
+"""Cooperative cancellation for running jobs and their subprocesses.
+
+A CancelToken is created per job, carried on ProcessingContext.cancel_token
+and made current (a contextvar) while a pipeline step runs. Subprocesses are
+started through run_subprocess, which puts each child in its own process
+group and, when the token fires (or the awaiting task is cancelled),
+terminates the whole group: SIGTERM, then SIGKILL after a grace period. The
+caller gets OperationCancelledError and cleans up its partial outputs.
+
+Tokens may be cancelled from any thread.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import os
+import signal
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+
+from audiomason.core.errors import OperationCancelledError
+
+TERMINATE_GRACE_S = 2.0
+
+_CURRENT: contextvars.ContextVar[CancelToken | None] = contextvars.ContextVar(
+    "audiomason_cancel_token", default=None
+)
+
+
+class CancelToken:
+    """Thread-safe, one-shot cancellation flag with callbacks."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reason: str | None = None
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._reason is not None
+
+    @property
+    def reason(self) -> str | None:
+        return self._reason
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        with self._lock:
+            if self._reason is not None:
+                return
+            self._reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            with contextlib.suppress(Exception):
+                callback()
+
+    def raise_if_cancelled(self) -> None:
+        if self._reason is not None:
+            raise OperationCancelledError(f"Operation cancelled: {self._reason}")
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call callback on cancel (now, if already cancelled); return a remover."""
+        with self._lock:
+            if self._reason is None:
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback: Callable[[], None]) -> None:
+        with self._lock, contextlib.suppress(ValueError):
+            self._callbacks.remove(callback)
+
+    def wait_future(self) -> asyncio.Future[None]:
+        """Future on the running loop that completes when the token is cancelled."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[None] = loop.create_future()
+
+        def _resolve() -> None:
+            if not fut.done():
+                fut.set_result(None)
+
+        def _fire() -> None:
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(_resolve)
+
+        remove = self.add_callback(_fire)
+        fut.add_done_callback(lambda _f: remove())
+        return fut
+
+
+def current_cancel_token() -> CancelToken | None:
+    return _CURRENT.get()
+
+
+@contextlib.contextmanager
+def cancel_scope(token: CancelToken | None) -> Iterator[None]:
+    """Make token current for the enclosed code (and tasks it creates)."""
+    reset = _CURRENT.set(token)
+    try:
+        yield
+    finally:
+        _CURRENT.reset(reset)
+
+
+def _signal_group(proc: asyncio.subprocess.Process, sig: int) -> None:
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, sig)
+        else:
+            proc.send_signal(sig)
+
+
+async def stop_process_group(
+    proc: asyncio.subprocess.Process, *, grace_s: float = TERMINATE_GRACE_S
+) -> None:
+    """Terminate proc's process group, escalating to SIGKILL after grace_s."""
+    if proc.returncode is not None:
+        return
+    _signal_group(proc, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(proc.wait(), grace_s)
+    except TimeoutError:
+        _signal_group(proc, signal.SIGKILL)
+        await proc.wait()
+
+
+async def run_subprocess(
+    cmd: Sequence[str],
+    *,
+    token: CancelToken | None = None,
+    stdout: int | None = asyncio.subprocess.PIPE,
+    stderr: int | None = asyncio.subprocess.PIPE,
+    stdin_data: bytes | None = None,
+    grace_s: float = TERMINATE_GRACE_S,
+) -> tuple[int, bytes, bytes]:
+    """Run cmd to completion; return (returncode, stdout, stderr).
+
+    stdin_data, when given, is written to the child's stdin (which is then
+    closed); otherwise stdin is inherited. token defaults to the current one.
+    When it is cancelled while cmd runs, the child's process group is stopped
+    and OperationCancelledError raised.
+    """
+    token = token if token is not None else current_cancel_token()
+    if token is not None:
+        token.raise_if_cancelled()
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if stdin_data is not None else None,
+        stdout=stdout,
+        stderr=stderr,
+        start_new_session=True,
+    )
+    communicate: asyncio.Future[tuple[Any, Any]] = asyncio.ensure_future(
+        proc.communicate(stdin_data)
+    )
+    cancelled = token.wait_future() if token is not None else None
+    try:
+        waiters: set[asyncio.Future[Any]] = {communicate}
+        if cancelled is not None:
+            waiters.add(cancelled)
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        if not communicate.done():
+            assert token is not None
+            await asyncio.shield(stop_process_group(proc, grace_s=grace_s))
+            token.raise_if_cancelled()
+        out, err = await communicate
+    except BaseException:
+        await asyncio.shield(stop_process_group(proc, grace_s=grace_s))
+        communicate.cancel()
+        with contextlib.suppress(BaseException):
+            await communicate
+        raise
+    finally:
+        if cancelled is not None:
+            cancelled.cancel()
+    return int(proc.returncode or 0), out or b"", err or b""
+
+
+__all__ = [
+    "CancelToken",
+    "cancel_scope",
+    "current_cancel_token",
+    "run_subprocess",
+    "stop_process_group",
+]
@@ -5,11 +5,18 @@ Priority (highest to lowest):
 2. Environment variables (AUDIOMASON_*)
 3. Config files (user > system)
 4. Defaults
+
+All layers are compiled on first use into one flat mapping of dotted key
+path -> (value, source), so resolve() is a single dict lookup. The compiled
+view is rebuilt when a config file's stamp or the AUDIOMASON_* environment
+changes (checked at most every RECHECK_INTERVAL_S) and on invalidate().
 """
 
 from __future__ import annotations
 
 import os
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -21,6 +28,11 @@ from audiomason.core.errors import ConfigError
 ALLOWED_LOGGING_LEVELS = frozenset({"quiet", "normal", "verbose", "debug"})
 DEFAULT_LOGGING_LEVEL = "normal"
 
+ENV_PREFIX = "AUDIOMASON_"
+RECHECK_INTERVAL_S = 1.0
+
+_MISSING: Any = object()
+
 
 @dataclass
 class ConfigSource:
@@ -121,6 +133,37 @@ def _flatten_keys(data: dict[str, Any], prefix: str = "") -> set[str]:
     return {k for k, _v in _flatten_items(data, prefix=prefix)}
 
 
+def _index_nodes(data: dict[str, Any], source: str, out: dict[str, Any], prefix: str = "") -> None:
+    """Record every non-None node of data (mappings included) by dotted path.
+
+    Mirrors dot-notation lookup: keys that are not strings or contain a dot
+    are unreachable by a dotted path and are skipped.
+    """
+    for key, value in data.items():
+        if not isinstance(key, str) or "." in key or value is None:
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        out[path] = (value, source)
+        if isinstance(value, dict):
+            _index_nodes(value, source, out, path)
+
+
+def _env_name(key: str) -> str:
+    return f"{ENV_PREFIX}{key.upper().replace('.', '_')}"
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _env_snapshot() -> dict[str, str]:
+    return {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX)}
+
+
 @dataclass(frozen=True)
 class LoggingPolicy:
     """Resolved, immutable logging policy.
@@ -177,6 +220,13 @@ class ConfigResolver:
         self._user_config: dict[str, Any] | None = None
         self._system_config: dict[str, Any] | None = None
 
+        # Compiled view: key -> (value, source), or _MISSING for known misses.
+        self._lock = threading.Lock()
+        self._compiled: dict[str, Any] | None = None
+        self._env: dict[str, str] = {}
+        self._stamp: tuple[Any, ...] = ()
+        self._checked_at = 0.0
+
     def resolve(self, key: str) -> tuple[Any, str]:
         """Resolve config value with priority.
 
@@ -189,32 +239,83 @@ class ConfigResolver:
         Raises:
             ConfigError: If key not found in any source
         """
-        # 1. CLI (highest priority)
-        value = self._from_cli(key)
-        if value is not None:
-            return value, "cli"
-
-        # 2. Environment
-        value = self._from_env(key)
-        if value is not None:
-            return value, "env"
-
-        # 3. User config
-        value = self._from_user_config(key)
-        if value is not None:
-            return value, "user_config"
-
-        # 4. System config
-        value = self._from_system_config(key)
-        if value is not None:
-            return value, "system_config"
-
-        # 5. Default
-        value = self._from_defaults(key)
-        if value is not None:
-            return value, "default"
+        compiled = self._compiled_view()
+        found = compiled.get(key)
+        if found is None:
+            found = self._resolve_uncompiled(key, compiled)
+        if found is _MISSING:
+            raise ConfigError(f"Config key '{key}' not found in any source")
+        return found
+
+    def resolve_many(self, keys: list[str]) -> dict[str, tuple[Any, str]]:
+        """Resolve several keys at once; keys found in no source are omitted."""
+        compiled = self._compiled_view()
+        out: dict[str, tuple[Any, str]] = {}
+        for key in keys:
+            found = compiled.get(key)
+            if found is None:
+                found = self._resolve_uncompiled(key, compiled)
+            if found is not _MISSING:
+                out[key] = found
+        return out
+
+    def invalidate(self) -> None:
+        """Drop loaded config files and the compiled view; the next call rebuilds."""
+        with self._lock:
+            self._user_config = None
+            self._system_config = None
+            self._compiled = None
+
+    def _current_stamp(self, env: dict[str, str]) -> tuple[Any, ...]:
+        return (
+            _file_stamp(self.user_config_path),
+            _file_stamp(self.system_config_path),
+            tuple(sorted(env.items())),
+        )
 
-        raise ConfigError(f"Config key '{key}' not found in any source")
+    def _compiled_view(self) -> dict[str, Any]:
+        compiled = self._compiled
+        now = time.monotonic()
+        if compiled is not None and now - self._checked_at < RECHECK_INTERVAL_S:
+            return compiled
+
+        with self._lock:
+            env = _env_snapshot()
+            stamp = self._current_stamp(env)
+            if self._compiled is not None and stamp == self._stamp:
+                self._checked_at = now
+                return self._compiled
+            self._user_config = None
+            self._system_config = None
+            self._env = env
+            self._stamp = stamp
+            self._compiled = self._compile()
+            self._checked_at = now
+            return self._compiled
+
+    def _compile(self) -> dict[str, Any]:
+        # Lowest priority first; each higher layer overwrites.
+        compiled: dict[str, Any] = {}
+        _index_nodes(self.defaults, "default", compiled)
+        _index_nodes(self._get_system_config(), "system_config", compiled)
+        _index_nodes(self._get_user_config(), "user_config", compiled)
+        if self._env:
+            for key in compiled:
+                env_value = self._env.get(_env_name(key))
+                if env_value is not None:
+                    compiled[key] = (env_value, "env")
+        _index_nodes(self.cli_args, "cli", compiled)
+        return compiled
+
+    def _resolve_uncompiled(self, key: str, compiled: dict[str, Any]) -> Any:
+        """Resolve a key present in no layer: only the environment can supply it.
+
+        The answer (hit or miss) is memoized in the compiled view.
+        """
+        env_value = self._env.get(_env_name(key))
+        found = (env_value, "env") if env_value is not None else _MISSING
+        compiled[key] = found
+        return found
 
     def resolve_logging_level(self) -> str:
         """Resolve and validate logging.level.
@@ -447,34 +548,6 @@ class ConfigResolver:
 
         return result
 
-    def _from_cli(self, key: str) -> Any | None:
-        """Get value from CLI args."""
-        return self._get_nested(self.cli_args, key)
-
-    def _from_env(self, key: str) -> Any | None:
-        """Get value from environment variables.
-
-        Environment variable format: AUDIOMASON_KEY_NAME
-        Example: AUDIOMASON_BITRATE, AUDIOMASON_OUTPUT_DIR
-        """
-        # Convert key to env var name
-        env_key = f"AUDIOMASON_{key.upper().replace('.', '_')}"
-        return os.environ.get(env_key)
-
-    def _from_user_config(self, key: str) -> Any | None:
-        """Get value from user config file."""
-        config = self._get_user_config()
-        return self._get_nested(config, key)
-
-    def _from_system_config(self, key: str) -> Any | None:
-        """Get value from system config file."""
-        config = self._get_system_config()
-        return self._get_nested(config, key)
-
-    def _from_defaults(self, key: str) -> Any | None:
-        """Get value from defaults."""
-        return self._get_nested(self.defaults, key)
-
     def _get_user_config(self) -> dict[str, Any]:
         """Load user config file (cached)."""
         if self._user_config is None:
@@ -499,25 +572,6 @@ class ConfigResolver:
         except Exception as e:
             raise ConfigError(f"Failed to load config from {path}: {e}") from e
 
-    def _get_nested(self, data: dict[str, Any], key: str) -> Any | None:
-        """Get nested value using dot notation.
-
-        Example:
-            data = {'logging': {'level': 'debug'}}
-            _get_nested(data, 'logging.level') -> 'debug'
-        """
-        parts = key.split(".")
-        current: Any = data
-
-        for part in parts:
-            if not isinstance(current, dict):
-                return None
-            current = current.get(part)
-            if current is None:
-                return None
-
-        return current
-
     @staticmethod
     def _default_config() -> dict[str, Any]:
         """Default configuration."""
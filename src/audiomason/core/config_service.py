@@ -145,6 +145,18 @@ class ConfigService:
             _set_nested(out, k, src.value)
         return out
 
+    def get_value(self, key_path: str) -> Any | None:
+        """Return the effective value of one key, or None when it is unset.
+
+        Unlike get_config(), this resolves a single key and does not rebuild
+        the whole nested mapping.
+        """
+        try:
+            value, _source = self._resolver.resolve(key_path)
+        except ConfigError:
+            return None
+        return value
+
     def get_effective_items(self) -> list[EffectiveConfigItem]:
         items: list[EffectiveConfigItem] = []
         resolved = self._resolver.resolve_all()
@@ -161,13 +173,8 @@ class ConfigService:
         return _dump_yaml_dict(flat)
 
     def _reinit_resolver(self) -> None:
-        path = self.user_config_path
-        self._resolver = ConfigResolver(
-            cli_args=self._resolver.cli_args,
-            user_config_path=path,
-            system_config_path=self._resolver.system_config_path,
-            defaults=self._resolver.defaults,
-        )
+        # The user config file changed; drop the resolver's compiled view.
+        self._resolver.invalidate()
 
     def set_value(self, key_path: str, value: Any) -> None:
         """Set a value in the user config file (lowest of non-default sources)."""
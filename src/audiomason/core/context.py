@@ -7,6 +7,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from audiomason.core.cancellation import CancelToken
+
 
 class State(Enum):
     """Processing state."""
@@ -128,6 +130,8 @@ class ProcessingContext:
     current_step: str | None = None
     progress: float = 0.0  # 0.0 - 1.0
     completed_steps: list[str] = field(default_factory=list)
+    # Set by the orchestrator; steps and their subprocesses stop when it fires.
+    cancel_token: CancelToken | None = field(default=None, repr=False, compare=False)
 
     # ===========================================
     #  WORKING PATHS
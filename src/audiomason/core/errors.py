@@ -87,3 +87,9 @@ class CoverError(AudioMasonError):
     """Cover-related error."""
 
     pass
+
+
+class OperationCancelledError(AudioMasonError):
+    """Operation stopped because its job was cancelled."""
+
+    pass
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import contextlib
+import threading
 import time
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
 from typing import Any
 
 from audiomason.core.diagnostics import build_envelope
 from audiomason.core.events import get_event_bus
+from audiomason.core.jobs.log_writer import JobLogWriter
 from audiomason.core.jobs.model import Job, JobState, JobType
 from audiomason.core.jobs.store import JobStore
 from audiomason.core.logging import get_logger
@@ -55,6 +58,9 @@ def _emit_op_end(operation: str, data: dict[str, Any]) -> None:
 class JobService:
     def __init__(self, store: JobStore | None = None) -> None:
         self._store = store if store is not None else JobStore()
+        # Open log writers of jobs running in this process: job_id -> (writer, users).
+        self._writers: dict[str, tuple[JobLogWriter, int]] = {}
+        self._writers_lock = threading.Lock()
 
     @property
     def store(self) -> JobStore:
@@ -151,22 +157,59 @@ class JobService:
     def read_log(
         self, job_id: str, offset: int = 0, limit_bytes: int = 64 * 1024
     ) -> tuple[str, int]:
+        with self._writers_lock:
+            entry = self._writers.get(job_id)
+        if entry is not None:
+            entry[0].flush()
         path = self._store.job_log_path(job_id)
-        if not path.exists():
-            return ("", offset)
-        data = path.read_bytes()
         if offset < 0:
             offset = 0
-        chunk = data[offset : offset + limit_bytes]
+        try:
+            with path.open("rb") as f:
+                f.seek(offset)
+                chunk = f.read(limit_bytes)
+        except FileNotFoundError:
+            return ("", offset)
         text = chunk.decode("utf-8", errors="replace")
         return (text, offset + len(chunk))
 
     def append_log_line(self, job_id: str, line: str) -> None:
+        with self._writers_lock:
+            entry = self._writers.get(job_id)
+        if entry is not None:
+            entry[0].write_line(line)
+            return
         path = self._store.job_log_path(job_id)
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("a", encoding="utf-8") as f:
             f.write(line.rstrip("\n") + "\n")
 
+    @contextlib.contextmanager
+    def job_log(self, job_id: str) -> Iterator[Callable[[str], None]]:
+        """Keep the job's log open and buffered while the job runs here.
+
+        Yields a line sink. While open, append_log_line for the job goes
+        through the same writer, so lines stay in order. Nested use shares
+        one writer; it is flushed and closed when the last user leaves.
+        """
+        with self._writers_lock:
+            entry = self._writers.get(job_id)
+            if entry is None:
+                entry = (JobLogWriter(self._store.job_log_path(job_id)), 0)
+            writer = entry[0]
+            self._writers[job_id] = (writer, entry[1] + 1)
+        try:
+            yield writer.write_line
+        finally:
+            with self._writers_lock:
+                _writer, users = self._writers[job_id]
+                if users <= 1:
+                    del self._writers[job_id]
+                else:
+                    self._writers[job_id] = (writer, users - 1)
+            if users <= 1:
+                writer.close()
+
     def cancel_job(self, job_id: str) -> Job:
         job = self._store.load_job(job_id)
         now = _utcnow_iso()
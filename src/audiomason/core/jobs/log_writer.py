@@ -0,0 +1,113 @@
+"""Buffered per-job log writer.
+
+A running job logs through one JobLogWriter: the log file stays open, lines
+are collected in memory and written in batches. A batch is written when it
+reaches MAX_BUFFERED_LINES, when the writer is flushed or closed, and by a
+shared background thread every FLUSH_INTERVAL_S, so readers polling the log
+file see new lines promptly even when a job is quiet.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import weakref
+from pathlib import Path
+from typing import TextIO
+
+FLUSH_INTERVAL_S = 0.5
+MAX_BUFFERED_LINES = 256
+
+
+class _Flusher:
+    """One daemon thread flushing every open writer periodically."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._writers: weakref.WeakSet[JobLogWriter] = weakref.WeakSet()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, writer: JobLogWriter) -> None:
+        with self._lock:
+            self._writers.add(writer)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="am-job-log-flush", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def unregister(self, writer: JobLogWriter) -> None:
+        with self._lock:
+            self._writers.discard(writer)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                writers = list(self._writers)
+            if not writers:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            self._wake.wait(FLUSH_INTERVAL_S)
+            self._wake.clear()
+            for writer in writers:
+                with contextlib.suppress(Exception):
+                    writer.flush()
+
+
+_FLUSHER = _Flusher()
+
+
+class JobLogWriter:
+    """Append lines to a job log through a persistent, buffered handle."""
+
+    def __init__(self, path: Path, *, max_buffered: int = MAX_BUFFERED_LINES) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._max_buffered = max(1, int(max_buffered))
+        self._lock = threading.Lock()
+        self._buffer: list[str] = []
+        self._file: TextIO | None = path.open("a", encoding="utf-8")
+        _FLUSHER.register(self)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write_line(self, line: str) -> None:
+        text = line.rstrip("\n") + "\n"
+        with self._lock:
+            if self._file is None:
+                # Closed: fall back to a one-off append.
+                with self._path.open("a", encoding="utf-8") as f:
+                    f.write(text)
+                return
+            self._buffer.append(text)
+            if len(self._buffer) >= self._max_buffered:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._file is None or not self._buffer:
+            return
+        self._file.write("".join(self._buffer))
+        self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        _FLUSHER.unregister(self)
+
+
+__all__ = ["FLUSH_INTERVAL_S", "JobLogWriter", "MAX_BUFFERED_LINES"]
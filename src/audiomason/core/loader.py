@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import ast
 import importlib.util
 import re
 import sys
@@ -16,6 +17,45 @@ if TYPE_CHECKING:
     from audiomason.core.plugin_registry import PluginRegistry
 
 from audiomason.core.errors import PluginError, PluginNotFoundError, PluginValidationError
+from audiomason.core.plugin_index import PluginIndex
+
+# libyaml's C parser is several times faster for manifests when available.
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_yaml(content: bytes) -> Any:
+    return yaml.load(content, Loader=_YAML_LOADER)
+
+
+def _module_facts(content: bytes, module_file: Path) -> dict[str, Any]:
+    """Derive validation facts (syntax, imports, classes) from module source."""
+    try:
+        tree = ast.parse(content, filename=str(module_file))
+        compile(tree, str(module_file), "exec")
+    except SyntaxError as e:
+        return {"syntax_error": str(e), "imports": [], "classes": []}
+
+    imports: list[str] = []
+    classes: list[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imports.append(node.module)
+        elif isinstance(node, ast.ClassDef):
+            classes.append(node.name)
+    return {"syntax_error": None, "imports": imports, "classes": classes}
+
+
+def _module_available(name: str) -> bool:
+    """Check that a top-level module can be imported, without importing it."""
+    top = name.split(".")[0]
+    if top in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(top) is not None
+    except (ImportError, ValueError):
+        return False
 
 
 @dataclass
@@ -54,6 +94,7 @@ class PluginLoader:
         system_plugins_dir: Path | None = None,
         *,
         registry: PluginRegistry | None = None,
+        index: PluginIndex | None = None,
     ) -> None:
         """Initialize plugin loader.
 
@@ -61,6 +102,8 @@ class PluginLoader:
             builtin_plugins_dir: Built-in plugins directory
             user_plugins_dir: User plugins directory
             system_plugins_dir: System plugins directory
+            registry: Plugin registry enforcing enablement and callable publication
+            index: Persistent manifest/validation index (no disk cache if None)
         """
         self.builtin_plugins_dir = builtin_plugins_dir
         self.user_plugins_dir = user_plugins_dir or Path.home() / ".audiomason/plugins"
@@ -69,11 +112,15 @@ class PluginLoader:
         self._ensure_builtin_import_root()
 
         self._registry = registry
+        self._index = index
 
         # Loaded plugins
         self._plugins: dict[str, Any] = {}
         self._manifests: dict[str, PluginManifest] = {}
 
+        # Parsed manifests keyed by path, valid while (mtime_ns, size) match
+        self._manifest_cache: dict[Path, tuple[tuple[int, int], PluginManifest]] = {}
+
     def _ensure_builtin_import_root(self) -> None:
         """Ensure built-in plugins can import the top-level 'plugins' package.
 
@@ -175,6 +222,11 @@ class PluginLoader:
 
         return plugin_instance
 
+    def save_index(self) -> None:
+        """Persist the plugin index after a batch of manifest loads/validations."""
+        if self._index is not None:
+            self._index.save()
+
     def get_plugin(self, name: str) -> Any:
         """Get loaded plugin by name.
 
@@ -251,12 +303,27 @@ class PluginLoader:
         """
         manifest_path = plugin_dir / "plugin.yaml"
 
-        if not manifest_path.exists():
-            raise PluginError(f"Plugin manifest not found: {manifest_path}")
+        try:
+            st = manifest_path.stat()
+        except OSError:
+            raise PluginError(f"Plugin manifest not found: {manifest_path}") from None
 
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._manifest_cache.get(manifest_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        manifest = self._parse_manifest(manifest_path)
+        self._manifest_cache[manifest_path] = (stamp, manifest)
+        return manifest
+
+    def _parse_manifest(self, manifest_path: Path) -> PluginManifest:
+        """Parse and validate one plugin.yaml file."""
         try:
-            with open(manifest_path) as f:
-                data = yaml.safe_load(f)
+            if self._index is not None:
+                data = self._index.lookup("manifests", manifest_path, _parse_yaml)
+            else:
+                data = _parse_yaml(manifest_path.read_bytes())
 
             interfaces = data.get("interfaces", [])
             if not isinstance(interfaces, list) or not all(isinstance(x, str) for x in interfaces):
@@ -412,60 +479,29 @@ class PluginLoader:
         if not module_file.exists():
             raise PluginValidationError(f"Plugin module not found: {module_file}")
 
-        # 2. Python syntax check
+        # 2-4. Syntax, imports and class presence, from one parse of the module.
+        # Facts are cached by file stamp/hash; imports are checked with
+        # find_spec so validation never executes third-party module code.
         try:
-            with open(module_file) as f:
-                code = f.read()
-            compile(code, str(module_file), "exec")
-        except SyntaxError as e:
-            validation_errors.append(f"Syntax error in {module_file}: {e}")
-
-        # 3. Test imports in sandbox (basic check - just try to import)
-        try:
-            import ast
-
-            with open(module_file) as f:
-                tree = ast.parse(f.read())
-
-            # Extract imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        try:
-                            __import__(alias.name.split(".")[0])
-                        except ImportError:
-                            validation_errors.append(
-                                f"Import error: module '{alias.name}' not available"
-                            )
-                elif isinstance(node, ast.ImportFrom) and node.module:
-                    try:
-                        __import__(node.module.split(".")[0])
-                    except ImportError:
-                        validation_errors.append(
-                            f"Import error: module '{node.module}' not available"
-                        )
-        except Exception as e:
-            validation_errors.append(f"Import validation failed: {e}")
-
-        # 4. Class exists (check via AST to avoid loading)
-        class_name = manifest.entrypoint.split(":")[1] if ":" in manifest.entrypoint else None
-        if class_name:
-            try:
-                import ast
+            if self._index is not None:
+                facts = self._index.lookup(
+                    "modules", module_file, lambda content: _module_facts(content, module_file)
+                )
+            else:
+                facts = _module_facts(module_file.read_bytes(), module_file)
+        except OSError as e:
+            raise PluginValidationError(f"Plugin module not readable: {module_file}: {e}") from e
 
-                with open(module_file) as f:
-                    tree = ast.parse(f.read())
+        if facts["syntax_error"] is not None:
+            validation_errors.append(f"Syntax error in {module_file}: {facts['syntax_error']}")
 
-                class_found = False
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef) and node.name == class_name:
-                        class_found = True
-                        break
+        for imported in facts["imports"]:
+            if not _module_available(imported):
+                validation_errors.append(f"Import error: module '{imported}' not available")
 
-                if not class_found:
-                    validation_errors.append(f"Class '{class_name}' not found in {module_file}")
-            except Exception as e:
-                validation_errors.append(f"Class validation failed: {e}")
+        class_name = manifest.entrypoint.split(":")[1] if ":" in manifest.entrypoint else None
+        if class_name and facts["syntax_error"] is None and class_name not in facts["classes"]:
+            validation_errors.append(f"Class '{class_name}' not found in {module_file}")
 
         # 5-6. Method presence/signatures would require loading the class
         # Skip for basic validation to avoid side effects
@@ -473,9 +509,7 @@ class PluginLoader:
         # 7. Check dependencies (basic - just check if importable)
         if manifest.dependencies:
             for dep_name, dep_info in manifest.dependencies.items():
-                try:
-                    __import__(dep_name)
-                except ImportError:
+                if not _module_available(dep_name):
                     # Check if it's a conditional dependency
                     if isinstance(dep_info, dict) and dep_info.get("optional", False):
                         # Optional dependency - just warning
@@ -51,6 +51,10 @@ class LogBus:
         except ValueError:
             return
 
+    def has_subscribers(self, level_name: str) -> bool:
+        """Return True if publishing a record at level_name would reach anyone."""
+        return bool(self._subs_all) or bool(self._subs_by_level.get(level_name))
+
     def publish(self, record: LogRecord) -> None:
         for cb in list(self._subs_all):
             self._invoke_cb(cb, record)
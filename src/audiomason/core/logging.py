@@ -17,14 +17,36 @@ Usage:
     logger.info("Started processing")
     logger.warning("Cover not found")
     logger.error("Failed to convert")
+
+Messages are built only when the level is enabled: pass %-style arguments
+(logger.debug("state %s", state)) or a zero-argument callable
+(logger.debug(lambda: expensive_dump())) instead of an f-string.
+
+Console output is printed synchronously by default. set_console_async(True)
+routes it through a bounded queue drained by a background thread, so a slow
+terminal or pipe never blocks the caller; when the queue is full, console
+lines are dropped (LogBus subscribers still receive every record) and the
+count is reported once the queue drains.
+
+log_scope(sink, verbosity=...) routes lines and overrides the verbosity for
+the current context only (a contextvar, so it follows asyncio tasks and
+asyncio.to_thread). Jobs use it instead of swapping the global log sink, so
+concurrent jobs in one process keep their logs apart.
 """
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import contextvars
+import queue
 import sys
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from enum import IntEnum
 from pathlib import Path
+from typing import Any, TextIO
 
 from audiomason.core.config import LoggingPolicy
 from audiomason.core.log_bus import LogRecord, get_log_bus
@@ -52,6 +74,125 @@ _USE_COLORS: bool = True
 _LOG_SINK: Callable[[str], None] | None = None
 _LEGACY_SINK_ADAPTER: Callable[[LogRecord], None] | None = None
 
+# Optional queued console writer (None: print synchronously)
+_CONSOLE_WRITER: _ConsoleWriter | None = None
+_CONSOLE_LOCK = threading.Lock()
+
+Message = str | Callable[[], str]
+
+
+@dataclass(frozen=True)
+class _LogScope:
+    sink: Callable[[str], None] | None
+    verbosity: VerbosityLevel | None
+
+
+_SCOPE: contextvars.ContextVar[_LogScope | None] = contextvars.ContextVar(
+    "audiomason_log_scope", default=None
+)
+
+
+def _render(message: Message, args: tuple[Any, ...]) -> str:
+    if callable(message):
+        return str(message())
+    if args:
+        return message % args
+    return message
+
+
+class _ConsoleWriter:
+    """Write console lines from a daemon thread via a bounded queue."""
+
+    def __init__(self, max_queue: int) -> None:
+        self._queue: queue.Queue[tuple[TextIO, str] | None] = queue.Queue(maxsize=max_queue)
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._drain, name="am-console", daemon=True)
+        self._thread.start()
+
+    def write(self, stream: TextIO, text: str) -> None:
+        try:
+            self._queue.put_nowait((stream, text))
+        except queue.Full:
+            self._dropped += 1
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                stream, text = item
+                try:
+                    stream.write(text + "\n")
+                    if self._queue.empty():
+                        stream.flush()
+                        if self._dropped:
+                            dropped, self._dropped = self._dropped, 0
+                            sys.stderr.write(f"[warning] {dropped} console log lines dropped\n")
+                except Exception:
+                    # A closed or broken stream must not kill the writer.
+                    pass
+            finally:
+                self._queue.task_done()
+
+
+def set_console_async(enabled: bool, *, max_queue: int = 10000) -> None:
+    """Route console output through a background writer thread (or stop doing so).
+
+    Disabling drains pending lines first.
+    """
+    global _CONSOLE_WRITER
+    with _CONSOLE_LOCK:
+        writer = _CONSOLE_WRITER
+        if enabled:
+            if writer is None:
+                _CONSOLE_WRITER = _ConsoleWriter(max(1, int(max_queue)))
+                atexit.register(flush_console)
+            return
+        _CONSOLE_WRITER = None
+    if writer is not None:
+        writer.close()
+
+
+def flush_console() -> None:
+    """Block until queued console output has been written."""
+    writer = _CONSOLE_WRITER
+    if writer is not None:
+        writer.flush()
+
+
+# isatty() is a syscall; remember the answer for the last stream seen.
+_TTY_CACHE: tuple[object, bool] | None = None
+
+
+def _stream_is_tty(stream: TextIO) -> bool:
+    global _TTY_CACHE
+    cached = _TTY_CACHE
+    if cached is not None and cached[0] is stream:
+        return cached[1]
+    try:
+        result = bool(stream.isatty())
+    except Exception:
+        result = False
+    _TTY_CACHE = (stream, result)
+    return result
+
+
+def _emit_console(level_name: str, formatted: str) -> None:
+    stream = sys.stderr if level_name == "ERROR" else sys.stdout
+    writer = _CONSOLE_WRITER
+    if writer is None:
+        print(formatted, file=stream)
+    else:
+        writer.write(stream, formatted)
+
 
 def set_verbosity(level: int | VerbosityLevel) -> None:
     """Set global verbosity level.
@@ -68,14 +209,49 @@ def set_verbosity(level: int | VerbosityLevel) -> None:
 
 
 def get_verbosity() -> VerbosityLevel:
-    """Get current verbosity level.
+    """Get current verbosity level (the log_scope override, if any).
 
     Returns:
         Current verbosity level
     """
+    return _effective_verbosity()
+
+
+def _effective_verbosity() -> VerbosityLevel:
+    scope = _SCOPE.get()
+    if scope is not None and scope.verbosity is not None:
+        return scope.verbosity
     return _VERBOSITY
 
 
+@contextlib.contextmanager
+def log_scope(
+    sink: Callable[[str], None] | None = None,
+    *,
+    verbosity: int | VerbosityLevel | None = None,
+) -> Iterator[None]:
+    """Route log lines to sink and use verbosity within the current context.
+
+    Unset arguments are inherited from an enclosing scope. Lines still reach
+    LogBus subscribers and the console as usual.
+
+    Args:
+        sink: Callback receiving each plain log line
+        verbosity: Verbosity for this context instead of the global one
+    """
+    outer = _SCOPE.get()
+    level = VerbosityLevel(verbosity) if verbosity is not None else None
+    scope = _LogScope(
+        sink=sink if sink is not None else (outer.sink if outer else None),
+        verbosity=level if level is not None else (outer.verbosity if outer else None),
+    )
+    token = _SCOPE.set(scope)
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
 def apply_logging_policy(policy: LoggingPolicy) -> None:
     """Apply a resolved LoggingPolicy to core logging.
 
@@ -179,7 +355,14 @@ class AudioMasonLogger:
         Returns:
             True if should log
         """
-        return level <= _VERBOSITY
+        return level <= _effective_verbosity()
+
+    def is_enabled(self, level: VerbosityLevel) -> bool:
+        """Return True if a message at level would be emitted.
+
+        Use it to guard building expensive log payloads.
+        """
+        return self._should_log(level)
 
     def _format_message(self, level: str, message: str) -> str:
         """Format log message.
@@ -192,75 +375,79 @@ class AudioMasonLogger:
             Formatted message
         """
         # Add color if enabled
-        if _USE_COLORS and sys.stdout.isatty():
+        if _USE_COLORS and _stream_is_tty(sys.stdout):
             color = self.COLORS.get(level, "")
             reset = self.COLORS["RESET"]
             return f"{color}[{level.lower()}]{reset} {message}"
         return f"[{level.lower()}] {message}"
 
-    def _log(self, level: VerbosityLevel, level_name: str, message: str) -> None:
+    def _emit(self, level_name: str, message: str) -> None:
+        bus = get_log_bus()
+        publish = bus.has_subscribers(level_name)
+        scope = _SCOPE.get()
+        sink = scope.sink if scope is not None else None
+        if publish or sink is not None:
+            plain = f"[{level_name.lower()}] {message}"
+            if sink is not None:
+                with contextlib.suppress(Exception):
+                    sink(plain)
+            if publish:
+                bus.publish(LogRecord(level_name=level_name, plain=plain, logger_name=self.name))
+
+        _emit_console(level_name, self._format_message(level_name, message))
+
+    def _log(self, level: VerbosityLevel, level_name: str, message: Message, *args: Any) -> None:
         """Internal logging method.
 
         Args:
             level: Required verbosity level
             level_name: Level name for display
-            message: Message to log
+            message: Message text, %-format string (with args) or callable
+            args: %-format arguments
         """
         if not self._should_log(level):
             return
+        self._emit(level_name, _render(message, args))
 
-        formatted = self._format_message(level_name, message)
-
-        plain = f"[{level_name.lower()}] {message}"
-        get_log_bus().publish(LogRecord(level_name=level_name, plain=plain, logger_name=self.name))
-
-        # Console output
-        print(formatted, file=sys.stderr if level_name == "ERROR" else sys.stdout)
-
-    def debug(self, message: str) -> None:
+    def debug(self, message: Message, *args: Any) -> None:
         """Log debug message (verbosity >= DEBUG).
 
         Args:
             message: Message to log
         """
-        self._log(VerbosityLevel.DEBUG, "DEBUG", message)
+        self._log(VerbosityLevel.DEBUG, "DEBUG", message, *args)
 
-    def verbose(self, message: str) -> None:
+    def verbose(self, message: Message, *args: Any) -> None:
         """Log verbose message (verbosity >= VERBOSE).
 
         Args:
             message: Message to log
         """
-        self._log(VerbosityLevel.VERBOSE, "VERBOSE", message)
+        self._log(VerbosityLevel.VERBOSE, "VERBOSE", message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: Message, *args: Any) -> None:
         """Log info message (verbosity >= NORMAL).
 
         Args:
             message: Message to log
         """
-        self._log(VerbosityLevel.NORMAL, "INFO", message)
+        self._log(VerbosityLevel.NORMAL, "INFO", message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: Message, *args: Any) -> None:
         """Log warning message (verbosity >= QUIET).
 
         Args:
             message: Message to log
         """
-        self._log(VerbosityLevel.QUIET, "WARNING", message)
+        self._log(VerbosityLevel.QUIET, "WARNING", message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: Message, *args: Any) -> None:
         """Log error message (always shown).
 
         Args:
             message: Message to log
         """
-        formatted = self._format_message("ERROR", message)
-
-        plain = f"[error] {message}"
-        get_log_bus().publish(LogRecord(level_name="ERROR", plain=plain, logger_name=self.name))
-
-        print(formatted, file=sys.stderr)
+        self._emit("ERROR", _render(message, args))
 
 
 # Logger registry
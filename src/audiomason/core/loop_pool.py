@@ -0,0 +1,159 @@
+"""Reusable background event loops for running coroutines from sync code.
+
+Sync callers (CLI job runs, wizard callables invoked from the DSL runtime)
+used to build and tear down a fresh thread and event loop per coroutine.
+LoopPool keeps a few loop threads alive instead. Each submitted coroutine
+gets a loop to itself for its whole run, so blocking code inside one
+coroutine never stalls another, and a coroutine that itself bridges into
+sync code that submits again simply gets a second loop.
+
+Like asyncio.run, tasks left behind by a coroutine are cancelled when it
+finishes. Cancelling the returned future cancels the coroutine on its loop.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any
+
+DEFAULT_MAX_IDLE = 2
+
+
+class _LoopThread:
+    """One event loop running forever on a daemon thread."""
+
+    def __init__(self, name: str) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._main, name=name, daemon=True)
+        self._thread.start()
+
+    def _main(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            self.loop.close()
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        if self.loop.is_closed():
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        except RuntimeError:
+            return
+        if timeout is not None and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+
+async def _cancel_stray_tasks() -> None:
+    current = asyncio.current_task()
+    stray = [task for task in asyncio.all_tasks() if task is not current]
+    for task in stray:
+        task.cancel()
+    if stray:
+        await asyncio.gather(*stray, return_exceptions=True)
+
+
+class LoopPool:
+    """Hand out event loop threads, keeping up to max_idle of them warm."""
+
+    def __init__(self, *, max_idle: int = DEFAULT_MAX_IDLE, name: str = "am-loop") -> None:
+        self._max_idle = max(0, int(max_idle))
+        self._name = name
+        self._lock = threading.Lock()
+        self._idle: list[_LoopThread] = []
+        self._created = 0
+        self._closed = False
+
+    def _acquire(self) -> _LoopThread:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("loop pool is shut down")
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+            name = f"{self._name}-{self._created}"
+        return _LoopThread(name)
+
+    def _release(self, runner: _LoopThread) -> None:
+        with self._lock:
+            if not self._closed and len(self._idle) < self._max_idle:
+                self._idle.append(runner)
+                return
+        runner.stop()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future[Any]:
+        """Schedule coro on a pooled loop and return a thread-safe future."""
+        runner = self._acquire()
+
+        async def _main() -> Any:
+            try:
+                return await coro
+            finally:
+                await _cancel_stray_tasks()
+                # Runs on the loop thread, after the coroutine is fully done,
+                # so the loop is never handed out while still busy.
+                self._release(runner)
+
+        try:
+            return asyncio.run_coroutine_threadsafe(_main(), runner.loop)
+        except BaseException:
+            coro.close()
+            runner.stop()
+            raise
+
+    def run(self, coro: Coroutine[Any, Any, Any], *, timeout: float | None = None) -> Any:
+        """Run coro on a pooled loop and block until it finishes.
+
+        If the wait is interrupted (KeyboardInterrupt, timeout), the
+        coroutine is cancelled before the exception propagates.
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self, *, timeout: float | None = 5.0) -> None:
+        """Stop idle loops; loops still running coroutines stop when those finish."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for runner in idle:
+            runner.stop(timeout=timeout)
+
+
+_pool_lock = threading.Lock()
+_pool: LoopPool | None = None
+
+
+def get_loop_pool() -> LoopPool:
+    """Return the process-wide loop pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = LoopPool()
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def run_coro_blocking(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run coro to completion on the shared loop pool and return its result."""
+    return get_loop_pool().run(coro)
+
+
+__all__ = ["LoopPool", "get_loop_pool", "run_coro_blocking"]
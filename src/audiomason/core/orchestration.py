@@ -11,14 +11,16 @@ This module is UI-agnostic: CLI and the future web interface can both call it.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import threading
 import time
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from audiomason.core.cancellation import CancelToken
 from audiomason.core.config import ConfigResolver
 from audiomason.core.context import ProcessingContext
 from audiomason.core.diagnostics import build_envelope
@@ -26,16 +28,11 @@ from audiomason.core.errors import ConfigError
 from audiomason.core.events import get_event_bus
 from audiomason.core.jobs.api import JobService
 from audiomason.core.jobs.model import Job, JobState, JobType
-from audiomason.core.logging import (
-    VerbosityLevel,
-    get_log_sink,
-    get_logger,
-    set_log_sink,
-    set_verbosity,
-)
+from audiomason.core.logging import VerbosityLevel, get_logger, log_scope
+from audiomason.core.loop_pool import run_coro_blocking
 from audiomason.core.orchestration_models import ProcessContractRequest, ProcessRequest
 from audiomason.core.phase import PhaseContractError, PhaseGuard
-from audiomason.core.pipeline import PipelineExecutor
+from audiomason.core.pipeline import Pipeline, PipelineExecutor, load_pipeline_limits
 from audiomason.core.process_contract_runtime import get_process_contract_runtime
 from audiomason.core.process_job_contracts import resolve_process_job_contract
 
@@ -52,6 +49,10 @@ OP_RUN_JOB = "run_job"
 OP_CTX = "context_lifecycle"
 OP_EXECUTE_PIPELINE = "execute_pipeline"
 
+# How often a running process job re-reads its job record for a cancel
+# request made by another process (the CLI, a web worker).
+CANCEL_POLL_S = 0.5
+
 
 def _emit_diag(event: str, *, operation: str, data: dict[str, Any]) -> None:
     """Emit a structured runtime diagnostic event via the authoritative entrypoint.
@@ -107,18 +108,11 @@ def _duration_ms(start: float, end: float) -> int:
 
 
 def _run_coro_sync(coro: Coroutine[Any, Any, Any]) -> None:
-    """Run a coroutine to completion in a dedicated event loop.
+    """Run a coroutine to completion on a pooled background event loop.
 
     This is used only when no running event loop exists (e.g., CLI code paths).
     """
-    loop = asyncio.new_event_loop()
-    try:
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(coro)
-        loop.run_until_complete(loop.shutdown_asyncgens())
-    finally:
-        asyncio.set_event_loop(None)
-        loop.close()
+    run_coro_blocking(coro)
 
 
 class Orchestrator:
@@ -126,6 +120,9 @@ class Orchestrator:
 
     def __init__(self, job_service: JobService | None = None) -> None:
         self._jobs = job_service if job_service is not None else JobService()
+        # Cancel tokens of process jobs running in this process.
+        self._cancel_tokens: dict[str, CancelToken] = {}
+        self._cancel_lock = threading.Lock()
 
     @property
     def jobs(self) -> JobService:
@@ -159,12 +156,8 @@ class Orchestrator:
             data={"job_id": job.job_id, "job_type": "process", "status": "running"},
         )
 
-        prev_sink = get_log_sink()
-        set_log_sink(lambda line: self._jobs.append_log_line(job.job_id, line))
-        try:
+        with log_scope(lambda line: self._jobs.append_log_line(job.job_id, line)):
             _LOGGER.info("started")
-        finally:
-            set_log_sink(prev_sink)
 
         try:
             loop = asyncio.get_running_loop()
@@ -225,12 +218,8 @@ class Orchestrator:
             job.meta["verbosity_override"] = str(int(verbosity))
             self._jobs.store.save_job(job)
 
-            prev_sink = get_log_sink()
-            set_log_sink(lambda line: self._jobs.append_log_line(job.job_id, line))
-            try:
+            with log_scope(lambda line: self._jobs.append_log_line(job.job_id, line)):
                 _LOGGER.info("started")
-            finally:
-                set_log_sink(prev_sink)
 
             try:
                 loop = asyncio.get_running_loop()
@@ -259,12 +248,8 @@ class Orchestrator:
             data={"job_id": job.job_id, "job_type": "process", "status": "running"},
         )
 
-        prev_sink = get_log_sink()
-        set_log_sink(lambda line: self._jobs.append_log_line(job.job_id, line))
-        try:
+        with log_scope(lambda line: self._jobs.append_log_line(job.job_id, line)):
             _LOGGER.info("started")
-        finally:
-            set_log_sink(prev_sink)
 
         def runner() -> None:
             _run_coro_sync(self._run_process_contract_job(job.job_id, request))
@@ -350,7 +335,36 @@ class Orchestrator:
         get_process_contract_runtime().start(jobs_root=self._jobs.store.root)
 
     def cancel(self, job_id: str) -> None:
+        """Request cancellation; a job running here stops its subprocesses at once."""
         self._jobs.cancel_job(job_id)
+        with self._cancel_lock:
+            token = self._cancel_tokens.get(job_id)
+        if token is not None:
+            token.cancel("job cancelled")
+
+    async def _watch_cancel_requests(self, job_id: str, token: CancelToken) -> None:
+        while not token.cancelled:
+            await asyncio.sleep(CANCEL_POLL_S)
+            with contextlib.suppress(Exception):
+                if self._jobs.get_job(job_id).cancel_requested:
+                    token.cancel("job cancelled")
+
+    def _finish_cancelled(self, job_id: str, *, start_time: float) -> None:
+        job = self._jobs.get_job(job_id)
+        job.transition(JobState.CANCELLED)
+        job.finished_at = _utcnow_iso()
+        self._jobs.store.save_job(job)
+        _emit_diag(
+            "diag.job.end",
+            operation=OP_RUN_JOB,
+            data={
+                "job_id": job_id,
+                "job_type": "process",
+                "status": "cancelled",
+                "duration_ms": _duration_ms(start_time, time.monotonic()),
+            },
+        )
+        _LOGGER.warning("cancelled")
 
     def get_job(self, job_id: str) -> Job:
         return self._jobs.get_job(job_id)
@@ -363,196 +377,70 @@ class Orchestrator:
     ) -> tuple[str, int]:
         return self._jobs.read_log(job_id, offset=offset, limit_bytes=limit_bytes)
 
+    @contextlib.contextmanager
+    def _job_log_scope(self, job_id: str) -> Iterator[None]:
+        """Log to job_id's log at its verbosity for the enclosed code only.
+
+        The scope is task-local, so jobs running concurrently on one loop
+        keep their lines and verbosity apart.
+        """
+        verbosity = _resolve_effective_verbosity()
+        override = self._jobs.get_job(job_id).meta.get("verbosity_override")
+        if isinstance(override, str) and override.isdigit():
+            verbosity = _parse_verbosity(int(override))
+        with self._jobs.job_log(job_id) as sink, log_scope(sink, verbosity=verbosity):
+            yield
+
     async def _run_process_contract_job(self, job_id: str, request: ProcessContractRequest) -> None:
-        prev_sink = get_log_sink()
-        set_log_sink(lambda line: self._jobs.append_log_line(job_id, line))
-        set_verbosity(_resolve_effective_verbosity())
         start_time = time.monotonic()
-        try:
-            job = self._jobs.get_job(job_id)
-            override = job.meta.get("verbosity_override")
-            if isinstance(override, str) and override.isdigit():
-                set_verbosity(_parse_verbosity(int(override)))
-
-            with PhaseGuard.processing():
-                plugin = request.plugin_loader.get_plugin(request.plugin_name)
-                handler = getattr(plugin, request.entrypoint_name)
-                _emit_diag(
-                    "diag.boundary.start",
-                    operation=OP_EXECUTE_PIPELINE,
-                    data={
-                        "job_id": job_id,
-                        "contract_id": request.contract_id,
-                        "plugin_name": request.plugin_name,
-                    },
-                )
-                try:
-                    result = handler(
-                        job_id=job_id,
-                        job_meta=dict(request.job_meta),
-                        plugin_loader=request.plugin_loader,
-                    )
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as e:
-                    _emit_diag(
-                        "diag.boundary.fail",
-                        operation=OP_EXECUTE_PIPELINE,
-                        data={
-                            "job_id": job_id,
-                            "contract_id": request.contract_id,
-                            "error_type": type(e).__name__,
-                            "error_message": str(e),
-                        },
-                    )
-                    raise
-                else:
+        with self._job_log_scope(job_id):
+            try:
+                with PhaseGuard.processing():
+                    plugin = request.plugin_loader.get_plugin(request.plugin_name)
+                    handler = getattr(plugin, request.entrypoint_name)
                     _emit_diag(
-                        "diag.boundary.end",
+                        "diag.boundary.start",
                         operation=OP_EXECUTE_PIPELINE,
                         data={
                             "job_id": job_id,
                             "contract_id": request.contract_id,
-                            "status": "succeeded",
+                            "plugin_name": request.plugin_name,
                         },
                     )
-
-            job = self._jobs.get_job(job_id)
-            job.progress = 1.0
-            job.transition(JobState.SUCCEEDED)
-            job.finished_at = _utcnow_iso()
-            self._jobs.store.save_job(job)
-            _emit_diag(
-                "diag.job.end",
-                operation=OP_RUN_JOB,
-                data={
-                    "job_id": job_id,
-                    "job_type": "process",
-                    "status": "succeeded",
-                    "duration_ms": _duration_ms(start_time, time.monotonic()),
-                },
-            )
-            _LOGGER.info("succeeded")
-        except PhaseContractError as e:
-            job = self._jobs.get_job(job_id)
-            job.transition(JobState.FAILED)
-            job.error = str(e)
-            job.finished_at = _utcnow_iso()
-            self._jobs.store.save_job(job)
-            _emit_diag(
-                "diag.job.end",
-                operation=OP_RUN_JOB,
-                data={
-                    "job_id": job_id,
-                    "job_type": "process",
-                    "status": "failed",
-                    "duration_ms": _duration_ms(start_time, time.monotonic()),
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                },
-            )
-            _LOGGER.error(f"failed: {e}")
-        except Exception as e:
-            job = self._jobs.get_job(job_id)
-            job.transition(JobState.FAILED)
-            job.error = str(e)
-            job.finished_at = _utcnow_iso()
-            self._jobs.store.save_job(job)
-            _emit_diag(
-                "diag.boundary.end",
-                operation=OP_EXECUTE_PIPELINE,
-                data={
-                    "job_id": job_id,
-                    "status": "failed",
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                },
-            )
-            _emit_diag(
-                "diag.job.end",
-                operation=OP_RUN_JOB,
-                data={
-                    "job_id": job_id,
-                    "job_type": "process",
-                    "status": "failed",
-                    "duration_ms": _duration_ms(start_time, time.monotonic()),
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                },
-            )
-            _LOGGER.error(f"failed: {e}")
-        finally:
-            set_log_sink(prev_sink)
-
-    async def _run_process_job(self, job_id: str, request: ProcessRequest) -> None:
-        prev_sink = get_log_sink()
-        set_log_sink(lambda line: self._jobs.append_log_line(job_id, line))
-        set_verbosity(_resolve_effective_verbosity())
-        start_time = time.monotonic()
-        try:
-            job = self._jobs.get_job(job_id)
-            override = job.meta.get("verbosity_override")
-            if isinstance(override, str) and override.isdigit():
-                set_verbosity(_parse_verbosity(int(override)))
-
-            with PhaseGuard.processing():
-                try:
-                    await self._run_process_job_impl(job_id, request, start_time=start_time)
-                except PhaseContractError as e:
-                    job = self._jobs.get_job(job_id)
-                    job.transition(JobState.FAILED)
-                    job.error = str(e)
-                    job.finished_at = _utcnow_iso()
-                    self._jobs.store.save_job(job)
-                    _emit_diag(
-                        "diag.job.end",
-                        operation=OP_RUN_JOB,
-                        data={
-                            "job_id": job_id,
-                            "job_type": "process",
-                            "status": "failed",
-                            "duration_ms": _duration_ms(start_time, time.monotonic()),
-                            "error_type": type(e).__name__,
-                            "error_message": str(e),
-                        },
-                    )
-                    _LOGGER.error(f"failed: {e}")
-                except Exception as e:
-                    job = self._jobs.get_job(job_id)
-                    job.transition(JobState.FAILED)
-                    job.error = str(e)
-                    job.finished_at = _utcnow_iso()
-                    self._jobs.store.save_job(job)
-                    _emit_diag(
-                        "diag.job.end",
-                        operation=OP_RUN_JOB,
-                        data={
-                            "job_id": job_id,
-                            "job_type": "process",
-                            "status": "failed",
-                            "duration_ms": _duration_ms(start_time, time.monotonic()),
-                            "error_type": type(e).__name__,
-                            "error_message": str(e),
-                        },
-                    )
-                    _LOGGER.error(f"failed: {e}")
-                else:
-                    # Success path is responsible for emitting diag.job.end.
-                    pass
-        finally:
-            set_log_sink(prev_sink)
-
-    async def _run_process_job_impl(
-        self, job_id: str, request: ProcessRequest, *, start_time: float
-    ) -> None:
-        contexts = request.contexts
-        total = max(1, len(contexts))
-        executor = PipelineExecutor(request.plugin_loader)
-
-        for i, ctx in enumerate(contexts, 1):
-            job = self._jobs.get_job(job_id)
-            if job.cancel_requested:
-                job.transition(JobState.CANCELLED)
+                    try:
+                        result = handler(
+                            job_id=job_id,
+                            job_meta=dict(request.job_meta),
+                            plugin_loader=request.plugin_loader,
+                        )
+                        if asyncio.iscoroutine(result):
+                            await result
+                    except Exception as e:
+                        _emit_diag(
+                            "diag.boundary.fail",
+                            operation=OP_EXECUTE_PIPELINE,
+                            data={
+                                "job_id": job_id,
+                                "contract_id": request.contract_id,
+                                "error_type": type(e).__name__,
+                                "error_message": str(e),
+                            },
+                        )
+                        raise
+                    else:
+                        _emit_diag(
+                            "diag.boundary.end",
+                            operation=OP_EXECUTE_PIPELINE,
+                            data={
+                                "job_id": job_id,
+                                "contract_id": request.contract_id,
+                                "status": "succeeded",
+                            },
+                        )
+
+                job = self._jobs.get_job(job_id)
+                job.progress = 1.0
+                job.transition(JobState.SUCCEEDED)
                 job.finished_at = _utcnow_iso()
                 self._jobs.store.save_job(job)
                 _emit_diag(
@@ -561,97 +449,191 @@ class Orchestrator:
                     data={
                         "job_id": job_id,
                         "job_type": "process",
-                        "status": "cancelled",
+                        "status": "succeeded",
                         "duration_ms": _duration_ms(start_time, time.monotonic()),
                     },
                 )
-                _LOGGER.warning("cancelled")
-                return
-
-            _LOGGER.info(f"processing: {ctx.source}")
-
-            _emit_diag(
-                "diag.ctx.start",
-                operation=OP_CTX,
-                data={
-                    "job_id": job_id,
-                    "context_index": i,
-                    "context_total": total,
-                    "source": str(ctx.source),
-                },
-            )
-
-            _emit_diag(
-                "diag.boundary.start",
-                operation=OP_EXECUTE_PIPELINE,
-                data={
-                    "job_id": job_id,
-                    "pipeline_path": str(request.pipeline_path),
-                    "source": str(ctx.source),
-                },
-            )
-
-            try:
-                await executor.execute_from_yaml(request.pipeline_path, ctx)
-            except Exception as e:
+                _LOGGER.info("succeeded")
+            except PhaseContractError as e:
+                job = self._jobs.get_job(job_id)
+                job.transition(JobState.FAILED)
+                job.error = str(e)
+                job.finished_at = _utcnow_iso()
+                self._jobs.store.save_job(job)
                 _emit_diag(
-                    "diag.boundary.fail",
-                    operation=OP_EXECUTE_PIPELINE,
+                    "diag.job.end",
+                    operation=OP_RUN_JOB,
                     data={
                         "job_id": job_id,
+                        "job_type": "process",
+                        "status": "failed",
+                        "duration_ms": _duration_ms(start_time, time.monotonic()),
                         "error_type": type(e).__name__,
                         "error_message": str(e),
                     },
                 )
+                _LOGGER.error(f"failed: {e}")
+            except Exception as e:
+                job = self._jobs.get_job(job_id)
+                job.transition(JobState.FAILED)
+                job.error = str(e)
+                job.finished_at = _utcnow_iso()
+                self._jobs.store.save_job(job)
                 _emit_diag(
                     "diag.boundary.end",
                     operation=OP_EXECUTE_PIPELINE,
                     data={
                         "job_id": job_id,
-                        "pipeline_path": str(request.pipeline_path),
                         "status": "failed",
                         "error_type": type(e).__name__,
                         "error_message": str(e),
                     },
                 )
                 _emit_diag(
-                    "diag.ctx.end",
-                    operation=OP_CTX,
+                    "diag.job.end",
+                    operation=OP_RUN_JOB,
                     data={
                         "job_id": job_id,
-                        "context_index": i,
-                        "context_total": total,
-                        "source": str(ctx.source),
+                        "job_type": "process",
                         "status": "failed",
+                        "duration_ms": _duration_ms(start_time, time.monotonic()),
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
                     },
                 )
-                raise
-            else:
+                _LOGGER.error(f"failed: {e}")
+
+    async def _run_process_job(self, job_id: str, request: ProcessRequest) -> None:
+        start_time = time.monotonic()
+        with self._job_log_scope(job_id), PhaseGuard.processing():
+            try:
+                await self._run_process_job_impl(job_id, request, start_time=start_time)
+            except PhaseContractError as e:
+                job = self._jobs.get_job(job_id)
+                job.transition(JobState.FAILED)
+                job.error = str(e)
+                job.finished_at = _utcnow_iso()
+                self._jobs.store.save_job(job)
                 _emit_diag(
-                    "diag.boundary.end",
-                    operation=OP_EXECUTE_PIPELINE,
+                    "diag.job.end",
+                    operation=OP_RUN_JOB,
                     data={
                         "job_id": job_id,
-                        "pipeline_path": str(request.pipeline_path),
-                        "status": "succeeded",
+                        "job_type": "process",
+                        "status": "failed",
+                        "duration_ms": _duration_ms(start_time, time.monotonic()),
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
                     },
                 )
+                _LOGGER.error(f"failed: {e}")
+            except Exception as e:
+                job = self._jobs.get_job(job_id)
+                job.transition(JobState.FAILED)
+                job.error = str(e)
+                job.finished_at = _utcnow_iso()
+                self._jobs.store.save_job(job)
                 _emit_diag(
-                    "diag.ctx.end",
-                    operation=OP_CTX,
+                    "diag.job.end",
+                    operation=OP_RUN_JOB,
                     data={
                         "job_id": job_id,
-                        "context_index": i,
-                        "context_total": total,
-                        "source": str(ctx.source),
-                        "status": "succeeded",
+                        "job_type": "process",
+                        "status": "failed",
+                        "duration_ms": _duration_ms(start_time, time.monotonic()),
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
                     },
                 )
+                _LOGGER.error(f"failed: {e}")
+            else:
+                # Success path is responsible for emitting diag.job.end.
+                pass
 
+    async def _run_process_job_impl(
+        self, job_id: str, request: ProcessRequest, *, start_time: float
+    ) -> None:
+        contexts = request.contexts
+        total = max(1, len(contexts))
+        limits = load_pipeline_limits()
+        executor = PipelineExecutor(
+            request.plugin_loader,
+            plugin_concurrency=limits.plugin_concurrency,
+            step_concurrency=limits.step_concurrency,
+            default_step_concurrency=limits.default_step_concurrency,
+        )
+        # Parsed once for all contexts of the job.
+        pipeline = executor.load_pipeline(request.pipeline_path)
+
+        # Up to contexts_in_flight books run at once; with per-step limits the
+        # next book's early steps overlap the previous book's later ones.
+        slots = asyncio.Semaphore(limits.contexts_in_flight)
+        in_flight: list[asyncio.Task[None]] = []
+        completed = 0
+
+        # One token for the job: cancelling it kills the subprocesses of every
+        # running step (see audiomason.core.cancellation).
+        token = CancelToken()
+        for ctx in contexts:
+            if ctx.cancel_token is None:
+                ctx.cancel_token = token
+        with self._cancel_lock:
+            self._cancel_tokens[job_id] = token
+        watcher = asyncio.create_task(self._watch_cancel_requests(job_id, token))
+
+        async def _run_one(index: int, ctx: ProcessingContext) -> None:
+            nonlocal completed
+            await self._run_process_context(
+                job_id, request, executor, pipeline, ctx, index=index, total=total
+            )
+            completed += 1
             job = self._jobs.get_job(job_id)
-            job.progress = float(i) / float(total)
+            job.progress = float(completed) / float(total)
             self._jobs.store.save_job(job)
 
+        def _raise_first_failure() -> None:
+            for task in in_flight:
+                if task.done() and not task.cancelled() and task.exception() is not None:
+                    task.result()
+
+        try:
+            for i, ctx in enumerate(contexts, 1):
+                await slots.acquire()
+                try:
+                    _raise_first_failure()
+                    if self._jobs.get_job(job_id).cancel_requested:
+                        token.cancel("job cancelled")
+                except BaseException:
+                    slots.release()
+                    raise
+                if token.cancelled:
+                    slots.release()
+                    break
+
+                task = asyncio.create_task(_run_one(i, ctx))
+                task.add_done_callback(lambda _t: slots.release())
+                in_flight.append(task)
+
+            await asyncio.gather(*in_flight)
+        except Exception:
+            # A step that failed because the job was cancelled is not a failure.
+            if not token.cancelled:
+                raise
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
+            with self._cancel_lock:
+                self._cancel_tokens.pop(job_id, None)
+
+        if token.cancelled:
+            self._finish_cancelled(job_id, start_time=start_time)
+            return
+
         job = self._jobs.get_job(job_id)
         job.progress = 1.0
         job.transition(JobState.SUCCEEDED)
@@ -668,3 +650,94 @@ class Orchestrator:
             },
         )
         _LOGGER.info("succeeded")
+
+    async def _run_process_context(
+        self,
+        job_id: str,
+        request: ProcessRequest,
+        executor: PipelineExecutor,
+        pipeline: Pipeline,
+        ctx: ProcessingContext,
+        *,
+        index: int,
+        total: int,
+    ) -> None:
+        _LOGGER.info(f"processing: {ctx.source}")
+
+        _emit_diag(
+            "diag.ctx.start",
+            operation=OP_CTX,
+            data={
+                "job_id": job_id,
+                "context_index": index,
+                "context_total": total,
+                "source": str(ctx.source),
+            },
+        )
+
+        _emit_diag(
+            "diag.boundary.start",
+            operation=OP_EXECUTE_PIPELINE,
+            data={
+                "job_id": job_id,
+                "pipeline_path": str(request.pipeline_path),
+                "source": str(ctx.source),
+            },
+        )
+
+        try:
+            await executor.execute_loaded(pipeline, ctx, request.pipeline_path)
+        except Exception as e:
+            _emit_diag(
+                "diag.boundary.fail",
+                operation=OP_EXECUTE_PIPELINE,
+                data={
+                    "job_id": job_id,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                },
+            )
+            _emit_diag(
+                "diag.boundary.end",
+                operation=OP_EXECUTE_PIPELINE,
+                data={
+                    "job_id": job_id,
+                    "pipeline_path": str(request.pipeline_path),
+                    "status": "failed",
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                },
+            )
+            _emit_diag(
+                "diag.ctx.end",
+                operation=OP_CTX,
+                data={
+                    "job_id": job_id,
+                    "context_index": index,
+                    "context_total": total,
+                    "source": str(ctx.source),
+                    "status": "failed",
+                },
+            )
+            raise
+        else:
+            _emit_diag(
+                "diag.boundary.end",
+                operation=OP_EXECUTE_PIPELINE,
+                data={
+                    "job_id": job_id,
+                    "pipeline_path": str(request.pipeline_path),
+                    "status": "succeeded",
+                },
+            )
+            _emit_diag(
+                "diag.ctx.end",
+                operation=OP_CTX,
+                data={
+                    "job_id": job_id,
+                    "context_index": index,
+                    "context_total": total,
+                    "source": str(ctx.source),
+                    "status": "succeeded",
+                },
+            )
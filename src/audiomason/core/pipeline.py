@@ -2,26 +2,46 @@
 
 Reads declarative YAML pipeline definitions and executes them
 as a DAG (Directed Acyclic Graph) with async and parallel support.
+
+Scheduling is a ready queue: a step starts as soon as its own dependencies
+have finished, not when a whole topological level has. Steps marked
+``parallel`` run concurrently, each on its own copy of the context; their
+changes are merged back field by field, and two steps writing different
+values to the same field is an error rather than a silent overwrite.
+Non-parallel steps run alone on the shared context. How many steps of one
+plugin may run at once is limited per plugin (``pipeline.plugin_concurrency``).
+
+Limits live on the executor, so one executor running several contexts at
+once (see Orchestrator process jobs) shares them: with a per-step limit of 1
+every step id works on one book at a time and books flow through the steps
+like a production line.
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import copy
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from audiomason.core.cancellation import cancel_scope
 from audiomason.core.context import ProcessingContext
 from audiomason.core.diagnostics import build_envelope
-from audiomason.core.errors import PipelineError
+from audiomason.core.errors import OperationCancelledError, PipelineError
 from audiomason.core.events import get_event_bus
 from audiomason.core.logging import get_logger
 
+# Fields owned by the scheduler itself; never merged from step copies.
+_UNMERGED_FIELDS = frozenset({"current_step"})
+_MISSING = object()
+
 
 @dataclass
 class PipelineStep:
@@ -66,16 +86,40 @@ class PipelineExecutor:
               parallel: true
     """
 
-    def __init__(self, plugin_loader: Any, log_fn: Callable[[str], None] | None = None) -> None:
+    def __init__(
+        self,
+        plugin_loader: Any,
+        log_fn: Callable[[str], None] | None = None,
+        *,
+        plugin_concurrency: Mapping[str, int] | None = None,
+        step_concurrency: Mapping[str, int] | None = None,
+        default_step_concurrency: int = 0,
+    ) -> None:
         """Initialize pipeline executor.
 
         Args:
             plugin_loader: Plugin loader instance
             log_fn: Optional logger callback for step events
+            plugin_concurrency: Max concurrently running steps per plugin name;
+                plugins not listed (or with a limit < 1) are unlimited
+            step_concurrency: Max concurrently running instances of a step id,
+                across all contexts this executor runs
+            default_step_concurrency: Limit for step ids not in step_concurrency
+                (< 1 means unlimited)
         """
         self.plugin_loader = plugin_loader
         self._log_fn = log_fn
         self._logger = get_logger(__name__)
+        self._plugin_limits = {
+            name: int(limit) for name, limit in (plugin_concurrency or {}).items() if int(limit) > 0
+        }
+        self._step_limits = {
+            name: int(limit) for name, limit in (step_concurrency or {}).items() if int(limit) >= 0
+        }
+        self._default_step_limit = max(0, int(default_step_concurrency))
+        # Semaphores are bound to the loop they were created on.
+        self._sem_loop: asyncio.AbstractEventLoop | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
 
     def _log(self, msg: str) -> None:
         if self._log_fn is not None:
@@ -92,6 +136,32 @@ class PipelineExecutor:
             )
             get_event_bus().publish(event, envelope)
 
+    def _semaphore(self, key: str, limit: int) -> asyncio.Semaphore | None:
+        if limit < 1:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._sem_loop is not loop:
+            self._sem_loop = loop
+            self._semaphores = {}
+        sem = self._semaphores.get(key)
+        if sem is None:
+            sem = self._semaphores[key] = asyncio.Semaphore(limit)
+        return sem
+
+    @contextlib.asynccontextmanager
+    async def _slot(self, step: PipelineStep) -> AsyncIterator[None]:
+        """Hold the step-id slot, then the plugin slot (fixed order, no deadlock)."""
+        async with contextlib.AsyncExitStack() as stack:
+            for sem in (
+                self._semaphore(
+                    f"step:{step.id}", self._step_limits.get(step.id, self._default_step_limit)
+                ),
+                self._semaphore(f"plugin:{step.plugin}", self._plugin_limits.get(step.plugin, 0)),
+            ):
+                if sem is not None:
+                    await stack.enter_async_context(sem)
+            yield
+
     async def execute(self, pipeline: Pipeline, context: ProcessingContext) -> ProcessingContext:
         """Execute pipeline.
 
@@ -105,12 +175,60 @@ class PipelineExecutor:
         Raises:
             PipelineError: If execution fails
         """
-        # Build DAG
-        dag = self._build_dag(pipeline.steps)
+        steps = pipeline.steps
+        children, in_degree = self._build_graph(steps)
+        # Reject cycles before any step runs.
+        self._build_dag(steps)
+
+        step_map = {step.id: step for step in steps}
+        ready: deque[PipelineStep] = deque(s for s in steps if in_degree[s.id] == 0)
+        running: dict[asyncio.Task[ProcessingContext | None], PipelineStep] = {}
+        exclusive = False
+
+        async def _run(step: PipelineStep) -> ProcessingContext | None:
+            async with self._slot(step):
+                if not step.parallel:
+                    return await self._execute_step(step, context)
+                base = _snapshot(context)
+                work = copy.copy(context)
+                vars(work).update(_snapshot(context))
+                result = await self._execute_step(step, work)
+                _merge_into(context, base, result, step.id)
+                return None
 
-        # Execute topologically
-        for level in dag:
-            context = await self._execute_level(level, context)
+        try:
+            while ready or running:
+                # Non-parallel steps run alone and go first among ready steps;
+                # while one waits, no new parallel step is started ahead of it.
+                if not exclusive:
+                    waiting_seq = next((s for s in ready if not s.parallel), None)
+                    if waiting_seq is not None:
+                        if not running:
+                            ready.remove(waiting_seq)
+                            running[asyncio.create_task(_run(waiting_seq))] = waiting_seq
+                            exclusive = True
+                    else:
+                        while ready:
+                            step = ready.popleft()
+                            running[asyncio.create_task(_run(step))] = step
+
+                done, _pending = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    result = task.result()
+                    if not step.parallel:
+                        exclusive = False
+                        if result is not None:
+                            context = result
+                    for child_id in children[step.id]:
+                        in_degree[child_id] -= 1
+                        if in_degree[child_id] == 0:
+                            ready.append(step_map[child_id])
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
         return context
 
@@ -129,6 +247,26 @@ class PipelineExecutor:
         Raises:
             PipelineError: If loading or execution fails
         """
+        return await self.execute_loaded(self.load_pipeline(yaml_path), context, yaml_path)
+
+    async def execute_loaded(
+        self, pipeline: Pipeline, context: ProcessingContext, yaml_path: Path
+    ) -> ProcessingContext:
+        """Execute an already loaded pipeline, with the execute_from_yaml diagnostics.
+
+        Lets callers running many contexts parse the pipeline YAML once.
+
+        Args:
+            pipeline: Pipeline loaded from yaml_path
+            context: Initial context
+            yaml_path: Path the pipeline was loaded from (reported in events)
+
+        Returns:
+            Final context
+
+        Raises:
+            PipelineError: If execution fails
+        """
         start_time = time.monotonic()
         self._emit_diag(
             "diag.pipeline.start",
@@ -139,7 +277,6 @@ class PipelineExecutor:
                 "status": "running",
             },
         )
-        pipeline = self.load_pipeline(yaml_path)
         try:
             result = await self.execute(pipeline, context)
         except Exception as e:
@@ -213,93 +350,56 @@ class PipelineExecutor:
         except Exception as e:
             raise PipelineError(f"Failed to load pipeline: {e}") from e
 
-    def _build_dag(self, steps: list[PipelineStep]) -> list[list[PipelineStep]]:
-        """Build DAG from steps using topological sort.
-
-        Returns:
-            List of levels, where each level contains steps that can run in parallel
+    def _build_graph(
+        self, steps: list[PipelineStep]
+    ) -> tuple[dict[str, list[str]], dict[str, int]]:
+        """Return (dependents per step, dependency count per step).
 
         Raises:
-            PipelineError: If DAG has cycles
+            PipelineError: If a step depends on an unknown step
         """
-        # Build dependency graph
-        step_map = {step.id: step for step in steps}
+        children: dict[str, list[str]] = {step.id: [] for step in steps}
         in_degree = {step.id: 0 for step in steps}
-
         for step in steps:
             for dep in step.after:
-                if dep not in step_map:
+                if dep not in children:
                     raise PipelineError(f"Step '{step.id}' depends on unknown step '{dep}'")
+                children[dep].append(step.id)
                 in_degree[step.id] += 1
+        return children, in_degree
 
-        # Topological sort (Kahn's algorithm)
-        levels: list[list[PipelineStep]] = []
-        remaining = set(step_map.keys())
-
-        while remaining:
-            # Find steps with no dependencies
-            current_level = [step_map[step_id] for step_id in remaining if in_degree[step_id] == 0]
-
-            if not current_level:
-                # Cycle detected
-                raise PipelineError(f"Pipeline has circular dependencies: {remaining}")
-
-            levels.append(current_level)
-
-            # Remove from remaining
-            for step in current_level:
-                remaining.remove(step.id)
-
-                # Decrease in-degree for dependent steps
-                for other_step in steps:
-                    if step.id in other_step.after:
-                        in_degree[other_step.id] -= 1
-
-        return levels
-
-    async def _execute_level(
-        self, steps: list[PipelineStep], context: ProcessingContext
-    ) -> ProcessingContext:
-        """Execute all steps in a level (potentially in parallel).
-
-        Args:
-            steps: Steps to execute
-            context: Current context
+    def _build_dag(self, steps: list[PipelineStep]) -> list[list[PipelineStep]]:
+        """Build DAG from steps using topological sort.
 
         Returns:
-            Updated context
+            List of levels, where each level contains steps that can run in parallel
 
         Raises:
-            PipelineError: If any step fails
+            PipelineError: If DAG has cycles
         """
-        if not steps:
-            return context
-
-        # Separate parallel and sequential steps
-        parallel_steps = [s for s in steps if s.parallel]
-        sequential_steps = [s for s in steps if not s.parallel]
-
-        # Execute sequential steps first
-        for step in sequential_steps:
-            context = await self._execute_step(step, context)
-
-        # Execute parallel steps
-        if parallel_steps:
-            tasks = [self._execute_step(step, context) for step in parallel_steps]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        children, in_degree = self._build_graph(steps)
+        step_map = {step.id: step for step in steps}
 
-            # Check for errors
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    raise PipelineError(
-                        f"Step '{parallel_steps[i].id}' failed: {result}"
-                    ) from result
+        # Topological sort (Kahn's algorithm), O(steps + dependencies)
+        levels: list[list[PipelineStep]] = []
+        current_level = [step for step in steps if in_degree[step.id] == 0]
+        seen = 0
+        while current_level:
+            levels.append(current_level)
+            seen += len(current_level)
+            next_level: list[PipelineStep] = []
+            for step in current_level:
+                for child_id in children[step.id]:
+                    in_degree[child_id] -= 1
+                    if in_degree[child_id] == 0:
+                        next_level.append(step_map[child_id])
+            current_level = next_level
 
-            # Use last result (all should have updated same context)
-            if results:
-                context = results[-1]  # type: ignore
+        if seen != len(step_map):
+            remaining = {step_id for step_id, n in in_degree.items() if n > 0}
+            raise PipelineError(f"Pipeline has circular dependencies: {remaining}")
 
-        return context
+        return levels
 
     async def _execute_step(
         self, step: PipelineStep, context: ProcessingContext
@@ -316,7 +416,7 @@ class PipelineExecutor:
         Raises:
             PipelineError: If step fails
         """
-        self._logger.verbose(f"step start: {step.id}")
+        self._logger.verbose("step start: %s", step.id)
 
         start_time = time.monotonic()
 
@@ -332,29 +432,35 @@ class PipelineExecutor:
         )
 
         try:
+            token = context.cancel_token
+            if token is not None:
+                token.raise_if_cancelled()
+
             # Mark step as current
             context.current_step = step.id
 
             # Get plugin
             plugin = self.plugin_loader.get_plugin(step.plugin)
 
-            # Execute based on interface
-            if step.interface == "IProcessor":
-                context = await plugin.process(context)
-            elif step.interface == "IProvider":
-                # Providers return data, not context
-                # For now, just call fetch and ignore result
-                # Real implementation would store result in context
-                pass
-            elif step.interface == "IEnricher":
-                context = await plugin.enrich(context)
-            else:
-                raise PipelineError(f"Unknown interface: {step.interface}")
+            # Execute based on interface; subprocesses started by the plugin
+            # pick up the context's cancel token.
+            with cancel_scope(token):
+                if step.interface == "IProcessor":
+                    context = await plugin.process(context)
+                elif step.interface == "IProvider":
+                    # Providers return data, not context
+                    # For now, just call fetch and ignore result
+                    # Real implementation would store result in context
+                    pass
+                elif step.interface == "IEnricher":
+                    context = await plugin.enrich(context)
+                else:
+                    raise PipelineError(f"Unknown interface: {step.interface}")
 
             # Mark step complete
             context.mark_step_complete(step.id)
 
-            self._logger.verbose(f"step done: {step.id}")
+            self._logger.verbose("step done: %s", step.id)
 
             self._emit_diag(
                 "diag.pipeline.step.end",
@@ -372,6 +478,7 @@ class PipelineExecutor:
             return context
 
         except Exception as e:
+            cancelled = isinstance(e, OperationCancelledError)
             self._emit_diag(
                 "diag.boundary.fail",
                 operation="plugin_call",
@@ -384,13 +491,16 @@ class PipelineExecutor:
                     "error_message": str(e),
                 },
             )
-            self._logger.error(f"step failed: {step.id}: {e}")
+            if cancelled:
+                self._logger.warning("step cancelled: %s", step.id)
+            else:
+                self._logger.error(f"step failed: {step.id}: {e}")
             self._emit_diag(
                 "diag.pipeline.step.end",
                 operation="step",
                 data={
                     "step_id": step.id,
-                    "status": "failed",
+                    "status": "cancelled" if cancelled else "failed",
                     "duration_ms": int((time.monotonic() - start_time) * 1000),
                     "plugin": step.plugin,
                     "interface": step.interface,
@@ -399,4 +509,145 @@ class PipelineExecutor:
                     "error": str(e),
                 },
             )
+            if cancelled:
+                raise
             raise PipelineError(f"Step '{step.id}' failed: {e}") from e
+
+
+@dataclass(frozen=True)
+class PipelineLimits:
+    """Concurrency limits for running pipelines (pipeline.* config keys)."""
+
+    plugin_concurrency: dict[str, int] = field(default_factory=dict)
+    step_concurrency: dict[str, int] = field(default_factory=dict)
+    default_step_concurrency: int = 0
+    contexts_in_flight: int = 1
+
+
+def load_pipeline_limits() -> PipelineLimits:
+    """Read pipeline.* concurrency settings; invalid values fall back to defaults.
+
+    pipeline.stage_concurrency is either an int applied to every step id or a
+    {step_id: limit} mapping. When several contexts are in flight and it is
+    not set, each step id runs one context at a time.
+    """
+    from audiomason.core.config import ConfigResolver
+
+    keys = [
+        "pipeline.plugin_concurrency",
+        "pipeline.stage_concurrency",
+        "pipeline.contexts_in_flight",
+    ]
+    try:
+        values = ConfigResolver().resolve_many(keys)
+    except Exception:
+        return PipelineLimits()
+
+    def _int(raw: object) -> int | None:
+        if isinstance(raw, bool) or not isinstance(raw, (int, str)):
+            return None
+        try:
+            return int(raw)
+        except ValueError:
+            return None
+
+    def _mapping(raw: object) -> dict[str, int]:
+        if not isinstance(raw, dict):
+            return {}
+        out: dict[str, int] = {}
+        for name, value in raw.items():
+            limit = _int(value)
+            if limit is not None and limit >= 0:
+                out[str(name)] = limit
+        return out
+
+    entry = values.get("pipeline.contexts_in_flight")
+    in_flight = max(1, _int(entry[0]) or 1) if entry is not None else 1
+
+    entry = values.get("pipeline.stage_concurrency")
+    raw_stage = entry[0] if entry is not None else None
+    default_step = 1 if in_flight > 1 else 0
+    step_limits: dict[str, int] = {}
+    if isinstance(raw_stage, dict):
+        step_limits = _mapping(raw_stage)
+    else:
+        limit = _int(raw_stage)
+        if limit is not None:
+            default_step = max(0, limit)
+
+    entry = values.get("pipeline.plugin_concurrency")
+    return PipelineLimits(
+        plugin_concurrency=_mapping(entry[0] if entry is not None else None),
+        step_concurrency=step_limits,
+        default_step_concurrency=default_step,
+        contexts_in_flight=in_flight,
+    )
+
+
+def _snapshot(context: ProcessingContext) -> dict[str, Any]:
+    """Attribute values of context with list/dict/set containers copied."""
+    out: dict[str, Any] = {}
+    for key, value in vars(context).items():
+        out[key] = copy.copy(value) if isinstance(value, (list, dict, set)) else value
+    return out
+
+
+def _merge_into(
+    shared: ProcessingContext, base: dict[str, Any], result: ProcessingContext, step_id: str
+) -> None:
+    """Apply what a parallel step changed (result vs base) to the shared context.
+
+    Lists that were only appended to have their new items appended, dicts are
+    merged per key, anything else is assigned. A change conflicts when another
+    step has meanwhile written a different value to the same field or key.
+    """
+    current = vars(shared)
+
+    def _conflict(name: str) -> PipelineError:
+        return PipelineError(
+            f"Step '{step_id}' wrote context field '{name}' that another step also changed"
+        )
+
+    for key, new in vars(result).items():
+        if key in _UNMERGED_FIELDS:
+            continue
+        old = base.get(key, _MISSING)
+        cur = current.get(key, _MISSING)
+        if isinstance(new, list) and isinstance(old, list) and new[: len(old)] == old:
+            if len(new) == len(old):
+                continue
+            if not isinstance(cur, list):
+                raise _conflict(key)
+            for item in new[len(old) :]:
+                if item not in cur:
+                    cur.append(item)
+            continue
+        if isinstance(new, dict) and isinstance(old, dict) and isinstance(cur, dict):
+            for k in old.keys() - new.keys():
+                if k in cur and cur[k] == old[k]:
+                    del cur[k]
+            for k, v in new.items():
+                before = old.get(k, _MISSING)
+                if _same(v, before):
+                    continue
+                now = cur.get(k, _MISSING)
+                if not _same(now, before) and not _same(now, v):
+                    raise _conflict(f"{key}[{k!r}]")
+                cur[k] = v
+            continue
+        if _same(new, old):
+            continue
+        if not _same(cur, old) and not _same(cur, new):
+            raise _conflict(key)
+        setattr(shared, key, new)
+
+
+def _same(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    if a is _MISSING or b is _MISSING:
+        return False
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
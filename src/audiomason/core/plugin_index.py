@@ -0,0 +1,144 @@
+"""Persistent index of parsed plugin manifests and module validation facts.
+
+Parsing every plugin.yaml and re-reading plugin modules for validation
+dominates CLI startup. PluginIndex stores the parsed manifest data and the
+AST-derived validation facts of each module file in one JSON file, keyed by
+absolute path. An entry is reused while the file's (mtime_ns, size) stamp
+matches; if the stamp changed but the content hash did not (checkout, touch),
+the entry is reused and re-stamped. The index is a cache: a missing, corrupt
+or unwritable file only costs a re-parse.
+
+ASCII-only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+INDEX_SCHEMA_VERSION = 1
+PLUGIN_INDEX_PATH_ENV = "AUDIOMASON_PLUGINS_INDEX_PATH"
+
+
+def default_plugin_index_path() -> Path:
+    """Return the plugin index location.
+
+    The index is opened before configuration is resolved, so the override is
+    an environment variable (AUDIOMASON_PLUGINS_INDEX_PATH); the default is
+    the per-user cache.
+    """
+    override = os.environ.get(PLUGIN_INDEX_PATH_ENV, "").strip()
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".audiomason" / "cache" / "plugin_index.json"
+
+
+def _stamp(st: os.stat_result) -> list[int]:
+    return [int(st.st_mtime_ns), int(st.st_size)]
+
+
+class PluginIndex:
+    """JSON-backed cache of per-file derived data, validated by stamp and hash."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, dict[str, Any]]] | None = None
+        self._dirty = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _load(self) -> dict[str, dict[str, dict[str, Any]]]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, dict[str, dict[str, Any]]] = {"manifests": {}, "modules": {}}
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raw = None
+        if isinstance(raw, dict) and raw.get("schema_version") == INDEX_SCHEMA_VERSION:
+            for section in entries:
+                value = raw.get(section)
+                if isinstance(value, dict):
+                    entries[section] = value
+        self._entries = entries
+        return entries
+
+    def lookup(
+        self,
+        section: str,
+        file_path: Path,
+        compute: Callable[[bytes], Any],
+    ) -> Any:
+        """Return derived data for file_path, computing it from bytes on a miss.
+
+        compute receives the file content. Its result must be JSON-serializable
+        to be persisted; otherwise it is returned without caching.
+        """
+        st = file_path.stat()
+        stamp = _stamp(st)
+        key = str(file_path)
+        with self._lock:
+            bucket = self._load()[section]
+            entry = bucket.get(key)
+            if isinstance(entry, dict) and entry.get("stamp") == stamp and "data" in entry:
+                return entry["data"]
+
+        content = file_path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            bucket = self._load()[section]
+            entry = bucket.get(key)
+            if isinstance(entry, dict) and entry.get("sha256") == digest and "data" in entry:
+                entry["stamp"] = stamp
+                self._dirty = True
+                return entry["data"]
+
+        data = compute(content)
+        try:
+            json.dumps(data)
+        except (TypeError, ValueError):
+            return data
+        with self._lock:
+            self._load()[section][key] = {"stamp": stamp, "sha256": digest, "data": data}
+            self._dirty = True
+        return data
+
+    def save(self) -> None:
+        """Write the index if it changed; failures are ignored (it is a cache).
+
+        Callers save once after a batch of lookups, not per lookup. The
+        sections are serialized and written under the lock, so concurrent
+        lookups cannot change them mid-dump.
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            payload = {"schema_version": INDEX_SCHEMA_VERSION, **self._entries}
+            text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+            tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(text, encoding="utf-8")
+                os.replace(tmp, self._path)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    tmp.unlink()
+                return
+            self._dirty = False
+
+
+__all__ = [
+    "INDEX_SCHEMA_VERSION",
+    "PLUGIN_INDEX_PATH_ENV",
+    "PluginIndex",
+    "default_plugin_index_path",
+]
@@ -52,21 +52,16 @@ class PluginRegistry:
         self._wizard_callables_by_operation: dict[str, RegisteredWizardCallable] = {}
 
     def _get_disabled(self) -> list[str]:
+        # Resolve only the two keys involved: this runs on every callable
+        # resolution, and building the full effective config is far slower.
         try:
-            cfg = self._config.get_config()
-        except Exception:
-            return []
-
-        reg = cfg.get("plugin_registry")
-        if isinstance(reg, dict):
-            disabled = reg.get("disabled")
+            disabled = self._config.get_value("plugin_registry.disabled")
             if isinstance(disabled, list):
                 return [str(x) for x in disabled]
-
-        plugins = cfg.get("plugins")
-        if not isinstance(plugins, dict):
+            disabled = self._config.get_value("plugins.disabled")
+        except Exception:
             return []
-        disabled = plugins.get("disabled")
+
         if not isinstance(disabled, list):
             return []
         return [str(x) for x in disabled]
@@ -1,5 +1,19 @@
 """Detached authority worker for PROCESS contract jobs.
 
+Runs either one-shot (--job-id / --adopt-all) or, with --serve, as a warm
+pool worker: plugins are imported once at startup, then job requests are
+read as JSON lines from stdin and answered on stdout until stdin closes, the
+job budget is spent, or the RSS limit is exceeded. Both modes claim jobs
+through the same process_contract.claim lock.
+
+--adopt-all recovers every adoptable job (PROCESS, pending or running, with
+a detached runtime bootstrap) oldest first, fanned out over a bounded process
+pool. The pool forks only while this process has a single thread (a fresh
+one-shot run); a --serve worker has live threads (log flusher, idle loop
+threads) whose locks a forked child would inherit, so it uses a forkserver
+or spawn context instead. Progress is written to adoption_progress.json in the
+jobs root and emitted as diag.process_contract.adopt events.
+
 ASCII-only.
 """
 
@@ -9,7 +23,14 @@ import argparse
 import asyncio
 import contextlib
 import fcntl
+import json
+import multiprocessing
+import os
+import resource
+import threading
+import time
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Protocol, TypeGuard
@@ -92,6 +113,21 @@ def _detached_contract_runtime(*, job_meta: dict[str, str]) -> object | None:
         return None
 
 
+class _WarmPluginCache:
+    """Plugin directories and classes kept across jobs by a serving worker.
+
+    One-shot authorities do not use it: each plugin load re-executes the
+    plugin module, as before.
+    """
+
+    def __init__(self) -> None:
+        self.plugin_dirs: dict[str, Path] = {}
+        self.plugin_classes: dict[Path, type] = {}
+
+
+_WARM_CACHE: _WarmPluginCache | None = None
+
+
 class _SupportsDetachedRuntimeEngine(Protocol):
     engine: object
 
@@ -115,19 +151,36 @@ class _ContractPluginLoader:
     def _plugin_dir(self, name: str) -> Path:
         if name in self._plugin_dirs:
             return self._plugin_dirs[name]
+        warm = _WARM_CACHE
+        if warm is not None and name in warm.plugin_dirs:
+            self._plugin_dirs[name] = warm.plugin_dirs[name]
+            return self._plugin_dirs[name]
         for plugin_dir in self._loader.discover():
             manifest = self._loader.load_manifest_only(plugin_dir)
             self._plugin_dirs.setdefault(manifest.name, plugin_dir)
+        if warm is not None:
+            warm.plugin_dirs.update(self._plugin_dirs)
         resolved = self._plugin_dirs.get(name)
         if resolved is None:
             raise RuntimeError(f"required_process_plugin_not_found:{name}")
         return resolved
 
+    def _load_plugin(self, plugin_dir: Path) -> object:
+        warm = _WARM_CACHE
+        if warm is None:
+            return self._loader.load_plugin(plugin_dir, validate=False)
+        plugin_class = warm.plugin_classes.get(plugin_dir)
+        if plugin_class is None:
+            manifest = self._loader.load_manifest_only(plugin_dir)
+            plugin_class = self._loader._load_plugin_class(plugin_dir, manifest.entrypoint)
+            warm.plugin_classes[plugin_dir] = plugin_class
+        return plugin_class()
+
     def get_plugin(self, name: str) -> object:
         plugin = self._plugins.get(name)
         if plugin is not None:
             return plugin
-        plugin = self._loader.load_plugin(self._plugin_dir(name), validate=False)
+        plugin = self._load_plugin(self._plugin_dir(name))
         if name == self._contract_plugin_name and self._contract_runtime is not None:
             if not _has_detached_runtime_engine(plugin):
                 raise RuntimeError(f"contract_plugin_missing_engine:{name}")
@@ -198,20 +251,215 @@ def _process_job(store: JobStore, *, job_id: str) -> None:
                 orch.jobs.store.save_job(job)
 
 
+OP_ADOPT_ALL = "adopt_all"
+ADOPTION_PROGRESS_FILENAME = "adoption_progress.json"
+
+
+def _adoptable(job: Any) -> bool:
+    # Same filter as _run_claimed_job, applied before a worker is used.
+    if job.type != JobType.PROCESS or job.state not in {JobState.PENDING, JobState.RUNNING}:
+        return False
+    if resolve_process_job_contract(job.meta) is None:
+        return False
+    return bool(str(job.meta.get("detached_runtime_json") or ""))
+
+
+def _adoption_candidates(store: JobStore) -> list[str]:
+    """Adoptable job ids, oldest first (created_at, then id)."""
+    ranked: list[tuple[str, str]] = []
+    for job_id in store.list_job_ids():
+        try:
+            job = store.load_job(job_id)
+        except Exception:
+            continue
+        if _adoptable(job):
+            ranked.append((str(job.created_at or ""), job_id))
+    return [job_id for _created, job_id in sorted(ranked)]
+
+
+def _adopt_workers() -> int:
+    try:
+        from audiomason.core.config import ConfigResolver
+
+        entry = (
+            ConfigResolver()
+            .resolve_many(["process_contract.adopt_workers"])
+            .get("process_contract.adopt_workers")
+        )
+        if entry is not None and int(entry[0]) > 0:
+            return int(entry[0])
+    except Exception:
+        pass
+    return os.cpu_count() or 1
+
+
+class _AdoptionProgress:
+    """Recovery counters, persisted to the jobs root and emitted as diagnostics."""
+
+    def __init__(self, jobs_root: Path, *, job_ids: list[str], workers: int) -> None:
+        self._path = jobs_root / ADOPTION_PROGRESS_FILENAME
+        self._state: dict[str, Any] = {
+            "pid": os.getpid(),
+            "total": len(job_ids),
+            "done": 0,
+            "failed": 0,
+            "workers": workers,
+            "started_at": _utcnow_iso(),
+            "finished_at": None,
+            "last_job_id": None,
+        }
+        self._started = time.monotonic()
+        self._write()
+
+    def job_done(self, job_id: str, *, ok: bool) -> None:
+        self._state["done"] += 1
+        if not ok:
+            self._state["failed"] += 1
+        self._state["last_job_id"] = job_id
+        if self._state["done"] >= self._state["total"]:
+            self._state["finished_at"] = _utcnow_iso()
+        self._write()
+
+    def _write(self) -> None:
+        data = dict(self._state)
+        data["elapsed_s"] = round(time.monotonic() - self._started, 3)
+        _emit_diag("diag.process_contract.adopt", operation=OP_ADOPT_ALL, data=data)
+        tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        with contextlib.suppress(OSError):
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self._path)
+
+
+def _adopt_context() -> Any:
+    """Return the multiprocessing context for the adoption pool."""
+    methods = multiprocessing.get_all_start_methods()
+    # A child forked from a multi-threaded process can inherit locks held by
+    # other threads and hang on them, so only fork while single-threaded.
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _adopt_one(jobs_root: str, job_id: str) -> None:
+    _process_job(JobStore(root=Path(jobs_root)), job_id=job_id)
+
+
+def _adopt_all(jobs_root: Path, *, workers: int | None = None) -> None:
+    store = JobStore(root=jobs_root)
+    job_ids = _adoption_candidates(store)
+    if not job_ids:
+        return
+    n_workers = max(1, min(workers or _adopt_workers(), len(job_ids)))
+    progress = _AdoptionProgress(jobs_root, job_ids=job_ids, workers=n_workers)
+    if n_workers == 1:
+        for job_id in job_ids:
+            try:
+                _process_job(store, job_id=job_id)
+                ok = True
+            except Exception:
+                ok = False
+            progress.job_done(job_id, ok=ok)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=_adopt_context()) as pool:
+        # The executor starts work in submission order: oldest jobs first.
+        futures = {pool.submit(_adopt_one, str(jobs_root), job_id): job_id for job_id in job_ids}
+        for future in as_completed(futures):
+            progress.job_done(futures[future], ok=future.exception() is None)
+
+
+def _run_request(
+    jobs_root: Path, *, job_id: str | None, adopt_all: bool, workers: int | None = None
+) -> None:
+    store = JobStore(root=jobs_root)
+    if job_id:
+        for candidate in _candidate_job_ids(store, job_id=job_id):
+            _process_job(store, job_id=candidate)
+        return
+    if adopt_all:
+        _adopt_all(jobs_root, workers=workers)
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is the peak, in KiB on Linux.
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+
+
+def _warm_up() -> None:
+    global _WARM_CACHE
+    _WARM_CACHE = _WarmPluginCache()
+    with contextlib.suppress(Exception):
+        loader = _ContractPluginLoader(job_meta={}, contract_plugin_name="")
+        for name in ("import",):
+            loader._load_plugin(loader._plugin_dir(name))
+
+
+def _serve(*, max_jobs: int, max_rss_bytes: int) -> int:
+    # The pipes carry the protocol; plugin output goes to /dev/null as in
+    # one-shot mode.
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull_fd = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull_fd, fd)
+    os.close(devnull_fd)
+
+    _warm_up()
+    done = 0
+    try:
+        replies.write(json.dumps({"ready": True}) + "\n")
+        replies.flush()
+        for line in requests:
+            try:
+                request = json.loads(line)
+                job_id = request.get("job_id")
+                _run_request(
+                    Path(str(request["jobs_root"])),
+                    job_id=str(job_id) if job_id else None,
+                    adopt_all=bool(request.get("adopt_all")),
+                )
+                ok = True
+            except Exception:
+                ok = False
+            done += 1
+            retire = done >= max_jobs > 0 or _rss_bytes() > max_rss_bytes > 0
+            replies.write(json.dumps({"ok": ok, "retire": retire}) + "\n")
+            replies.flush()
+            if retire:
+                break
+    except BrokenPipeError:
+        # The supervisor went away; the job that was running has finished.
+        pass
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
-    parser.add_argument("--jobs-root", required=True)
+    parser.add_argument("--jobs-root")
     parser.add_argument("--job-id")
     parser.add_argument("--adopt-all", action="store_true")
+    parser.add_argument("--serve", action="store_true")
+    parser.add_argument("--max-jobs", type=int, default=0)
+    parser.add_argument("--max-rss-mb", type=int, default=0)
+    parser.add_argument("--adopt-workers", type=int, default=0)
     args = parser.parse_args()
 
-    store = JobStore(root=Path(args.jobs_root))
-    if args.job_id and not args.adopt_all:
-        _process_job(store, job_id=str(args.job_id))
-        return 0
+    if args.serve:
+        return _serve(max_jobs=args.max_jobs, max_rss_bytes=args.max_rss_mb * 1024 * 1024)
+    if not args.jobs_root:
+        parser.error("--jobs-root is required")
 
-    for job_id in _candidate_job_ids(store, job_id=str(args.job_id) if args.job_id else None):
-        _process_job(store, job_id=job_id)
+    _run_request(
+        Path(args.jobs_root),
+        job_id=str(args.job_id) if args.job_id else None,
+        adopt_all=bool(args.adopt_all),
+        workers=args.adopt_workers or None,
+    )
     return 0
 
 
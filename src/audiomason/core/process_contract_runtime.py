@@ -1,35 +1,335 @@
-"""Detached process runtime launcher for PROCESS contract execution.
+"""Detached process runtime launcher for PROCESS contract jobs.
+
+Jobs are handed to a pool of warm authority processes
+(process_contract_authority --serve) that have the core and the contract
+plugins imported already, so a submitted job starts in milliseconds instead
+of paying an interpreter start and plugin import. Each worker serves one job
+at a time over its stdin/stdout pipes and is replaced after
+max_jobs_per_worker jobs or when its RSS exceeds max_worker_rss_mb. Workers
+still claim jobs through process_contract.claim, so the pool composes with
+one-shot authorities and other hosts.
+
+A worker is bound to the environment and working directory it was started
+with; a request made under a different environment gets a fresh worker.
+With process_contract.workers set to 0, every job gets its own detached
+one-shot authority process, as before. Requests still queued when the host
+exits are handed to one-shot authorities, and busy workers finish their job.
 
 ASCII-only.
 """
 
 from __future__ import annotations
 
+import atexit
+import contextlib
+import json
 import os
+import queue
 import signal
+import subprocess
 import sys
 import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 
+_AUTHORITY_MODULE = "audiomason.core.process_contract_authority"
+
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+DEFAULT_MAX_WORKER_RSS_MB = 1024
+
+
+def _default_workers() -> int:
+    return max(1, min(2, os.cpu_count() or 1))
+
+
+@dataclass(frozen=True)
+class WorkerPoolSettings:
+    workers: int
+    max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER
+    max_worker_rss_mb: int = DEFAULT_MAX_WORKER_RSS_MB
+
+
+def load_worker_pool_settings() -> WorkerPoolSettings:
+    """Read process_contract.* pool settings; invalid values fall back to defaults."""
+    from audiomason.core.config import ConfigResolver
+
+    defaults = WorkerPoolSettings(workers=_default_workers())
+    try:
+        values = ConfigResolver().resolve_many(
+            [
+                "process_contract.workers",
+                "process_contract.max_jobs_per_worker",
+                "process_contract.max_worker_rss_mb",
+            ]
+        )
+    except Exception:
+        return defaults
+
+    def _int(key: str, default: int) -> int:
+        entry = values.get(key)
+        if entry is None:
+            return default
+        try:
+            return max(0, int(entry[0]))
+        except (TypeError, ValueError):
+            return default
+
+    return WorkerPoolSettings(
+        workers=_int("process_contract.workers", defaults.workers),
+        max_jobs_per_worker=_int(
+            "process_contract.max_jobs_per_worker", defaults.max_jobs_per_worker
+        ),
+        max_worker_rss_mb=_int("process_contract.max_worker_rss_mb", defaults.max_worker_rss_mb),
+    )
+
+
+def _child_env() -> dict[str, str]:
+    env = dict(os.environ)
+    src_root = Path(__file__).resolve().parents[2]
+    repo_root = src_root.parent
+    pythonpath = [str(repo_root), str(src_root)]
+    existing = env.get("PYTHONPATH", "")
+    if existing:
+        pythonpath.append(existing)
+    env["PYTHONPATH"] = os.pathsep.join(pythonpath)
+    return env
+
+
+@dataclass(frozen=True)
+class _Request:
+    jobs_root: Path
+    job_id: str | None
+    adopt_all: bool
+    env: dict[str, str]
+    cwd: str
+
+    @property
+    def env_key(self) -> tuple[str, tuple[tuple[str, str], ...]]:
+        return (self.cwd, tuple(sorted(self.env.items())))
+
+    def line(self) -> str:
+        payload = {
+            "jobs_root": str(self.jobs_root),
+            "job_id": self.job_id,
+            "adopt_all": self.adopt_all,
+        }
+        return json.dumps(payload) + "\n"
+
+
+class _WarmWorker:
+    """One pool slot: a thread feeding requests to one warm authority process."""
+
+    def __init__(self, pool: _WorkerPool, index: int, first: _Request) -> None:
+        self._pool = pool
+        self._proc: subprocess.Popen[str] | None = None
+        self._env_key: tuple[str, tuple[tuple[str, str], ...]] | None = None
+        self._thread = threading.Thread(
+            target=self._run, args=(first,), name=f"am-process-worker-{index}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def pid(self) -> int | None:
+        proc = self._proc
+        return None if proc is None else proc.pid
+
+    def _spawn(self, request: _Request) -> subprocess.Popen[str]:
+        settings = self._pool.settings
+        command = [
+            sys.executable,
+            "-m",
+            _AUTHORITY_MODULE,
+            "--serve",
+            "--max-jobs",
+            str(settings.max_jobs_per_worker),
+            "--max-rss-mb",
+            str(settings.max_worker_rss_mb),
+        ]
+        proc = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=request.env,
+            cwd=request.cwd,
+            text=True,
+            encoding="utf-8",
+            start_new_session=True,
+        )
+        self._pool.runtime._track(proc.pid)
+        assert proc.stdout is not None
+        # Blocks until the worker has imported everything it needs.
+        if not proc.stdout.readline():
+            proc.wait()
+            raise RuntimeError("process contract worker failed to start")
+        return proc
+
+    def _ensure(self, request: _Request) -> subprocess.Popen[str]:
+        proc = self._proc
+        if proc is not None and (proc.poll() is not None or self._env_key != request.env_key):
+            self._retire()
+            proc = None
+        if proc is None:
+            proc = self._spawn(request)
+            self._proc, self._env_key = proc, request.env_key
+        return proc
+
+    def _retire(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        with contextlib.suppress(OSError):
+            assert proc.stdin is not None
+            proc.stdin.close()
+        with contextlib.suppress(subprocess.TimeoutExpired, ChildProcessError):
+            proc.wait(timeout=5.0)
+
+    def _dispatch(self, request: _Request) -> None:
+        proc = self._ensure(request)
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(request.line())
+        proc.stdin.flush()
+        reply_line = proc.stdout.readline()
+        if not reply_line:
+            # The worker died mid-job; the claim lock died with it.
+            self._proc = None
+            proc.wait()
+            return
+        reply = json.loads(reply_line)
+        if reply.get("retire"):
+            self._retire()
+
+    def _run(self, first: _Request) -> None:
+        # Start warm, before the first job arrives.
+        with contextlib.suppress(Exception):
+            self._ensure(first)
+        while True:
+            request = self._pool.requests.get()
+            try:
+                if request is None:
+                    return
+                try:
+                    self._dispatch(request)
+                except Exception:
+                    self._proc = None
+                    if not self._pool.stopped:
+                        self._pool.runtime._spawn_detached(request)
+            finally:
+                self._pool.requests.task_done()
+
+    def release(self) -> None:
+        """Let the worker finish its current job and exit (EOF on stdin)."""
+        proc = self._proc
+        if proc is not None and proc.stdin is not None:
+            with contextlib.suppress(OSError):
+                proc.stdin.close()
+
+    def join(self, timeout: float) -> None:
+        self._thread.join(timeout)
+
+
+class _WorkerPool:
+    def __init__(
+        self, runtime: ProcessContractRuntime, settings: WorkerPoolSettings, first: _Request
+    ) -> None:
+        self.runtime = runtime
+        self.settings = settings
+        self.requests: queue.Queue[_Request | None] = queue.Queue()
+        self.stopped = False
+        self.workers = [_WarmWorker(self, i, first) for i in range(settings.workers)]
+
+    def submit(self, request: _Request) -> None:
+        self.requests.put(request)
+
+    def drain(self) -> list[_Request]:
+        pending: list[_Request] = []
+        while True:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                return pending
+            self.requests.task_done()
+            if item is not None:
+                pending.append(item)
+
+    def stop(self) -> None:
+        self.stopped = True
+        for _ in self.workers:
+            self.requests.put(None)
+
 
 class ProcessContractRuntime:
-    """Launch detached Core-owned authority processes for PROCESS contract jobs."""
+    """Run PROCESS contract jobs in Core-owned authority processes."""
 
-    def __init__(self) -> None:
+    def __init__(self, settings: WorkerPoolSettings | None = None) -> None:
         self._lock = threading.Lock()
         self._children: list[int] = []
+        self._settings = settings
+        self._pool: _WorkerPool | None = None
+        self._atexit_registered = False
+
+    def configure(self, settings: WorkerPoolSettings | None) -> None:
+        """Replace pool settings (None: read config on next use); stops the pool."""
+        self.shutdown()
+        with self._lock:
+            self._settings = settings
 
     def start(self, *, jobs_root: Path) -> None:
-        self._spawn(jobs_root=jobs_root, adopt_all=True, job_id=None)
+        self._dispatch(_request(jobs_root=jobs_root, adopt_all=True, job_id=None))
 
     def submit(self, *, job_id: str, jobs_root: Path) -> None:
-        self._spawn(jobs_root=jobs_root, adopt_all=False, job_id=job_id)
+        self._dispatch(_request(jobs_root=jobs_root, adopt_all=False, job_id=job_id))
+
+    def worker_pids(self) -> list[int]:
+        with self._lock:
+            pool = self._pool
+        if pool is None:
+            return []
+        return [pid for pid in (w.pid for w in pool.workers) if pid is not None]
+
+    def _dispatch(self, request: _Request) -> None:
+        with self._lock:
+            if self._settings is None:
+                self._settings = load_worker_pool_settings()
+            settings = self._settings
+            if settings.workers <= 0:
+                pool = None
+            else:
+                if self._pool is None:
+                    self._pool = _WorkerPool(self, settings, request)
+                    if not self._atexit_registered:
+                        atexit.register(self._release)
+                        self._atexit_registered = True
+                pool = self._pool
+        if pool is None:
+            self._spawn_detached(request)
+        else:
+            pool.submit(request)
+
+    def _release(self) -> None:
+        """Host exit: hand queued jobs to one-shot authorities, let workers finish."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        for request in pool.drain():
+            self._spawn_detached(request)
+        pool.stop()
+        for worker in pool.workers:
+            worker.release()
 
     def shutdown(self) -> None:
         with self._lock:
+            pool, self._pool = self._pool, None
             children = self._children[:]
             self._children.clear()
+        if pool is not None:
+            pool.stopped = True
+            pool.drain()
+            pool.stop()
+            for worker in pool.workers:
+                worker.release()
         for pid in children:
             self._terminate(pid, sig=signal.SIGTERM)
         for pid in children:
@@ -38,30 +338,29 @@ class ProcessContractRuntime:
             if self._is_alive(pid):
                 self._terminate(pid, sig=signal.SIGKILL)
                 self._reap_until_gone(pid)
+        if pool is not None:
+            for worker in pool.workers:
+                worker.join(timeout=2.0)
 
-    def _spawn(self, *, jobs_root: Path, adopt_all: bool, job_id: str | None) -> None:
-        command = [sys.executable, "-m", "audiomason.core.process_contract_authority"]
-        command.extend(["--jobs-root", str(jobs_root)])
-        if adopt_all:
+    def _track(self, pid: int) -> None:
+        with self._lock:
+            self._children = [child for child in self._children if self._refresh_child(child)]
+            self._children.append(pid)
+
+    def _spawn_detached(self, request: _Request) -> None:
+        command = [sys.executable, "-m", _AUTHORITY_MODULE]
+        command.extend(["--jobs-root", str(request.jobs_root)])
+        if request.adopt_all:
             command.append("--adopt-all")
-        if job_id is not None:
-            command.extend(["--job-id", job_id])
-
-        env = dict(os.environ)
-        src_root = Path(__file__).resolve().parents[2]
-        repo_root = src_root.parent
-        pythonpath = [str(repo_root), str(src_root)]
-        existing = env.get("PYTHONPATH", "")
-        if existing:
-            pythonpath.append(existing)
-        env["PYTHONPATH"] = os.pathsep.join(pythonpath)
+        if request.job_id is not None:
+            command.extend(["--job-id", request.job_id])
 
         devnull_fd = os.open(os.devnull, os.O_RDWR)
         try:
             pid = os.posix_spawn(
                 sys.executable,
                 command,
-                env,
+                request.env,
                 file_actions=(
                     (os.POSIX_SPAWN_DUP2, devnull_fd, 0),
                     (os.POSIX_SPAWN_DUP2, devnull_fd, 1),
@@ -72,9 +371,7 @@ class ProcessContractRuntime:
         finally:
             os.close(devnull_fd)
 
-        with self._lock:
-            self._children = [child for child in self._children if self._refresh_child(child)]
-            self._children.append(pid)
+        self._track(pid)
 
     def _refresh_child(self, pid: int) -> bool:
         self._reap_child(pid)
@@ -113,6 +410,16 @@ class ProcessContractRuntime:
         return True
 
 
+def _request(*, jobs_root: Path, adopt_all: bool, job_id: str | None) -> _Request:
+    return _Request(
+        jobs_root=jobs_root,
+        job_id=job_id,
+        adopt_all=adopt_all,
+        env=_child_env(),
+        cwd=os.getcwd(),
+    )
+
+
 class OSErrorGuard:
     def __enter__(self) -> None:
         return None
@@ -129,11 +436,15 @@ def get_process_contract_runtime() -> ProcessContractRuntime:
 
 
 def reset_process_contract_runtime_for_tests() -> None:
-    _RUNTIME.shutdown()
+    _RUNTIME.configure(None)
 
 
 __all__ = [
+    "DEFAULT_MAX_JOBS_PER_WORKER",
+    "DEFAULT_MAX_WORKER_RSS_MB",
     "ProcessContractRuntime",
+    "WorkerPoolSettings",
     "get_process_contract_runtime",
+    "load_worker_pool_settings",
     "reset_process_contract_runtime_for_tests",
 ]
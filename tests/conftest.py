@@ -11,6 +11,15 @@ sys.path.insert(0, str(repo_root))
 sys.path.insert(0, str(repo_root / "src"))
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _isolate_plugin_index(tmp_path_factory):
+    """Keep the persistent plugin index out of the real home directory."""
+    index_path = tmp_path_factory.mktemp("plugin_index") / "plugin_index.json"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AUDIOMASON_PLUGINS_INDEX_PATH", str(index_path))
+        yield
+
+
 @pytest.fixture(autouse=True)
 def _isolate_generic_plugin_module():
     """Ensure 'plugin' module cache does not leak between tests.
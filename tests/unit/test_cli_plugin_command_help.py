@@ -124,6 +124,9 @@ def test_registry_does_not_globally_sort_discovered_across_sources(
                 },
             )()
 
+        def save_index(self) -> None:
+            pass
+
     monkeypatch.setattr(cli_mod, "ConfigService", FakeConfigService)
     monkeypatch.setattr(cli_mod, "PluginRegistry", FakePluginRegistry)
     monkeypatch.setattr(cli_mod, "PluginLoader", FakePluginLoader)
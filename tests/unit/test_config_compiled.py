@@ -0,0 +1,88 @@
+"""Compiled ConfigResolver view: parity, invalidation and resolve_many."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from audiomason.core import config as config_mod
+from audiomason.core.config import ConfigResolver
+from audiomason.core.config_service import ConfigService
+from audiomason.core.errors import ConfigError
+
+
+def _resolver(tmp_path: Path, **kwargs: object) -> ConfigResolver:
+    user = tmp_path / "user.yaml"
+    system = tmp_path / "system.yaml"
+    user.write_text(
+        "logging:\n  level: debug\nplugins:\n  demo:\n    enabled: true\n'a.b': 1\n",
+        encoding="utf-8",
+    )
+    system.write_text("bitrate: 96k\nlogging:\n  color: false\n", encoding="utf-8")
+    return ConfigResolver(user_config_path=user, system_config_path=system, **kwargs)  # type: ignore[arg-type]
+
+
+def test_compiled_lookup_keeps_layer_semantics(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("AUDIOMASON_LOGGING_COLOR", "env-color")
+    monkeypatch.setenv("AUDIOMASON_ONLY_IN_ENV", "x")
+    resolver = _resolver(tmp_path, cli_args={"bitrate": "320k"})
+
+    assert resolver.resolve("bitrate") == ("320k", "cli")
+    assert resolver.resolve("logging.color") == ("env-color", "env")
+    assert resolver.resolve("logging.level") == ("debug", "user_config")
+    assert resolver.resolve("target_format") == ("mp3", "default")
+    assert resolver.resolve("only.in.env") == ("x", "env")
+    # Whole mappings resolve from the highest layer that has them, unmerged.
+    assert resolver.resolve("plugins.demo") == ({"enabled": True}, "user_config")
+    assert resolver.resolve("logging")[1] == "user_config"
+    # Dotted YAML keys are not reachable by dot notation.
+    with pytest.raises(ConfigError, match="not found"):
+        resolver.resolve("a.b")
+    with pytest.raises(ConfigError, match="not found"):
+        resolver.resolve("missing.key")
+
+
+def test_resolve_many_omits_missing_keys(tmp_path: Path) -> None:
+    resolver = _resolver(tmp_path)
+    assert resolver.resolve_many(["bitrate", "nope", "logging.level"]) == {
+        "bitrate": ("96k", "system_config"),
+        "logging.level": ("debug", "user_config"),
+    }
+
+
+def test_view_rebuilds_when_file_or_env_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    resolver = _resolver(tmp_path)
+    assert resolver.resolve("logging.level") == ("debug", "user_config")
+
+    user = tmp_path / "user.yaml"
+    user.write_text("logging:\n  level: quiet\n", encoding="utf-8")
+    st = user.stat()
+    os.utime(user, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    # Within the recheck interval the compiled view is reused as-is.
+    assert resolver.resolve("logging.level") == ("debug", "user_config")
+
+    monkeypatch.setattr(config_mod, "RECHECK_INTERVAL_S", 0.0)
+    assert resolver.resolve("logging.level") == ("quiet", "user_config")
+
+    monkeypatch.setenv("AUDIOMASON_LOGGING_LEVEL", "verbose")
+    assert resolver.resolve("logging.level") == ("verbose", "env")
+
+
+def test_config_service_writes_invalidate_its_resolver(tmp_path: Path) -> None:
+    service = ConfigService(
+        user_config_path=tmp_path / "user.yaml",
+        system_config_path=tmp_path / "system.yaml",
+    )
+    assert service.get_value("bitrate") == "128k"
+
+    service.set_value("bitrate", "192k")
+    assert service.get_value("bitrate") == "192k"
+
+    service.unset_value("bitrate")
+    assert service.get_value("bitrate") == "128k"
@@ -0,0 +1,140 @@
+"""Cover candidate index: header-only artwork probe and cached listings."""
+
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+
+import pytest
+from mutagen.id3 import APIC, ID3, TIT2
+from plugins.cover_handler import candidate_index
+from plugins.cover_handler.candidate_index import (
+    CoverCandidateIndex,
+    _probe_with_mutagen,
+    probe_embedded_artwork,
+)
+
+
+def _mp3(path: Path, *, version: int, frames: list[object]) -> Path:
+    tags = ID3()
+    for frame in frames:
+        tags.add(frame)
+    tags.save(path, v2_version=version)
+    with path.open("ab") as f:
+        f.write(b"\xff\xfb" + b"\x00" * 400)
+    return path
+
+
+@pytest.mark.parametrize("version", [3, 4])
+@pytest.mark.parametrize(
+    ("encoding", "desc", "data", "expected"),
+    [
+        (3, "cover", b"jpeg-data", True),
+        (1, "front \u00e9", b"\x00\x00jpeg", True),
+        (0, "x" * 2000, b"jpeg", True),
+        (3, "", b"", False),
+    ],
+)
+def test_id3_probe_matches_mutagen(
+    tmp_path: Path, version: int, encoding: int, desc: str, data: bytes, expected: bool
+) -> None:
+    frames: list[object] = [TIT2(encoding=3, text="Title")]
+    frames.append(APIC(encoding=encoding, mime="image/jpeg", type=3, desc=desc, data=data))
+    path = _mp3(tmp_path / "a.mp3", version=version, frames=frames)
+    assert probe_embedded_artwork(path) is expected
+    assert _probe_with_mutagen(path) is expected
+
+
+def test_id3_probe_without_artwork_or_tag(tmp_path: Path) -> None:
+    tagged = _mp3(tmp_path / "t.mp3", version=4, frames=[TIT2(encoding=3, text="T")])
+    assert probe_embedded_artwork(tagged) is False
+    bare = tmp_path / "bare.mp3"
+    bare.write_bytes(b"\xff\xfb" + b"\x00" * 100)
+    assert probe_embedded_artwork(bare) is False
+
+
+def _atom(name: bytes, body: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(body), name) + body
+
+
+def _m4b(path: Path, image: bytes) -> Path:
+    data = _atom(b"data", struct.pack(">II", 13, 0) + image)
+    ilst = _atom(b"ilst", _atom(b"covr", data))
+    meta = _atom(b"meta", b"\x00\x00\x00\x00" + _atom(b"hdlr", b"\x00" * 25) + ilst)
+    moov = _atom(b"moov", _atom(b"mvhd", b"\x00" * 100) + _atom(b"udta", meta))
+    path.write_bytes(_atom(b"ftyp", b"M4B \x00\x00\x00\x00") + _atom(b"mdat", b"\x00" * 64) + moov)
+    return path
+
+
+def test_mp4_probe_follows_atoms(tmp_path: Path) -> None:
+    assert probe_embedded_artwork(_m4b(tmp_path / "a.m4b", b"\xff\xd8jpeg")) is True
+    assert probe_embedded_artwork(_m4b(tmp_path / "b.m4a", b"")) is False
+    (tmp_path / "c.m4b").write_bytes(_atom(b"ftyp", b"M4B ") + _atom(b"moov", b""))
+    assert probe_embedded_artwork(tmp_path / "c.m4b") is False
+
+
+def test_listing_is_one_scan_until_directory_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    book = tmp_path / "book"
+    book.mkdir()
+    for name in ("b.png", "folder.jpg", "cover.jpg", "a.jpg", "02.mp3", "01.m4b", "notes.txt"):
+        (book / name).write_bytes(b"x")
+    (book / "sub.jpg").mkdir()
+    settled = book.stat().st_mtime_ns - 10 * candidate_index.RACY_WINDOW_NS
+    os.utime(book, ns=(settled, settled))
+
+    scans: list[str] = []
+    real_scandir = os.scandir
+
+    def _counting_scandir(path: Path) -> object:
+        scans.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(candidate_index.os, "scandir", _counting_scandir)
+    index = CoverCandidateIndex()
+    listing = index.listing(book)
+    assert listing is not None
+    assert [p.name for p in listing.file_candidates] == [
+        "cover.jpg",
+        "folder.jpg",
+        "a.jpg",
+        "b.png",
+    ]
+    assert listing.first_audio == book / "01.m4b"
+    assert index.listing(book) is listing
+    assert len(scans) == 1
+
+    # A fresh change is picked up and, while racy, not cached.
+    (book / "00.mp3").write_bytes(b"x")
+    refreshed = index.listing(book)
+    assert refreshed is not None and refreshed.first_audio == book / "00.mp3"
+    assert index.listing(book) is not refreshed
+    assert len(scans) == 3
+    assert index.listing(book / "missing") is None
+    assert index.listing(book / "a.jpg") is None
+
+
+def test_artwork_probe_is_cached_per_file_stamp(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = _mp3(tmp_path / "a.mp3", version=3, frames=[TIT2(encoding=3, text="T")])
+    settled = path.stat().st_mtime_ns - 10 * candidate_index.RACY_WINDOW_NS
+    os.utime(path, ns=(settled, settled))
+    probes: list[Path] = []
+    real_probe = candidate_index.probe_embedded_artwork
+
+    def _counting_probe(audio_file: Path) -> bool:
+        probes.append(audio_file)
+        return real_probe(audio_file)
+
+    monkeypatch.setattr(candidate_index, "probe_embedded_artwork", _counting_probe)
+    index = CoverCandidateIndex()
+    assert index.has_embedded_artwork(path) is False
+    assert index.has_embedded_artwork(path) is False
+    assert len(probes) == 1
+
+    _mp3(path, version=3, frames=[APIC(encoding=3, mime="image/png", type=3, desc="", data=b"p")])
+    assert index.has_embedded_artwork(path) is True
+    assert len(probes) == 2
@@ -0,0 +1,167 @@
+"""Cover downloads: in-process pooled client and the persistent cover cache."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from plugins.cover_handler.download_cache import CoverCache, CoverHttpClient
+from plugins.cover_handler.plugin import CoverHandlerPlugin
+
+from audiomason.core.errors import CoverError
+
+_IMAGE = b"\xff\xd8\xff\xe0" + b"jpeg" * 64
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.hits: list[tuple[str, str]] = []
+        self.peers: set[tuple[str, int]] = set()
+
+    @property
+    def base(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        conditional = "304" if self.headers.get("If-None-Match") == '"v1"' else ""
+        self.server.hits.append((self.path, conditional))
+        self.server.peers.add(self.client_address)
+        if self.path == "/redirect.jpg":
+            self._send(302, headers={"Location": "/cover.jpg"})
+        elif self.path == "/slow.jpg":
+            time.sleep(1.0)
+            self._send(200, _IMAGE)
+        elif self.path.startswith("/cover"):
+            if conditional:
+                self._send(304, headers={"ETag": '"v1"'})
+            else:
+                self._send(200, _IMAGE, {"ETag": '"v1"', "Content-Type": "image/jpeg"})
+        else:
+            self._send(404)
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    srv = _Server()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def _plugin(tmp_path: Path, **config: object) -> CoverHandlerPlugin:
+    return CoverHandlerPlugin({"cover_cache_dir": str(tmp_path / "cache"), **config})
+
+
+def test_series_books_share_one_download(tmp_path: Path, server: _Server) -> None:
+    url = f"{server.base}/cover.jpg"
+
+    async def _main() -> list[Path | None]:
+        return list(
+            await asyncio.gather(
+                *(
+                    _plugin(tmp_path).download_cover(url, output_dir=tmp_path / f"book{i}")
+                    for i in range(4)
+                )
+            )
+        )
+
+    paths = asyncio.run(_main())
+    assert all(p is not None and p.read_bytes() == _IMAGE for p in paths)
+    assert server.hits == [("/cover.jpg", "")]
+
+    # A new session (fresh plugin) is served from disk without network.
+    again = asyncio.run(_plugin(tmp_path).download_cover(url, output_dir=tmp_path / "book9"))
+    assert again is not None and again.read_bytes() == _IMAGE
+    assert len(server.hits) == 1
+
+
+def test_stale_entry_is_revalidated_and_served_offline(tmp_path: Path, server: _Server) -> None:
+    cache = CoverCache(tmp_path / "cache", max_age_s=0, client=CoverHttpClient())
+    url = f"{server.base}/redirect.jpg"
+
+    first = cache.fetch(url, tmp_path / "a.jpg")
+    second = cache.fetch(url, tmp_path / "b.jpg")
+    assert first.sha256 == second.sha256
+    assert (tmp_path / "b.jpg").read_bytes() == _IMAGE
+    assert server.hits == [
+        ("/redirect.jpg", ""),
+        ("/cover.jpg", ""),
+        ("/redirect.jpg", "304"),
+        ("/cover.jpg", "304"),
+    ]
+    # Keep-alive: every request went over one pooled connection.
+    assert len(server.peers) == 1
+
+    server.shutdown()
+    server.server_close()
+    cache.client.close()
+    offline = cache.fetch(url, tmp_path / "c.jpg")
+    assert offline.from_network is False
+    assert (tmp_path / "c.jpg").read_bytes() == _IMAGE
+
+
+def test_eviction_is_lru_and_drops_url_entries(tmp_path: Path, server: _Server) -> None:
+    cache = CoverCache(tmp_path / "cache", max_bytes=len(_IMAGE) * 2, client=CoverHttpClient())
+    blobs = tmp_path / "cache" / "blobs"
+    cache.fetch(f"{server.base}/cover1.jpg", tmp_path / "1.jpg")
+    assert cache.total_bytes() == len(_IMAGE)
+
+    (blobs / "aa").mkdir()
+    (blobs / "aa" / ("a" * 64)).write_bytes(b"x" * len(_IMAGE))
+    (blobs / "bb").mkdir()
+    (blobs / "bb" / ("b" * 64)).write_bytes(b"y" * len(_IMAGE))
+    old = time.time() - 100
+    os.utime(blobs / "aa" / ("a" * 64), (old, old))
+    assert cache.evict() == 1
+    assert not (blobs / "aa" / ("a" * 64)).exists()
+    assert (blobs / "bb" / ("b" * 64)).exists()
+
+    # Losing the blob of a URL forgets the URL too.
+    cache.max_bytes = 0
+    cache.evict()
+    assert cache.total_bytes() == 0
+    assert cache._load_index() == {}
+
+
+def test_timeout_and_http_errors_fail_fast(tmp_path: Path, server: _Server) -> None:
+    plugin = _plugin(tmp_path, download_timeout_s=0.2, cover_cache=False)
+    started = time.monotonic()
+    slow = asyncio.run(plugin.download_cover(f"{server.base}/slow.jpg", output_dir=tmp_path))
+    assert slow is None
+    assert time.monotonic() - started < 1.0
+
+    missing = asyncio.run(plugin.download_cover(f"{server.base}/nope.jpg", output_dir=tmp_path))
+    assert missing is None
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(CoverError):
+        CoverHttpClient(max_bytes=10).get(f"{server.base}/cover.jpg")
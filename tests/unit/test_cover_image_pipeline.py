@@ -0,0 +1,129 @@
+"""In-process cover pipeline: header sniffing, resize fallback and embedding."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import stat
+import struct
+from pathlib import Path
+from typing import Any
+
+import pytest
+from mutagen.id3 import APIC, ID3
+from plugins.cover_handler import image_pipeline
+from plugins.cover_handler import plugin as cover_plugin
+from plugins.cover_handler.image_pipeline import image_info, prepare_cover
+from plugins.cover_handler.plugin import CoverHandlerPlugin
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x01\x01\x00" + b"\x00" * 6
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x01\x11\x00"
+    return b"\xff\xd8" + app0 + sof0 + b"\xff\xda" + b"scan" + b"\xff\xd9"
+
+
+def _png(width: int, height: int) -> bytes:
+    ihdr = struct.pack(">II", width, height) + b"\x08\x02\x00\x00\x00"
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + ihdr + b"\x00" * 4
+
+
+def _no_subprocess(*_args: object, **_kwargs: object) -> Any:
+    raise AssertionError("no process expected")
+
+
+def _fake_ffmpeg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    args_file = tmp_path / "ffmpeg.args"
+    script = bin_dir / "ffmpeg"
+    script.write_text(
+        f'#!/bin/sh\necho "$@" > "{args_file}"\nprintf \'\\377\\330resized:\'\ncat\n',
+        encoding="ascii",
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(image_pipeline, "_pil_image", lambda: None)
+    return args_file
+
+
+def test_image_info_reads_headers_only() -> None:
+    assert image_info(_jpeg(5000, 3000)) == ("jpeg", 5000, 3000)
+    assert image_info(_png(640, 480)) == ("png", 640, 480)
+    assert image_info(b"GIF89a") is None
+    assert image_info(b"\xff\xd8\xff") is None
+
+
+def test_small_jpeg_passes_through_without_decoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(image_pipeline, "run_subprocess", _no_subprocess)
+    monkeypatch.setattr(image_pipeline, "_prepare_with_pillow", _no_subprocess)
+    data = _jpeg(1400, 1400)
+    assert asyncio.run(prepare_cover(data, max_dimension=1400)) is data
+
+
+def test_oversized_cover_uses_ffmpeg_pipes_without_pillow(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    args_file = _fake_ffmpeg(tmp_path, monkeypatch)
+    data = _jpeg(5000, 5000)
+    out = asyncio.run(prepare_cover(data, max_dimension=800))
+    assert out == b"\xff\xd8resized:" + data
+    args = args_file.read_text(encoding="ascii")
+    assert "-i pipe:0" in args and args.rstrip().endswith("pipe:1")
+    assert "min(iw,800)" in args
+    # No temp files: only the fake binary and its argument log exist.
+    assert set(tmp_path.iterdir()) == {tmp_path / "bin", args_file}
+
+
+def test_pillow_downscales_and_flattens() -> None:
+    pil_image = pytest.importorskip("PIL.Image")
+    buf = io.BytesIO()
+    pil_image.new("RGBA", (3000, 1000), (10, 20, 30, 128)).save(buf, "PNG")
+    out = asyncio.run(prepare_cover(buf.getvalue(), max_dimension=1200))
+    assert image_info(out) == ("jpeg", 1200, 400)
+
+
+def test_convert_to_jpeg_replaces_png(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _fake_ffmpeg(tmp_path, monkeypatch)
+    src = tmp_path / "cover.png"
+    src.write_bytes(_png(100, 100))
+    out = asyncio.run(CoverHandlerPlugin().convert_to_jpeg(src))
+    assert out == tmp_path / "cover.jpg"
+    assert out.read_bytes().startswith(b"\xff\xd8resized:")
+    assert not src.exists()
+
+    small = tmp_path / "small.jpg"
+    small.write_bytes(_jpeg(10, 10))
+    assert asyncio.run(CoverHandlerPlugin().convert_to_jpeg(small)) == small
+
+
+def _tagged_mp3(path: Path, picture: bytes | None) -> Path:
+    path.write_bytes(b"\xff\xfb" + b"\x00" * 200)
+    if picture is not None:
+        tags = ID3()
+        tags.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="old", data=picture))
+        tags.save(path)
+    return path
+
+
+def test_extract_and_batch_embed_stay_in_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(cover_plugin, "run_subprocess", _no_subprocess)
+    monkeypatch.setattr(image_pipeline, "run_subprocess", _no_subprocess)
+    cover = _jpeg(600, 600)
+    source = _tagged_mp3(tmp_path / "source.mp3", cover)
+    plugin = CoverHandlerPlugin({"embed_concurrency": 2})
+
+    extracted = asyncio.run(plugin.extract_embedded_cover(source, output_path=tmp_path / "x.jpg"))
+    assert extracted is not None and extracted.read_bytes() == cover
+
+    books = [_tagged_mp3(tmp_path / f"{i:02d}.mp3", b"stale" if i else None) for i in range(3)]
+    broken = tmp_path / "missing.mp3"
+    asyncio.run(plugin.embed_covers_batch([*books, broken], extracted))
+
+    for mp3 in books:
+        frames = ID3(mp3).getall("APIC")
+        assert [(f.data, f.mime, f.type) for f in frames] == [(cover, "image/jpeg", 3)]
+    assert not broken.exists()
@@ -0,0 +1,215 @@
+"""External-tool archive backend: streamed listing, reuse, async cancellation."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from plugins.file_io import import_runtime
+from plugins.file_io.service import (
+    ArchiveFormat,
+    ArchiveService,
+    CollisionPolicy,
+    FileService,
+    RootName,
+)
+from plugins.file_io.service.archives.external import parse_listing
+
+# A stand-in for 7z: the "archive" is JSON describing its files. Every call is
+# appended to <archive>.calls; extraction optionally sleeps first and records
+# its pid so cancellation can be observed.
+_FAKE_7Z = """#!{python}
+import json, os, sys, time
+from pathlib import Path
+cmd, args = sys.argv[1], sys.argv[2:]
+src = Path([a for a in args if not a.startswith("-")][-1])
+spec = json.loads(src.read_text())
+with open(str(src) + ".calls", "a") as f:
+    f.write(cmd + "\\n")
+if cmd == "l":
+    print("Listing archive: " + str(src))
+    print("--")
+    print("Path = " + str(src))
+    print("Type = 7z")
+    print("")
+    print("----------")
+    for name in sorted(spec["files"]):
+        print("Path = " + name.rsplit("/", 1)[0])
+        print("Folder = +")
+        print("")
+        print("Path = " + name)
+        print("Size = " + str(len(spec["files"][name])))
+        print("Attributes = A")
+        print("")
+    sys.exit(0)
+dst = Path([a for a in args if a.startswith("-o")][0][2:])
+if spec.get("sleep"):
+    Path(str(src) + ".pid").write_text(str(os.getpid()))
+    time.sleep(spec["sleep"])
+for name, data in spec["files"].items():
+    out = dst / (Path(name).name if cmd == "e" else name)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(data)
+"""
+
+
+@pytest.fixture()
+def service(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FileService:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "7z"
+    tool.write_text(_FAKE_7Z.format(python=sys.executable))
+    tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+
+    roots = {name: tmp_path / name.value for name in RootName}
+    for p in roots.values():
+        p.mkdir(parents=True, exist_ok=True)
+    return FileService(roots)
+
+
+def _archive(fs: FileService, files: dict[str, str], *, sleep: float = 0.0) -> Path:
+    path = fs.resolve_abs_path(RootName.INBOX, "book.rar")
+    path.write_text(json.dumps({"files": files, "sleep": sleep}))
+    return path
+
+
+def _calls(path: Path) -> list[str]:
+    return Path(f"{path}.calls").read_text().split()
+
+
+def test_slt_parser_skips_archive_block_and_directories() -> None:
+    lines = [
+        "Path = /in/book.rar",
+        "Type = Rar",
+        "",
+        "----------",
+        "Path = CD1",
+        "Attributes = D....",
+        "",
+        "Path = CD1\\01.mp3",
+        "Size = 12",
+        "Attributes = A",
+        "",
+        "Path = cover.jpg",
+        "Size = 3",
+    ]
+    entries = list(parse_listing("7z", iter(lines)))
+    assert [(e.path, e.size) for e in entries] == [("CD1/01.mp3", 12), ("cover.jpg", 3)]
+
+
+def test_plan_and_unpack_share_one_listing(service: FileService) -> None:
+    files = {"CD1/01.mp3": "one", "CD2/02.mp3": "two"}
+    path = _archive(service, files)
+    svc = ArchiveService(service)
+
+    plan = svc.plan_unpack(RootName.INBOX, "book.rar", RootName.STAGE, "out", fmt=ArchiveFormat.RAR)
+    assert plan.entries == ["CD1/01.mp3", "CD2/02.mp3"]
+    result = svc.unpack(RootName.INBOX, "book.rar", RootName.STAGE, "out", fmt=ArchiveFormat.RAR)
+
+    assert (result.files_unpacked, result.total_bytes) == (2, 6)
+    assert _calls(path) == ["l", "x"]
+    out = service.resolve_abs_path(RootName.STAGE, "out")
+    assert (out / "CD2" / "02.mp3").read_text() == "two"
+
+
+def test_flatten_extracts_flat_unless_names_collide(service: FileService) -> None:
+    path = _archive(service, {"CD1/01.mp3": "a", "CD2/02.mp3": "b"})
+    svc = ArchiveService(service)
+    svc.unpack(
+        RootName.INBOX, "book.rar", RootName.STAGE, "flat", fmt=ArchiveFormat.RAR, flatten=True
+    )
+    assert _calls(path) == ["l", "e"]
+    assert sorted(p.name for p in service.resolve_abs_path(RootName.STAGE, "flat").iterdir()) == [
+        "01.mp3",
+        "02.mp3",
+    ]
+
+    path = _archive(service, {"CD1/01.mp3": "a", "CD2/01.mp3": "b"})
+    Path(f"{path}.calls").unlink()
+    result = svc.unpack(
+        RootName.INBOX,
+        "book.rar",
+        RootName.STAGE,
+        "dup",
+        fmt=ArchiveFormat.RAR,
+        flatten=True,
+        collision=CollisionPolicy.RENAME,
+    )
+    assert _calls(path) == ["l", "x"]
+    assert result.files_unpacked == 2
+    assert sorted(p.name for p in service.resolve_abs_path(RootName.STAGE, "dup").iterdir()) == [
+        "01.mp3",
+        "01__1.mp3",
+    ]
+
+
+def test_unpack_async_does_not_block_the_loop(service: FileService) -> None:
+    _archive(service, {"a.mp3": "x"}, sleep=0.5)
+    svc = ArchiveService(service)
+
+    async def _run() -> tuple[int, int]:
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        result = await svc.unpack_async(
+            RootName.INBOX, "book.rar", RootName.STAGE, "out", fmt=ArchiveFormat.RAR
+        )
+        ticker.cancel()
+        return result.files_unpacked, ticks
+
+    files, ticks = asyncio.run(_run())
+    assert files == 1
+    assert ticks >= 5
+
+
+def test_cancelling_unpack_async_terminates_the_tool(service: FileService) -> None:
+    path = _archive(service, {"a.mp3": "x"}, sleep=30.0)
+    pid_file = Path(f"{path}.pid")
+    svc = ArchiveService(service)
+
+    async def _run() -> None:
+        task = asyncio.create_task(
+            svc.unpack_async(
+                RootName.INBOX, "book.rar", RootName.STAGE, "out", fmt=ArchiveFormat.RAR
+            )
+        )
+        deadline = time.monotonic() + 10
+        while not pid_file.exists() and time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    started = time.monotonic()
+    asyncio.run(_run())
+    assert time.monotonic() - started < 10
+    pid = int(pid_file.read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+def test_stage_source_async_unpacks_external_archive(service: FileService) -> None:
+    _archive(service, {"CD1/01.mp3": "one"})
+
+    staged = asyncio.run(
+        import_runtime.stage_source_async(
+            service, source_root=RootName.INBOX, source_relative_path="book.rar"
+        )
+    )
+
+    work = service.resolve_abs_path(RootName.STAGE, staged["work"]["relative_path"])
+    assert staged["intake"] == {"kind": "archive", "archive_format": "rar"}
+    assert (work / "CD1" / "01.mp3").read_text() == "one"
@@ -0,0 +1,144 @@
+"""Unit tests for FileService.move_path and rename-based publish."""
+
+from __future__ import annotations
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+from plugins.file_io.import_runtime import publish_staged
+from plugins.file_io.service import FileService, RootName, transfer
+from plugins.file_io.service.ops import AlreadyExistsError, NotFoundError
+
+
+@pytest.fixture()
+def service(tmp_path: Path) -> FileService:
+    roots = {
+        RootName.INBOX: tmp_path / "inbox",
+        RootName.STAGE: tmp_path / "stage",
+        RootName.JOBS: tmp_path / "jobs",
+        RootName.OUTBOX: tmp_path / "outbox",
+    }
+    for p in roots.values():
+        p.mkdir(parents=True, exist_ok=True)
+    return FileService(roots)
+
+
+def _make_book(root: Path) -> Path:
+    book = root / "work" / "Book"
+    (book / "cd1").mkdir(parents=True)
+    (book / "01.mp3").write_bytes(b"a" * 4096)
+    (book / "cd1" / "02.mp3").write_bytes(b"b" * 10)
+    return book
+
+
+def test_same_device_move_is_a_rename(service: FileService, tmp_path: Path) -> None:
+    book = _make_book(tmp_path / "stage")
+    inode = (book / "01.mp3").stat().st_ino
+
+    method = service.move_path(RootName.STAGE, "work/Book", RootName.OUTBOX, "Author/Book")
+
+    assert method == transfer.MOVE_RENAME
+    assert not book.exists()
+    moved = tmp_path / "outbox" / "Author" / "Book"
+    assert (moved / "01.mp3").stat().st_ino == inode
+    assert (moved / "cd1" / "02.mp3").read_bytes() == b"b" * 10
+
+
+def test_cross_device_move_streams_copy_and_removes_source(
+    service: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    book = _make_book(tmp_path / "stage")
+    real_rename = os.rename
+
+    def _rename(src: object, dst: object) -> None:
+        if Path(str(src)) == book:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        real_rename(src, dst)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(transfer.os, "rename", _rename)
+
+    method = service.move_path(RootName.STAGE, "work/Book", RootName.OUTBOX, "Book")
+
+    assert method == transfer.MOVE_COPY
+    assert not book.exists()
+    moved = tmp_path / "outbox" / "Book"
+    assert (moved / "01.mp3").read_bytes() == b"a" * 4096
+    assert (moved / "cd1" / "02.mp3").read_bytes() == b"b" * 10
+    assert sorted(p.name for p in (tmp_path / "outbox").iterdir()) == ["Book"]
+
+
+def test_failed_copy_leaves_no_partial_destination(
+    service: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    book = _make_book(tmp_path / "stage")
+    monkeypatch.setattr(transfer, "same_device", lambda src, dst_dir: False)
+
+    def _boom(src: Path, dst: Path) -> None:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(transfer, "copy_file_streaming", _boom)
+
+    with pytest.raises(OSError):
+        service.move_path(RootName.STAGE, "work/Book", RootName.OUTBOX, "Book")
+
+    assert (book / "01.mp3").exists()
+    assert list((tmp_path / "outbox").iterdir()) == []
+
+
+def test_move_path_respects_overwrite(service: FileService, tmp_path: Path) -> None:
+    _make_book(tmp_path / "stage")
+    (tmp_path / "outbox" / "Book").mkdir()
+    (tmp_path / "outbox" / "Book" / "old.mp3").write_bytes(b"old")
+
+    with pytest.raises(AlreadyExistsError):
+        service.move_path(RootName.STAGE, "work/Book", RootName.OUTBOX, "Book")
+    with pytest.raises(NotFoundError):
+        service.move_path(RootName.STAGE, "work/Missing", RootName.OUTBOX, "Other")
+
+    service.move_path(RootName.STAGE, "work/Book", RootName.OUTBOX, "Book", overwrite=True)
+    assert not (tmp_path / "outbox" / "Book" / "old.mp3").exists()
+    assert (tmp_path / "outbox" / "Book" / "01.mp3").exists()
+
+
+def test_publish_with_cleanup_moves_stage_tree(
+    service: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    book = _make_book(tmp_path / "stage")
+    copied: list[str] = []
+    monkeypatch.setattr(service, "copy_path", lambda *a, **k: copied.append("copy"))
+
+    published = publish_staged(
+        service,
+        work_relative_path="work/Book",
+        final_root=RootName.OUTBOX,
+        final_relative_path="Author/Book",
+        cleanup=True,
+    )
+
+    assert copied == []
+    assert published["cleanup_performed"] is True
+    assert not book.exists()
+    assert (tmp_path / "outbox" / "Author" / "Book" / "01.mp3").exists()
+
+
+def test_zero_byte_copy_file_range_falls_back(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src.mp3"
+    src.write_bytes(b"x" * 5000)
+    monkeypatch.setattr(transfer.os, "copy_file_range", lambda *a: 0, raising=False)
+
+    transfer.copy_file_streaming(src, tmp_path / "dst.mp3")
+    assert (tmp_path / "dst.mp3").read_bytes() == b"x" * 5000
+
+    calls: list[int] = []
+
+    def _short(src_fd: int, dst_fd: int, count: int) -> int:
+        calls.append(count)
+        return 100 if len(calls) == 1 else 0
+
+    monkeypatch.setattr(transfer.os, "copy_file_range", _short, raising=False)
+    with pytest.raises(OSError, match="short copy: 100 of 5000"):
+        transfer.copy_file_streaming(src, tmp_path / "dst2.mp3")
@@ -0,0 +1,179 @@
+"""Single-pass ArchiveService unpack: parallel zip, streamed tar, progress."""
+
+from __future__ import annotations
+
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from plugins.file_io.service import (
+    ArchiveFormat,
+    ArchiveService,
+    CollisionPolicy,
+    FileService,
+    RootName,
+)
+from plugins.file_io.service.archives import extract as extract_mod
+from plugins.file_io.service.archives.types import OpEvent, OpPhase
+
+from audiomason.core.errors import FileError
+
+
+@pytest.fixture()
+def service(tmp_path: Path) -> FileService:
+    roots = {name: tmp_path / name.value for name in RootName}
+    for p in roots.values():
+        p.mkdir(parents=True, exist_ok=True)
+    return FileService(roots)
+
+
+def _members() -> dict[str, bytes]:
+    return {
+        "Book/CD1/01.mp3": bytes(range(256)) * 4096,
+        "Book/CD1/02.mp3": b"\x01" * 300_000,
+        "Book/CD2/01.mp3": b"\x02" * 200_000,
+        "Book/cover.jpg": b"jpeg",
+        "Book/notes.txt": b"hello " * 5000,
+    }
+
+
+def _write_zip(path: Path, members: dict[str, bytes]) -> None:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            # MP3s are stored like real audiobook zips; the rest is deflated.
+            method = zipfile.ZIP_STORED if name.endswith(".mp3") else zipfile.ZIP_DEFLATED
+            zf.writestr(name, data, compress_type=method)
+
+
+def _read_tree(base: Path) -> dict[str, bytes]:
+    return {
+        str(p.relative_to(base)).replace("\\", "/"): p.read_bytes()
+        for p in base.rglob("*")
+        if p.is_file()
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_zip_unpack_is_exact_and_reports_progress(service: FileService, workers: int) -> None:
+    members = _members()
+    _write_zip(service.resolve_abs_path(RootName.INBOX, "book.zip"), members)
+    events: list[OpEvent] = []
+
+    result = ArchiveService(service).unpack(
+        RootName.INBOX,
+        "book.zip",
+        RootName.STAGE,
+        "out",
+        fmt=ArchiveFormat.ZIP,
+        progress=events.append,
+        workers=workers,
+    )
+
+    assert _read_tree(service.resolve_abs_path(RootName.STAGE, "out")) == members
+    total = sum(len(v) for v in members.values())
+    assert (result.files_unpacked, result.total_bytes) == (len(members), total)
+    assert all(e.phase == OpPhase.PROGRESS for e in events)
+    assert events[-1].details["files_done"] == len(members)
+    assert events[-1].details["bytes_done"] == total
+    assert events[-1].details["bytes_total"] == total
+    assert [e.details["bytes_done"] for e in events] == sorted(
+        e.details["bytes_done"] for e in events
+    )
+
+
+def test_corrupt_stored_member_fails_crc_check(service: FileService) -> None:
+    path = service.resolve_abs_path(RootName.INBOX, "bad.zip")
+    _write_zip(path, {"a.mp3": b"A" * 5000})
+    raw = bytearray(path.read_bytes())
+    raw[raw.index(b"A" * 10) + 3] = ord("B")
+    path.write_bytes(bytes(raw))
+
+    with pytest.raises(FileError, match="CRC"):
+        ArchiveService(service).unpack(
+            RootName.INBOX, "bad.zip", RootName.STAGE, "out", fmt=ArchiveFormat.ZIP
+        )
+
+
+@pytest.mark.parametrize("fmt", [ArchiveFormat.TAR, ArchiveFormat.TAR_GZ, ArchiveFormat.TAR_XZ])
+def test_tar_unpack_streams_once(
+    service: FileService, monkeypatch: pytest.MonkeyPatch, fmt: ArchiveFormat
+) -> None:
+    members = _members()
+    mode = {"tar": "w:", "tar.gz": "w:gz", "tar.xz": "w:xz"}[fmt.value]
+    path = service.resolve_abs_path(RootName.INBOX, f"book.{fmt.value}")
+    with tarfile.open(path, mode) as tf:  # type: ignore[call-overload]
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+    def _no_random_access(self: tarfile.TarFile) -> list[tarfile.TarInfo]:
+        raise AssertionError("unpack must not index the archive before extracting")
+
+    monkeypatch.setattr(tarfile.TarFile, "getmembers", _no_random_access)
+    events: list[OpEvent] = []
+    result = ArchiveService(service).unpack(
+        RootName.INBOX,
+        f"book.{fmt.value}",
+        RootName.STAGE,
+        "out",
+        fmt=fmt,
+        progress=events.append,
+    )
+
+    assert _read_tree(service.resolve_abs_path(RootName.STAGE, "out")) == members
+    assert result.files_unpacked == len(members)
+    assert events[-1].details["files_done"] == len(members)
+    assert events[-1].details["files_total"] is None
+
+
+def test_tar_flatten_rename_follows_sorted_names_not_archive_order(
+    service: FileService,
+) -> None:
+    path = service.resolve_abs_path(RootName.INBOX, "dup.tar.gz")
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in (("b/x.mp3", b"from-b"), ("a/x.mp3", b"from-a")):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+    archives = ArchiveService(service)
+    kwargs = {"fmt": ArchiveFormat.TAR_GZ, "flatten": True, "collision": CollisionPolicy.RENAME}
+    plan = archives.plan_unpack(RootName.INBOX, "dup.tar.gz", RootName.STAGE, "flat", **kwargs)
+    archives.unpack(RootName.INBOX, "dup.tar.gz", RootName.STAGE, "flat", **kwargs)
+
+    out = service.resolve_abs_path(RootName.STAGE, "flat")
+    assert _read_tree(out) == {"x.mp3": b"from-a", "x__1.mp3": b"from-b"}
+    assert sorted(plan.entries) == ["x.mp3", "x__1.mp3"]
+    # Nothing of the staging directory is left behind.
+    assert sorted(p.name for p in out.iterdir()) == ["x.mp3", "x__1.mp3"]
+
+
+def test_flatten_overwrite_keeps_last_entry_and_escape_is_rejected(
+    service: FileService,
+) -> None:
+    path = service.resolve_abs_path(RootName.INBOX, "dup.zip")
+    _write_zip(path, {"a/x.txt": b"first", "b/x.txt": b"second"})
+    ArchiveService(service).unpack(
+        RootName.INBOX,
+        "dup.zip",
+        RootName.STAGE,
+        "flat",
+        fmt=ArchiveFormat.ZIP,
+        flatten=True,
+        collision=CollisionPolicy.OVERWRITE,
+        workers=2,
+    )
+    assert _read_tree(service.resolve_abs_path(RootName.STAGE, "flat")) == {"x.txt": b"second"}
+
+    _write_zip(path, {"../evil.txt": b"x"})
+    with pytest.raises(FileError, match="escapes"):
+        ArchiveService(service).unpack(
+            RootName.INBOX, "dup.zip", RootName.STAGE, "evil", fmt=ArchiveFormat.ZIP
+        )
+
+
+def test_default_worker_count_is_bounded() -> None:
+    assert 1 <= extract_mod.default_unpack_workers() <= 4
@@ -0,0 +1,145 @@
+"""Shared, invalidation-aware wizard callable authority for the import plugin."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from audiomason.core.config_service import ConfigService
+from audiomason.core.errors import PluginNotFoundError
+from audiomason.core.loader import PluginLoader
+
+callable_authority = import_module("plugins.import.callable_authority")
+
+
+def _write_plugin(plugins_dir: Path, *, operation_id: str = "demo.op") -> Path:
+    plugin_dir = plugins_dir / "demo_plugin"
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    (plugin_dir / "plugin.yaml").write_text(
+        "name: demo_plugin\n"
+        "version: 1.0.0\n"
+        "entrypoint: plugin:DemoPlugin\n"
+        "interfaces: []\n"
+        "wizard_callable_manifest_pointer: wizard_callable_manifest.json\n"
+        "test_level: none\n",
+        encoding="utf-8",
+    )
+    (plugin_dir / "wizard_callable_manifest.json").write_text(
+        json.dumps(
+            {
+                "schema_version": 1,
+                "operations": [
+                    {
+                        "operation_id": operation_id,
+                        "method_name": "run_demo",
+                        "execution_mode": "inline",
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return plugin_dir
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture()
+def plugins_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    out = tmp_path / "plugins"
+    out.mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setattr(callable_authority, "_builtin_plugins_dir", lambda: out)
+    callable_authority.invalidate_callable_authority()
+    yield out
+    callable_authority.invalidate_callable_authority()
+
+
+def test_authority_is_shared_and_resolution_stays_warm(
+    plugins_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_plugin(plugins_dir)
+    registry, loader = callable_authority.callable_authority()
+    assert registry.resolve_wizard_callable("demo.op", loader=loader).plugin_id == "demo_plugin"
+
+    def _no_scan() -> list[Path]:
+        raise AssertionError("warm resolution must not rescan plugins")
+
+    monkeypatch.setattr(loader, "discover", _no_scan)
+    again_registry, again_loader = callable_authority.callable_authority()
+    assert again_registry is registry
+    assert again_loader is loader
+    assert registry.resolve_wizard_callable("demo.op", loader=loader).operation_id == "demo.op"
+
+
+def test_authority_rebuilds_when_callable_manifest_changes(
+    plugins_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin_dir = _write_plugin(plugins_dir)
+    registry, loader = callable_authority.callable_authority()
+    registry.resolve_wizard_callable("demo.op", loader=loader)
+
+    monkeypatch.setattr(callable_authority, "RECHECK_INTERVAL_S", 0.0)
+    assert callable_authority.callable_authority()[0] is registry
+
+    _write_plugin(plugins_dir, operation_id="demo.renamed")
+    _bump_mtime(plugin_dir / "wizard_callable_manifest.json")
+    fresh_registry, fresh_loader = callable_authority.callable_authority()
+
+    assert fresh_registry is not registry
+    assert fresh_registry.resolve_wizard_callable("demo.renamed", loader=fresh_loader)
+    with pytest.raises(PluginNotFoundError):
+        fresh_registry.resolve_wizard_callable("demo.op", loader=fresh_loader)
+
+
+def test_authority_sees_plugin_disabled_in_user_config(
+    plugins_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_plugin(plugins_dir)
+    registry, loader = callable_authority.callable_authority()
+    registry.resolve_wizard_callable("demo.op", loader=loader)
+
+    monkeypatch.setattr(callable_authority, "RECHECK_INTERVAL_S", 0.0)
+    ConfigService().set_value("plugin_registry.disabled", ["demo_plugin"])
+    registry, loader = callable_authority.callable_authority()
+
+    with pytest.raises(PluginNotFoundError):
+        registry.resolve_wizard_callable("demo.op", loader=loader)
+
+
+def test_loader_reparses_manifest_only_when_it_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin_dir = _write_plugin(tmp_path / "plugins")
+    loader = PluginLoader(builtin_plugins_dir=tmp_path / "plugins")
+    parsed: list[Path] = []
+    original = loader._parse_manifest
+
+    def _counting(manifest_path: Path) -> object:
+        parsed.append(manifest_path)
+        return original(manifest_path)
+
+    monkeypatch.setattr(loader, "_parse_manifest", _counting)
+    first = loader.load_manifest_only(plugin_dir)
+    assert loader.load_manifest_only(plugin_dir) is first
+    assert len(parsed) == 1
+
+    _bump_mtime(plugin_dir / "plugin.yaml")
+    assert loader.load_manifest_only(plugin_dir) is not first
+    assert len(parsed) == 2
+
+
+def test_config_service_get_value_resolves_single_key(tmp_path: Path) -> None:
+    service = ConfigService(user_config_path=tmp_path / "config.yaml")
+    assert service.get_value("plugin_registry.disabled") is None
+
+    service.set_value("plugin_registry.disabled", ["a"])
+    assert service.get_value("plugin_registry.disabled") == ["a"]
@@ -0,0 +1,82 @@
+"""Conflict scan lists each target parent once and honors the target cache."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+from plugins.file_io.service import FileService, RootName
+
+conflicts = import_module("plugins.import.conflicts")
+
+
+@pytest.fixture()
+def fs(tmp_path: Path) -> FileService:
+    stage = tmp_path / "stage"
+    stage.mkdir()
+    return FileService({RootName.STAGE: stage})
+
+
+def _plan(*targets: str) -> dict[str, object]:
+    return {
+        "selected_books": [
+            {"book_id": f"b{i}", "proposed_target_relative_path": target}
+            for i, target in enumerate(targets)
+        ]
+    }
+
+
+def _count_list_names(fs: FileService, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    original = fs.list_names
+
+    def _counting(root: RootName, rel_path: str = ".") -> object:
+        calls.append(rel_path)
+        return original(root, rel_path)
+
+    monkeypatch.setattr(fs, "list_names", _counting)
+    return calls
+
+
+def test_scan_lists_each_parent_once(
+    fs: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "stage" / "Author A" / "Book 1").mkdir(parents=True)
+    (tmp_path / "stage" / "Author A" / "Book 3").write_text("x", encoding="utf-8")
+    calls = _count_list_names(fs, monkeypatch)
+
+    items = conflicts.scan_conflicts(
+        fs,
+        plan=_plan("Author A/Book 1", "Author A/Book 2", "Author A/Book 3", "Author B/Book 1"),
+        mode="stage",
+    )
+
+    assert [item["target_relative_path"] for item in items] == [
+        "Author A/Book 1",
+        "Author A/Book 3",
+    ]
+    assert sorted(calls) == ["Author A", "Author B"]
+
+
+def test_target_cache_reuses_listings_until_expired(
+    fs: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [0.0]
+    cache = conflicts.TargetTreeCache(ttl_s=5.0, clock=lambda: now[0])
+    calls = _count_list_names(fs, monkeypatch)
+    plan = _plan("Author/Book")
+
+    assert conflicts.scan_conflicts(fs, plan=plan, mode="stage", cache=cache) == []
+    (tmp_path / "stage" / "Author" / "Book").mkdir(parents=True)
+    assert conflicts.scan_conflicts(fs, plan=plan, mode="stage", cache=cache) == []
+    assert len(calls) == 1
+
+    now[0] = 10.0
+    items = conflicts.scan_conflicts(fs, plan=plan, mode="stage", cache=cache)
+    assert [item["source_book_id"] for item in items] == ["b0"]
+    assert len(calls) == 2
+
+    cache.invalidate()
+    conflicts.scan_conflicts(fs, plan=plan, mode="stage", cache=cache)
+    assert len(calls) == 3
@@ -0,0 +1,172 @@
+"""Incremental discovery backed by a persistent directory-tree snapshot."""
+
+from __future__ import annotations
+
+import os
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+from plugins.file_io.service import FileService, RootName
+
+discovery = import_module("plugins.import.discovery")
+fingerprint_json = import_module("plugins.import.fingerprints").fingerprint_json
+
+
+@pytest.fixture()
+def fs(tmp_path: Path) -> FileService:
+    roots = {
+        RootName.INBOX: tmp_path / "inbox",
+        RootName.WIZARDS: tmp_path / "wizards",
+    }
+    for p in roots.values():
+        p.mkdir(parents=True, exist_ok=True)
+    return FileService(roots)
+
+
+def _age_tree(base: Path, seconds: int = 60) -> None:
+    # Push mtimes out of the racy window so unchanged directories are reused.
+    stamp = int(os.stat(base).st_mtime) - seconds
+    for dirpath, dirnames, filenames in os.walk(base):
+        for name in [*dirnames, *filenames]:
+            os.utime(os.path.join(dirpath, name), (stamp, stamp))
+    os.utime(base, (stamp, stamp))
+
+
+def _populate(inbox: Path) -> None:
+    (inbox / "Author A" / "Book 1").mkdir(parents=True)
+    (inbox / "Author A" / "Book 1" / "01.mp3").write_bytes(b"x")
+    (inbox / "Author A" / "Book 2.zip").write_bytes(b"z")
+    (inbox / "Author-B").mkdir()
+    (inbox / "Author-B" / "cover.jpg").write_bytes(b"c")
+
+
+def test_snapshot_discovery_matches_full_listing(fs: FileService, tmp_path: Path) -> None:
+    _populate(tmp_path / "inbox")
+
+    result = discovery.discover(fs, root="inbox", relative_path=".")
+    entries = fs.list_dir(RootName.INBOX, ".", recursive=True)
+    expected = discovery._canonical_items("inbox", [(e.rel_path, e.is_dir) for e in entries])
+
+    assert result.items == expected
+    assert result.fingerprint == fingerprint_json(expected)
+    assert discovery.run_discovery(fs, root="inbox", relative_path=".") == expected
+
+
+def test_unchanged_tree_is_not_relisted(fs: FileService, tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    _populate(inbox)
+    _age_tree(inbox)
+    first = discovery.discover(fs, root="inbox", relative_path=".")
+
+    snapshot = fs.scan_tree(
+        RootName.INBOX,
+        ".",
+        previous=discovery._memory_cache[(str(inbox), "inbox", "")].snapshot,
+    )
+    assert snapshot.dirs_listed == 0
+    assert snapshot.digest == first.tree_digest
+
+    second = discovery.discover(fs, root="inbox", relative_path=".")
+    assert second == first
+
+
+def test_change_in_nested_directory_updates_fingerprint(fs: FileService, tmp_path: Path) -> None:
+    inbox = tmp_path / "inbox"
+    _populate(inbox)
+    _age_tree(inbox)
+    first = discovery.discover(fs, root="inbox", relative_path=".")
+
+    (inbox / "Author A" / "Book 1" / "02.mp3").write_bytes(b"y")
+    second = discovery.discover(fs, root="inbox", relative_path=".")
+
+    assert second.tree_digest != first.tree_digest
+    assert second.fingerprint != first.fingerprint
+    assert "Author A/Book 1/02.mp3" in {item["relative_path"] for item in second.items}
+
+
+def test_persisted_snapshot_survives_process_cache_loss(
+    fs: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inbox = tmp_path / "inbox"
+    _populate(inbox)
+    _age_tree(inbox)
+    first = discovery.discover(fs, root="inbox", relative_path=".")
+    snapshot_rel = discovery._snapshot_rel_path("inbox", "")
+    assert fs.exists(RootName.WIZARDS, snapshot_rel)
+
+    monkeypatch.setattr(discovery, "_memory_cache", {})
+    monkeypatch.setattr(discovery, "fingerprint_json", lambda _obj: "must-not-be-called")
+    second = discovery.discover(fs, root="inbox", relative_path=".")
+
+    assert second.items == first.items
+    assert second.fingerprint == first.fingerprint
+
+
+def test_directory_removed_during_listing_is_skipped(
+    fs: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inbox = tmp_path / "inbox"
+    _populate(inbox)
+    snapshots = import_module("plugins.file_io.service.snapshots")
+    real_scandir = os.scandir
+
+    class _VanishedEntry:
+        def __init__(self, entry: os.DirEntry[str]) -> None:
+            self._entry = entry
+            self.name = entry.name
+
+        def is_dir(self) -> bool:
+            return True
+
+        def is_symlink(self) -> bool:
+            return False
+
+        def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+            raise FileNotFoundError(self._entry.path)
+
+    class _Listing:
+        def __init__(self, path: str) -> None:
+            self._it = real_scandir(path)
+
+        def __enter__(self) -> list[object]:
+            entries = list(self._it)
+            return [_VanishedEntry(e) if e.name == "Author-B" else e for e in entries]
+
+        def __exit__(self, *exc: object) -> None:
+            self._it.close()
+
+    monkeypatch.setattr(snapshots.os, "scandir", _Listing)
+    snapshot = fs.scan_tree(RootName.INBOX, ".")
+    assert sorted(snapshot.tree.dirs) == ["Author A"]
+
+
+def test_unlistable_child_directory_is_skipped_and_relisted_later(
+    fs: FileService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inbox = tmp_path / "inbox"
+    _populate(inbox)
+    _age_tree(inbox)
+    snapshots = import_module("plugins.file_io.service.snapshots")
+    real_scandir = os.scandir
+    failures = {
+        str(inbox / "Author A" / "Book 1"): PermissionError,
+        str(inbox / "Author-B"): FileNotFoundError,
+    }
+
+    def _scandir(path: str) -> object:
+        error = failures.get(str(path))
+        if error is not None:
+            raise error(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(snapshots.os, "scandir", _scandir)
+    first = fs.scan_tree(RootName.INBOX, ".")
+    assert sorted(first.tree.dirs) == ["Author A"]
+    assert first.tree.dirs["Author A"].dirs == {}
+    assert first.tree.dirs["Author A"].mtime_ns == 0
+
+    monkeypatch.undo()
+    second = fs.scan_tree(RootName.INBOX, ".", previous=first)
+    assert sorted(second.tree.dirs) == ["Author A", "Author-B"]
+    assert "Author A/Book 1/01.mp3" in {rel for rel, _is_dir in second.iter_entries()}
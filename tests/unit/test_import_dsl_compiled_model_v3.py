@@ -0,0 +1,110 @@
+"""Indexed runtime model for the WizardDefinition v3 interpreter."""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+import pytest
+
+compiled_model_v3 = import_module("plugins.import.dsl.compiled_model_v3")
+interpreter_v3 = import_module("plugins.import.dsl.interpreter_v3")
+build_flow_model_v3 = import_module("plugins.import.dsl.flowmodel_v3").build_flow_model_v3
+FinalizeError = import_module("plugins.import.errors").FinalizeError
+
+
+def _chain_program(count: int) -> dict[str, object]:
+    nodes: list[dict[str, object]] = []
+    edges: list[dict[str, object]] = []
+    for i in range(count):
+        nodes.append(
+            {
+                "step_id": f"s{i}",
+                "op": {
+                    "primitive_id": "data.set",
+                    "primitive_version": 1,
+                    "inputs": {"value": i},
+                    "writes": [
+                        {"to_path": "$.state.vars.last", "value": {"expr": "$.op.outputs.value"}}
+                    ],
+                },
+            }
+        )
+        if i:
+            edges.append({"from": f"s{i - 1}", "to": f"s{i}"})
+    nodes.append(
+        {
+            "step_id": "stop",
+            "op": {"primitive_id": "ctrl.stop", "primitive_version": 1, "inputs": {}},
+        }
+    )
+    edges.append({"from": f"s{count - 1}", "to": "stop"})
+    return {"version": 3, "entry_step_id": "s0", "nodes": nodes, "edges": edges}
+
+
+def test_compile_indexes_steps_edges_and_registry() -> None:
+    model = build_flow_model_v3(wizard_definition=_chain_program(3))
+    compiled = compiled_model_v3.compile_flow_model(model)
+
+    assert set(compiled.steps) == {"s0", "s1", "s2", "stop"}
+    s0 = compiled.step("s0")
+    assert s0.primitive_id == "data.set"
+    assert s0.registry_declared is True
+    assert s0.is_non_interactive is True
+    assert s0.is_prompt is False
+    assert [edge.to_step_id for edge in s0.outgoing] == ["s1"]
+    assert compiled.step("stop").outgoing == ()
+    assert ("ctrl.stop", 1) in compiled_model_v3.registry_primitive_keys()
+    with pytest.raises(FinalizeError):
+        compiled.step("missing")
+
+
+def test_compile_keeps_edge_order_and_drops_malformed_conditions() -> None:
+    model = {
+        "steps": [{"step_id": "a"}, {"step_id": "b"}, {"step_id": "c"}],
+        "edges": [
+            {"from": "a", "to": "b"},
+            {"from": "a", "to": "c", "condition_expr": {"bogus": 1}},
+            {"from": "a", "to": "c", "condition_expr": {"expr": "true"}},
+        ],
+    }
+    compiled = compiled_model_v3.compile_flow_model(model)
+
+    outgoing = compiled.step("a").outgoing
+    assert [(edge.to_step_id, edge.condition_expr) for edge in outgoing] == [
+        ("b", None),
+        ("c", {"expr": "true"}),
+    ]
+
+
+def test_for_graph_reuses_compiled_library_graphs() -> None:
+    library = {"steps": [{"step_id": "x"}], "edges": []}
+    root = compiled_model_v3.compile_flow_model({"steps": [], "edges": [], "libraries": {}})
+
+    first = root.for_graph(dict(library))
+    second = root.for_graph(dict(library))
+
+    assert first is second
+    assert root.for_graph(root.model) is root
+
+
+def test_run_automatic_steps_compiles_long_chain_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    model = build_flow_model_v3(wizard_definition=_chain_program(300))
+    calls: list[int] = []
+    original = interpreter_v3.compile_flow_model
+
+    def _counting(effective_model: dict[str, object]) -> object:
+        calls.append(1)
+        return original(effective_model)
+
+    monkeypatch.setattr(interpreter_v3, "compile_flow_model", _counting)
+    monkeypatch.setattr(interpreter_v3, "_emit_runtime_boundary", lambda **_: None)
+
+    state = interpreter_v3.run_automatic_steps(
+        effective_model=model,
+        state={"status": "in_progress", "current_step_id": "s0"},
+        session_id="sess",
+    )
+
+    assert state["status"] == "completed"
+    assert state["vars"]["last"] == 299
+    assert len(calls) == 1
@@ -0,0 +1,189 @@
+"""PHASE 2 runs independent books concurrently with deterministic diagnostics."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+import pytest
+from plugins.file_io.service import FileService, RootName
+
+phase2_job_runner = import_module("plugins.import.phase2_job_runner")
+
+
+class _SlowAudioProcessor:
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.bitrate = "128k"
+        self.loudnorm = False
+        self.split_chapters = False
+        self.delays = delays
+        # Shared through copy.copy(), so every per-book copy updates the same counters.
+        self.stats = {"active": 0, "peak": 0}
+        self.seen_bitrates: dict[str, str] = {}
+
+    def plan_import_conversion(
+        self,
+        source: Path,
+        output_dir: Path,
+        *,
+        chapters: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        return [{"source": source, "output": output_dir / f"{source.stem}.mp3", "order": 1}]
+
+    async def _execute_plan(self, plan: list[dict[str, Any]]) -> list[Path]:
+        source = Path(plan[0]["source"])
+        self.seen_bitrates[source.parent.name] = self.bitrate
+        self.stats["active"] += 1
+        self.stats["peak"] = max(self.stats["peak"], self.stats["active"])
+        try:
+            await asyncio.sleep(self.delays.get(source.parent.name, 0.0))
+            if source.parent.name == "Broken":
+                raise RuntimeError("ffmpeg failed")
+        finally:
+            self.stats["active"] -= 1
+        output = Path(plan[0]["output"])
+        output.write_bytes(b"mp3")
+        return [output]
+
+
+class _Loader:
+    def __init__(self, audio: _SlowAudioProcessor) -> None:
+        self.audio = audio
+
+    def get_plugin(self, name: str) -> Any:
+        assert name == "audio_processor"
+        return self.audio
+
+
+class _Engine:
+    def __init__(self, fs: FileService) -> None:
+        self._fs = fs
+
+    def get_file_service(self) -> FileService:
+        return self._fs
+
+
+@pytest.fixture()
+def roots(tmp_path: Path) -> dict[str, Path]:
+    out = {name: tmp_path / name for name in ("inbox", "stage", "wizards")}
+    for path in out.values():
+        path.mkdir()
+    return out
+
+
+def _action(name: str, bitrate: str) -> dict[str, Any]:
+    return {
+        "type": "import.book",
+        "book_id": f"book:{name}",
+        "source": {"root": "inbox", "relative_path": name},
+        "target": {"root": "stage", "relative_path": f"Out/{name}"},
+        "authority": {"rename": {"mode": "keep_generated", "extension": ".mp3"}},
+        "capabilities": [
+            {"kind": "audio.import", "order": 10, "options": {"bitrate": bitrate}},
+            {"kind": "publish.write", "order": 40, "relative_path": f"Out/{name}"},
+        ],
+    }
+
+
+async def _run(
+    roots: dict[str, Path],
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    books: list[str],
+    delays: dict[str, float],
+    workers: int,
+) -> tuple[_SlowAudioProcessor, list[tuple[str, int]]]:
+    for name in books:
+        (roots["inbox"] / name).mkdir()
+        (roots["inbox"] / name / "01.m4a").write_bytes(b"audio")
+    job_requests = {
+        "parallelism": {"workers": workers},
+        "actions": [_action(name, f"{64 + i}k") for i, name in enumerate(books)],
+    }
+    (roots["wizards"] / "job_requests.json").write_text(json.dumps(job_requests))
+
+    monkeypatch.setattr(phase2_job_runner.os, "cpu_count", lambda: 8)
+    events: list[tuple[str, int]] = []
+    monkeypatch.setattr(
+        phase2_job_runner,
+        "_emit_required",
+        lambda event, _operation, data: events.append((event, int(data.get("action_index", 0)))),
+    )
+    fs = FileService({RootName(name): path for name, path in roots.items()})
+    audio = _SlowAudioProcessor(delays)
+    try:
+        await phase2_job_runner.run_phase2_job_requests(
+            engine=_Engine(fs),
+            job_id="job-1",
+            job_meta={"job_requests_path": "wizards:job_requests.json"},
+            plugin_loader=_Loader(audio),
+        )
+    finally:
+        assert audio.bitrate == "128k"
+    return audio, events
+
+
+async def test_books_run_concurrently_with_serial_diagnostics(
+    roots: dict[str, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    audio, events = await _run(
+        roots,
+        monkeypatch,
+        books=["A", "B", "C"],
+        delays={"A": 0.2, "B": 0.0, "C": 0.1},
+        workers=3,
+    )
+
+    assert audio.stats["peak"] == 3
+    assert audio.seen_bitrates == {"A": "64k", "B": "65k", "C": "66k"}
+    assert events == [
+        ("phase2.runner.start", 0),
+        ("phase2.action.start", 1),
+        ("phase2.action.end", 1),
+        ("phase2.action.start", 2),
+        ("phase2.action.end", 2),
+        ("phase2.action.start", 3),
+        ("phase2.action.end", 3),
+        ("phase2.runner.end", 0),
+    ]
+    for name in ("A", "B", "C"):
+        assert (roots["stage"] / "Out" / name / "01.mp3").exists()
+
+
+async def test_single_worker_keeps_books_serial(
+    roots: dict[str, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    audio, _events = await _run(roots, monkeypatch, books=["A", "B"], delays={"A": 0.05}, workers=1)
+    assert audio.stats["peak"] == 1
+
+
+def test_limits_bound_cpu_and_disk_work(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(phase2_job_runner.os, "cpu_count", lambda: 4)
+    limits = phase2_job_runner._phase2_limits
+
+    assert limits({"parallelism": {"workers": 8}}) == phase2_job_runner._Limits(8, 4, 2)
+    assert limits({"parallelism": {"workers": 1}}) == phase2_job_runner._Limits(1, 1, 1)
+    assert limits({}) == phase2_job_runner._Limits(1, 1, 1)
+    assert limits({"parallelism": {}}) == phase2_job_runner._Limits(1, 1, 1)
+    assert limits({"parallelism": {"workers": 0}}) == phase2_job_runner._Limits(1, 1, 1)
+    assert limits({"parallelism": {"workers": -3}}) == phase2_job_runner._Limits(1, 1, 1)
+    assert limits({"parallelism": {"workers": "x"}}) == phase2_job_runner._Limits(1, 1, 1)
+
+
+async def test_failure_stops_new_books_and_raises_first_failure(
+    roots: dict[str, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with pytest.raises(RuntimeError, match="ffmpeg failed"):
+        await _run(
+            roots,
+            monkeypatch,
+            books=["A", "Broken", "C", "D"],
+            delays={"A": 0.1},
+            workers=2,
+        )
+
+    assert (roots["stage"] / "Out" / "A" / "01.mp3").exists()
+    assert not (roots["stage"] / "Out" / "D").exists()
@@ -0,0 +1,143 @@
+"""Append-only processed registry with compacted snapshot and per-book index."""
+
+from __future__ import annotations
+
+import threading
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+import pytest
+from plugins.file_io.service import FileService, RootName
+
+processed_registry = import_module("plugins.import.processed_registry")
+read_json = import_module("plugins.import.storage").read_json
+
+_SNAPSHOT = "import/processed/processed_registry.json"
+_LOG = "import/processed/processed_registry.log.jsonl"
+
+
+@pytest.fixture()
+def fs(tmp_path: Path) -> FileService:
+    wizards = tmp_path / "wizards"
+    wizards.mkdir()
+    return FileService({RootName.WIZARDS: wizards})
+
+
+def _job_requests(book_id: str, *, idem: str = "idem") -> dict[str, Any]:
+    return {
+        "idempotency_key": idem,
+        "config_fingerprint": "cfg",
+        "actions": [
+            {
+                "type": "import.book",
+                "book_id": book_id,
+                "source": {"root": "inbox", "relative_path": f"src/{book_id}"},
+                "target": {"root": "stage", "relative_path": f"dst/{book_id}"},
+            }
+        ],
+    }
+
+
+def test_first_write_creates_snapshot_then_appends_to_log(fs: FileService) -> None:
+    assert processed_registry.apply_successful_job_requests(fs, _job_requests("b1")) is True
+    snapshot = read_json(fs, RootName.WIZARDS, _SNAPSHOT)
+    assert set(snapshot["books"]) == {"b1"}
+    assert not fs.exists(RootName.WIZARDS, _LOG)
+
+    assert processed_registry.apply_successful_job_requests(fs, _job_requests("b2")) is True
+    assert set(read_json(fs, RootName.WIZARDS, _SNAPSHOT)["books"]) == {"b1"}
+    with fs.open_read(RootName.WIZARDS, _LOG) as handle:
+        assert handle.read().count(b"\n") == 1
+
+    reg = processed_registry.load_registry(fs)
+    assert set(reg["books"]) == {"b1", "b2"}
+    assert processed_registry.apply_successful_job_requests(fs, _job_requests("b2")) is False
+
+
+def test_lookup_by_book_id_and_source_path(fs: FileService) -> None:
+    processed_registry.apply_successful_job_requests(fs, _job_requests("b1"))
+    processed_registry.apply_successful_job_requests(fs, _job_requests("b2", idem="other"))
+
+    entry = processed_registry.lookup_book(fs, "b2")
+    assert entry is not None
+    assert entry["idempotency_key"] == "other"
+    assert processed_registry.lookup_book(fs, "missing") is None
+    assert processed_registry.lookup_source(fs, "src/b1") == ["b1"]
+    assert processed_registry.lookup_source(fs, "src/none") == []
+
+    # A book re-imported from another source moves between source buckets.
+    moved = _job_requests("b1", idem="again")
+    moved["actions"][0]["source"]["relative_path"] = "src/elsewhere"
+    processed_registry.apply_successful_job_requests(fs, moved)
+    assert processed_registry.lookup_source(fs, "src/b1") == []
+    assert processed_registry.lookup_source(fs, "src/elsewhere") == ["b1"]
+
+    # lookup_book returns a copy, never the shared index entry.
+    entry["idempotency_key"] = "mutated"
+    assert processed_registry.lookup_book(fs, "b2")["idempotency_key"] == "other"
+
+
+def test_concurrent_readers_share_one_index_safely(fs: FileService) -> None:
+    processed_registry.apply_successful_job_requests(fs, _job_requests("seed"))
+    errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def _read() -> None:
+        while not stop.is_set():
+            try:
+                books = processed_registry.load_registry(fs)["books"]
+                assert "seed" in books
+                assert processed_registry.lookup_source(fs, "src/seed") == ["seed"]
+            except BaseException as e:
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=_read) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    for i in range(40):
+        processed_registry.apply_successful_job_requests(fs, _job_requests(f"b{i}", idem="other"))
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    books = processed_registry.load_registry(fs)["books"]
+    assert set(books) == {"seed", *(f"b{i}" for i in range(40))}
+    assert books["b3"]["idempotency_key"] == "other"
+    # The replay offset is the log size, not a sum of overlapping reads.
+    index = processed_registry._indexes[str(fs.root_dir(RootName.WIZARDS))]
+    with fs.open_read(RootName.WIZARDS, _LOG) as handle:
+        assert index.log_offset == len(handle.read())
+
+
+def test_compaction_folds_log_into_snapshot(
+    fs: FileService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(processed_registry, "COMPACT_MIN_LOG_BYTES", 1)
+    processed_registry.apply_successful_job_requests(fs, _job_requests("b1"))
+    processed_registry.apply_successful_job_requests(fs, _job_requests("b2"))
+    processed_registry.wait_for_compaction(fs, timeout=10)
+
+    assert set(read_json(fs, RootName.WIZARDS, _SNAPSHOT)["books"]) == {"b1", "b2"}
+    with fs.open_read(RootName.WIZARDS, _LOG) as handle:
+        assert handle.read() == b""
+    assert set(processed_registry.load_registry(fs)["books"]) == {"b1", "b2"}
+    assert processed_registry.compact_registry(fs) is False
+
+
+def test_concurrent_writers_do_not_lose_updates(fs: FileService) -> None:
+    processed_registry.apply_successful_job_requests(fs, _job_requests("seed"))
+
+    def _write(i: int) -> None:
+        processed_registry.apply_successful_job_requests(fs, _job_requests(f"b{i}"))
+
+    threads = [threading.Thread(target=_write, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    books = processed_registry.load_registry(fs)["books"]
+    assert set(books) == {"seed", *(f"b{i}" for i in range(16))}
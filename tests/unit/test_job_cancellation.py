@@ -0,0 +1,146 @@
+"""Cancelling a running job kills its subprocess group and drops partial output."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from plugins.audio_processor.plugin import AudioProcessorPlugin
+
+from audiomason.core.cancellation import CancelToken, run_subprocess
+from audiomason.core.context import ProcessingContext
+from audiomason.core.errors import OperationCancelledError
+from audiomason.core.jobs.model import JobState
+from audiomason.core.orchestration import Orchestrator
+from audiomason.core.orchestration_models import ProcessRequest
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX process groups")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # A zombie is dead for our purposes.
+    try:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as f:
+            return f.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+
+def _wait_for(predicate: Callable[[], object], timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_cancel_from_another_thread_kills_the_process_group(tmp_path: Path) -> None:
+    pid_file = tmp_path / "grandchild.pid"
+    token = CancelToken()
+    script = f"sleep 60 & echo $! > {pid_file}; wait"
+
+    async def _main() -> None:
+        timer = threading.Timer(0.3, token.cancel)
+        timer.start()
+        try:
+            await run_subprocess(["sh", "-c", script], token=token)
+        finally:
+            timer.cancel()
+
+    started = time.monotonic()
+    with pytest.raises(OperationCancelledError):
+        asyncio.run(_main())
+    assert time.monotonic() - started < 5
+    assert _wait_for(lambda: pid_file.exists() and pid_file.read_text().strip())
+    assert _wait_for(lambda: not _alive(int(pid_file.read_text())))
+
+    # An already cancelled token does not start anything.
+    with pytest.raises(OperationCancelledError):
+        asyncio.run(run_subprocess(["sh", "-c", f"touch {tmp_path / 'never'}"], token=token))
+    assert not (tmp_path / "never").exists()
+
+
+def _fake_ffmpeg(bin_dir: Path, pid_file: Path) -> None:
+    bin_dir.mkdir()
+    script = bin_dir / "ffmpeg"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'echo $$ > "{pid_file}"\n'
+        'for last; do :; done\necho partial > "$last"\n'
+        "exec sleep 60\n",
+        encoding="ascii",
+    )
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+
+
+class _Loader:
+    def __init__(self) -> None:
+        self.plugin = AudioProcessorPlugin({"step_cache": False})
+
+    def get_plugin(self, _name: str) -> AudioProcessorPlugin:
+        return self.plugin
+
+
+def test_orchestrator_cancel_stops_running_conversion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    pid_file = tmp_path / "ffmpeg.pid"
+    _fake_ffmpeg(tmp_path / "bin", pid_file)
+    monkeypatch.setenv("PATH", f"{tmp_path / 'bin'}{os.pathsep}{os.environ['PATH']}")
+
+    pipeline_path = tmp_path / "convert.yaml"
+    pipeline_path.write_text(
+        "pipeline:\n"
+        "  name: convert\n"
+        "  steps:\n"
+        "    - id: convert\n"
+        "      plugin: audio_processor\n"
+        "      interface: IProcessor\n",
+        encoding="utf-8",
+    )
+    source = tmp_path / "book.opus"
+    source.write_bytes(b"opus")
+    stage = tmp_path / "stage"
+    stage.mkdir()
+    contexts = [
+        ProcessingContext(id=f"c{i}", source=source, stage_dir=stage / str(i)) for i in range(2)
+    ]
+    for ctx in contexts:
+        assert ctx.stage_dir is not None
+        ctx.stage_dir.mkdir()
+
+    orchestrator = Orchestrator()
+
+    async def _main() -> str:
+        job_id = orchestrator.start_process(
+            ProcessRequest(contexts=contexts, pipeline_path=pipeline_path, plugin_loader=_Loader())
+        )
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            await asyncio.sleep(0.02)
+        orchestrator.cancel(job_id)
+        while orchestrator.get_job(job_id).state == JobState.RUNNING:
+            await asyncio.sleep(0.02)
+        return job_id
+
+    started = time.monotonic()
+    job_id = asyncio.run(asyncio.wait_for(_main(), 20))
+    assert time.monotonic() - started < 10
+
+    assert orchestrator.get_job(job_id).state == JobState.CANCELLED
+    assert _wait_for(lambda: not _alive(int(pid_file.read_text())))
+    # The half-written MP3 is removed and the second book never started.
+    assert not (stage / "0" / "book.mp3").exists()
+    assert list((stage / "1").iterdir()) == []
@@ -0,0 +1,107 @@
+"""Per-job log routing: log_scope and the buffered job log writer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from audiomason.core.jobs.api import JobService
+from audiomason.core.jobs.log_writer import FLUSH_INTERVAL_S, JobLogWriter
+from audiomason.core.jobs.model import JobType
+from audiomason.core.jobs.store import JobStore
+from audiomason.core.logging import (
+    VerbosityLevel,
+    get_logger,
+    get_verbosity,
+    log_scope,
+    set_verbosity,
+)
+
+_LOG = get_logger("test_job_log_scope")
+
+
+@pytest.fixture(autouse=True)
+def _quiet_console() -> object:
+    previous = get_verbosity()
+    set_verbosity(VerbosityLevel.QUIET)
+    yield None
+    set_verbosity(previous)
+
+
+def test_concurrent_scopes_keep_lines_and_verbosity_apart() -> None:
+    lines: dict[str, list[str]] = {"a": [], "b": []}
+
+    async def _job(name: str, verbosity: VerbosityLevel) -> None:
+        with log_scope(lines[name].append, verbosity=verbosity):
+            for i in range(3):
+                _LOG.info(f"{name}{i}")
+                _LOG.debug(f"{name}-debug")
+                await asyncio.sleep(0)
+
+    async def _main() -> None:
+        await asyncio.gather(_job("a", VerbosityLevel.NORMAL), _job("b", VerbosityLevel.DEBUG))
+
+    asyncio.run(_main())
+    assert lines["a"] == ["[info] a0", "[info] a1", "[info] a2"]
+    assert lines["b"] == [
+        "[info] b0",
+        "[debug] b-debug",
+        "[info] b1",
+        "[debug] b-debug",
+        "[info] b2",
+        "[debug] b-debug",
+    ]
+    # The global verbosity was never touched.
+    assert get_verbosity() == VerbosityLevel.QUIET
+
+
+def test_nested_scope_inherits_the_sink() -> None:
+    lines: list[str] = []
+    with log_scope(lines.append, verbosity=VerbosityLevel.NORMAL):
+        with log_scope(verbosity=VerbosityLevel.DEBUG):
+            assert get_verbosity() == VerbosityLevel.DEBUG
+            _LOG.debug("inner")
+        _LOG.debug("outer")
+    assert lines == ["[debug] inner"]
+
+
+def test_writer_buffers_until_flush_close_or_interval(tmp_path: Path) -> None:
+    path = tmp_path / "job.log"
+    writer = JobLogWriter(path, max_buffered=3)
+    writer.write_line("one")
+    writer.write_line("two\n")
+    assert path.read_text(encoding="utf-8") == ""
+    writer.write_line("three")
+    assert path.read_text(encoding="utf-8") == "one\ntwo\nthree\n"
+
+    writer.write_line("four")
+    deadline = time.monotonic() + FLUSH_INTERVAL_S * 10
+    while "four" not in path.read_text(encoding="utf-8") and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert path.read_text(encoding="utf-8").endswith("four\n")
+
+    writer.write_line("five")
+    writer.close()
+    writer.write_line("late")
+    assert path.read_text(encoding="utf-8") == "one\ntwo\nthree\nfour\nfive\nlate\n"
+
+
+def test_job_log_routes_appends_and_read_log_flushes(tmp_path: Path) -> None:
+    service = JobService(store=JobStore(root=tmp_path))
+    job = service.create_job(JobType.PROCESS)
+
+    with service.job_log(job.job_id) as sink:
+        sink("first")
+        service.append_log_line(job.job_id, "second")
+        with service.job_log(job.job_id) as inner:
+            inner("third")
+        text, offset = service.read_log(job.job_id)
+        assert text == "first\nsecond\nthird\n"
+        sink("fourth")
+
+    assert service.read_log(job.job_id, offset=offset) == ("fourth\n", offset + 7)
+    service.append_log_line(job.job_id, "after")
+    assert service.read_log(job.job_id)[0].endswith("fourth\nafter\n")
@@ -0,0 +1,83 @@
+"""Logging fast path: lazy message rendering and queued console output."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from audiomason.core import logging as core_logging
+from audiomason.core.log_bus import LogRecord, get_log_bus
+from audiomason.core.logging import (
+    VerbosityLevel,
+    flush_console,
+    get_logger,
+    set_console_async,
+    set_verbosity,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore() -> object:
+    old = core_logging.get_verbosity()
+    yield
+    set_console_async(False)
+    set_verbosity(old)
+
+
+def test_disabled_levels_never_render_the_message(capsys: pytest.CaptureFixture[str]) -> None:
+    set_verbosity(VerbosityLevel.NORMAL)
+    logger = get_logger("fast")
+
+    def _boom() -> str:
+        raise AssertionError("rendered a disabled message")
+
+    class _Explosive:
+        def __str__(self) -> str:
+            raise AssertionError("formatted a disabled argument")
+
+    logger.debug(_boom)
+    logger.verbose("state %s", _Explosive())
+    logger.info("done %d/%d", 3, 4)
+    logger.warning(lambda: "lazy warning")
+
+    out = capsys.readouterr().out.splitlines()
+    assert out == ["[info] done 3/4", "[warning] lazy warning"]
+    assert not logger.is_enabled(VerbosityLevel.DEBUG)
+
+
+def test_records_are_only_built_for_subscribed_levels() -> None:
+    bus = get_log_bus()
+    assert not bus.has_subscribers("INFO")
+    seen: list[LogRecord] = []
+    bus.subscribe("INFO", seen.append)
+    try:
+        assert bus.has_subscribers("INFO")
+        assert not bus.has_subscribers("DEBUG")
+        get_logger("fast").info("x=%s", 1)
+    finally:
+        bus.unsubscribe("INFO", seen.append)
+    assert [r.plain for r in seen] == ["[info] x=1"]
+
+
+def test_async_console_keeps_order_and_streams(capsys: pytest.CaptureFixture[str]) -> None:
+    set_verbosity(VerbosityLevel.NORMAL)
+    set_console_async(True)
+    logger = get_logger("fast")
+    for i in range(200):
+        logger.info("line %d", i)
+    logger.error("bad")
+    flush_console()
+
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [f"[info] line {i}" for i in range(200)]
+    assert captured.err.splitlines() == ["[error] bad"]
+
+
+def test_full_console_queue_drops_instead_of_blocking() -> None:
+    writer = core_logging._ConsoleWriter(max_queue=1)
+    writer.close()  # no drain thread: the queue stays full after one write
+    stream = io.StringIO()
+    writer.write(stream, "kept")
+    writer.write(stream, "dropped")
+    assert writer._dropped == 1
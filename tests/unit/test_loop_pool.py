@@ -0,0 +1,115 @@
+"""Reusable background event loops for sync-to-async bridges."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+
+import pytest
+
+from audiomason.core.loop_pool import LoopPool
+
+_marker: contextvars.ContextVar[str] = contextvars.ContextVar("marker", default="unset")
+
+
+async def _loop_id() -> int:
+    return id(asyncio.get_running_loop())
+
+
+def test_run_reuses_the_same_loop_thread() -> None:
+    pool = LoopPool(max_idle=1)
+    try:
+        first = pool.run(_loop_id())
+        second = pool.run(_loop_id())
+    finally:
+        pool.shutdown()
+
+    assert first == second
+
+
+def test_results_exceptions_and_context_propagate() -> None:
+    pool = LoopPool()
+
+    async def _fail() -> None:
+        raise ValueError("boom")
+
+    async def _read_marker() -> str:
+        return _marker.get()
+
+    token = _marker.set("caller")
+    try:
+        assert pool.run(_read_marker()) == "caller"
+        with pytest.raises(ValueError, match="boom"):
+            pool.run(_fail())
+    finally:
+        _marker.reset(token)
+        pool.shutdown()
+
+
+def test_nested_bridge_gets_its_own_loop() -> None:
+    pool = LoopPool(max_idle=1)
+
+    async def _outer() -> tuple[int, int]:
+        # Sync code running inside a pooled coroutine bridges again.
+        inner = pool.run(_loop_id())
+        return id(asyncio.get_running_loop()), inner
+
+    try:
+        outer_id, inner_id = pool.run(_outer(), timeout=5)
+    finally:
+        pool.shutdown()
+
+    assert outer_id != inner_id
+
+
+def test_cancel_propagates_and_stray_tasks_are_cleaned_up() -> None:
+    pool = LoopPool(max_idle=1)
+    started = threading.Event()
+    cancelled = threading.Event()
+    stray_cancelled = threading.Event()
+
+    async def _stray() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            stray_cancelled.set()
+            raise
+
+    async def _slow() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def _spawns_stray() -> None:
+        asyncio.get_running_loop().create_task(_stray())
+        await asyncio.sleep(0)
+
+    try:
+        future = pool.submit(_slow())
+        assert started.wait(5)
+        future.cancel()
+        assert cancelled.wait(5)
+        with pytest.raises(concurrent.futures.CancelledError):
+            future.result(5)
+
+        pool.run(_spawns_stray(), timeout=5)
+        assert stray_cancelled.wait(5)
+    finally:
+        pool.shutdown()
+
+
+def test_timeout_cancels_and_shutdown_rejects_new_work() -> None:
+    pool = LoopPool(max_idle=0)
+    with pytest.raises(TimeoutError):
+        pool.run(asyncio.sleep(60), timeout=0.05)
+
+    pool.shutdown()
+    coro = _loop_id()
+    with pytest.raises(RuntimeError, match="shut down"):
+        pool.run(coro)
+    coro.close()
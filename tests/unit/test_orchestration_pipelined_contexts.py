@@ -0,0 +1,123 @@
+"""Process jobs overlap contexts across pipeline stages and parse the YAML once."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from audiomason.core.context import ProcessingContext
+from audiomason.core.jobs.model import JobState
+from audiomason.core.orchestration import Orchestrator
+from audiomason.core.orchestration_models import ProcessRequest
+from audiomason.core.pipeline import Pipeline, PipelineExecutor, load_pipeline_limits
+
+
+class _Stage:
+    def __init__(self, name: str, trace: list[str], delay: float, fail_on: str = "") -> None:
+        self.name = name
+        self.trace = trace
+        self.delay = delay
+        self.fail_on = fail_on
+        self.active = 0
+        self.peak = 0
+
+    async def process(self, context: ProcessingContext) -> ProcessingContext:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.trace.append(f"start:{self.name}:{context.id}")
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        if context.id == self.fail_on:
+            raise RuntimeError("boom")
+        self.trace.append(f"end:{self.name}:{context.id}")
+        return context
+
+
+class _Loader:
+    def __init__(self, stages: dict[str, _Stage]) -> None:
+        self.stages = stages
+
+    def get_plugin(self, name: str) -> _Stage:
+        return self.stages[name]
+
+
+def _pipeline(tmp_path: Path) -> Path:
+    path = tmp_path / "two_stage.yaml"
+    path.write_text(
+        "pipeline:\n"
+        "  name: two_stage\n"
+        "  steps:\n"
+        "    - id: import\n"
+        "      plugin: importer\n"
+        "      interface: IProcessor\n"
+        "    - id: convert\n"
+        "      plugin: converter\n"
+        "      interface: IProcessor\n"
+        "      after: [import]\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _run(tmp_path: Path, loader: _Loader, count: int) -> tuple[Orchestrator, str]:
+    contexts = [ProcessingContext(id=f"b{i}", source=tmp_path / f"b{i}.mp3") for i in range(count)]
+    orchestrator = Orchestrator()
+    job_id = orchestrator.start_process(
+        ProcessRequest(contexts=contexts, pipeline_path=_pipeline(tmp_path), plugin_loader=loader)
+    )
+    return orchestrator, job_id
+
+
+def test_next_book_imports_while_previous_converts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("AUDIOMASON_PIPELINE_CONTEXTS_IN_FLIGHT", "3")
+    loads: list[Path] = []
+    original = PipelineExecutor.load_pipeline
+
+    def _counting(self: PipelineExecutor, yaml_path: Path) -> Pipeline:
+        loads.append(yaml_path)
+        return original(self, yaml_path)
+
+    monkeypatch.setattr(PipelineExecutor, "load_pipeline", _counting)
+
+    trace: list[str] = []
+    importer = _Stage("import", trace, 0.02)
+    converter = _Stage("convert", trace, 0.05)
+    orchestrator, job_id = _run(
+        tmp_path, _Loader({"importer": importer, "converter": converter}), 3
+    )
+
+    job = orchestrator.get_job(job_id)
+    assert job.state == JobState.SUCCEEDED
+    assert job.progress == 1.0
+    assert len(loads) == 1
+    # Each stage handles one book at a time, but stages overlap across books.
+    assert importer.peak == 1
+    assert converter.peak == 1
+    assert trace.index("start:import:b1") < trace.index("end:convert:b0")
+
+
+def test_sequential_by_default_and_failure_stops_the_job(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert load_pipeline_limits().contexts_in_flight == 1
+
+    trace: list[str] = []
+    loader = _Loader(
+        {
+            "importer": _Stage("import", trace, 0.01),
+            "converter": _Stage("convert", trace, 0.01, fail_on="b1"),
+        }
+    )
+    orchestrator, job_id = _run(tmp_path, loader, 3)
+
+    assert trace[:4] == ["start:import:b0", "end:import:b0", "start:convert:b0", "end:convert:b0"]
+    job = orchestrator.get_job(job_id)
+    assert job.state == JobState.FAILED
+    assert "boom" in (job.error or "")
+    assert not any(entry.endswith(":b2") for entry in trace)
@@ -0,0 +1,145 @@
+"""Ready-queue PipelineExecutor: early start, per-plugin limits, context merge."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from audiomason.core.context import ProcessingContext
+from audiomason.core.errors import PipelineError
+from audiomason.core.pipeline import Pipeline, PipelineExecutor, PipelineStep
+
+
+class _Plugin:
+    def __init__(self, name: str, trace: list[str], delay: float, apply: Any = None) -> None:
+        self.name = name
+        self.trace = trace
+        self.delay = delay
+        self.apply = apply
+        self.active = 0
+        self.peak = 0
+
+    async def process(self, context: ProcessingContext) -> ProcessingContext:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.trace.append(f"start:{context.current_step}")
+        await asyncio.sleep(self.delay)
+        if self.apply is not None:
+            self.apply(context)
+        self.trace.append(f"end:{context.current_step}")
+        self.active -= 1
+        return context
+
+
+class _Loader:
+    def __init__(self, plugins: dict[str, _Plugin]) -> None:
+        self.plugins = plugins
+
+    def get_plugin(self, name: str) -> _Plugin:
+        return self.plugins[name]
+
+
+def _ctx() -> ProcessingContext:
+    return ProcessingContext(id="c1", source=Path("/tmp/book"))
+
+
+def _step(step_id: str, plugin: str, after: list[str] | None = None) -> PipelineStep:
+    return PipelineStep(
+        id=step_id, plugin=plugin, interface="IProcessor", after=after or [], parallel=True
+    )
+
+
+def test_step_starts_when_its_own_dependencies_finish() -> None:
+    trace: list[str] = []
+    loader = _Loader(
+        {
+            "slow": _Plugin("slow", trace, 0.2),
+            "fast": _Plugin("fast", trace, 0.01),
+            "next": _Plugin("next", trace, 0.01),
+        }
+    )
+    pipeline = Pipeline(
+        name="p",
+        description="",
+        steps=[_step("slow", "slow"), _step("fast", "fast"), _step("next", "next", ["fast"])],
+    )
+    ctx = asyncio.run(PipelineExecutor(loader).execute(pipeline, _ctx()))
+
+    # With level barriers 'next' would wait for 'slow'.
+    assert trace.index("end:next") < trace.index("end:slow")
+    assert sorted(ctx.completed_steps) == ["fast", "next", "slow"]
+
+
+def test_plugin_concurrency_limits_parallel_steps() -> None:
+    trace: list[str] = []
+    plugin = _Plugin("conv", trace, 0.02)
+    steps = [_step(f"s{i}", "conv") for i in range(5)]
+    executor = PipelineExecutor(_Loader({"conv": plugin}), plugin_concurrency={"conv": 2})
+    asyncio.run(executor.execute(Pipeline(name="p", description="", steps=steps), _ctx()))
+    assert plugin.peak == 2
+
+    unlimited = _Plugin("conv", [], 0.02)
+    asyncio.run(
+        PipelineExecutor(_Loader({"conv": unlimited})).execute(
+            Pipeline(name="p", description="", steps=steps), _ctx()
+        )
+    )
+    assert unlimited.peak == 5
+
+
+def test_independent_writes_are_merged_not_overwritten() -> None:
+    def _meta(ctx: ProcessingContext) -> None:
+        ctx.author = "Author"
+        ctx.final_metadata["title"] = "T"
+        ctx.warnings.append("meta")
+
+    def _cover(ctx: ProcessingContext) -> None:
+        ctx.cover_path = Path("/tmp/cover.jpg")
+        ctx.final_metadata["cover"] = "yes"
+        ctx.warnings.append("cover")
+
+    loader = _Loader(
+        {"meta": _Plugin("meta", [], 0.01, _meta), "cover": _Plugin("cover", [], 0.02, _cover)}
+    )
+    pipeline = Pipeline(name="p", description="", steps=[_step("m", "meta"), _step("c", "cover")])
+    ctx = asyncio.run(PipelineExecutor(loader).execute(pipeline, _ctx()))
+
+    assert ctx.author == "Author"
+    assert ctx.cover_path == Path("/tmp/cover.jpg")
+    assert ctx.final_metadata == {"title": "T", "cover": "yes"}
+    assert sorted(ctx.warnings) == ["cover", "meta"]
+    assert sorted(ctx.completed_steps) == ["c", "m"]
+
+
+def test_conflicting_parallel_writes_fail() -> None:
+    def _a(ctx: ProcessingContext) -> None:
+        ctx.title = "A"
+
+    def _b(ctx: ProcessingContext) -> None:
+        ctx.title = "B"
+
+    loader = _Loader({"a": _Plugin("a", [], 0.01, _a), "b": _Plugin("b", [], 0.02, _b)})
+    pipeline = Pipeline(name="p", description="", steps=[_step("a", "a"), _step("b", "b")])
+    with pytest.raises(PipelineError, match="title"):
+        asyncio.run(PipelineExecutor(loader).execute(pipeline, _ctx()))
+
+
+def test_sequential_step_runs_alone_and_cycles_are_rejected() -> None:
+    trace: list[str] = []
+    loader = _Loader({"p": _Plugin("p", trace, 0.01), "s": _Plugin("s", trace, 0.01)})
+    seq = PipelineStep(id="seq", plugin="s", interface="IProcessor", after=[])
+    pipeline = Pipeline(
+        name="p", description="", steps=[_step("p1", "p"), seq, _step("p2", "p", ["seq"])]
+    )
+    asyncio.run(PipelineExecutor(loader).execute(pipeline, _ctx()))
+    assert trace[:2] == ["start:seq", "end:seq"]
+
+    cyclic = Pipeline(
+        name="p", description="", steps=[_step("x", "p", ["y"]), _step("y", "p", ["x"])]
+    )
+    with pytest.raises(PipelineError, match="circular"):
+        asyncio.run(PipelineExecutor(loader).execute(cyclic, _ctx()))
+    assert len(trace) == 6
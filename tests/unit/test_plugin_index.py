@@ -0,0 +1,157 @@
+"""Persistent plugin manifest/validation index used for fast CLI startup."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from audiomason.core import loader as loader_mod
+from audiomason.core.errors import PluginValidationError
+from audiomason.core.loader import PluginLoader, PluginManifest
+from audiomason.core.plugin_index import (
+    PLUGIN_INDEX_PATH_ENV,
+    PluginIndex,
+    default_plugin_index_path,
+)
+
+
+def _write_plugin(plugins_dir: Path, *, body: str = "", version: str = "1.0.0") -> Path:
+    plugin_dir = plugins_dir / "demo"
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    (plugin_dir / "plugin.yaml").write_text(
+        "name: demo\n"
+        f"version: {version}\n"
+        "entrypoint: plugin:DemoPlugin\n"
+        "interfaces: [ICLICommands]\n"
+        "cli_commands: [demo]\n"
+        "test_level: basic\n",
+        encoding="utf-8",
+    )
+    (plugin_dir / "plugin.py").write_text(
+        body + "\n\nclass DemoPlugin:\n    pass\n",
+        encoding="utf-8",
+    )
+    return plugin_dir
+
+
+def _loader(plugins_dir: Path, index_path: Path) -> PluginLoader:
+    return PluginLoader(builtin_plugins_dir=plugins_dir, index=PluginIndex(index_path))
+
+
+def _load_and_save(plugins_dir: Path, index_path: Path, plugin_dir: Path) -> PluginManifest:
+    # One "process": load the manifest, then persist the index once.
+    loader = _loader(plugins_dir, index_path)
+    manifest = loader.load_manifest_only(plugin_dir)
+    loader.save_index()
+    return manifest
+
+
+def _forbid_yaml(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _no_parse(_content: bytes) -> object:
+        raise AssertionError("manifest must come from the index")
+
+    monkeypatch.setattr(loader_mod, "_parse_yaml", _no_parse)
+
+
+def test_second_process_reads_manifests_from_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin_dir = _write_plugin(tmp_path / "plugins")
+    index_path = tmp_path / "cache" / "plugin_index.json"
+    first = _load_and_save(tmp_path / "plugins", index_path, plugin_dir)
+    assert index_path.is_file()
+
+    _forbid_yaml(monkeypatch)
+    second = _loader(tmp_path / "plugins", index_path).load_manifest_only(plugin_dir)
+    assert second == first
+    assert second.cli_commands == ["demo"]
+
+    # A touch without a content change is recognised by hash.
+    st = (plugin_dir / "plugin.yaml").stat()
+    os.utime(plugin_dir / "plugin.yaml", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert _loader(tmp_path / "plugins", index_path).load_manifest_only(plugin_dir) == first
+
+
+def test_changed_manifest_is_reparsed_and_corrupt_index_ignored(tmp_path: Path) -> None:
+    plugin_dir = _write_plugin(tmp_path / "plugins")
+    index_path = tmp_path / "plugin_index.json"
+    _load_and_save(tmp_path / "plugins", index_path, plugin_dir)
+
+    _write_plugin(tmp_path / "plugins", version="2.0.0")
+    manifest = _loader(tmp_path / "plugins", index_path).load_manifest_only(plugin_dir)
+    assert manifest.version == "2.0.0"
+
+    index_path.write_text("{not json", encoding="utf-8")
+    manifest = _loader(tmp_path / "plugins", index_path).load_manifest_only(plugin_dir)
+    assert manifest.version == "2.0.0"
+
+
+def test_validation_checks_imports_without_executing_them(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "am_explosive_dep.py").write_text("raise RuntimeError('imported')\n")
+    monkeypatch.syspath_prepend(str(site))
+
+    plugin_dir = _write_plugin(tmp_path / "plugins", body="import am_explosive_dep")
+    loader = _loader(tmp_path / "plugins", tmp_path / "plugin_index.json")
+    loader._validate_plugin(plugin_dir, loader.load_manifest_only(plugin_dir))
+    assert "am_explosive_dep" not in sys.modules
+
+    broken_dir = _write_plugin(tmp_path / "plugins", body="import am_missing_dep_xyz")
+    with pytest.raises(PluginValidationError, match="am_missing_dep_xyz"):
+        loader._validate_plugin(broken_dir, loader.load_manifest_only(broken_dir))
+
+
+def test_validation_facts_are_cached_per_module_content(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plugin_dir = _write_plugin(tmp_path / "plugins")
+    index_path = tmp_path / "plugin_index.json"
+    loader = _loader(tmp_path / "plugins", index_path)
+    loader._validate_plugin(plugin_dir, loader.load_manifest_only(plugin_dir))
+    loader.save_index()
+
+    def _no_facts(_content: bytes, _module_file: Path) -> object:
+        raise AssertionError("module facts must come from the index")
+
+    monkeypatch.setattr(loader_mod, "_module_facts", _no_facts)
+    fresh = _loader(tmp_path / "plugins", index_path)
+    fresh._validate_plugin(plugin_dir, fresh.load_manifest_only(plugin_dir))
+
+    (plugin_dir / "plugin.py").write_text("class Other:\n    pass\n", encoding="utf-8")
+    monkeypatch.undo()
+    with pytest.raises(PluginValidationError, match="DemoPlugin"):
+        fresh._validate_plugin(plugin_dir, fresh.load_manifest_only(plugin_dir))
+
+
+def test_index_path_follows_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PLUGIN_INDEX_PATH_ENV, str(tmp_path / "idx.json"))
+    assert default_plugin_index_path() == tmp_path / "idx.json"
+    monkeypatch.delenv(PLUGIN_INDEX_PATH_ENV)
+    assert default_plugin_index_path() == Path.home() / ".audiomason/cache/plugin_index.json"
+
+
+def test_index_is_written_once_per_batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index_path = tmp_path / "index.json"
+    plugin_dir = _write_plugin(tmp_path / "plugins")
+    loader = _loader(tmp_path / "plugins", index_path)
+    writes: list[str] = []
+    real_replace = os.replace
+
+    def _counting_replace(src: str, dst: str) -> None:
+        writes.append(str(dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", _counting_replace)
+    for _ in range(3):
+        loader._validate_plugin(plugin_dir, loader.load_manifest_only(plugin_dir))
+    assert writes == []
+
+    loader.save_index()
+    loader.save_index()
+    assert writes == [str(index_path)]
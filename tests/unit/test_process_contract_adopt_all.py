@@ -0,0 +1,130 @@
+"""Parallel, oldest-first adoption of orphaned PROCESS contract jobs."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from audiomason.core import process_contract_authority as authority
+from audiomason.core.jobs.model import Job, JobState, JobType
+from audiomason.core.jobs.store import JobStore
+from audiomason.core.process_job_contracts import IMPORT_PROCESS_CONTRACT_ID
+
+
+def _job(
+    store: JobStore,
+    job_id: str,
+    created_at: str,
+    *,
+    state: JobState = JobState.PENDING,
+    job_type: JobType = JobType.PROCESS,
+) -> None:
+    store.save_job(
+        Job(
+            job_id=job_id,
+            type=job_type,
+            state=state,
+            created_at=created_at,
+            meta={
+                "contract_id": IMPORT_PROCESS_CONTRACT_ID,
+                "job_requests_path": "wizards:import/sessions/s/job_requests.json",
+                "detached_runtime_json": "{}",
+            },
+        )
+    )
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> JobStore:
+    store = JobStore(root=tmp_path / "jobs")
+    store.init_root()
+    # Deliberately not in id order: adoption follows created_at.
+    _job(store, "c", "2026-01-01T00:00:01Z")
+    _job(store, "a", "2026-01-01T00:00:03Z", state=JobState.RUNNING)
+    _job(store, "b", "2026-01-01T00:00:02Z")
+    _job(store, "d", "2026-01-01T00:00:04Z")
+    _job(store, "done", "2026-01-01T00:00:00Z", state=JobState.SUCCEEDED)
+    _job(store, "daemon", "2026-01-01T00:00:00Z", job_type=JobType.DAEMON)
+    return store
+
+
+def _record_calls(monkeypatch: pytest.MonkeyPatch, log: Path, *, delay: float) -> None:
+    def _fake_process_job(store: JobStore, *, job_id: str) -> None:
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(json.dumps([os.getpid(), job_id]) + "\n")
+        time.sleep(delay)
+        if job_id == "d":
+            raise RuntimeError("boom")
+
+    # Forked adoption workers inherit the patched module.
+    monkeypatch.setattr(authority, "_process_job", _fake_process_job)
+
+
+def _calls(log: Path) -> list[list[object]]:
+    return [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+
+def test_candidates_are_adoptable_jobs_oldest_first(store: JobStore) -> None:
+    assert authority._adoption_candidates(store) == ["c", "b", "a", "d"]
+
+
+def test_serial_adoption_keeps_order_and_survives_failures(
+    store: JobStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / "calls.jsonl"
+    _record_calls(monkeypatch, log, delay=0.0)
+
+    authority._run_request(store.root, job_id=None, adopt_all=True, workers=1)
+
+    assert [c[1] for c in _calls(log)] == ["c", "b", "a", "d"]
+    progress = json.loads((store.root / authority.ADOPTION_PROGRESS_FILENAME).read_text())
+    assert (progress["total"], progress["done"], progress["failed"]) == (4, 4, 1)
+    assert progress["finished_at"] is not None
+
+
+def test_adoption_fans_out_over_processes(
+    store: JobStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / "calls.jsonl"
+    _record_calls(monkeypatch, log, delay=0.3)
+    # Workers must inherit the patch; other tests may leave threads behind.
+    monkeypatch.setattr(authority, "_adopt_context", lambda: multiprocessing.get_context("fork"))
+
+    started = time.monotonic()
+    authority._adopt_all(store.root, workers=4)
+    elapsed = time.monotonic() - started
+
+    calls = _calls(log)
+    assert sorted(c[1] for c in calls) == ["a", "b", "c", "d"]
+    assert len({c[0] for c in calls}) > 1
+    assert os.getpid() not in {c[0] for c in calls}
+    assert elapsed < 4 * 0.3 + 2.0
+    progress = json.loads((store.root / authority.ADOPTION_PROGRESS_FILENAME).read_text())
+    assert (progress["done"], progress["failed"], progress["workers"]) == (4, 1, 4)
+
+
+def test_single_job_request_ignores_adoption(
+    store: JobStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / "calls.jsonl"
+    _record_calls(monkeypatch, log, delay=0.0)
+    authority._run_request(store.root, job_id="done", adopt_all=False)
+    assert [c[1] for c in _calls(log)] == ["done"]
+    assert not (store.root / authority.ADOPTION_PROGRESS_FILENAME).exists()
+
+
+def test_pool_does_not_fork_while_other_threads_run() -> None:
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, daemon=True)
+    thread.start()
+    try:
+        assert authority._adopt_context().get_start_method() != "fork"
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,147 @@
+"""Warm worker pool for detached PROCESS contract jobs."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from audiomason.core import process_contract_runtime as runtime_mod
+from audiomason.core.process_contract_runtime import (
+    ProcessContractRuntime,
+    WorkerPoolSettings,
+)
+
+# Speaks the authority protocol and records (pid, mode, job_id) per job.
+_FAKE_AUTHORITY = """
+import json, os, sys
+from pathlib import Path
+
+def record(jobs_root, mode, job_id):
+    with open(Path(jobs_root) / "handled.jsonl", "a") as f:
+        f.write(json.dumps([os.getpid(), mode, job_id]) + "\\n")
+
+args = sys.argv[1:]
+if "--serve" in args:
+    max_jobs = int(args[args.index("--max-jobs") + 1])
+    print(json.dumps({"ready": True}), flush=True)
+    done = 0
+    for line in sys.stdin:
+        req = json.loads(line)
+        record(req["jobs_root"], "warm", req["job_id"])
+        done += 1
+        retire = done >= max_jobs > 0
+        print(json.dumps({"ok": True, "retire": retire}), flush=True)
+        if retire:
+            break
+else:
+    record(args[args.index("--jobs-root") + 1], "oneshot", args[args.index("--job-id") + 1])
+"""
+
+
+@pytest.fixture()
+def fake_authority(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    pkg = tmp_path / "fakepkg"
+    pkg.mkdir()
+    (pkg / "fake_authority.py").write_text(_FAKE_AUTHORITY, encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", f"{pkg}{os.pathsep}{os.environ.get('PYTHONPATH', '')}")
+    monkeypatch.setattr(runtime_mod, "_AUTHORITY_MODULE", "fake_authority")
+    jobs_root = tmp_path / "jobs"
+    jobs_root.mkdir()
+    return jobs_root
+
+
+def _handled(jobs_root: Path, count: int) -> list[list[object]]:
+    path = jobs_root / "handled.jsonl"
+    deadline = time.monotonic() + 20.0
+    while time.monotonic() < deadline:
+        lines = path.read_text().splitlines() if path.exists() else []
+        if len(lines) >= count:
+            return [json.loads(line) for line in lines]
+        time.sleep(0.01)
+    raise AssertionError(f"expected {count} handled jobs")
+
+
+def test_jobs_reuse_warm_worker_until_recycled(fake_authority: Path) -> None:
+    runtime = ProcessContractRuntime(WorkerPoolSettings(workers=1, max_jobs_per_worker=2))
+    try:
+        for i in range(3):
+            runtime.submit(job_id=f"job-{i}", jobs_root=fake_authority)
+        handled = _handled(fake_authority, 3)
+    finally:
+        runtime.shutdown()
+
+    assert [h[1:] for h in handled] == [["warm", f"job-{i}"] for i in range(3)]
+    pids = [h[0] for h in handled]
+    assert pids[0] == pids[1] != pids[2]
+
+
+def test_environment_change_gets_a_fresh_worker(
+    fake_authority: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    runtime = ProcessContractRuntime(WorkerPoolSettings(workers=1))
+    try:
+        runtime.submit(job_id="a", jobs_root=fake_authority)
+        _handled(fake_authority, 1)
+        monkeypatch.setenv("AUDIOMASON_TEST_MARKER", "changed")
+        runtime.submit(job_id="b", jobs_root=fake_authority)
+        handled = _handled(fake_authority, 2)
+    finally:
+        runtime.shutdown()
+    assert handled[0][0] != handled[1][0]
+
+
+def test_zero_workers_spawns_one_shot_authorities(fake_authority: Path) -> None:
+    runtime = ProcessContractRuntime(WorkerPoolSettings(workers=0))
+    try:
+        runtime.submit(job_id="solo", jobs_root=fake_authority)
+        handled = _handled(fake_authority, 1)
+    finally:
+        runtime.shutdown()
+    assert handled[0][1:] == ["oneshot", "solo"]
+    assert runtime.worker_pids() == []
+
+
+def test_shutdown_stops_warm_workers(fake_authority: Path) -> None:
+    runtime = ProcessContractRuntime(WorkerPoolSettings(workers=2))
+    runtime.submit(job_id="x", jobs_root=fake_authority)
+    _handled(fake_authority, 1)
+    deadline = time.monotonic() + 20.0
+    while len(runtime.worker_pids()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    pids = runtime.worker_pids()
+    assert len(pids) == 2
+
+    runtime.shutdown()
+
+    for pid in pids:
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+def test_authority_serve_mode_answers_and_retires(tmp_path: Path) -> None:
+    src_root = Path(runtime_mod.__file__).resolve().parents[2]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(src_root.parent), str(src_root)])
+    env["HOME"] = str(tmp_path)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", runtime_mod._AUTHORITY_MODULE, "--serve", "--max-jobs", "2"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    assert json.loads(proc.stdout.readline()) == {"ready": True}
+    replies = []
+    for job_id in ("missing-1", "missing-2"):
+        proc.stdin.write(json.dumps({"jobs_root": str(tmp_path / "jobs"), "job_id": job_id}) + "\n")
+        proc.stdin.flush()
+        replies.append(json.loads(proc.stdout.readline()))
+    assert [r["retire"] for r in replies] == [False, True]
+    assert proc.wait(timeout=20) == 0
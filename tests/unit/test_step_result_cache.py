@@ -0,0 +1,157 @@
+"""Content-addressed step result cache and its use by audio_processor."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+from plugins.audio_processor.plugin import AudioProcessorPlugin
+
+from audiomason.checkpoint import StepResultCache, step_cache_key
+
+
+def _file(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_put_get_roundtrip_copies_files_out(tmp_path: Path) -> None:
+    cache = StepResultCache(tmp_path / "cache")
+    key = step_cache_key("d" * 64, "audio_processor", "1.0.0", {"bitrate": "128k"})
+    assert key == step_cache_key("d" * 64, "audio_processor", "1.0.0", {"bitrate": "128k"})
+    assert key != step_cache_key("d" * 64, "audio_processor", "1.0.1", {"bitrate": "128k"})
+
+    outs = [tmp_path / "restored" / "01.mp3", tmp_path / "restored" / "02.mp3"]
+    assert cache.get(key, outs) is False
+
+    cache.put(key, [_file(tmp_path / "a.mp3", b"one"), _file(tmp_path / "b.mp3", b"two")])
+    assert cache.get(key, outs) is True
+    assert [p.read_bytes() for p in outs] == [b"one", b"two"]
+    # A restored file is a copy: editing it in place leaves the entry intact.
+    outs[0].write_bytes(b"retagged")
+    assert cache.get(key, outs) is True
+    assert outs[0].read_bytes() == b"one"
+    # The entry holds two files; asking for a different count is a miss.
+    assert cache.get(key, outs[:1]) is False
+
+
+def test_eviction_drops_least_recently_used(tmp_path: Path) -> None:
+    cache = StepResultCache(tmp_path / "cache", max_bytes=250)
+    keys = [step_cache_key(str(i), "p", "1", {}) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, [_file(tmp_path / f"src{i}", b"x" * 100)])
+        entry = cache.root / "entries" / key[:2] / key / "entry.json"
+        os.utime(entry, (1000 + i, 1000 + i))
+    # Touch the oldest so the other one becomes least recently used.
+    assert cache.get(keys[0], [tmp_path / "out0"]) is True
+
+    cache.put(keys[2], [_file(tmp_path / "src2", b"x" * 100)])
+    assert cache.total_bytes() == 200
+    assert cache.get(keys[0], [tmp_path / "o"]) is True
+    assert cache.get(keys[1], [tmp_path / "o"]) is False
+    assert cache.get(keys[2], [tmp_path / "o"]) is True
+
+
+def test_source_digest_is_remembered_by_stamp(tmp_path: Path) -> None:
+    src = _file(tmp_path / "book.m4a", b"audio")
+    first = StepResultCache(tmp_path / "cache").source_digest(src)
+
+    # Same stamp (mtime, size): a fresh instance trusts the persisted digest
+    # without reading the file again.
+    src_stat = src.stat()
+    src.write_bytes(b"AUDIO")
+    os.utime(src, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    assert StepResultCache(tmp_path / "cache").source_digest(src) == first
+
+    src.write_bytes(b"other audio")
+    os.utime(src, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns + 10**9))
+    assert StepResultCache(tmp_path / "cache").source_digest(src) != first
+
+
+def test_audio_processor_reuses_encoded_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[list[str]] = []
+
+    async def _fake_ffmpeg(self: AudioProcessorPlugin, cmd: list[str]) -> None:
+        calls.append(cmd)
+        Path(cmd[-1]).write_bytes(f"mp3@{self.bitrate}".encode())
+
+    monkeypatch.setattr(AudioProcessorPlugin, "_run_ffmpeg_command", _fake_ffmpeg)
+    source = _file(tmp_path / "in" / "book.opus", b"opus data")
+    config = {"step_cache_dir": str(tmp_path / "cache")}
+
+    def _run(plugin: AudioProcessorPlugin, out_dir: Path) -> list[Path]:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        plan = plugin.plan_import_conversion(source, out_dir)
+        return asyncio.run(plugin._execute_plan(plan))
+
+    assert _run(AudioProcessorPlugin(config), tmp_path / "run1") == [tmp_path / "run1/book.mp3"]
+    assert len(calls) == 1
+
+    # Re-run (e.g. only tags changed): no re-encode, same bytes.
+    out = _run(AudioProcessorPlugin(config), tmp_path / "run2")
+    assert len(calls) == 1
+    assert out[0].read_bytes() == b"mp3@128k"
+
+    # An option that changes the audio is a different key.
+    _run(AudioProcessorPlugin({**config, "bitrate": "64k"}), tmp_path / "run3")
+    assert len(calls) == 2
+
+    _run(AudioProcessorPlugin({**config, "step_cache": False}), tmp_path / "run4")
+    assert len(calls) == 3
+
+
+def test_digest_table_is_bounded_and_saved_in_batches(tmp_path: Path) -> None:
+    sources = [_file(tmp_path / f"src{i}.m4a", f"audio{i}".encode()) for i in range(4)]
+    cache = StepResultCache(tmp_path / "cache", max_digests=2)
+    digests_file = tmp_path / "cache" / "digests.json"
+
+    for src in sources[:3]:
+        cache.source_digest(src, persist=False)
+    assert not digests_file.exists()
+    # A hit makes src1 the most recently used, so src2 is dropped next.
+    cache.source_digest(sources[1], persist=False)
+    cache.save_digests()
+    saved = json.loads(digests_file.read_text(encoding="utf-8"))["files"]
+    assert set(saved) == {str(sources[1].resolve()), str(sources[2].resolve())}
+
+    # Nothing changed: saving again does not rewrite the file.
+    before = digests_file.stat().st_mtime_ns
+    os.utime(digests_file, ns=(before - 10**9, before - 10**9))
+    cache.save_digests()
+    assert digests_file.stat().st_mtime_ns == before - 10**9
+
+    cache.source_digest(sources[3])
+    saved = json.loads(digests_file.read_text(encoding="utf-8"))["files"]
+    assert set(saved) == {str(sources[1].resolve()), str(sources[3].resolve())}
+
+
+def test_audio_processor_saves_digests_once_per_plan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _fake_ffmpeg(self: AudioProcessorPlugin, cmd: list[str]) -> None:
+        Path(cmd[-1]).write_bytes(b"mp3")
+
+    saves: list[int] = []
+    real_save = StepResultCache.save_digests
+
+    def _counting_save(self: StepResultCache) -> None:
+        saves.append(len(self._load_digests()))
+        real_save(self)
+
+    monkeypatch.setattr(AudioProcessorPlugin, "_run_ffmpeg_command", _fake_ffmpeg)
+    monkeypatch.setattr(StepResultCache, "save_digests", _counting_save)
+    plugin = AudioProcessorPlugin({"step_cache_dir": str(tmp_path / "cache")})
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    plan = [
+        *plugin.plan_import_conversion(_file(tmp_path / "in/a.opus", b"a"), out_dir),
+        *plugin.plan_import_conversion(_file(tmp_path / "in/b.opus", b"b"), out_dir),
+    ]
+    asyncio.run(plugin._execute_plan(plan))
+    assert saves == [2]
@@ -0,0 +1,98 @@
+"""Buffered, rotating syslog writer and rotation-aware reads."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import pytest
+from plugins.file_io.service import FileService, RootName
+from plugins.syslog.service import SyslogService
+from plugins.syslog.writer import SyslogRotation, SyslogWriter
+
+from audiomason.core.log_bus import LogRecord
+
+
+@pytest.fixture()
+def fs(tmp_path: Path) -> FileService:
+    roots = {
+        RootName.INBOX: tmp_path / "inbox",
+        RootName.STAGE: tmp_path / "stage",
+        RootName.JOBS: tmp_path / "jobs",
+        RootName.OUTBOX: tmp_path / "outbox",
+    }
+    for p in roots.values():
+        p.mkdir(parents=True, exist_ok=True)
+    return FileService(roots)
+
+
+def _record(i: int) -> LogRecord:
+    return LogRecord(logger_name="t", level_name="INFO", plain=f"line {i:04d}")
+
+
+def test_append_uses_one_handle_and_no_file_io_calls_per_record(
+    fs: FileService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    svc = SyslogService(fs, filename="logs/system.log", disk_format="plain")
+    svc.append_record(_record(0))
+
+    def _no_open(*_a: object, **_k: object) -> None:
+        raise AssertionError("append must not reopen the file through file_io")
+
+    monkeypatch.setattr(fs, "open_append", _no_open)
+    for i in range(1, 200):
+        svc.append_record(_record(i))
+    svc.flush()
+
+    lines = svc.read_all_raw().splitlines()
+    svc.close()
+    assert lines == [f"line {i:04d}" for i in range(200)]
+
+
+def test_size_rotation_keeps_backups_and_reads_span_segments(fs: FileService) -> None:
+    rotation = SyslogRotation(max_bytes=100, backups=2, compress=True)
+    svc = SyslogService(fs, filename="logs/system.log", disk_format="plain", rotation=rotation)
+    for i in range(45):
+        svc.append_record(_record(i))
+        svc.flush()
+
+    logs = fs.root_dir(RootName.STAGE) / "logs"
+    names = sorted(p.name for p in logs.iterdir())
+    assert names == ["system.log", "system.log.1.gz", "system.log.2.gz"]
+    assert gzip.decompress((logs / "system.log.1.gz").read_bytes()).startswith(b"line ")
+
+    everything = svc.read_all_raw().splitlines()
+    assert everything == sorted(everything)
+    assert everything[-1] == "line 0044"
+
+    tail = svc.tail_lines_raw(15)
+    assert tail == [f"line {i:04d}" for i in range(30, 45)]
+    svc.close()
+
+
+def test_writer_reopens_after_external_rotation(tmp_path: Path) -> None:
+    path = tmp_path / "system.log"
+    writer = SyslogWriter(path, rotation=SyslogRotation(max_bytes=0))
+    writer.write(b"a\n")
+    writer.flush()
+
+    path.rename(tmp_path / "system.log.1")
+    writer.write(b"b\n")
+    writer.close()
+
+    assert (tmp_path / "system.log.1").read_bytes() == b"a\n"
+    assert path.read_bytes() == b"b\n"
+
+
+def test_background_write_failure_surfaces_on_next_write(tmp_path: Path) -> None:
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_bytes(b"")
+    writer = SyslogWriter(blocker / "system.log")
+    writer.write(b"a\n")
+    writer.flush()
+
+    with pytest.raises(OSError):
+        writer.write(b"b\n")
+    writer.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.write(b"c\n")